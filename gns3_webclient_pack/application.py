@@ -47,8 +47,10 @@ class Application(QtWidgets.QApplication):
         self.setApplicationName("GNS3 WebClient pack")
         self.setApplicationVersion(__version__)
 
-        # set the window icon
-        self.setWindowIcon(QtGui.QIcon(":/images/gns3_webclient.ico"))
+        # set the window icon, an error is logged if the resources cannot be registered
+        from .ui import resources_rc
+        if resources_rc.qInitResources():
+            self.setWindowIcon(QtGui.QIcon(":/images/gns3_webclient.ico"))
 
     def event(self, event):
         # Handle QFileOpenEvent on macOS to receive a URL
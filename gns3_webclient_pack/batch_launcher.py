@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Launch many gns3+ URLs from a single launcher process.
+"""
+
+import sys
+import time
+import subprocess
+import concurrent.futures
+
+from gns3_webclient_pack.launcher_error import LauncherError
+from gns3_webclient_pack.launcher_service import launcher_command
+
+import logging
+log = logging.getLogger(__name__)
+
+
+def read_urls(path):
+    """
+    Read URLs from a file, one per line. Empty lines and lines starting with # are ignored.
+
+    :param path: file path or "-" for the standard input
+
+    :returns: list of URLs
+    """
+
+    try:
+        if path == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+    except OSError as e:
+        raise LauncherError("Cannot read URLs from '{}': {}".format(path, e))
+
+    urls = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+def spawn_launcher(url):
+    """
+    Launch a URL in its own launcher process.
+    Used for packet captures which keep a network stream open.
+    The launch has already been claimed by this process, the
+    launcher process does not check for duplicates again.
+
+    :param url: URL to launch
+    """
+
+    try:
+        subprocess.Popen(launcher_command("--no-coalesce", url))
+    except (OSError, subprocess.SubprocessError) as e:
+        raise LauncherError("Cannot start a launcher for '{}': {}".format(url, e))
+
+
+def batch_launch(urls, launch_callback, concurrency=4, pace=0.05):
+    """
+    Launch URLs with a bounded number of concurrent launches.
+
+    :param urls: list of URLs
+    :param launch_callback: callable launching one URL, raises LauncherError on failure
+    :param concurrency: maximum number of launches running at the same time
+    :param pace: minimum delay in seconds between the start of two launches
+
+    :returns: list of (url, error message or None) tuples, in the order of the URLs
+    """
+
+    results = [None] * len(urls)
+    # from the command line or the settings, a negative delay would make time.sleep() fail
+    pace = max(0.0, pace or 0.0)
+
+    def launch(index, url):
+        try:
+            launch_callback(url)
+        except LauncherError as e:
+            log.error('Could not launch using URL "{}": {}'.format(url, e))
+            return index, "{}".format(e)
+        except Exception as e:
+            # one failing URL must not abort the launch of the others
+            log.exception('Unexpected error while launching using URL "{}"'.format(url))
+            return index, "Unexpected error: {}".format(e)
+        log.info('Launched URL "{}"'.format(url))
+        return index, None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = []
+        for index, url in enumerate(urls):
+            if index and pace:
+                # pacing so the desktop does not stall under a burst of new windows
+                time.sleep(pace)
+            futures.append(executor.submit(launch, index, url))
+        for future in concurrent.futures.as_completed(futures):
+            index, error = future.result()
+            results[index] = (urls[index], error)
+    return results
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compiled command line templates.
+
+A template like 'xterm -T "{name}" -e "telnet {host} {port}"' is parsed once
+into literal segments and placeholders. "{{" and "}}" are literal braces and
+any other brace (e.g. in AppleScript lists) is kept as is.
+"""
+
+import re
+import shlex
+import functools
+
+from gns3_webclient_pack.launcher_error import LauncherError
+
+# placeholders that can be used in command lines
+KNOWN_PLACEHOLDERS = frozenset((
+    "host",
+    "port",
+    "url",
+    "display",
+    "name",
+    "project",
+    "project_id",
+    "node_id",
+    "link_id",
+    "protocol",
+    "pcap_file",
+))
+
+_TOKEN_RE = re.compile(r"\{\{|\}\}|\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_MARKER_RE = re.compile("\x00([0-9]+)\x00")
+
+# characters changing how shlex splits a command line
+_SHELL_CHARS = frozenset(" \t\r\n'\"\\")
+
+
+def _parse(template):
+
+    segments = []
+    position = 0
+    for match in _TOKEN_RE.finditer(template):
+        if match.start() > position:
+            segments.append((False, template[position:match.start()]))
+        token = match.group(0)
+        if match.group(1):
+            segments.append((True, match.group(1)))
+        else:
+            # "{{" or "}}"
+            segments.append((False, token[0]))
+        position = match.end()
+    if position < len(template):
+        segments.append((False, template[position:]))
+
+    # merge consecutive literal segments
+    merged = []
+    for segment in segments:
+        if merged and not segment[0] and not merged[-1][0]:
+            merged[-1] = (False, merged[-1][1] + segment[1])
+        else:
+            merged.append(segment)
+    return tuple(merged)
+
+
+def _is_shell_neutral(value):
+
+    return value != "" and not _SHELL_CHARS.intersection(value)
+
+
+class CommandTemplate:
+    """
+    Command line template parsed into literal segments and placeholders.
+
+    :param template: command line with placeholders
+    """
+
+    __slots__ = ("_template", "_segments", "_placeholders", "_argv")
+
+    def __init__(self, template):
+
+        self._template = template
+        self._segments = _parse(template)
+        self._placeholders = frozenset(text for is_placeholder, text in self._segments if is_placeholder)
+        self._argv = None
+
+        unknown = self._placeholders - KNOWN_PLACEHOLDERS
+        if unknown:
+            raise LauncherError("Unknown placeholder(s) {} in command '{}'".format(
+                ", ".join("{" + name + "}" for name in sorted(unknown)), template))
+
+    def template(self):
+        """
+        Returns the template text.
+        """
+
+        return self._template
+
+    def placeholders(self):
+        """
+        Returns the names of the placeholders used by the template.
+        """
+
+        return self._placeholders
+
+    def argv(self):
+        """
+        Returns the template split into arguments, each argument being
+        a tuple of segments (the split is only done once).
+        """
+
+        if self._argv is None:
+            # split the template with each placeholder replaced by a marker
+            # that shlex keeps untouched in the argument it belongs to
+            text = "".join("\x00{}\x00".format(index) if is_placeholder else text
+                           for index, (is_placeholder, text) in enumerate(self._segments))
+            try:
+                args = shlex.split(text)
+            except ValueError as e:
+                raise LauncherError("Cannot parse '{}': {}".format(self._template, e))
+
+            argv = []
+            for arg in args:
+                pieces = []
+                for index, piece in enumerate(_MARKER_RE.split(arg)):
+                    if index % 2:
+                        pieces.append((True, self._segments[int(piece)][1]))
+                    elif piece:
+                        pieces.append((False, piece))
+                argv.append(tuple(pieces))
+            self._argv = tuple(argv)
+        return self._argv
+
+    def _value(self, values, name):
+
+        try:
+            return str(values[name])
+        except KeyError as e:
+            raise LauncherError("{} could not be replaced in command '{}'".format(e, self._template))
+
+    def render(self, values):
+        """
+        Replace the placeholders by their values.
+
+        :param values: placeholder values (dict)
+
+        :returns: command line
+        """
+
+        return "".join(self._value(values, text) if is_placeholder else text for is_placeholder, text in self._segments)
+
+    def renderArgs(self, values):
+        """
+        Replace the placeholders by their values and split the command line into arguments.
+
+        :param values: placeholder values (dict)
+
+        :returns: list of arguments
+        """
+
+        rendered = {name: self._value(values, name) for name in self._placeholders}
+        if all(_is_shell_neutral(value) for value in rendered.values()):
+            # values cannot change how the command is split: reuse the pre-split arguments
+            return ["".join(rendered[text] if is_placeholder else text for is_placeholder, text in arg) for arg in self.argv()]
+
+        command = self.render(values)
+        try:
+            return shlex.split(command)
+        except ValueError as e:
+            raise LauncherError("Cannot parse '{}': {}".format(command, e))
+
+
+@functools.lru_cache(maxsize=64)
+def compile_template(template):
+    """
+    Returns the compiled version of a command line template, cached by template text.
+
+    :param template: command line with placeholders
+
+    :returns: CommandTemplate instance
+    """
+
+    return CommandTemplate(template)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Coalescing of duplicate launch requests.
+
+A double-click in the web UI or a browser retrying a protocol handler can start
+several launchers for the same URL. The first launcher creates a marker file,
+named after the normalized URL, with an exclusive create. Launchers finding a
+marker younger than the coalescing window drop their request. An expired
+marker is replaced by the single launcher which creates its lock file.
+"""
+
+import os
+import time
+import hashlib
+import urllib.parse
+
+import logging
+log = logging.getLogger(__name__)
+
+MARKERS_DIRECTORY = "launches"
+
+
+def normalize_url(url):
+    """
+    Returns a normalized version of a gns3+ URL so equivalent URLs are identical.
+
+    :param url: URL to normalize
+    """
+
+    try:
+        parsed = urllib.parse.urlparse(url.strip())
+        host = (parsed.hostname or "").lower()
+        if not host or host in ("0.0.0.0", "0:0:0:0:0:0:0:0", "::"):
+            host = "localhost"
+        port = parsed.port or ""
+        query = sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True))
+    except ValueError:
+        # let the launcher report invalid URLs
+        return url.strip()
+    return "{}://{}:{}/{}?{}".format(parsed.scheme.lower(),
+                                     host,
+                                     port,
+                                     parsed.path.strip("/"),
+                                     urllib.parse.urlencode(query))
+
+
+def marker_path(url, directory):
+    """
+    Returns the path of the marker file of a URL.
+
+    :param url: URL to launch
+    :param directory: directory of the marker files
+    """
+
+    digest = hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+    return os.path.join(directory, MARKERS_DIRECTORY, digest)
+
+
+def _create_marker(path):
+
+    fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+    finally:
+        os.close(fd)
+
+
+def _marker_age(path, window):
+
+    try:
+        return time.time() - os.stat(path).st_mtime
+    except FileNotFoundError:
+        return window
+
+
+def _remove_marker(path):
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _prune_markers(directory, max_age):
+
+    now = time.time()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if now - entry.stat().st_mtime > max_age:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def claim_launch(url, window, directory):
+    """
+    Claims the launch of a URL for this process.
+
+    :param url: URL to launch
+    :param window: seconds during which identical requests are dropped (0 to disable)
+    :param directory: directory where the marker files are created
+
+    :returns: False if the same URL has been launched less than window seconds ago
+    """
+
+    if not window:
+        return True
+
+    path = marker_path(url, directory)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            _create_marker(path)
+        except FileExistsError:
+            age = _marker_age(path, window)
+            if age < window:
+                log.info('Dropping duplicate launch request for "{}" (same URL launched {:.1f} seconds ago)'.format(url, age))
+                return False
+
+            # expired marker: it is only replaced by the launcher which creates the lock file,
+            # the others drop their request
+            lock_path = path + ".lock"
+            for attempt in range(2):
+                try:
+                    _create_marker(lock_path)
+                    break
+                except FileExistsError:
+                    if attempt or _marker_age(lock_path, window) < window:
+                        log.info('Dropping duplicate launch request for "{}"'.format(url))
+                        return False
+                    # left by a launcher stopped while replacing the marker: the claim is retried
+                    _remove_marker(lock_path)
+            try:
+                # the marker may have been replaced before the lock was created
+                if _marker_age(path, window) < window:
+                    log.info('Dropping duplicate launch request for "{}"'.format(url))
+                    return False
+                _remove_marker(path)
+                # a launcher may create a new marker once this one is removed
+                _create_marker(path)
+            except FileExistsError:
+                log.info('Dropping duplicate launch request for "{}"'.format(url))
+                return False
+            finally:
+                _remove_marker(lock_path)
+        _prune_markers(os.path.dirname(path), max(window, 60))
+    except OSError as e:
+        # never prevent a launch because the markers cannot be written
+        log.warning("Cannot check for duplicate launch requests: {}".format(e))
+    return True
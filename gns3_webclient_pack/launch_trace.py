@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Per-stage launch tracing.
+
+Spans are recorded with monotonic timestamps and written in the Chrome trace
+event format (JSON array format, one event per line) so a trace file can be
+opened with chrome://tracing or https://ui.perfetto.dev. Each launcher process
+appends its events to the same file, identified by its pid.
+
+Tracing is enabled with the --trace option of the launcher or by setting the
+GNS3_WEBCLIENT_TRACE environment variable.
+"""
+
+import os
+import json
+import time
+import atexit
+import threading
+import contextlib
+
+import logging
+log = logging.getLogger(__name__)
+
+TRACE_ENV_VARIABLE = "GNS3_WEBCLIENT_TRACE"
+TRACE_FILENAME = "launcher-trace.json"
+
+# start again with a new file when the trace gets bigger than this
+MAX_TRACE_FILE_SIZE = 5 * 1024 * 1024
+
+_lock = threading.Lock()
+_events = []
+_enabled = False
+_path = None
+
+
+def _timestamp(seconds):
+
+    # Chrome trace timestamps are in microseconds
+    return round(seconds * 1000000, 1)
+
+
+def is_enabled():
+    """
+    Returns whether launch tracing is enabled.
+    """
+
+    return _enabled
+
+
+def enable(path, dump_at_exit=True):
+    """
+    Enables launch tracing.
+
+    :param path: trace file the events are appended to
+    :param dump_at_exit: write the events when the process exits
+    """
+
+    global _enabled, _path
+    if dump_at_exit and not _enabled:
+        atexit.register(dump)
+    _enabled = True
+    _path = path
+
+
+def disable():
+    """
+    Disables launch tracing and drops the events not yet written.
+    """
+
+    global _enabled, _path
+    _enabled = False
+    _path = None
+    with _lock:
+        del _events[:]
+
+
+def enabled_from_environment():
+    """
+    Returns whether the environment asks for launch tracing.
+    """
+
+    return os.environ.get(TRACE_ENV_VARIABLE, "").lower() not in ("", "0", "false", "no")
+
+
+def add_span(name, start, end, **args):
+    """
+    Records a span measured by the caller.
+
+    :param name: span name
+    :param start: time.perf_counter() value at the start of the span
+    :param end: time.perf_counter() value at the end of the span
+    :param args: extra information displayed with the span
+    """
+
+    if not _enabled:
+        return
+    event = {
+        "name": name,
+        "cat": "launcher",
+        "ph": "X",
+        "ts": _timestamp(start),
+        "dur": _timestamp(end - start),
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = {key: "{}".format(value) for key, value in args.items()}
+    with _lock:
+        _events.append(event)
+
+
+@contextlib.contextmanager
+def span(name, **args):
+    """
+    Context manager recording the time spent in a block.
+
+    :param name: span name
+    :param args: extra information displayed with the span
+    """
+
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        args["error"] = e.__class__.__name__
+        raise
+    finally:
+        add_span(name, start, time.perf_counter(), **args)
+
+
+def events():
+    """
+    Returns a copy of the events not yet written.
+    """
+
+    with _lock:
+        return list(_events)
+
+
+def dump():
+    """
+    Appends the recorded events to the trace file.
+    """
+
+    with _lock:
+        pending, _events[:] = list(_events), []
+    if not _path or not pending:
+        return
+
+    lines = []
+    if not os.path.exists(_path) or os.path.getsize(_path) > MAX_TRACE_FILE_SIZE:
+        mode = "w"
+        # the closing bracket is optional in the JSON array format which lets processes append to the file
+        lines.append("[\n")
+    else:
+        mode = "a"
+    lines.extend(json.dumps(event, sort_keys=True) + ",\n" for event in pending)
+    try:
+        os.makedirs(os.path.dirname(_path), exist_ok=True)
+        with open(_path, mode, encoding="utf-8") as f:
+            f.write("".join(lines))
+    except OSError as e:
+        log.warning("Cannot write the launch trace to {}: {}".format(_path, e))
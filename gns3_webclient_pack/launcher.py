@@ -16,31 +16,39 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import time
+_IMPORTS_START = time.perf_counter()
+
 import os
 import sys
 import subprocess
 import shlex
-import psutil
 import urllib.parse
 import datetime
+import argparse
 
 try:
-    from gns3_webclient_pack.qt import QtCore, QtGui, QtWidgets, QtNetwork
+    from gns3_webclient_pack.qt import QtCore
 except ImportError:
     raise SystemExit("Can't import Qt modules: Qt and/or PyQt is probably not installed correctly...")
 
+# only what every launch needs is imported here, the other modules
+# (QtWidgets, QtNetwork, psutil, packet capture, resident service...)
+# are imported by the code paths using them
 from gns3_webclient_pack.local_config import LocalConfig
-from gns3_webclient_pack.settings import COMMANDS_SETTINGS, CONTROLLER_SETTINGS
+from gns3_webclient_pack.settings_sections import CommandsSettings, ControllerSettings, LauncherSettings
 from gns3_webclient_pack.version import __version__
-from gns3_webclient_pack.utils.bring_to_front import bring_window_to_front_from_pid
-from gns3_webclient_pack.application import Application
 from gns3_webclient_pack.main import checks
 from gns3_webclient_pack.launcher_error import LauncherError
-from gns3_webclient_pack.pcap_stream import PcapStream
+from gns3_webclient_pack.command_template import compile_template
+from gns3_webclient_pack import launch_trace
+from gns3_webclient_pack.utils.profiler import profiled
 
 import logging
 log = logging.getLogger(__name__)
 
+_IMPORTS_END = time.perf_counter()
+
 
 class Command(object):
 
@@ -55,65 +63,98 @@ class Command(object):
     @staticmethod
     def gnome_terminal_env():
 
-        uid = os.getuid()
-
-        # get list of processes of current user
-        procs = [p.info for p in psutil.process_iter(
-            attrs=['name', 'pid', 'ppid', 'create_time', 'uids']
-        ) if p.info['uids'].real == uid]
-
-        # get pid of gnome-terminal-server process
-        gnome_terminal_server_pid = [p['pid'] for p in procs if p['name'] == "gnome-terminal-server"]
-        if not gnome_terminal_server_pid:
-            return {}
-        gnome_terminal_server_pid = gnome_terminal_server_pid[0]
+        from gns3_webclient_pack.utils.gnome_terminal import gnome_terminal_env, CACHE_FILENAME
+        return gnome_terminal_env(os.path.join(LocalConfig.instance().configDirectory(), CACHE_FILENAME))
 
-        # get subprocesses of gnome-terminal-server
-        gnome_terminal_server_children = [p for p in procs if p['ppid'] == gnome_terminal_server_pid]
-        gnome_terminal_server_children.sort(key=lambda p: p['create_time'], reverse=True)
+    @staticmethod
+    def resolve_executable(program):
 
-        # return the gnome-terminal environment variables of the first subprocess named telnet
-        for proc in gnome_terminal_server_children:
-            if proc['name'] == "telnet":
-                try:
-                    env = psutil.Process(proc['pid']).environ()
-                    if 'GNOME_TERMINAL_SERVICE' in env and \
-                            'GNOME_TERMINAL_SCREEN' in env:
-                        return {'GNOME_TERMINAL_SERVICE': env['GNOME_TERMINAL_SERVICE'],
-                                'GNOME_TERMINAL_SCREEN': env['GNOME_TERMINAL_SCREEN']}
-                except psutil.Error:
-                    pass
-        return {}
+        from gns3_webclient_pack.utils.executables import ExecutableCache
+        return ExecutableCache.instance().resolve(program)
 
     def _exec_command(self, command):
         """
         Execute a command using subprocess
 
-        :param command: command with all variables replaced
+        :param command: command with all variables replaced (string on Windows, list of arguments or string on other platforms)
         """
 
         if sys.platform.startswith("win"):
             # use the string on Windows
-            process = subprocess.Popen(command, env=os.environ)
+            with launch_trace.span("spawn"):
+                process = subprocess.Popen(command, env=os.environ)
         else:
             # use arguments on other platforms
-            try:
-                args = shlex.split(command)
-            except ValueError as e:
-                raise LauncherError("Cannot parse '{}': {}".format(command, e))
+            if isinstance(command, list):
+                args = command
+            else:
+                try:
+                    args = shlex.split(command)
+                except ValueError as e:
+                    raise LauncherError("Cannot parse '{}': {}".format(command, e))
+            if not args:
+                raise LauncherError("The command is empty")
 
             env = os.environ.copy()
             # special case to force gnome-terminal to correctly use tabs on Linux
-            if sys.platform.startswith("linux") and "gnome-terminal" in args[0] and "--tab" in command:
+            if sys.platform.startswith("linux") and "gnome-terminal" in args[0] and "--tab" in args:
                 # inject gnome-terminal environment variables
                 if "GNOME_TERMINAL_SERVICE" not in env or "GNOME_TERMINAL_SCREEN" not in env:
-                    env.update(self.gnome_terminal_env())
-            process = subprocess.Popen(args, env=env)
+                    with launch_trace.span("gnome_terminal_env"):
+                        env.update(self.gnome_terminal_env())
+
+            # a missing program is reported before any process is created
+            with launch_trace.span("executable_resolve", program=args[0]):
+                executable = self.resolve_executable(args[0])
+            if executable is None:
+                raise LauncherError("Program '{}' cannot be found, please check it is installed and in your PATH".format(args[0]))
+            args = [executable] + list(args[1:])
+            with launch_trace.span("spawn", program=args[0]):
+                process = subprocess.Popen(args, env=env)
 
         if sys.platform.startswith("win") and not hasattr(sys, '_called_from_test'):
             # bring the launched application to the front (Windows only)
+            from gns3_webclient_pack.utils.bring_to_front import bring_window_to_front_from_pid
             bring_window_to_front_from_pid(process.pid)
 
+    def _values(self, template):
+        """
+        Returns the values of the place-holders used by a command template.
+
+        :param template: CommandTemplate instance
+        """
+
+        values = dict(self._params)
+        values.update({
+            "host": self._host,
+            "port": str(self._port),
+            "url": self._url,
+            "name": self._params.get("name", "").replace('"', '\\"'),
+            "project": self._params.get("project", "").replace('"', '\\"')
+        })
+
+        placeholders = template.placeholders()
+        if "display" in placeholders:
+            if not self._url.startswith("gns3+vnc"):
+                raise LauncherError("The {display} parameter is only supported for the gns3+vnc protocol scheme")
+            values["display"] = str(self._port - 5900)
+
+        if "pcap_file" in placeholders:
+            raise LauncherError("The {pcap_file} parameter is only supported for the gns3+pcap protocol scheme")
+        return values
+
+    def render(self, command_line):
+        """
+        Replace the place-holders of a command line by the actual values
+
+        :param command_line: command line with place-holders
+
+        :returns: command ready to be executed
+        """
+
+        template = compile_template(command_line)
+        return template.render(self._values(template)).strip()
+
     def launch(self, command_line):
         """
         Launch a command
@@ -121,37 +162,28 @@ class Command(object):
         :param command_line: command line to be launched
         """
 
-        # replace the place-holders by the actual values
-        command = command_line.replace("{host}", self._host)
-        command = command.replace("{port}", str(self._port))
-        command = command.replace("{url}", self._url)
-        command = command.replace("{name}", self._params.get("name", "").replace('"', '\\"'))
-        command = command.replace("{project}", self._params.get("project", "").replace('"', '\\"'))
-
-        if "{display}" in command_line:
-            if not self._url.startswith("gns3+vnc"):
-                raise LauncherError("The {{display}} parameter is only supported for the gns3+vnc protocol scheme")
+        with launch_trace.span("template_render"):
+            template = compile_template(command_line)
+            values = self._values(template)
+            if sys.platform.startswith("win"):
+                command = template.render(values).strip()
             else:
-                command = command.replace("{display}", str(self._port - 5900))
-
-        if "{pcap_file}" in command_line:
-            raise LauncherError("The {{pcap_file}} parameter is only supported for the gns3+pcap protocol scheme")
-
-        try:
-            # replace the other params
-            command = command.format(**self._params)
-        except KeyError as e:
-            raise LauncherError("{} could not be replaced in command '{}'".format(e, command))
+                # the template is only split once, the values are inserted in the arguments
+                command = template.renderArgs(values)
 
         try:
-            self._exec_command(command.strip())
+            self._exec_command(command)
         except (OSError, subprocess.SubprocessError) as e:
             raise LauncherError("Cannot start command  '{}': {}".format(command, e))
 
 
-def launcher(argv):
+def parse_url(argv):
     """
-    Parse the URL and launch the command.
+    Parse a gns3+ URL.
+
+    :param argv: URL to parse
+
+    :returns: tuple with the parsed URL and the URL data used to launch the command
     """
 
     try:
@@ -173,30 +205,47 @@ def launcher(argv):
             url_data["params"] = {k: v[0] for k, v in params.items()}
     except ValueError as e:
         raise LauncherError("Cannot parse URL '{}': {}".format(argv, e))
+    return url, url_data
 
+
+def launcher(argv, command_settings=None):
+    """
+    Parse the URL and launch the command.
+
+    :param argv: URL to launch
+    :param command_settings: CommandsSettings section, loaded from the config if not provided
+    """
+
+    with launch_trace.span("url_parse"):
+        url, url_data = parse_url(argv)
     local_config = LocalConfig.instance()
-    command_settings = local_config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
+    if command_settings is None:
+        with launch_trace.span("settings_load", section="CommandsSettings"):
+            command_settings = local_config.section(CommandsSettings)
     if url.scheme == "gns3+telnet":
-        command_line = command_settings["telnet_command"]
+        command_line = command_settings.telnet_command
         log.info('Launching Telnet command: "{}"'.format(command_line))
     elif url.scheme == "gns3+vnc":
         if url.port and url.port < 5900:
             raise LauncherError("VNC requires a port superior or equal to 5900, current port is '{}'".format(url.port))
-        command_line = command_settings["vnc_command"]
+        command_line = command_settings.vnc_command
         log.info('Launching VNC command: "{}"'.format(command_line))
     elif url.scheme == "gns3+spice":
-        command_line = command_settings["spice_command"]
+        command_line = command_settings.spice_command
         log.info('Launching SPICE command: "{}"'.format(command_line))
     elif url.scheme == "gns3+pcap":
-        command_line = command_settings["pcap_command"]
-        controller_settings = local_config.loadSectionSettings("ControllerSettings", CONTROLLER_SETTINGS)
-        protocol = controller_settings["protocol"]
-        accept_invalid_ssl_certificates = controller_settings["accept_invalid_ssl_certificates"]
-        jwt_token = controller_settings["token"]
-        user = controller_settings["username"]
-        password = controller_settings["password"]
+        command_line = command_settings.pcap_command
+        controller_settings = local_config.section(ControllerSettings)
         log.info('Launching PCAP command: "{}"'.format(command_line))
-        pcap_stream = PcapStream(command_line, protocol, user, password, jwt_token, accept_invalid_ssl_certificates, **url_data)
+        with launch_trace.span("pcap_imports"):
+            from gns3_webclient_pack.pcap_stream import PcapStream
+        pcap_stream = PcapStream(command_line,
+                                 controller_settings.protocol,
+                                 controller_settings.username,
+                                 controller_settings.password,
+                                 controller_settings.token,
+                                 controller_settings.accept_invalid_ssl_certificates,
+                                 **url_data)
         pcap_stream.start()
         return
     else:
@@ -210,12 +259,12 @@ def launcher(argv):
     command.launch(command_line)
 
 
-def configure_logging(level):
+def configure_logging(level, filename="launcher.log"):
     """
     Save logging info to a file.
     """
 
-    logfile = os.path.join(LocalConfig.instance().configDirectory(), "launcher.log")
+    logfile = os.path.join(LocalConfig.instance().configDirectory(), filename)
     logger = logging.getLogger()
     logger.setLevel(level)
 
@@ -233,15 +282,206 @@ def configure_logging(level):
         log.warning("Cannot save log to {}: {}".format(logfile, e))
 
 
+def run_service(idle_timeout):
+    """
+    Run the resident launcher service until it has been idle for too long.
+
+    :param idle_timeout: seconds without request before exiting (0 to never exit)
+    """
+
+    from gns3_webclient_pack.launcher_service import LauncherService
+    app = QtCore.QCoreApplication(sys.argv)
+    # changes made with the config application are picked up without polling
+    LocalConfig.instance().startWatching()
+    service = LauncherService(launcher, idle_timeout)
+    try:
+        service.listen()
+    except LauncherError as e:
+        log.critical("{}".format(e))
+        raise SystemExit("{}".format(e))
+    exit_code = app.exec_()
+    service.close()
+    sys.exit(exit_code)
+
+
+def application():
+    """
+    Returns the Qt application, it is only created when first needed.
+    """
+
+    from gns3_webclient_pack.qt import QtWidgets
+    from gns3_webclient_pack.application import Application
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        with launch_trace.span("qt_application"):
+            app = Application(sys.argv)
+    return app
+
+
+def show_error(message):
+    """
+    Show an error message box, building the GUI if required.
+
+    :param message: error message
+    """
+
+    application()
+    from gns3_webclient_pack.qt import QtWidgets
+    QtWidgets.QMessageBox.critical(None, "GNS3 Command launcher {}".format(__version__), message)
+
+
+def launch_without_gui(url):
+    """
+    Launch a console URL without creating a Qt application.
+    The GUI is only built if an error has to be shown.
+
+    :param url: URL to launch
+    """
+
+    try:
+        launcher(url)
+    except LauncherError as e:
+        show_error("{}".format(e))
+        log.critical("Could not launch using URL: {}".format(e))
+        raise SystemExit("{}".format(e))
+
+
+def is_duplicate_launch(url, window):
+    """
+    Returns whether the same URL has been launched, by any launcher process,
+    less than window seconds ago. Otherwise the launch is claimed for this process.
+
+    :param url: URL to launch
+    :param window: coalescing window in seconds (0 to disable)
+    """
+
+    if not window:
+        return False
+    from gns3_webclient_pack.launch_coalescing import claim_launch
+    with launch_trace.span("coalesce"):
+        return not claim_launch(url, window, LocalConfig.instance().configDirectory())
+
+
+def launch_batch(urls, concurrency, pace, coalesce_window=0):
+    """
+    Launch several URLs from this process and report how each launch ended.
+    The config is loaded once and packet captures get their own launcher process.
+
+    :param urls: list of URLs
+    :param concurrency: maximum number of concurrent launches
+    :param pace: minimum delay in seconds between two launches
+    :param coalesce_window: seconds during which a URL already launched is not launched again
+    """
+
+    from gns3_webclient_pack.batch_launcher import batch_launch, spawn_launcher
+
+    command_settings = LocalConfig.instance().section(CommandsSettings)
+
+    def launch(url):
+        if is_duplicate_launch(url, coalesce_window):
+            return
+        if url.lower().startswith("gns3+pcap:"):
+            spawn_launcher(url)
+        else:
+            launcher(url, command_settings)
+
+    log.info("Launching {} URLs ({} concurrent launches)".format(len(urls), concurrency))
+    results = batch_launch(urls, launch, concurrency, pace)
+    failures = []
+    for url, error in results:
+        # the log is also written to stdout
+        if error:
+            failures.append("{}: {}".format(url, error))
+            log.info("FAILED {}: {}".format(url, error))
+        else:
+            log.info("OK {}".format(url))
+
+    log.info("{} of {} URLs launched".format(len(results) - len(failures), len(results)))
+    if failures:
+        show_error("{} of {} launches failed:\n\n{}".format(len(failures), len(results), "\n".join(failures)))
+        raise SystemExit(1)
+
+
+@profiled("launcher")
 def main():
     """
     Entry point for GNS3 WebClient launcher
     """
 
     checks()
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("urls", nargs="*", metavar="url", help="URL to launch (several URLs are launched in batch)")
+    parser.add_argument("--file", help="Launch the URLs listed in a file, one per line ('-' for stdin)")
+    parser.add_argument("--concurrency", help="Maximum number of concurrent launches in batch", type=int)
+    parser.add_argument("--pace", help="Minimum delay in seconds between two launches in batch", type=float)
+    parser.add_argument("--resident", help="Hand over the launch to a resident launcher service (started if needed)", action="store_true", default=False)
+    parser.add_argument("--service", help="Run the resident launcher service", action="store_true", default=False)
+    parser.add_argument("--no-coalesce", help="Launch even if the same URL has just been launched (used when the URL has already been claimed)", action="store_true", default=False)
+    parser.add_argument("--trace", help="Append per-stage launch timings to {} in the config directory".format(launch_trace.TRACE_FILENAME), action="store_true", default=False)
+    options, _ = parser.parse_known_args()
+
+    config_load_start = time.perf_counter()
+    # launches never rewrite the config file unless a setting is changed (e.g. a refreshed token)
+    local_config = LocalConfig.instance(read_only=True)
+    config_load_end = time.perf_counter()
+    if options.trace or launch_trace.enabled_from_environment():
+        # the trace file is next to the launcher log
+        launch_trace.enable(os.path.join(local_config.configDirectory(), launch_trace.TRACE_FILENAME))
+        launch_trace.add_span("imports", _IMPORTS_START, _IMPORTS_END)
+        launch_trace.add_span("config_load", config_load_start, config_load_end, path=local_config.configFilePath())
+
+    launcher_settings = local_config.section(LauncherSettings)
+    if options.service:
+        configure_logging(logging.INFO, "launcher-service.log")
+        run_service(launcher_settings.resident_idle_timeout)
+        return
+
     configure_logging(logging.INFO)
-    app = Application(sys.argv)
+    current_year = datetime.date.today().year
+    log.info("GNS3 WebClient launcher version {}".format(__version__))
+    log.info("Copyright (c) {} GNS3 Technologies Inc.".format(current_year))
 
+    if options.file or len(options.urls) > 1:
+        urls = list(options.urls)
+        try:
+            if options.file:
+                from gns3_webclient_pack.batch_launcher import read_urls
+                urls.extend(read_urls(options.file))
+        except LauncherError as e:
+            show_error("{}".format(e))
+            raise SystemExit("{}".format(e))
+        concurrency = options.concurrency or launcher_settings.batch_concurrency
+        pace = launcher_settings.batch_pace if options.pace is None else options.pace
+        launch_batch(urls, concurrency, pace, 0 if options.no_coalesce else launcher_settings.coalesce_window)
+        return
+
+    url = options.urls[0] if options.urls else None
+    coalesce_window = 0 if options.no_coalesce else launcher_settings.coalesce_window
+
+    # Telnet, VNC and SPICE consoles only need to spawn a command: no Qt application is created
+    if url and not url.lower().startswith("gns3+pcap:"):
+        if is_duplicate_launch(url, coalesce_window):
+            return
+        from gns3_webclient_pack.launcher_service import is_forwardable, forward_url, start_service
+        if is_forwardable(url) and (options.resident or launcher_settings.resident_mode):
+            try:
+                if forward_url(url):
+                    log.info('URL "{}" handed over to the launcher service'.format(url))
+                    return
+            except LauncherError as e:
+                show_error("{}".format(e))
+                log.critical("Could not launch using URL: {}".format(e))
+                raise SystemExit("{}".format(e))
+            # no service is running yet: launch in this process and start one for the next launches
+            start_service()
+        launch_without_gui(url)
+        return
+
+    app = application()
+
+    from gns3_webclient_pack.qt import QtNetwork
     if QtNetwork.QSslSocket.supportsSsl():
         log.info(f"SSL is supported, version: {QtNetwork.QSslSocket().sslLibraryBuildVersionString()}")
 
@@ -273,7 +513,8 @@ def main():
         QtCore.QTimer.singleShot(2000, loop.quit)
 
         if not loop.isRunning():
-            loop.exec_()
+            with launch_trace.span("macos_url_wait"):
+                loop.exec_()
 
         try:
             if not url_open_requests and hasattr(sys, "frozen"):
@@ -282,28 +523,26 @@ def main():
                 subprocess.Popen(["gns3-webclient-config"], env=os.environ)
                 sys.exit(0)
         except (OSError, subprocess.SubprocessError) as e:
-            QtWidgets.QMessageBox.critical(None, "GNS3 Command launcher {}".format(__version__), "Cannot start the WebClient config: {}".format(e))
+            show_error("Cannot start the WebClient config: {}".format(e))
             sys.exit(1)
 
-    current_year = datetime.date.today().year
-    log.info("GNS3 WebClient launcher version {}".format(__version__))
-    log.info("Copyright (c) {} GNS3 Technologies Inc.".format(current_year))
-
     try:
         if url_open_requests:
             url = url_open_requests.pop()
-        else:
-            url = sys.argv[1]
+        elif not url:
+            raise IndexError
+        if is_duplicate_launch(url, coalesce_window):
+            return
         launcher(url)
     except IndexError:
         if hasattr(sys, "frozen"):
             program = sys.executable
         else:
             program = __file__
-        QtWidgets.QMessageBox.critical(None, "GNS3 Command launcher {}".format(__version__), "usage: {} <url>".format(program))
+        show_error("usage: {} <url>".format(program))
         raise SystemExit("usage: {} <url>".format(program))
     except LauncherError as e:
-        QtWidgets.QMessageBox.critical(None, "GNS3 Command launcher {}".format(__version__), "{}".format(e))
+        show_error("{}".format(e))
         log.critical("Could not launch using URL: {}".format(e))
         raise SystemExit("{}".format(e))
 
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Resident launcher service. The service keeps Qt and the config loaded so
+later launcher invocations only have to hand their URL over a local socket.
+"""
+
+import os
+import sys
+import socket
+import subprocess
+
+from gns3_webclient_pack.qt import QtCore, qpartial
+from gns3_webclient_pack.local_config import LocalConfig
+from gns3_webclient_pack.launcher_error import LauncherError
+from gns3_webclient_pack import launch_trace
+from gns3_webclient_pack.utils.file_lock import FileLock
+
+import logging
+log = logging.getLogger(__name__)
+
+# QtNetwork is only imported by the service and on Windows: on other platforms
+# forwarding a URL is done with a plain Unix socket to keep the client light.
+
+# packet captures keep a network stream open for their whole lifetime
+# so they are always handled by their own launcher process
+FORWARDABLE_SCHEMES = ("gns3+telnet", "gns3+vnc", "gns3+spice")
+
+# lock serializing the start of the services, in the config directory
+SERVICE_LOCK_FILENAME = "launcher-service.lock"
+
+# seconds to wait for another service to start
+SERVICE_LOCK_TIMEOUT = 5
+
+
+def is_forwardable(url):
+    """
+    Returns whether a URL can be handed over to the resident service.
+
+    :param url: URL to launch
+    """
+
+    return url.lower().startswith(tuple(scheme + ":" for scheme in FORWARDABLE_SCHEMES))
+
+
+def service_address():
+    """
+    Returns the address the resident service listens on: a Unix socket
+    in the config directory or a named pipe on Windows.
+    """
+
+    if sys.platform.startswith("win"):
+        return "gns3-webclient-launcher-{}".format(os.environ.get("USERNAME", "default"))
+    return os.path.join(LocalConfig.instance().configDirectory(), "launcher.sock")
+
+
+def _sendWithUnixSocket(address, data, timeout):
+
+    if not os.path.exists(address):
+        return None
+    reply = b""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            sock.sendall(data)
+            while not reply.endswith(b"\n"):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                reply += chunk
+    except OSError as e:
+        log.debug("Cannot reach the launcher service on '{}': {}".format(address, e))
+        return None
+    return reply
+
+
+def _sendWithLocalSocket(address, data, timeout):
+
+    from gns3_webclient_pack.qt import QtNetwork
+    sock = QtNetwork.QLocalSocket()
+    sock.connectToServer(address)
+    if not sock.waitForConnected(500):
+        log.debug("Cannot reach the launcher service on '{}': {}".format(address, sock.errorString()))
+        return None
+    sock.write(data)
+    sock.waitForBytesWritten(timeout * 1000)
+    reply = b""
+    while not reply.endswith(b"\n") and sock.waitForReadyRead(timeout * 1000):
+        reply += bytes(sock.readAll())
+    sock.disconnectFromServer()
+    return reply
+
+
+def forward_url(url, timeout=10):
+    """
+    Hands a URL over to the resident launcher service.
+
+    :param url: URL to launch
+    :param timeout: seconds to wait for the service to reply
+
+    :returns: True if the service launched the URL, False if no service is running
+    """
+
+    address = service_address()
+    data = url.encode("utf-8") + b"\n"
+    if sys.platform.startswith("win"):
+        reply = _sendWithLocalSocket(address, data, timeout)
+    else:
+        reply = _sendWithUnixSocket(address, data, timeout)
+
+    reply = (reply or b"").decode("utf-8", errors="replace").strip()
+    if not reply:
+        return False
+    status, _, message = reply.partition(" ")
+    if status != "OK":
+        raise LauncherError(message)
+    return True
+
+
+def launcher_command(*args):
+    """
+    Returns the command line to run the launcher in another process.
+
+    :param args: launcher arguments
+    """
+
+    if hasattr(sys, "frozen"):
+        return [sys.executable] + list(args)
+    return [sys.executable, "-m", "gns3_webclient_pack.launcher"] + list(args)
+
+
+def start_service():
+    """
+    Starts the resident launcher service in a detached process.
+    """
+
+    command = launcher_command("--service")
+
+    kwargs = {}
+    if sys.platform.startswith("win"):
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+
+    log.info("Starting the resident launcher service")
+    try:
+        subprocess.Popen(command,
+                         stdin=subprocess.DEVNULL,
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL,
+                         **kwargs)
+    except (OSError, subprocess.SubprocessError) as e:
+        log.warning("Cannot start the resident launcher service: {}".format(e))
+
+
+class LauncherService(QtCore.QObject):
+    """
+    Local socket server launching the URLs sent by other launcher processes.
+
+    Each request is a single line with the URL, the reply is a single line
+    with "OK" or "ERROR <message>".
+
+    :param launch_callback: callable launching a URL, raises LauncherError on failure
+    :param idle_timeout: seconds without request before the service exits (0 to never exit)
+    """
+
+    def __init__(self, launch_callback, idle_timeout=3600, parent=None):
+
+        from gns3_webclient_pack.qt import QtNetwork
+
+        super().__init__(parent)
+        self._launch_callback = launch_callback
+        self._server = QtNetwork.QLocalServer(self)
+        self._server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._newConnectionSlot)
+
+        self._idle_timeout = idle_timeout
+        self._idle_timer = QtCore.QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.timeout.connect(self._idleTimeoutSlot)
+
+    def listen(self):
+        """
+        Starts listening for launch requests.
+        """
+
+        from gns3_webclient_pack.qt import QtNetwork
+
+        address = service_address()
+        lock_path = os.path.join(LocalConfig.instance().configDirectory(), SERVICE_LOCK_FILENAME)
+        try:
+            # services started at the same time must not remove the socket of each other
+            with FileLock(lock_path, timeout=SERVICE_LOCK_TIMEOUT):
+                probe = QtNetwork.QLocalSocket()
+                probe.connectToServer(address)
+                if probe.waitForConnected(500):
+                    probe.disconnectFromServer()
+                    raise LauncherError("A launcher service is already listening on '{}'".format(address))
+
+                if not sys.platform.startswith("win"):
+                    os.makedirs(os.path.dirname(address), exist_ok=True)
+
+                # nothing answers: remove any socket left behind by a service that did not exit cleanly
+                QtNetwork.QLocalServer.removeServer(address)
+                if not self._server.listen(address):
+                    raise LauncherError("Cannot start the launcher service on '{}': {}".format(address, self._server.errorString()))
+        except OSError as e:
+            raise LauncherError("Cannot start the launcher service on '{}': {}".format(address, e))
+        log.info("Launcher service listening on '{}'".format(address))
+        self._restartIdleTimer()
+
+    def close(self):
+        """
+        Stops listening for launch requests.
+        """
+
+        self._idle_timer.stop()
+        self._server.close()
+
+    def _restartIdleTimer(self):
+
+        if self._idle_timeout:
+            self._idle_timer.start(self._idle_timeout * 1000)
+
+    def _idleTimeoutSlot(self):
+
+        log.info("Launcher service idle for {} seconds, exiting".format(self._idle_timeout))
+        self.close()
+        QtCore.QCoreApplication.quit()
+
+    def _newConnectionSlot(self):
+
+        while self._server.hasPendingConnections():
+            connection = self._server.nextPendingConnection()
+            connection.disconnected.connect(connection.deleteLater)
+            connection.readyRead.connect(qpartial(self._readyReadSlot, connection))
+
+    def _readyReadSlot(self, connection):
+
+        if not connection.canReadLine():
+            return
+        url = bytes(connection.readLine()).decode("utf-8", errors="replace").strip()
+        connection.write(self.handleRequest(url).encode("utf-8") + b"\n")
+        connection.flush()
+        connection.disconnectFromServer()
+        self._restartIdleTimer()
+
+    def handleRequest(self, url):
+        """
+        Launches a URL received from another launcher process.
+
+        :param url: URL to launch
+
+        :returns: reply to send back
+        """
+
+        log.info('Launch request received for "{}"'.format(url))
+        if not is_forwardable(url):
+            return "ERROR Protocol not supported by the launcher service in URL '{}'".format(url)
+
+        try:
+            with launch_trace.span("service_request", url=url):
+                # make sure a change made with the config application just before is used
+                LocalConfig.instance().checkConfigChanged()
+                self._launch_callback(url)
+        except LauncherError as e:
+            log.error("Could not launch using URL: {}".format(e))
+            return "ERROR {}".format(e)
+        except Exception as e:
+            # an unexpected error must not stop the service or leave the client without a reply
+            log.exception("Unexpected error while launching using URL '{}'".format(url))
+            return "ERROR {}".format(e)
+        finally:
+            # the service runs for a long time, write the trace of each request
+            launch_trace.dump()
+        return "OK"
@@ -18,31 +18,169 @@
 import sys
 import os
 import json
-import shutil
+import hashlib
 import copy
+import types
+import contextlib
 
 from .qt import QtCore
 from .version import __version__, __version_info__
+from .utils.atomic_write import atomic_write
 
 import logging
 log = logging.getLogger(__name__)
 
+# format of the config file, stored in its "format" key:
+# 1 (no "format" key): JSON indented with 4 spaces
+# 2: compact JSON
+CONFIG_FORMAT = 2
+
+# top-level keys which are not settings sections
+METADATA_KEYS = ("type", "version", "format")
+
+# orjson takes about 20 ms to import, it is only used once a config
+# file is large enough for its faster parsing to make up for it
+FAST_JSON_THRESHOLD = 256 * 1024
+
+# orjson module, False if it is not installed, None until needed
+_fast_json = None
+
+
+def _freeze(value):
+    """
+    Returns a read-only copy of a setting value.
+    """
+
+    if isinstance(value, dict):
+        return types.MappingProxyType({name: _freeze(item) for name, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def config_directory():
+    """
+    Returns the configuration directory, without loading the config.
+    """
+
+    if sys.platform.startswith("win"):
+        appdata = os.path.expandvars("%APPDATA%")
+        path = os.path.join(appdata, "GNS3", "WebClient")
+    else:
+        home = os.path.expanduser("~")
+        path = os.path.join(home, ".config", "GNS3", "WebClient")
+
+    return os.path.normpath(path)
+
+
+def _fastJson():
+    """
+    Returns the orjson module or None if it is not installed.
+    """
+
+    global _fast_json
+    if _fast_json is None:
+        try:
+            import orjson
+            _fast_json = orjson
+        except ImportError:
+            _fast_json = False
+    return _fast_json or None
+
+
+class ConfigSerializer:
+    """
+    Encodes and decodes the config files.
+
+    :param pretty: sorted keys indented with 4 spaces, for humans (compact otherwise)
+    """
+
+    def __init__(self, pretty=False):
+
+        self._pretty = pretty
+
+    def dumps(self, config):
+        """
+        Encode a config.
+
+        :param config: config (dict)
+
+        :returns: bytes
+        """
+
+        if not self._pretty and _fast_json:
+            try:
+                return _fast_json.dumps(config, option=_fast_json.OPT_SORT_KEYS)
+            except TypeError:
+                # e.g. non string keys, which json converts
+                pass
+        if self._pretty:
+            return json.dumps(config, sort_keys=True, indent=4).encode("utf-8")
+        return json.dumps(config, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        """
+        Decode a config, whatever its format.
+
+        :param data: bytes
+
+        :returns: decoded config
+        :raises ValueError: if the content is not valid
+        """
+
+        if len(data) >= FAST_JSON_THRESHOLD and _fastJson():
+            return _fast_json.loads(data)
+        return json.loads(data.decode("utf-8"))
+
+
+def migrate_config(config):
+    """
+    Upgrades a config read from a file to the current format.
+
+    :param config: decoded config, modified in place
+
+    :returns: config
+    """
+
+    if not isinstance(config, dict):
+        return config
+    config_format = config.get("format", 1)
+    if not isinstance(config_format, int) or config_format > CONFIG_FORMAT:
+        log.warning("Config format {!r} is not supported by this version, some settings may be ignored".format(config_format))
+        return config
+    # format 2 only changed the encoding, the upgrades of the sections go here
+    config["format"] = CONFIG_FORMAT
+    return config
+
 
 class LocalConfig(QtCore.QObject):
     """
     Handles the local settings.
     """
 
-    config_changed_signal = QtCore.Signal()
+    # emitted with the set of the changed section names
+    config_changed_signal = QtCore.Signal(object)
 
-    def __init__(self, config_file=None):
+    def __init__(self, config_file=None, read_only=False):
         """
         :param config_file: Path to the config file (override all other config, useful for tests)
+        :param read_only: only write the config file when a setting is explicitly changed
         """
 
         super().__init__()
         self._profile = None
         self._config_file = config_file
+        self._read_only = read_only
+        self._pending_sections = set()
+        # sections changed with setSettings(), announced once written
+        self._changed_sections = set()
+        self._batch_depth = 0
+        self._batch_snapshot = None
+        self._write_delay = 0
+        self._write_timer = None
+        self._watcher = None
+        self._reload_timer = None
+        self._serializer = ConfigSerializer()
         self._resetLoadConfig()
 
     def _resetLoadConfig(self):
@@ -52,6 +190,14 @@ class LocalConfig(QtCore.QObject):
         """
 
         self._settings = {}
+        self._section_views = {}
+        self._section_objects = {}
+        # validated values of the typed sections loaded from the snapshot
+        self._snapshot_sections = {}
+        self._pending_sections = set()
+        # content of the user config file as last read or written
+        self._config_hash = None
+        self._file_settings = {}
         self._last_config_changed = None
         if sys.platform.startswith("win"):
             filename = "webclient_pack.ini"
@@ -71,44 +217,140 @@ class LocalConfig(QtCore.QObject):
         if not self._config_file:
             self._config_file = os.path.join(self.configDirectory(), filename)
 
-        # First load system wide settings
-        if os.path.exists(system_wide_config_file):
-            self._readConfig(system_wide_config_file)
-
         config_file_in_cwd = os.path.join(os.getcwd(), filename)
         if os.path.exists(config_file_in_cwd):
             # use any config file present in the current working directory
             self._config_file = config_file_in_cwd
-        elif not os.path.exists(self._config_file):
+
+        snapshot_path = snapshot_key = None
+        if self._read_only:
+            # the merged and defaulted config is loaded from the snapshot unless one of its sources has changed
+            snapshot_path = self._config_file + ".snapshot"
+            snapshot_key = self._snapshotKey((system_wide_config_file, self._config_file))
+            if self._loadSnapshot(snapshot_path, snapshot_key):
+                return
+
+        # First load system wide settings
+        if os.path.exists(system_wide_config_file):
+            self._readConfig(system_wide_config_file)
+
+        if self._read_only:
+            if os.path.exists(self._config_file):
+                self._readConfig(self._config_file)
+            else:
+                # the defaults are used, the file is created by the first explicit change
+                log.debug("Config file %s does not exist, using default settings", self._config_file)
+                self._last_config_changed = 0
+            self._saveSnapshot(snapshot_path, snapshot_key)
+            return
+
+        if not os.path.exists(self._config_file):
             try:
                 # create the config file if it doesn't exist
                 os.makedirs(os.path.dirname(self._config_file), exist_ok=True)
 
                 # create a new config
-                with open(self._config_file, "w", encoding="utf-8") as f:
-                    json.dump({"version": __version__, "type": "settings"}, f)
+                with open(self._config_file, "wb") as f:
+                    f.write(self._serializer.dumps({"version": __version__, "type": "settings", "format": CONFIG_FORMAT}))
 
             except OSError as e:
                 log.error("Could not create the config file {}: {}".format(self._config_file, e))
 
-        user_settings = self._readConfig(self._config_file)
         # overwrite system wide settings with user specific ones
-        self._settings.update(user_settings)
+        self._readConfig(self._config_file)
         self.writeConfig()
 
+    @staticmethod
+    def _snapshotKey(layers):
+        """
+        Returns what identifies the content of the config layers
+        and the default settings merged with them.
+
+        :param layers: paths of the config files
+        """
+
+        # the default commands depend on the console clients detected
+        from .utils.console_detection import detection_key
+        key = [__version__, detection_key()]
+        for path in layers:
+            try:
+                stat = os.stat(path)
+                key.append([path, stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                key.append([path, None, None])
+        return key
+
+    def _loadSnapshot(self, path, key):
+        """
+        Load the merged and defaulted config from a snapshot.
+
+        :param path: snapshot path
+        :param key: key of the current config layers
+
+        :returns: True if the snapshot was valid and loaded
+        """
+
+        try:
+            with open(path, "rb") as f:
+                snapshot = self._serializer.loads(f.read())
+            if snapshot["key"] != key:
+                log.debug("Config snapshot %s is outdated", path)
+                return False
+            settings = snapshot["settings"]
+            file_settings = snapshot["file_settings"]
+            sections = snapshot["sections"]
+            if not isinstance(settings, dict) or not isinstance(file_settings, dict) or not isinstance(sections, dict):
+                raise ValueError("invalid content")
+            self._settings = settings
+            self._file_settings = file_settings
+            self._snapshot_sections = sections
+            self._config_hash = snapshot["config_hash"]
+            self._last_config_changed = snapshot["last_config_changed"]
+        except FileNotFoundError:
+            return False
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            log.debug("Could not load the config snapshot {}: {}".format(path, e))
+            return False
+        log.debug("Config loaded from snapshot %s", path)
+        return True
+
+    def _saveSnapshot(self, path, key):
+        """
+        Save the merged config layers, with the default values and the
+        validated typed settings of the sections, to a snapshot.
+
+        :param path: snapshot path
+        :param key: key of the config layers
+        """
+
+        from .settings_sections import SECTION_CLASSES
+        sections = {section_class.SECTION: self.section(section_class).toDict() for section_class in SECTION_CLASSES}
+        snapshot = {
+            "key": key,
+            "settings": self._settings,
+            "file_settings": self._file_settings,
+            "sections": sections,
+            "config_hash": self._config_hash,
+            "last_config_changed": self._last_config_changed
+        }
+        try:
+            atomic_write(path, self._serializer.dumps(snapshot))
+        except (OSError, TypeError, ValueError) as e:
+            log.debug("Could not save the config snapshot {}: {}".format(path, e))
+
+    def isReadOnly(self):
+        """
+        Returns whether the config file is only written when a setting is explicitly changed.
+        """
+
+        return self._read_only
+
     def configDirectory(self):
         """
         Get the configuration directory
         """
 
-        if sys.platform.startswith("win"):
-            appdata = os.path.expandvars("%APPDATA%")
-            path = os.path.join(appdata, "GNS3", "WebClient")
-        else:
-            home = os.path.expanduser("~")
-            path = os.path.join(home, ".config", "GNS3", "WebClient")
-
-        return os.path.normpath(path)
+        return config_directory()
 
     def _readConfig(self, config_path):
         """
@@ -117,18 +359,20 @@ class LocalConfig(QtCore.QObject):
 
         log.debug("Load config from %s", config_path)
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
+            with open(config_path, "rb") as f:
                 self._last_config_changed = os.stat(config_path).st_mtime
-                config = json.load(f)
-                self._settings.update(config)
+                data = f.read()
+            config = migrate_config(self._serializer.loads(data))
+            self._settings.update(config)
+            if config_path == self._config_file:
+                self._config_hash = hashlib.sha256(data).hexdigest()
+                # the settings are edited in place (e.g. defaults added), this must stay what is on disk
+                self._file_settings = copy.deepcopy(config)
         except (ValueError, OSError) as e:
             log.error("Could not read the config file {}: {}".format(self._config_file, e))
 
-        # Update already loaded section
-        for section in self._settings.keys():
-            if isinstance(self._settings[section], dict):
-                self.loadSectionSettings(section, self._settings[section])
-
+        # the loaded sections have to be viewed again
+        self._invalidateSection()
         return dict()
 
     def writeConfig(self):
@@ -136,27 +380,318 @@ class LocalConfig(QtCore.QObject):
         Write the configuration file.
         """
 
-        self._settings["version"] = __version__
+        self._notifyChanges(self._writeConfig())
+
+    def _writeConfig(self):
+        """
+        Write the whole configuration file.
+
+        :returns: sections changed in the file by another process
+        """
+
+        try:
+            with self._fileLock():
+                changed = self._mergeFileChanges(self._pending_sections)[1]
+                self._settings["version"] = __version__
+                self._settings["format"] = CONFIG_FORMAT
+                self._dumpConfig(self._settings)
+        except OSError as e:
+            log.error("Could not write the config file {}: {}".format(self._config_file, e))
+            return set()
+        return changed
+
+    def exportConfig(self, path):
+        """
+        Export the settings, indented for humans. The exported
+        file can be used as a config file.
+
+        :param path: path of the exported file
+
+        :raises OSError: if the file cannot be written
+        """
+
+        config = dict(self._settings, version=__version__, format=CONFIG_FORMAT)
+        config.setdefault("type", "settings")
+        with open(path, "wb") as f:
+            f.write(ConfigSerializer(pretty=True).dumps(config))
+        log.info("Configuration exported to {}".format(path))
+
+    def _writeSections(self, sections):
+        """
+        Write only some sections on top of the current content of the
+        config file, the other sections are left as they are on disk.
+
+        :param sections: names of the sections to write
+
+        :returns: sections changed in the file by another process
+        """
+
         try:
-            temporary = os.path.join(os.path.dirname(self._config_file), "gns3_gui.tmp")
-            with open(temporary, "w", encoding="utf-8") as f:
-                json.dump(self._settings, f, sort_keys=True, indent=4)
-            shutil.move(temporary, self._config_file)
+            with self._fileLock():
+                config, changed = self._mergeFileChanges(sections)
+                if config is None:
+                    # unreadable config file: replace it with what we have
+                    config = copy.deepcopy(self._settings)
+                config.setdefault("type", "settings")
+                for section in sections:
+                    config[section] = copy.deepcopy(self._settings[section])
+                config["version"] = __version__
+                config["format"] = CONFIG_FORMAT
+                self._dumpConfig(config)
+        except OSError as e:
+            log.error("Could not write the config file {}: {}".format(self._config_file, e))
+            return set()
+        return changed
+
+    def _fileLock(self):
+        """
+        Returns the lock serializing the writers of the config file.
+        Readers do not take it: the file is always replaced atomically.
+        """
+
+        from .utils.file_lock import FileLock
+        return FileLock(self._config_file + ".lock")
+
+    def _saveChanges(self, sections):
+        """
+        Save changed sections, the write is postponed until the end of
+        a batch or until the write delay has expired.
+
+        :param sections: names of the changed sections
+        """
+
+        self._pending_sections.update(sections)
+        if self._batch_depth:
+            return
+        if self._write_delay and self._write_timer is not None:
+            self._write_timer.start(self._write_delay)
+        else:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the pending changes now: the whole config is written unless in read-only mode.
+        """
+
+        if self._write_timer is not None:
+            self._write_timer.stop()
+        if not self._pending_sections:
+            return
+        sections = self._pending_sections
+        try:
+            if self._read_only:
+                changed = self._writeSections(sections)
+            else:
+                changed = self._writeConfig()
+        finally:
+            self._pending_sections = set()
+            changed_sections, self._changed_sections = self._changed_sections, set()
+        # a single signal for the changes made here and those reloaded from the file
+        self._notifyChanges(changed | changed_sections)
+
+    def hasPendingChanges(self):
+        """
+        Returns whether some changes have not been written yet.
+        """
+
+        return bool(self._pending_sections)
+
+    def setWriteDelay(self, delay):
+        """
+        Debounce writes: changes are written once no other change has
+        been made for the given delay. Requires a Qt event loop.
+
+        :param delay: delay in milliseconds (0 to write immediately)
+        """
+
+        self._write_delay = delay
+        if delay and self._write_timer is None:
+            self._write_timer = QtCore.QTimer(self)
+            self._write_timer.setSingleShot(True)
+            self._write_timer.timeout.connect(self.flush)
+        elif not delay:
+            self.flush()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager grouping changes to several sections in a single write.
+        If an exception is raised in the block, the changes are rolled back.
+
+        Example:
+            with LocalConfig.instance().batch():
+                local_config.saveSectionSettings("CommandsSettings", commands_settings)
+                local_config.saveSectionSettings("ControllerSettings", controller_settings)
+        """
+
+        if self._batch_depth == 0:
+            self._batch_snapshot = (copy.deepcopy(self._settings), set(self._pending_sections), set(self._changed_sections))
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                log.debug("Configuration changes rolled back")
+                self._settings, self._pending_sections, self._changed_sections = self._batch_snapshot
+                self._batch_snapshot = None
+                self._invalidateSection()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._batch_snapshot = None
+            if self._pending_sections:
+                self._saveChanges(())
+
+    def _dumpConfig(self, config):
+        """
+        Write the config with atomic_write(), readers always see either the
+        previous or the new content. Must be called with the file lock held.
+        """
+
+        try:
+            data = self._serializer.dumps(config)
+            atomic_write(self._config_file, data)
             log.debug("Configuration save to %s", self._config_file)
             self._last_config_changed = os.stat(self._config_file).st_mtime
+            # our own write must not be seen as a change made by another process
+            self._config_hash = hashlib.sha256(data).hexdigest()
+            self._file_settings = copy.deepcopy(config)
         except (ValueError, OSError) as e:
             log.error("Could not write the config file {}: {}".format(self._config_file, e))
 
     def checkConfigChanged(self):
+        """
+        Reload the config file if it has been changed by another process.
+        When the config file is watched, only a change waiting for the
+        debounce delay is processed, otherwise the file is polled.
+
+        Pending changes are not flushed first: the sections they change
+        keep their value and the other sections are reloaded.
+        """
+
+        if self._watcher is not None:
+            if self._reload_timer.isActive():
+                self._reload_timer.stop()
+                self._reloadConfig()
+            return
 
         try:
-            if self._last_config_changed and self._last_config_changed < os.stat(self._config_file).st_mtime:
-                log.debug("Client config has changed, reloading it...")
-                self._readConfig(self._config_file)
-                self.config_changed_signal.emit()
+            if self._last_config_changed is not None and self._last_config_changed < os.stat(self._config_file).st_mtime:
+                self._reloadConfig()
         except OSError as e:
             log.error("Error when checking for changes {}: {}".format(self._config_file, str(e)))
 
+    def _reloadConfig(self):
+        """
+        Reload the sections changed in the config file by another process and
+        emit config_changed_signal with them. Sections with changes not written
+        yet are kept as they are.
+        """
+
+        self._notifyChanges(self._mergeFileChanges(self._pending_sections)[1])
+
+    def _mergeFileChanges(self, keep):
+        """
+        Apply the sections changed in the config file by another process.
+
+        :param keep: sections keeping their current value (not written yet)
+
+        :returns: tuple with the config file content (None if it cannot be read) and the changed sections
+        """
+
+        try:
+            with open(self._config_file, "rb") as f:
+                mtime = os.stat(self._config_file).st_mtime
+                data = f.read()
+        except FileNotFoundError:
+            # deleted or not created yet
+            return {}, set()
+        except OSError as e:
+            log.error("Could not read the config file {}: {}".format(self._config_file, e))
+            return None, set()
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self._config_hash:
+            # same content (e.g. our own write or a touch)
+            self._last_config_changed = mtime
+            return copy.deepcopy(self._file_settings), set()
+
+        try:
+            config = migrate_config(self._serializer.loads(data))
+        except ValueError as e:
+            log.warning("Could not reload the config file {}: {}".format(self._config_file, e))
+            return None, set()
+        if not isinstance(config, dict):
+            return None, set()
+
+        changed = set()
+        for section, value in config.items():
+            if section not in METADATA_KEYS and self._file_settings.get(section) != value and section not in keep:
+                changed.add(section)
+                self._settings[section] = copy.deepcopy(value)
+                self._invalidateSection(section)
+
+        self._config_hash = digest
+        self._file_settings = copy.deepcopy(config)
+        self._last_config_changed = mtime
+        return config, changed
+
+    def _notifyChanges(self, changed):
+
+        if changed:
+            log.debug("Client config has changed, sections %s", ",".join(sorted(changed)))
+            self.config_changed_signal.emit(changed)
+
+    def startWatching(self, debounce=200):
+        """
+        Watch the config file and reload it when another process changes it.
+        Requires a Qt event loop.
+
+        :param debounce: milliseconds to wait for a write-then-rename sequence to complete
+        """
+
+        if self._watcher is not None:
+            return
+        self._reload_timer = QtCore.QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(debounce)
+        self._reload_timer.timeout.connect(self._reloadConfig)
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._configFileChangedSlot)
+        # the directory is watched as well because the file is replaced when written
+        self._watcher.directoryChanged.connect(self._configFileChangedSlot)
+        self._watchPaths()
+
+    def stopWatching(self):
+        """
+        Stop watching the config file.
+        """
+
+        if self._watcher is None:
+            return
+        self._reload_timer.stop()
+        self._watcher.deleteLater()
+        self._reload_timer.deleteLater()
+        self._watcher = None
+        self._reload_timer = None
+
+    def _watchPaths(self):
+
+        if self._watcher is None:
+            return
+        directory = os.path.dirname(self._config_file)
+        if os.path.isdir(directory) and directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        if os.path.exists(self._config_file) and self._config_file not in self._watcher.files():
+            self._watcher.addPath(self._config_file)
+
+    def _configFileChangedSlot(self, path):
+
+        # a file replaced by a rename is no longer watched
+        self._watchPaths()
+        self._reload_timer.start()
+
     def configFilePath(self):
         """
         Returns the config file path.
@@ -173,8 +708,12 @@ class LocalConfig(QtCore.QObject):
         :returns: path to the config file.
         """
 
+        debounce = self._reload_timer.interval() if self._watcher is not None else None
+        self.stopWatching()
         self._config_file = config_file
         self._resetLoadConfig()
+        if debounce is not None:
+            self.startWatching(debounce)
 
     def settings(self):
         """
@@ -193,45 +732,132 @@ class LocalConfig(QtCore.QObject):
         """
 
         if self._settings != settings:
+            changed = [name for name, value in settings.items() if self._settings.get(name) != value]
             self._settings.update(settings)
-            self.writeConfig()
-            self.config_changed_signal.emit()
+            self._invalidateSection()
+            # config_changed_signal is emitted when the change is written
+            self._changed_sections.update(changed)
+            self._saveChanges(changed)
 
     def loadSectionSettings(self, section, default_settings):
         """
-        Get all the settings from a given section.
+        Get a copy of all the settings from a given section.
 
+        :param section: section name
         :param default_settings: setting names and default values (dict)
 
         :returns: settings (dict)
         """
 
-        settings = self.settings().get(section, dict())
-        changed = False
+        # only this section is copied, it can be edited and given back to saveSectionSettings()
+        return copy.deepcopy(self._mergeDefaults(section, default_settings))
+
+    def sectionView(self, section, default_settings):
+        """
+        Get a read-only view of the settings of a given section.
+        The view is cached until the section changes, use
+        loadSectionSettings() to get a copy that can be edited.
+
+        :param section: section name
+        :param default_settings: setting names and default values (dict)
+
+        :returns: settings (read-only mapping)
+        """
+
+        view = self._section_views.get(section)
+        if view is None:
+            view = self._section_views[section] = _freeze(self._mergeDefaults(section, default_settings))
+        return view
+
+    def section(self, section_class):
+        """
+        Get the typed settings of a section, validated once and cached until
+        the section changes.
+
+        :param section_class: SettingsSection subclass (e.g. CommandsSettings)
+
+        :returns: section_class instance
+        """
+
+        section = self._section_objects.get(section_class.SECTION)
+        if type(section) is not section_class:
+            section = None
+            values = self._snapshot_sections.get(section_class.SECTION)
+            if values is not None:
+                try:
+                    section = section_class.fromValues(values)
+                except (AttributeError, KeyError, TypeError) as e:
+                    log.debug("Invalid section {} in the config snapshot: {}".format(section_class.SECTION, e))
+            if section is None:
+                section = section_class.fromSettings(self.sectionView(section_class.SECTION, section_class.defaults()))
+            self._section_objects[section_class.SECTION] = section
+        return section
+
+    def saveSection(self, section):
+        """
+        Save typed settings.
+
+        :param section: SettingsSection instance
+        """
+
+        self.saveSectionSettings(section.SECTION, section.toDict())
+
+    def _invalidateSection(self, section=None):
+        """
+        Drop the cached views and typed settings of a section.
+
+        :param section: section name (all the sections if None)
+        """
+
+        if section is None:
+            self._section_views.clear()
+            self._section_objects.clear()
+            self._snapshot_sections.clear()
+        else:
+            self._section_views.pop(section, None)
+            self._section_objects.pop(section, None)
+            self._snapshot_sections.pop(section, None)
+
+    def _mergeDefaults(self, section, default_settings):
+        """
+        Add the missing default values to a section.
+
+        :param section: section name
+        :param default_settings: setting names and default values (dict)
+
+        :returns: settings of the section (not a copy)
+        """
+
+        missing = []
 
         def _copySettings(local, default):
             """
             Copy only existing settings, ignore the other.
             Add default values if require.
             """
-            nonlocal changed
 
             # use default values for missing settings
             for name, value in default.items():
                 if name not in local:
-                    local[name] = value
-                    changed = True
+                    local[name] = copy.deepcopy(value)
+                    missing.append(name)
                 elif isinstance(value, dict):
                     local[name] = _copySettings(local[name], default[name])
             return local
 
-        settings = _copySettings(settings, default_settings)
-        self._settings[section] = settings
+        settings = self._settings.get(section)
+        if not isinstance(settings, dict):
+            settings = self._settings[section] = {}
+        _copySettings(settings, default_settings)
 
-        if changed:
-            log.debug("Section %s has missing default values. Adding keys %s Saving configuration", section, ','.join(set(default_settings.keys()) - set(settings.keys())))
-            self.writeConfig()
-        return copy.deepcopy(settings)
+        if missing:
+            self._invalidateSection(section)
+            if self._read_only:
+                log.debug("Section %s has missing default values, using them without saving the configuration", section)
+            else:
+                log.debug("Section %s has missing default values. Adding keys %s Saving configuration", section, ",".join(missing))
+                self._saveChanges([section])
+        return settings
 
     def saveSectionSettings(self, section, settings):
         """
@@ -246,19 +872,22 @@ class LocalConfig(QtCore.QObject):
 
         if self._settings[section] != settings:
             self._settings[section].update(copy.deepcopy(settings))
+            self._invalidateSection(section)
             log.debug("Section %s has changed. Saving configuration", section)
-            self.writeConfig()
+            self._saveChanges([section])
         else:
             log.debug("Section %s has not changed. Skip saving configuration", section)
 
     @staticmethod
-    def instance():
+    def instance(read_only=False):
         """
         Singleton to return only on instance of LocalConfig.
 
+        :param read_only: create the instance in read-only mode (ignored if it already exists)
+
         :returns: instance of LocalConfig
         """
 
         if not hasattr(LocalConfig, "_instance") or LocalConfig._instance is None:
-            LocalConfig._instance = LocalConfig()
+            LocalConfig._instance = LocalConfig(read_only=read_only)
         return LocalConfig._instance
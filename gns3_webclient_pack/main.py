@@ -24,19 +24,21 @@ import signal
 import argparse
 
 try:
-    from gns3_webclient_pack.qt import QtCore, QtWidgets
+    from gns3_webclient_pack.qt import QtCore
 except ImportError:
     raise SystemExit("Can't import Qt modules: Qt and/or PyQt is probably not installed correctly...")
 
-from gns3_webclient_pack.main_window import MainWindow
-from gns3_webclient_pack.application import Application
+# the launcher imports this module for checks(): the GUI modules are imported in main()
 from gns3_webclient_pack.utils import parse_version
-from gns3_webclient_pack.utils.install_mime_types import install_mime_types
 from gns3_webclient_pack.version import __version__
+from gns3_webclient_pack.utils.profiler import profiled
 
 import logging
 log = logging.getLogger(__name__)
 
+# milliseconds without any other change before settings edited in the GUI are written
+CONFIG_WRITE_DELAY = 500
+
 
 def locale_check():
     """
@@ -113,6 +115,7 @@ def checks():
         QtCore.QSettings.setDefaultFormat(QtCore.QSettings.IniFormat)
 
 
+@profiled("config")
 def main():
     """
     Entry point for GNS3 WebClient pack
@@ -122,12 +125,22 @@ def main():
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--install-mime-types", help="Install mime types (Linux only)", action="store_true", default=False)
+    parser.add_argument("--export-config", help="Export the settings in a readable format to a file", metavar="path")
     options = parser.parse_args()
 
     if options.install_mime_types:
+        from gns3_webclient_pack.utils.install_mime_types import install_mime_types
         install_mime_types()
         return
 
+    if options.export_config:
+        from gns3_webclient_pack.local_config import LocalConfig
+        try:
+            LocalConfig.instance(read_only=True).exportConfig(options.export_config)
+        except OSError as e:
+            raise SystemExit("Could not export the settings to {}: {}".format(options.export_config, e))
+        return
+
     try:
         import truststore
         truststore.inject_into_ssl()
@@ -135,8 +148,15 @@ def main():
     except ImportError:
         pass
 
+    from gns3_webclient_pack.qt import QtWidgets
+    from gns3_webclient_pack.application import Application
+    from gns3_webclient_pack.main_window import MainWindow
+    from gns3_webclient_pack.local_config import LocalConfig
+
     global app
     app = Application(sys.argv)
+    LocalConfig.instance().setWriteDelay(CONFIG_WRITE_DELAY)
+    LocalConfig.instance().startWatching()
 
     current_year = datetime.date.today().year
     log.info("GNS3 WebClient pack version {}".format(__version__))
@@ -165,6 +185,7 @@ def main():
     mainwindow.show()
 
     exit_code = app.exec_()
+    LocalConfig.instance().flush()
     signal.signal(signal.SIGINT, orig_sigint)
     signal.signal(signal.SIGTERM, orig_sigterm)
 
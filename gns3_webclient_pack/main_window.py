@@ -25,10 +25,10 @@ import sys
 from .local_config import LocalConfig
 from .qt import QtGui, QtCore, QtWidgets, QtNetwork
 from .ui.main_window_ui import Ui_MainWindow
-from .dialogs.about_dialog import AboutDialog
-from .dialogs.command_dialog import CommandDialog
-from .utils.install_mime_types import install_mime_types
-from .settings import (GENERAL_SETTINGS, COMMANDS_SETTINGS, CONTROLLER_SETTINGS)
+from .command_template import compile_template
+from .launcher_error import LauncherError
+from .settings_sections import GeneralSettings, CommandsSettings, ControllerSettings
+# the dialogs are imported when they are first opened
 
 log = logging.getLogger(__name__)
 
@@ -43,9 +43,9 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
     def __init__(self, parent=None):
 
         super().__init__(parent)
-        self._settings = {}
-        self._commands_settings = {}
-        self._controller_settings = {}
+        self._settings = None
+        self._about_dialog = None
+        self._command_dialog = None
         self.setupUi(self)
         self.resize(self.width(), self.minimumHeight())
 
@@ -55,8 +55,8 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self._commands_saved = True
 
         # restore the geometry and state of the main window.
-        self.restoreGeometry(QtCore.QByteArray().fromBase64(self._settings["geometry"].encode()))
-        self.restoreState(QtCore.QByteArray().fromBase64(self._settings["state"].encode()))
+        self.restoreGeometry(QtCore.QByteArray().fromBase64(self._settings.geometry.encode()))
+        self.restoreState(QtCore.QByteArray().fromBase64(self._settings.state.encode()))
 
         # load initial stuff once the event loop isn't busy
         QtCore.QTimer.singleShot(0, self._startupLoading)
@@ -85,31 +85,31 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Loads the settings from the persistent settings file.
         """
 
-        self._settings = self._local_config.loadSectionSettings("GeneralSettings", GENERAL_SETTINGS)
+        self._settings = self._local_config.section(GeneralSettings)
 
         # command settings
-        self._commands_settings = self._local_config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
-        self.uiTelnetCommandLineEdit.setText(self._commands_settings["telnet_command"])
-        self.uiVNCCommandLineEdit.setText(self._commands_settings["vnc_command"])
-        self.uiSPICECommandLineEdit.setText(self._commands_settings["spice_command"])
-        self.uiPacketCaptureCommandLineEdit.setText(self._commands_settings["pcap_command"])
+        commands_settings = self._local_config.section(CommandsSettings)
+        self.uiTelnetCommandLineEdit.setText(commands_settings.telnet_command)
+        self.uiVNCCommandLineEdit.setText(commands_settings.vnc_command)
+        self.uiSPICECommandLineEdit.setText(commands_settings.spice_command)
+        self.uiPacketCaptureCommandLineEdit.setText(commands_settings.pcap_command)
         self.uiPacketCaptureCommandLineEdit.textChanged.connect(self._commandChangedSlot)
         self.uiTelnetCommandLineEdit.textChanged.connect(self._commandChangedSlot)
         self.uiVNCCommandLineEdit.textChanged.connect(self._commandChangedSlot)
         self.uiSPICECommandLineEdit.textChanged.connect(self._commandChangedSlot)
 
         # controller settings
-        self._controller_settings = self._local_config.loadSectionSettings("ControllerSettings", CONTROLLER_SETTINGS)
-        self.uiAcceptInvalidSSLCertificatesCheckBox.setChecked(self._controller_settings["accept_invalid_ssl_certificates"])
-        self.uiProtocolComboBox.setCurrentText(self._controller_settings["protocol"].upper())
-        self.uiUserLineEdit.setText(self._controller_settings["username"])
-        self.uiPasswordLineEdit.setText(self._controller_settings["password"])
+        controller_settings = self._local_config.section(ControllerSettings)
+        self.uiAcceptInvalidSSLCertificatesCheckBox.setChecked(controller_settings.accept_invalid_ssl_certificates)
+        self.uiProtocolComboBox.setCurrentText(controller_settings.protocol.upper())
+        self.uiUserLineEdit.setText(controller_settings.username)
+        self.uiPasswordLineEdit.setText(controller_settings.password)
 
     def settings(self):
         """
         Returns the general settings.
 
-        :returns: settings dictionary
+        :returns: GeneralSettings instance
         """
 
         return self._settings
@@ -118,12 +118,12 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         """
         Set new general settings.
 
-        :param new_settings: settings dictionary
+        :param new_settings: GeneralSettings instance
         """
 
-        self._settings.update(new_settings)
+        self._settings = new_settings
         # save the settings
-        LocalConfig.instance().saveSectionSettings("GeneralSettings", self._settings)
+        LocalConfig.instance().saveSection(self._settings)
 
     def _installMimeSlot(self):
         """
@@ -131,6 +131,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         """
 
         if sys.platform.startswith("linux"):
+            from .utils.install_mime_types import install_mime_types
             install_mime_types()
         else:
             QtWidgets.QMessageBox.critical(self, "MIME types", "Installing MIME types is only possible on Linux")
@@ -154,9 +155,11 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Slot to display the GNS3 About dialog.
         """
 
-        dialog = AboutDialog(self)
-        dialog.show()
-        dialog.exec_()
+        if self._about_dialog is None:
+            from .dialogs.about_dialog import AboutDialog
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.show()
+        self._about_dialog.exec_()
 
     def _commandChangedSlot(self):
         """
@@ -165,13 +168,33 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
         self._commands_saved = False
 
+    def _getCommand(self, console_type, current):
+        """
+        Shows the command dialog, built the first time and reused afterwards.
+
+        :param console_type: telnet, vnc or spice
+        :param current: current console command
+
+        :returns: tuple (ok, command)
+        """
+
+        if self._command_dialog is None:
+            from .dialogs.command_dialog import CommandDialog
+            self._command_dialog = CommandDialog(self, console_type=console_type, current=current)
+        else:
+            self._command_dialog.setCommand(console_type, current)
+        self._command_dialog.show()
+        if self._command_dialog.exec_():
+            return True, self._command_dialog.command()
+        return False, None
+
     def _telnetCommandSlot(self):
         """
         Slot to set a chosen Telnet command.
         """
 
         cmd = self.uiTelnetCommandLineEdit.text()
-        (ok, cmd) = CommandDialog.getCommand(self, console_type="telnet", current=cmd)
+        (ok, cmd) = self._getCommand("telnet", cmd)
         if ok:
             self.uiTelnetCommandLineEdit.setText(cmd)
 
@@ -181,7 +204,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         """
 
         cmd = self.uiVNCCommandLineEdit.text()
-        (ok, cmd) = CommandDialog.getCommand(self, console_type="vnc", current=cmd)
+        (ok, cmd) = self._getCommand("vnc", cmd)
         if ok:
             self.uiVNCCommandLineEdit.setText(cmd)
 
@@ -191,7 +214,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         """
 
         cmd = self.uiSPICECommandLineEdit.text()
-        (ok, cmd) = CommandDialog.getCommand(self, console_type="spice", current=cmd)
+        (ok, cmd) = self._getCommand("spice", cmd)
         if ok:
             self.uiSPICECommandLineEdit.setText(cmd)
 
@@ -210,24 +233,39 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Save the commands in the settings file.
         """
 
-        # save command settings
-        self._commands_settings["telnet_command"] = self.uiTelnetCommandLineEdit.text().strip()
-        self._commands_settings["vnc_command"] = self.uiVNCCommandLineEdit.text().strip()
-        self._commands_settings["spice_command"] = self.uiSPICECommandLineEdit.text().strip()
-        self._commands_settings["pcap_command"] = self.uiPacketCaptureCommandLineEdit.text().strip()
-        LocalConfig.instance().saveSectionSettings("CommandsSettings", self._commands_settings)
-
-        # save controller settings
-        self._controller_settings["accept_invalid_ssl_certificates"] = self.uiAcceptInvalidSSLCertificatesCheckBox.isChecked()
-        self._controller_settings["protocol"] = self.uiProtocolComboBox.currentText().lower()
-        self._controller_settings["username"] = self.uiUserLineEdit.text().strip()
-        self._controller_settings["password"] = self.uiPasswordLineEdit.text().strip()
-        LocalConfig.instance().saveSectionSettings("ControllerSettings", self._controller_settings)
+        # report invalid commands now rather than when they are launched
+        for command_line in (self.uiTelnetCommandLineEdit.text(),
+                             self.uiVNCCommandLineEdit.text(),
+                             self.uiSPICECommandLineEdit.text(),
+                             self.uiPacketCaptureCommandLineEdit.text()):
+            try:
+                compile_template(command_line.strip())
+            except LauncherError as e:
+                QtWidgets.QMessageBox.critical(self, "Command", "{}".format(e))
+                return
 
-        if self._controller_settings["protocol"] == "https" and not QtNetwork.QSslSocket.supportsSsl():
+        # all the sections are saved with a single write
+        local_config = LocalConfig.instance()
+        with local_config.batch():
+
+            # save command settings
+            local_config.saveSection(local_config.section(CommandsSettings).replace(
+                telnet_command=self.uiTelnetCommandLineEdit.text().strip(),
+                vnc_command=self.uiVNCCommandLineEdit.text().strip(),
+                spice_command=self.uiSPICECommandLineEdit.text().strip(),
+                pcap_command=self.uiPacketCaptureCommandLineEdit.text().strip()))
+
+            # save controller settings
+            controller_settings = local_config.section(ControllerSettings).replace(
+                accept_invalid_ssl_certificates=self.uiAcceptInvalidSSLCertificatesCheckBox.isChecked(),
+                protocol=self.uiProtocolComboBox.currentText().lower(),
+                username=self.uiUserLineEdit.text().strip(),
+                password=self.uiPasswordLineEdit.text().strip())
+            local_config.saveSection(controller_settings)
+
+        if controller_settings.protocol == "https" and not QtNetwork.QSslSocket.supportsSsl():
             QtWidgets.QMessageBox.critical(self, "SSL", "SSL is not supported")
 
-        self.setSettings(self._settings)
         self._commands_saved = True
 
     def _resetSlot(self):
@@ -235,12 +273,14 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         Reset the commands to their default value.
         """
 
-        self.uiTelnetCommandLineEdit.setText(COMMANDS_SETTINGS["telnet_command"])
-        self.uiVNCCommandLineEdit.setText(COMMANDS_SETTINGS["vnc_command"])
-        self.uiSPICECommandLineEdit.setText(COMMANDS_SETTINGS["spice_command"])
-        self.uiPacketCaptureCommandLineEdit.setText(COMMANDS_SETTINGS["pcap_command"])
-        self.uiUserLineEdit.setText(CONTROLLER_SETTINGS["username"])
-        self.uiPasswordLineEdit.setText(CONTROLLER_SETTINGS["password"])
+        commands_settings = CommandsSettings.defaults()
+        controller_settings = ControllerSettings.defaults()
+        self.uiTelnetCommandLineEdit.setText(commands_settings["telnet_command"])
+        self.uiVNCCommandLineEdit.setText(commands_settings["vnc_command"])
+        self.uiSPICECommandLineEdit.setText(commands_settings["spice_command"])
+        self.uiPacketCaptureCommandLineEdit.setText(commands_settings["pcap_command"])
+        self.uiUserLineEdit.setText(controller_settings["username"])
+        self.uiPasswordLineEdit.setText(controller_settings["password"])
 
     def closeEvent(self, event):
         """
@@ -258,9 +298,10 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
                 event.ignore()
                 return
 
-        self._settings["geometry"] = bytes(self.saveGeometry().toBase64()).decode()
-        self._settings["state"] = bytes(self.saveState().toBase64()).decode()
-        self.setSettings(self._settings)
+        self.setSettings(self._settings.replace(geometry=bytes(self.saveGeometry().toBase64()).decode(),
+                                                state=bytes(self.saveState().toBase64()).decode()))
+        # write any change still waiting for the write delay
+        LocalConfig.instance().flush()
         self.close()
         event.accept()
 
@@ -26,10 +26,12 @@ from typing import List, Optional
 
 from gns3_webclient_pack.dialogs.login_dialog import LoginDialog
 from gns3_webclient_pack.local_config import LocalConfig
-from gns3_webclient_pack.settings import CONTROLLER_SETTINGS
+from gns3_webclient_pack.token_cache import TOKEN_CACHE_FILENAME, controller_key, load_token, store_token, token_expiry, is_expired
 from gns3_webclient_pack.qt import QtCore, QtWidgets, QtNetwork, qpartial, sip
 from gns3_webclient_pack.version import __version__
 from gns3_webclient_pack.launcher_error import LauncherError
+from gns3_webclient_pack.command_template import compile_template
+from gns3_webclient_pack import launch_trace
 
 
 import logging
@@ -140,14 +142,20 @@ class PcapStream(QtCore.QObject):
             raise LauncherError("SSL is not supported")
 
         try:
-            self._executeHTTPQuery("GET", "/version", wait=True)
+            with launch_trace.span("pcap_version_probe", host=self._host, port=self._port):
+                self._executeHTTPQuery("GET", "/version", wait=True)
             log.info("API version 2 detected")
             endpoint = "pcap"
         except LauncherError as e:
             if e.status() == 404:
                 log.info("API version 3 detected")
                 self._api_version = "v3"
-                self._executeHTTPQuery("GET", "/access/users/me", wait=True)  # check if we are authenticated
+                self._jwt_token = self._cachedToken()
+                if self._jwt_token:
+                    self._executeHTTPQuery("GET", "/access/users/me", wait=True)  # check if we are authenticated
+                elif not self._authenticate():
+                    # no valid token for this controller: authenticate without a request bound to fail
+                    raise LauncherError("Authentication with controller {}:{} is required".format(self._host, self._port))
                 endpoint = "capture/stream"  # pcap endpoint was renamed in v3
             else:
                 raise
@@ -179,7 +187,10 @@ class PcapStream(QtCore.QObject):
         self._capture_file = QtCore.QTemporaryFile()
         self._capture_file.open(QtCore.QFile.WriteOnly)
         self._capture_file.setAutoRemove(True)
-        process = self._startPacketCaptureCommand(self._capture_file.fileName())
+        with launch_trace.span("spawn"):
+            process = self._startPacketCaptureCommand(self._capture_file.fileName())
+        # the capture can run for hours and be killed: write the trace now
+        launch_trace.dump()
 
         response.error.connect(qpartial(self._processError, response))
         response.readyRead.connect(qpartial(self._readPcapStreamCallback, response))
@@ -248,9 +259,29 @@ class PcapStream(QtCore.QObject):
             password = login_dialog.getPassword()
         return username, password
 
-    def _handleUnauthorizedRequest(self, reply: QtNetwork.QNetworkReply) -> None:
+    def _tokenCachePath(self) -> str:
+
+        return os.path.join(LocalConfig.instance().configDirectory(), TOKEN_CACHE_FILENAME)
+
+    def _cachedToken(self) -> Optional[str]:
         """
-        Request the username / password to authenticate with the server
+        Returns the cached token of the controller, None if there is no valid token.
+        """
+
+        key = controller_key(self._protocol, self._host, self._port)
+        token = load_token(self._tokenCachePath(), key)
+        if token is None and self._jwt_token and not is_expired(token_expiry(self._jwt_token)):
+            # token saved in the controller settings by previous versions
+            token = self._jwt_token
+        if token:
+            log.debug("Using cached token for controller {}".format(key))
+        return token
+
+    def _authenticate(self) -> bool:
+        """
+        Authenticate with the controller and cache the token for the next launches
+
+        :returns: False if no credentials were given
         """
 
         if not self._user or not self._password or self._auth_attempted is True:
@@ -259,25 +290,32 @@ class PcapStream(QtCore.QObject):
             username = self._user
             password = self._password
 
-        if username and password:
-            body = {
-                "username": username,
-                "password": password
-            }
-            self._auth_attempted = True
-            content = self._executeHTTPQuery("POST", "/access/users/authenticate", body=body, wait=True)
-            if content:
-                log.info(f"Authenticated with controller {self._host} on port {self._port}")
-                token = content.get("access_token")
-                if token:
-                    self._auth_attempted = False
-                    self._jwt_token = token
-                    # save the token for future sessions
-                    controller_settings = LocalConfig.instance().loadSectionSettings("ControllerSettings", CONTROLLER_SETTINGS)
-                    controller_settings["token"] = token
-                    LocalConfig.instance().saveSectionSettings("ControllerSettings", controller_settings)
-                    return
-        else:
+        if not username or not password:
+            return False
+
+        body = {
+            "username": username,
+            "password": password
+        }
+        self._jwt_token = None
+        self._auth_attempted = True
+        content = self._executeHTTPQuery("POST", "/access/users/authenticate", body=body, wait=True)
+        if content:
+            log.info(f"Authenticated with controller {self._host} on port {self._port}")
+            token = content.get("access_token")
+            if token:
+                self._auth_attempted = False
+                self._jwt_token = token
+                # save the token for the next launches to this controller
+                store_token(self._tokenCachePath(), controller_key(self._protocol, self._host, self._port), token)
+        return True
+
+    def _handleUnauthorizedRequest(self, reply: QtNetwork.QNetworkReply) -> None:
+        """
+        Request the username / password to authenticate with the server
+        """
+
+        if not self._authenticate():
             self._jwt_token = None
             raise LauncherError(f"{reply.errorString()}")
 
@@ -410,9 +448,16 @@ class PcapStream(QtCore.QObject):
         Starts the packet capture command.
         """
 
-        command = self._command_line.replace("{pcap_file}", '"' + capture_file_path + '"')
-        command = command.replace("{name}", self._params.get("name", "unknown packet capture"))
-        command = command.replace("{project}", self._params.get("project", "unknown project"))
+        values = dict(self._params)
+        values.update({
+            "host": self._host,
+            "port": self._port,
+            "url": self._url,
+            "pcap_file": '"' + capture_file_path + '"',
+            "name": self._params.get("name", "unknown packet capture"),
+            "project": self._params.get("project", "unknown project")
+        })
+        command = compile_template(self._command_line).render(values)
 
         if "|" in command:
             # live traffic capture (using tail)
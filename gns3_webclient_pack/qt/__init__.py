@@ -25,6 +25,7 @@ Compatibility layer for Qt bindings, so it is easier to switch to PySide if need
 
 import sys
 import inspect
+import importlib
 import functools
 
 try:
@@ -32,13 +33,24 @@ try:
 except ImportError:
     import sip
 
-from PyQt5 import QtCore, QtGui, QtNetwork, QtWidgets
+from PyQt5 import QtCore
 sys.modules[__name__ + '.QtCore'] = QtCore
-sys.modules[__name__ + '.QtGui'] = QtGui
-sys.modules[__name__ + '.QtNetwork'] = QtNetwork
-sys.modules[__name__ + '.QtWidgets'] = QtWidgets
 sys.modules[__name__ + '.sip'] = sip
 
+# QtGui, QtNetwork and QtWidgets are only imported when first used
+# so that the launcher does not load them for consoles
+_LAZY_MODULES = ("QtGui", "QtNetwork", "QtWidgets")
+
+
+def __getattr__(name):
+
+    if name in _LAZY_MODULES:
+        module = importlib.import_module("PyQt5." + name)
+        sys.modules[__name__ + '.' + name] = module
+        globals()[name] = module
+        return module
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
 QtCore.Signal = QtCore.pyqtSignal
 QtCore.Slot = QtCore.pyqtSlot
 QtCore.Property = QtCore.pyqtProperty
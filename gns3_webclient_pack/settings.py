@@ -21,8 +21,10 @@ Default general settings.
 
 import os
 import sys
-import distro
-import shutil
+
+# settings depending on the console clients installed on the system,
+# computed on first access (see __getattr__)
+DETECTED_SETTINGS = ("PRECONFIGURED_TELNET_COMMANDS", "DEFAULT_TELNET_COMMAND", "COMMANDS_SETTINGS")
 
 
 # Pre-configured Telnet console commands on various OSes
@@ -36,29 +38,20 @@ if sys.platform.startswith("win"):
         # windows 32-bit
         program_files_x86 = program_files = os.environ["PROGRAMFILES"]
 
-    PRECONFIGURED_TELNET_COMMANDS = {'Putty (normal standalone version)': 'putty_standalone.exe -telnet {host} {port} -loghost "{name}"',
-                                     'KiTTY': r'kitty -title "{name}" telnet://{host} {port}',
-                                     'MobaXterm': r'"{}\Mobatek\MobaXterm Personal Edition\MobaXterm.exe" -newtab "telnet {{host}} {{port}}"'.format(program_files_x86),
-                                     'Royal TS V3': r'{}\code4ward.net\Royal TS V3\RTS3App.exe /connectadhoc:{{host}} /adhoctype:terminal /p:IsTelnetConnection="true" /p:ConnectionType="telnet;Telnet Connection" /p:Port="{{port}}" /p:Name="{{name}}"'.format(program_files),
-                                     'Royal TS V5': r'"{}\Royal TS V5\RoyalTS.exe" /protocol:terminal /using:adhoc /uri:"{{host}}" /property:Port="{{port}}" /property:IsTelnetConnection="true" /property:Name="{{name}}"'.format(program_files_x86),
-                                     'SuperPutty': r'SuperPutty.exe -telnet "{host} -P {port} -wt \"{name}\""',
-                                     'SecureCRT': r'"{}\VanDyke Software\SecureCRT\SecureCRT.exe" /N "{{name}}" /T /TELNET {{host}} {{port}}'.format(program_files),
-                                     'SecureCRT (personal profile)': r'"{}\AppData\Local\VanDyke Software\SecureCRT\SecureCRT.exe" /T /N "{{name}}" /TELNET {{host}} {{port}}'.format(userprofile),
-                                     'TeraTerm Pro': r'"{}\teraterm\ttermpro.exe" /W="{{name}}" /M="ttstart.macro" /T=1 {{host}} {{port}}'.format(program_files_x86),
-                                     'Telnet': 'telnet {host} {port}',
-                                     'Xshell 4': r'"{}\NetSarang\Xshell 4\xshell.exe" -url telnet://{{host}}:{{port}}'.format(program_files_x86),
-                                     'Xshell 5': r'"{}\NetSarang\Xshell 5\xshell.exe" -url telnet://{{host}}:{{port}} -newtab {{name}}'.format(program_files_x86),
-                                     'Windows Terminal': r'wt.exe -w 1 new-tab --suppressApplicationTitle --title {name} telnet {host} {port}',
-                                     'ZOC 6': r'"{}\ZOC6\zoc.exe" "/TELNET:{{host}}:{{port}}" /TABBED "/TITLE:{{name}}"'.format(program_files_x86)}
-
-    # default on Windows
-    if shutil.which("Solar-PuTTY.exe"):
-        # Solar-Putty is the default if it is installed.
-        PRECONFIGURED_TELNET_COMMANDS["Solar-Putty (included with GNS3)"] = 'Solar-PuTTY.exe --telnet --hostname {host} --port {port}  --name "{name}"'
-        DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Solar-Putty (included with GNS3)"]
-    else:
-        PRECONFIGURED_TELNET_COMMANDS["Solar-Putty (included with GNS3 downloaded from gns3.com)"] = 'Solar-PuTTY.exe --telnet --hostname {host} --port {port}  --name "{name}"'
-        DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Putty (normal standalone version)"]
+    _WINDOWS_TELNET_COMMANDS = {'Putty (normal standalone version)': 'putty_standalone.exe -telnet {host} {port} -loghost "{name}"',
+                                'KiTTY': r'kitty -title "{name}" telnet://{host} {port}',
+                                'MobaXterm': r'"{}\Mobatek\MobaXterm Personal Edition\MobaXterm.exe" -newtab "telnet {{host}} {{port}}"'.format(program_files_x86),
+                                'Royal TS V3': r'{}\code4ward.net\Royal TS V3\RTS3App.exe /connectadhoc:{{host}} /adhoctype:terminal /p:IsTelnetConnection="true" /p:ConnectionType="telnet;Telnet Connection" /p:Port="{{port}}" /p:Name="{{name}}"'.format(program_files),
+                                'Royal TS V5': r'"{}\Royal TS V5\RoyalTS.exe" /protocol:terminal /using:adhoc /uri:"{{host}}" /property:Port="{{port}}" /property:IsTelnetConnection="true" /property:Name="{{name}}"'.format(program_files_x86),
+                                'SuperPutty': r'SuperPutty.exe -telnet "{host} -P {port} -wt \"{name}\""',
+                                'SecureCRT': r'"{}\VanDyke Software\SecureCRT\SecureCRT.exe" /N "{{name}}" /T /TELNET {{host}} {{port}}'.format(program_files),
+                                'SecureCRT (personal profile)': r'"{}\AppData\Local\VanDyke Software\SecureCRT\SecureCRT.exe" /T /N "{{name}}" /TELNET {{host}} {{port}}'.format(userprofile),
+                                'TeraTerm Pro': r'"{}\teraterm\ttermpro.exe" /W="{{name}}" /M="ttstart.macro" /T=1 {{host}} {{port}}'.format(program_files_x86),
+                                'Telnet': 'telnet {host} {port}',
+                                'Xshell 4': r'"{}\NetSarang\Xshell 4\xshell.exe" -url telnet://{{host}}:{{port}}'.format(program_files_x86),
+                                'Xshell 5': r'"{}\NetSarang\Xshell 5\xshell.exe" -url telnet://{{host}}:{{port}} -newtab {{name}}'.format(program_files_x86),
+                                'Windows Terminal': r'wt.exe -w 1 new-tab --suppressApplicationTitle --title {name} telnet {host} {port}',
+                                'ZOC 6': r'"{}\ZOC6\zoc.exe" "/TELNET:{{host}}:{{port}}" /TABBED "/TITLE:{{name}}"'.format(program_files_x86)}
 
 elif sys.platform.startswith("darwin"):
     # Mac OS X
@@ -127,9 +120,6 @@ elif sys.platform.startswith("darwin"):
         'ZOC 8': '/Applications/zoc8.app/Contents/MacOS/zoc8 "/TELNET:{host}:{port}" /TABBED "/TITLE:{name}"'
     }
 
-    # default Mac OS X Telnet console command
-    DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Terminal"]
-
 else:
     PRECONFIGURED_TELNET_COMMANDS = {'Xterm': 'xterm -T "{name}" -e "telnet {host} {port}"',
                                      'Putty': 'putty -telnet {host} {port} -title "{name}" -sl 2500 -fg SALMON1 -bg BLACK',
@@ -143,36 +133,6 @@ else:
                                      'urxvt': 'urxvt -title {name} -e telnet {host} {port}',
                                      'kitty': 'kitty -T {name} telnet {host} {port}'}
 
-    # default Telnet command on other systems
-    DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Xterm"]
-
-    if sys.platform.startswith("linux"):
-
-        def find_desktop(*desktops):
-            current_desktop = os.getenv('XDG_CURRENT_DESKTOP')
-            if current_desktop:
-                current_desktop = current_desktop.lower()
-                for desktop in desktops:
-                    if desktop in current_desktop:
-                        return True
-            return False
-
-
-        if find_desktop("gnome", "unity", "cinnamon"):
-            DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Gnome Terminal"]
-        elif find_desktop("kde"):
-            DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["KDE Konsole"]
-        elif find_desktop("mate"):
-            DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Mate Terminal"]
-        elif find_desktop("xfce"):
-            DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Xfce4 Terminal"]
-        elif find_desktop("lxde", "lxqt"):
-            DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["LXTerminal"]
-        elif distro.name() in ["Debian", "Ubuntu", "Linux Mint"]:
-            DEFAULT_TELNET_COMMAND = PRECONFIGURED_TELNET_COMMANDS["Gnome Terminal"]
-        elif shutil.which("x-terminal-emulator"):
-            DEFAULT_TELNET_COMMAND = 'x-terminal-emulator -T "{name}" -e "telnet {host} {port}"'
-
 # Pre-configured VNC console commands on various OSes
 if sys.platform.startswith("win"):
     # Windows
@@ -267,13 +227,6 @@ GENERAL_SETTINGS = {
     "state": "",
 }
 
-COMMANDS_SETTINGS = {
-    "telnet_command": DEFAULT_TELNET_COMMAND,
-    "vnc_command": DEFAULT_VNC_COMMAND,
-    "spice_command": DEFAULT_SPICE_COMMAND,
-    "pcap_command": DEFAULT_PACKET_CAPTURE_READER_COMMAND
-}
-
 CUSTOM_COMMANDS_SETTINGS = {
     "telnet": {},
     "vnc": {},
@@ -287,3 +240,72 @@ CONTROLLER_SETTINGS = {
     "accept_invalid_ssl_certificates": False,
     "token": ""
 }
+
+LAUNCHER_SETTINGS = {
+    "resident_mode": False,
+    "resident_idle_timeout": 3600,
+    "batch_concurrency": 4,
+    "batch_pace": 0.05,
+    "coalesce_window": 2
+}
+
+
+def _detection_cache_path():
+
+    if hasattr(sys, "_called_from_test"):
+        return None
+    from gns3_webclient_pack.local_config import config_directory
+    from gns3_webclient_pack.utils.console_detection import CACHE_FILENAME
+    return os.path.join(config_directory(), CACHE_FILENAME)
+
+
+def _telnet_settings():
+    """
+    Returns the pre-configured Telnet commands and the default Telnet command,
+    which depend on the console clients installed on the system.
+    """
+
+    from gns3_webclient_pack.utils.console_detection import detect_console_clients, X_TERMINAL_EMULATOR
+    detected = detect_console_clients(_detection_cache_path())
+
+    if sys.platform.startswith("win"):
+        commands = dict(_WINDOWS_TELNET_COMMANDS)
+        if detected.get("solar_putty"):
+            # Solar-Putty is the default if it is installed.
+            commands["Solar-Putty (included with GNS3)"] = 'Solar-PuTTY.exe --telnet --hostname {host} --port {port}  --name "{name}"'
+            return commands, commands["Solar-Putty (included with GNS3)"]
+        commands["Solar-Putty (included with GNS3 downloaded from gns3.com)"] = 'Solar-PuTTY.exe --telnet --hostname {host} --port {port}  --name "{name}"'
+        return commands, commands["Putty (normal standalone version)"]
+
+    commands = PRECONFIGURED_TELNET_COMMANDS
+    if sys.platform.startswith("darwin"):
+        # default Mac OS X Telnet console command
+        return commands, commands["Terminal"]
+
+    # default Telnet command on other systems
+    terminal = detected.get("terminal")
+    if terminal == X_TERMINAL_EMULATOR:
+        return commands, 'x-terminal-emulator -T "{name}" -e "telnet {host} {port}"'
+    return commands, commands.get(terminal, commands["Xterm"])
+
+
+def __getattr__(name):
+    """
+    Computes the settings depending on the console clients on first access.
+    """
+
+    if name not in DETECTED_SETTINGS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    telnet_commands, default_telnet_command = _telnet_settings()
+    globals().update({
+        "PRECONFIGURED_TELNET_COMMANDS": telnet_commands,
+        "DEFAULT_TELNET_COMMAND": default_telnet_command,
+        "COMMANDS_SETTINGS": {
+            "telnet_command": default_telnet_command,
+            "vnc_command": DEFAULT_VNC_COMMAND,
+            "spice_command": DEFAULT_SPICE_COMMAND,
+            "pcap_command": DEFAULT_PACKET_CAPTURE_READER_COMMAND
+        }
+    })
+    return globals()[name]
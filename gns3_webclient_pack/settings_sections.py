@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Typed settings sections.
+
+Each section is validated and type-coerced once when loaded with
+LocalConfig.section(), invalid values are replaced by their default.
+Sections are immutable, use replace() to get a modified copy.
+"""
+
+import math
+from collections.abc import Mapping
+
+import logging
+log = logging.getLogger(__name__)
+
+_TRUE_STRINGS = ("true", "yes", "on", "1")
+_FALSE_STRINGS = ("false", "no", "off", "0", "")
+
+
+def _coerce(value, default):
+    """
+    Converts a value to the type of its default value.
+
+    :raises ValueError: if the value cannot be converted
+    """
+
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, (int, float)):
+            return bool(value)
+        if isinstance(value, str) and value.strip().lower() in _TRUE_STRINGS:
+            return True
+        if isinstance(value, str) and value.strip().lower() in _FALSE_STRINGS:
+            return False
+        raise ValueError("{!r} is not a boolean".format(value))
+    if isinstance(default, int):
+        if isinstance(value, bool) or value is None:
+            raise ValueError("{!r} is not an integer".format(value))
+        if isinstance(value, float) and not value.is_integer():
+            # never truncated, e.g. 1.5 must not become 1
+            raise ValueError("{!r} is not an integer".format(value))
+        return int(value)
+    if isinstance(default, float):
+        if isinstance(value, bool) or value is None:
+            raise ValueError("{!r} is not a number".format(value))
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError("{!r} is not a finite number".format(value))
+        return value
+    if isinstance(default, str):
+        if not isinstance(value, str):
+            raise ValueError("{!r} is not a string".format(value))
+        return value
+    return value
+
+
+class SettingsSection:
+    """
+    Base class of the typed settings sections.
+    The fields are the __slots__ of the subclasses.
+    """
+
+    __slots__ = ()
+
+    # section name in the config file
+    SECTION = None
+
+    # name of the default settings in the settings module
+    DEFAULTS = None
+
+    # allowed values for some fields
+    CHOICES = {}
+
+    def __init__(self, **values):
+
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+
+        raise AttributeError("{} settings are read-only, use replace()".format(self.SECTION))
+
+    def __eq__(self, other):
+
+        return type(self) is type(other) and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+
+        return "{}({})".format(self.__class__.__name__, ", ".join("{}={!r}".format(name, getattr(self, name)) for name in self.__slots__))
+
+    @classmethod
+    def defaults(cls):
+        """
+        Returns the default settings of the section.
+        """
+
+        from gns3_webclient_pack import settings
+        return getattr(settings, cls.DEFAULTS)
+
+    @classmethod
+    def fromSettings(cls, settings):
+        """
+        Build a section from the settings loaded from the config file.
+
+        :param settings: settings of the section (mapping)
+
+        :returns: section instance
+        """
+
+        defaults = cls.defaults()
+        values = {}
+        for name in cls.__slots__:
+            default = defaults[name]
+            values[name] = cls._validate(name, settings.get(name, default), default)
+        return cls(**values)
+
+    @classmethod
+    def fromValues(cls, values):
+        """
+        Build a section from values already validated (see toDict()).
+
+        :param values: field values (dict)
+
+        :returns: section instance
+        """
+
+        return cls(**{name: values[name] for name in cls.__slots__})
+
+    @classmethod
+    def _validate(cls, name, value, default):
+
+        try:
+            value = _coerce(value, default)
+            if name in cls.CHOICES and value not in cls.CHOICES[name]:
+                raise ValueError("{!r} is not one of {}".format(value, ", ".join(cls.CHOICES[name])))
+        except (TypeError, ValueError) as e:
+            log.warning("Invalid value for {} in section {}: {}, using the default value".format(name, cls.SECTION, e))
+            return default
+        return value
+
+    def replace(self, **changes):
+        """
+        Returns a copy of the section with some fields changed.
+
+        :param changes: new field values
+        """
+
+        values = {name: getattr(self, name) for name in self.__slots__}
+        values.update(changes)
+        return self.__class__(**values)
+
+    def toDict(self):
+        """
+        Returns the section as settings to save in the config file.
+        """
+
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class GeneralSettings(SettingsSection):
+
+    __slots__ = ("geometry", "state")
+    SECTION = "GeneralSettings"
+    DEFAULTS = "GENERAL_SETTINGS"
+
+
+class CommandsSettings(SettingsSection):
+
+    __slots__ = ("telnet_command", "vnc_command", "spice_command", "pcap_command")
+    SECTION = "CommandsSettings"
+    DEFAULTS = "COMMANDS_SETTINGS"
+
+
+class ControllerSettings(SettingsSection):
+
+    __slots__ = ("username", "password", "protocol", "accept_invalid_ssl_certificates", "token")
+    SECTION = "ControllerSettings"
+    DEFAULTS = "CONTROLLER_SETTINGS"
+    CHOICES = {"protocol": ("http", "https")}
+
+
+class LauncherSettings(SettingsSection):
+
+    __slots__ = ("resident_mode", "resident_idle_timeout", "batch_concurrency", "batch_pace", "coalesce_window")
+    SECTION = "LauncherSettings"
+    DEFAULTS = "LAUNCHER_SETTINGS"
+
+
+class CustomCommands(SettingsSection):
+    """
+    Custom commands by console type, stored as tuples of (name, command) pairs.
+    """
+
+    __slots__ = ("telnet", "vnc", "spice")
+    SECTION = "CustomCommands"
+    DEFAULTS = "CUSTOM_COMMANDS_SETTINGS"
+
+    @classmethod
+    def _validate(cls, name, value, default):
+
+        commands = []
+        if not isinstance(value, Mapping):
+            log.warning("Invalid custom {} commands: {!r}".format(name, value))
+            return ()
+        for command_name, command in value.items():
+            if isinstance(command_name, str) and isinstance(command, str):
+                commands.append((command_name, command))
+            else:
+                log.warning("Invalid custom {} command {!r}: {!r}".format(name, command_name, command))
+        return tuple(sorted(commands))
+
+    @classmethod
+    def fromValues(cls, values):
+
+        return cls(**{name: tuple(sorted(values[name].items())) for name in cls.__slots__})
+
+    def commands(self, console_type):
+        """
+        Returns the custom commands of a console type.
+
+        :param console_type: telnet, vnc or spice
+
+        :returns: dict with the command names and command lines
+        """
+
+        return dict(getattr(self, console_type, ()))
+
+    def replace(self, **changes):
+
+        # dicts of commands are accepted like in the config file
+        changes = {name: self._validate(name, value, {}) if isinstance(value, Mapping) else value for name, value in changes.items()}
+        return super().replace(**changes)
+
+    def toDict(self):
+
+        return {name: dict(getattr(self, name)) for name in self.__slots__}
+
+
+# sections stored validated in the read-only config snapshot
+SECTION_CLASSES = (GeneralSettings, CommandsSettings, ControllerSettings, LauncherSettings, CustomCommands)
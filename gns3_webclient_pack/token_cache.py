@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Cache of the JWT tokens issued by GNS3 v3 controllers.
+
+Tokens are stored per controller (protocol://host:port) with their expiry
+time so an expired token is never sent. The cache file is shared by the
+launcher processes, writers are serialized with a file lock.
+"""
+
+import json
+import time
+import base64
+
+from gns3_webclient_pack.utils.file_lock import FileLock
+from gns3_webclient_pack.utils.atomic_write import atomic_write_json
+
+import logging
+log = logging.getLogger(__name__)
+
+TOKEN_CACHE_FILENAME = "controller_tokens.json"
+
+# tokens expiring in less than this number of seconds are considered expired
+EXPIRY_MARGIN = 30
+
+
+def controller_key(protocol, host, port):
+    """
+    Returns the key of a controller in the token cache.
+
+    :param protocol: http or https
+    :param host: controller host
+    :param port: controller port
+    """
+
+    host = str(host).lower()
+    if ":" in host and not host.startswith("["):
+        # IPv6 address
+        host = "[{}]".format(host)
+    return "{}://{}:{}".format(protocol.lower(), host, port)
+
+
+def token_expiry(token):
+    """
+    Returns the expiry time ("exp" claim) of a JWT, the signature is not verified.
+
+    :param token: JWT
+
+    :returns: expiry timestamp or None if the token has no expiry or cannot be decoded
+    """
+
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload.encode("ascii")))
+        exp = claims.get("exp")
+    except (AttributeError, IndexError, ValueError, UnicodeError):
+        return None
+    if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+        return exp
+    return None
+
+
+def is_expired(exp, now=None):
+    """
+    Returns whether an expiry time is passed or about to be.
+
+    :param exp: expiry timestamp (None for tokens without expiry)
+    :param now: current timestamp
+    """
+
+    if exp is None:
+        return False
+    if now is None:
+        now = time.time()
+    return exp - EXPIRY_MARGIN <= now
+
+
+def _read_cache(path):
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        log.warning("Cannot read the token cache '{}': {}".format(path, e))
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return data
+
+
+def load_token(path, key):
+    """
+    Returns the cached token of a controller if it has not expired.
+
+    :param path: token cache file
+    :param key: controller key (see controller_key())
+
+    :returns: token or None
+    """
+
+    entry = _read_cache(path).get(key)
+    if not isinstance(entry, dict) or not isinstance(entry.get("token"), str):
+        return None
+    if is_expired(entry.get("exp")):
+        log.debug("Cached token for {} has expired".format(key))
+        return None
+    return entry["token"]
+
+
+def store_token(path, key, token):
+    """
+    Stores the token of a controller, expired tokens of the other controllers are dropped.
+
+    :param path: token cache file
+    :param key: controller key (see controller_key())
+    :param token: JWT (None to forget the token of the controller)
+    """
+
+    try:
+        with FileLock(path + ".lock"):
+            cache = _read_cache(path)
+            now = time.time()
+            cache = {name: entry for name, entry in cache.items()
+                     if name != key and isinstance(entry, dict) and not is_expired(entry.get("exp"), now)}
+            if token:
+                cache[key] = {"token": token, "exp": token_expiry(token)}
+
+            # tokens are credentials: the file is created readable by the user only
+            atomic_write_json(path, cache, sort_keys=True, indent=4)
+    except OSError as e:
+        log.warning("Cannot write the token cache '{}': {}".format(path, e))
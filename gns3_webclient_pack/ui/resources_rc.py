@@ -1,4145 +1,75 @@
 # -*- coding: utf-8 -*-
-
-# Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.13.2)
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
 #
-# WARNING! All changes made in this file will be lost!
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Qt resources (icons and images) of the user interfaces.
+
+The resources are compiled into the binary resources.rcc file by
+scripts/build_pyqt.py and registered when this module is first imported:
+Qt maps the file in memory, nothing is unmarshalled by Python.
+
+The file is package data (see pyproject.toml); frozen builds must ship it
+as ui/resources.rcc next to the executable.
+"""
 
-from PyQt5 import QtCore
+import os
 
-qt_resource_data = b"\
-\x00\x00\x16\x57\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x49\x6e\x6b\x73\x63\x61\x70\x65\
-\x20\x28\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x29\x20\x2d\x2d\x3e\x0a\
-\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x64\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\
-\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\
-\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\x63\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\
-\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\x23\
-\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\
-\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\
-\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\
-\x73\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\
-\x44\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\
-\x74\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\
-\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\
-\x61\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x22\x0a\x20\x20\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\
-\x31\x2e\x31\x22\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x30\x25\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
-\x31\x30\x30\x25\x22\x0a\x20\x20\x20\x76\x69\x65\x77\x42\x6f\x78\
-\x3d\x22\x30\x20\x30\x20\x32\x38\x38\x20\x32\x38\x38\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x37\x36\x33\x31\x22\x0a\x20\
-\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\
-\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x30\x2e\x34\x38\
-\x2e\x34\x20\x72\x39\x39\x33\x39\x22\x0a\x20\x20\x20\x73\x6f\x64\
-\x69\x70\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x70\
-\x72\x65\x66\x65\x72\x65\x6e\x63\x65\x73\x2e\x73\x76\x67\x22\x3e\
-\x3c\x73\x6f\x64\x69\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\
-\x69\x65\x77\x0a\x20\x20\x20\x20\x20\x70\x61\x67\x65\x63\x6f\x6c\
-\x6f\x72\x3d\x22\x23\x66\x66\x66\x66\x66\x66\x22\x0a\x20\x20\x20\
-\x20\x20\x62\x6f\x72\x64\x65\x72\x63\x6f\x6c\x6f\x72\x3d\x22\x23\
-\x36\x36\x36\x36\x36\x36\x22\x0a\x20\x20\x20\x20\x20\x62\x6f\x72\
-\x64\x65\x72\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\x31\x22\x0a\x20\
-\x20\x20\x20\x20\x6f\x62\x6a\x65\x63\x74\x74\x6f\x6c\x65\x72\x61\
-\x6e\x63\x65\x3d\x22\x31\x30\x22\x0a\x20\x20\x20\x20\x20\x67\x72\
-\x69\x64\x74\x6f\x6c\x65\x72\x61\x6e\x63\x65\x3d\x22\x31\x30\x22\
-\x0a\x20\x20\x20\x20\x20\x67\x75\x69\x64\x65\x74\x6f\x6c\x65\x72\
-\x61\x6e\x63\x65\x3d\x22\x31\x30\x22\x0a\x20\x20\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x70\x61\x67\x65\x6f\x70\x61\x63\
-\x69\x74\x79\x3d\x22\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x70\x61\x67\x65\x73\x68\x61\x64\x6f\x77\
-\x3d\x22\x32\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x77\x69\x64\x74\x68\x3d\
-\x22\x36\x34\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\
-\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x68\x65\x69\x67\x68\
-\x74\x3d\x22\x34\x38\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\
-\x22\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x37\x22\x0a\x20\x20\x20\
-\x20\x20\x73\x68\x6f\x77\x67\x72\x69\x64\x3d\x22\x66\x61\x6c\x73\
-\x65\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x3a\x7a\x6f\x6f\x6d\x3d\x22\x30\x2e\x38\x31\x39\x34\x34\x34\x34\
-\x34\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x3a\x63\x78\x3d\x22\x31\x34\x34\x22\x0a\x20\x20\x20\x20\x20\x69\
-\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x79\x3d\x22\x31\x34\x34\x22\
-\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\
-\x69\x6e\x64\x6f\x77\x2d\x78\x3d\x22\x37\x35\x22\x0a\x20\x20\x20\
-\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\
-\x77\x2d\x79\x3d\x22\x33\x34\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\
-\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x6d\x61\
-\x78\x69\x6d\x69\x7a\x65\x64\x3d\x22\x30\x22\x0a\x20\x20\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x75\x72\x72\x65\x6e\
-\x74\x2d\x6c\x61\x79\x65\x72\x3d\x22\x73\x76\x67\x37\x36\x33\x31\
-\x22\x20\x2f\x3e\x3c\x6d\x65\x74\x61\x64\x61\x74\x61\x0a\x20\x20\
-\x20\x20\x20\x69\x64\x3d\x22\x6d\x65\x74\x61\x64\x61\x74\x61\x31\
-\x33\x22\x3e\x3c\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x63\x63\x3a\
-\x57\x6f\x72\x6b\x0a\x20\x20\x20\x20\x20\x20\x20\x20\x20\x72\x64\
-\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\x3e\x3c\x64\x63\x3a\x66\
-\x6f\x72\x6d\x61\x74\x3e\x69\x6d\x61\x67\x65\x2f\x73\x76\x67\x2b\
-\x78\x6d\x6c\x3c\x2f\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x3c\
-\x64\x63\x3a\x74\x79\x70\x65\x0a\x20\x20\x20\x20\x20\x20\x20\x20\
-\x20\x20\x20\x72\x64\x66\x3a\x72\x65\x73\x6f\x75\x72\x63\x65\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\
-\x2f\x64\x63\x2f\x64\x63\x6d\x69\x74\x79\x70\x65\x2f\x53\x74\x69\
-\x6c\x6c\x49\x6d\x61\x67\x65\x22\x20\x2f\x3e\x3c\x64\x63\x3a\x74\
-\x69\x74\x6c\x65\x20\x2f\x3e\x3c\x2f\x63\x63\x3a\x57\x6f\x72\x6b\
-\x3e\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x3c\x2f\x6d\x65\x74\
-\x61\x64\x61\x74\x61\x3e\x3c\x64\x65\x66\x73\x0a\x20\x20\x20\x20\
-\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x31\x31\x22\x20\x2f\x3e\x3c\
-\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\x64\x3d\x22\x6d\x20\x31\
-\x33\x37\x2e\x37\x35\x36\x30\x32\x2c\x37\x2e\x35\x35\x35\x32\x38\
-\x30\x38\x20\x63\x20\x2d\x32\x2e\x37\x36\x33\x30\x38\x2c\x30\x2e\
-\x31\x38\x39\x32\x30\x33\x37\x20\x2d\x35\x2e\x34\x34\x38\x36\x38\
-\x2c\x30\x2e\x36\x31\x37\x30\x35\x32\x33\x20\x2d\x38\x2e\x31\x36\
-\x32\x36\x2c\x30\x2e\x39\x32\x37\x35\x38\x38\x31\x20\x6c\x20\x2d\
-\x30\x2e\x31\x38\x35\x37\x2c\x30\x20\x2d\x36\x2e\x34\x39\x33\x2c\
-\x33\x35\x2e\x34\x33\x33\x31\x37\x31\x31\x20\x63\x20\x2d\x31\x30\
-\x2e\x35\x38\x33\x30\x32\x2c\x32\x2e\x34\x31\x30\x31\x34\x38\x20\
-\x2d\x32\x30\x2e\x35\x33\x39\x35\x34\x2c\x36\x2e\x35\x30\x30\x33\
-\x35\x20\x2d\x32\x39\x2e\x34\x39\x36\x37\x2c\x31\x32\x2e\x30\x35\
-\x38\x34\x31\x31\x20\x4c\x20\x36\x34\x2e\x32\x39\x32\x33\x33\x35\
-\x2c\x33\x35\x2e\x30\x31\x31\x33\x37\x31\x20\x43\x20\x35\x36\x2e\
-\x34\x31\x38\x39\x30\x32\x2c\x34\x31\x2e\x31\x32\x34\x31\x30\x34\
-\x20\x34\x39\x2e\x32\x35\x34\x31\x34\x2c\x34\x38\x2e\x32\x35\x33\
-\x31\x38\x37\x20\x34\x32\x2e\x39\x35\x38\x32\x31\x38\x2c\x35\x35\
-\x2e\x39\x37\x34\x34\x35\x31\x20\x6c\x20\x32\x30\x2e\x32\x32\x31\
-\x30\x31\x36\x2c\x32\x39\x2e\x34\x39\x36\x37\x31\x37\x20\x63\x20\
-\x2d\x36\x2e\x31\x33\x39\x36\x35\x37\x2c\x39\x2e\x33\x38\x32\x36\
-\x32\x36\x20\x2d\x31\x30\x2e\x37\x35\x36\x36\x34\x2c\x32\x30\x2e\
-\x30\x39\x36\x32\x33\x32\x20\x2d\x31\x33\x2e\x33\x35\x36\x39\x37\
-\x39\x2c\x33\x31\x2e\x33\x35\x31\x38\x38\x32\x20\x2d\x34\x2e\x36\
-\x35\x65\x2d\x34\x2c\x30\x2e\x30\x35\x32\x36\x20\x2d\x34\x2e\x30\
-\x37\x65\x2d\x34\x2c\x30\x2e\x31\x37\x36\x33\x36\x20\x30\x2c\x30\
-\x2e\x31\x38\x35\x37\x20\x6c\x20\x2d\x33\x35\x2e\x32\x34\x37\x37\
-\x30\x36\x2c\x35\x2e\x35\x36\x35\x34\x20\x63\x20\x2d\x30\x2e\x36\
-\x34\x34\x33\x37\x33\x2c\x35\x2e\x32\x36\x33\x34\x35\x20\x2d\x30\
-\x2e\x39\x32\x37\x35\x33\x2c\x31\x30\x2e\x37\x30\x33\x30\x32\x20\
-\x2d\x30\x2e\x39\x32\x37\x35\x33\x2c\x31\x36\x2e\x31\x33\x39\x36\
-\x39\x20\x30\x2c\x34\x2e\x34\x34\x38\x32\x31\x20\x30\x2e\x31\x32\
-\x32\x36\x33\x2c\x38\x2e\x38\x33\x36\x39\x32\x20\x30\x2e\x35\x35\
-\x36\x34\x39\x33\x2c\x31\x33\x2e\x31\x37\x31\x35\x20\x6c\x20\x33\
-\x35\x2e\x32\x34\x37\x36\x34\x37\x2c\x36\x2e\x33\x30\x37\x34\x39\
-\x20\x63\x20\x32\x2e\x35\x30\x36\x38\x35\x32\x2c\x31\x32\x2e\x32\
-\x34\x30\x33\x20\x37\x2e\x32\x36\x38\x39\x34\x33\x2c\x32\x33\x2e\
-\x36\x37\x31\x36\x33\x20\x31\x33\x2e\x39\x31\x33\x35\x34\x2c\x33\
-\x33\x2e\x37\x36\x33\x35\x31\x20\x6c\x20\x2d\x32\x30\x2e\x39\x36\
-\x33\x30\x39\x2c\x32\x38\x2e\x37\x35\x34\x37\x20\x63\x20\x36\x2e\
-\x30\x30\x33\x37\x32\x2c\x37\x2e\x34\x35\x33\x32\x39\x20\x31\x32\
-\x2e\x39\x33\x34\x39\x30\x32\x2c\x31\x34\x2e\x32\x33\x39\x32\x37\
-\x20\x32\x30\x2e\x34\x30\x36\x35\x32\x39\x2c\x32\x30\x2e\x32\x32\
-\x31\x30\x32\x20\x6c\x20\x32\x39\x2e\x36\x38\x32\x32\x33\x36\x2c\
-\x2d\x32\x30\x2e\x34\x30\x36\x35\x33\x20\x63\x20\x31\x30\x2e\x33\
-\x37\x33\x35\x36\x36\x2c\x36\x2e\x36\x31\x37\x34\x34\x20\x32\x31\
-\x2e\x39\x35\x33\x34\x38\x36\x2c\x31\x31\x2e\x32\x35\x37\x37\x31\
-\x20\x33\x34\x2e\x35\x30\x35\x36\x31\x36\x2c\x31\x33\x2e\x35\x34\
-\x32\x34\x39\x20\x6c\x20\x35\x2e\x35\x36\x35\x34\x33\x2c\x33\x35\
-\x2e\x30\x36\x32\x31\x33\x20\x63\x20\x33\x2e\x39\x35\x34\x37\x32\
-\x2c\x30\x2e\x33\x36\x30\x32\x39\x20\x38\x2e\x30\x31\x30\x33\x2c\
-\x30\x2e\x33\x37\x30\x37\x39\x20\x31\x32\x2e\x30\x35\x38\x34\x2c\
-\x30\x2e\x33\x37\x30\x37\x39\x20\x35\x2e\x37\x31\x34\x38\x39\x2c\
-\x30\x20\x31\x31\x2e\x31\x37\x33\x38\x2c\x2d\x30\x2e\x32\x31\x36\
-\x36\x32\x20\x31\x36\x2e\x36\x39\x36\x32\x33\x2c\x2d\x30\x2e\x39\
-\x32\x37\x35\x32\x20\x6c\x20\x36\x2e\x36\x37\x38\x35\x32\x2c\x2d\
-\x33\x35\x2e\x38\x30\x34\x32\x31\x20\x63\x20\x31\x31\x2e\x39\x31\
-\x37\x38\x31\x2c\x2d\x32\x2e\x39\x36\x35\x38\x38\x20\x32\x33\x2e\
-\x31\x31\x33\x33\x38\x2c\x2d\x38\x2e\x31\x31\x30\x39\x31\x20\x33\
-\x32\x2e\x38\x33\x35\x39\x38\x2c\x2d\x31\x35\x2e\x30\x32\x36\x36\
-\x33\x20\x6c\x20\x32\x38\x2e\x35\x36\x39\x31\x32\x2c\x32\x30\x2e\
-\x37\x37\x37\x35\x38\x20\x63\x20\x37\x2e\x34\x30\x38\x38\x35\x2c\
-\x2d\x36\x2e\x33\x30\x33\x33\x35\x20\x31\x34\x2e\x31\x38\x33\x38\
-\x35\x2c\x2d\x31\x33\x2e\x35\x34\x38\x35\x32\x20\x32\x30\x2e\x30\
-\x33\x35\x35\x36\x2c\x2d\x32\x31\x2e\x33\x33\x34\x31\x33\x20\x6c\
-\x20\x2d\x32\x30\x2e\x37\x37\x37\x35\x36\x2c\x2d\x33\x30\x2e\x30\
-\x35\x33\x32\x36\x20\x63\x20\x35\x2e\x36\x32\x36\x38\x34\x2c\x2d\
-\x39\x2e\x37\x31\x37\x38\x37\x20\x39\x2e\x35\x32\x35\x37\x35\x2c\
-\x2d\x32\x30\x2e\x34\x33\x39\x39\x39\x20\x31\x31\x2e\x35\x30\x31\
-\x38\x36\x2c\x2d\x33\x31\x2e\x39\x30\x38\x34\x20\x6c\x20\x33\x35\
-\x2e\x30\x36\x32\x31\x32\x2c\x2d\x35\x2e\x35\x36\x35\x34\x20\x63\
-\x20\x30\x2e\x33\x30\x37\x37\x35\x2c\x2d\x33\x2e\x36\x35\x38\x39\
-\x31\x20\x30\x2e\x33\x37\x30\x38\x32\x2c\x2d\x37\x2e\x32\x30\x37\
-\x34\x20\x30\x2e\x33\x37\x30\x38\x32\x2c\x2d\x31\x30\x2e\x39\x34\
-\x35\x33\x20\x30\x2c\x2d\x36\x2e\x34\x39\x35\x37\x36\x20\x2d\x30\
-\x2e\x37\x35\x35\x30\x36\x2c\x2d\x31\x32\x2e\x38\x36\x34\x38\x35\
-\x20\x2d\x31\x2e\x36\x36\x39\x36\x38\x2c\x2d\x31\x39\x2e\x31\x30\
-\x37\x39\x39\x20\x6c\x20\x2d\x33\x35\x2e\x36\x31\x38\x36\x38\x2c\
-\x2d\x36\x2e\x34\x39\x32\x39\x38\x20\x63\x20\x2d\x32\x2e\x37\x39\
-\x31\x32\x39\x2c\x2d\x31\x30\x2e\x33\x30\x37\x20\x2d\x37\x2e\x33\
-\x37\x31\x31\x32\x2c\x2d\x31\x39\x2e\x39\x32\x33\x33\x31\x39\x20\
-\x2d\x31\x33\x2e\x31\x37\x31\x34\x36\x2c\x2d\x32\x38\x2e\x35\x36\
-\x39\x31\x37\x39\x20\x4c\x20\x32\x34\x36\x2e\x30\x39\x35\x36\x39\
-\x2c\x35\x35\x2e\x37\x38\x38\x38\x37\x20\x43\x20\x32\x33\x39\x2e\
-\x35\x39\x37\x38\x33\x2c\x34\x37\x2e\x38\x34\x32\x33\x32\x36\x20\
-\x32\x33\x32\x2e\x31\x38\x35\x35\x34\x2c\x34\x30\x2e\x35\x30\x31\
-\x34\x35\x34\x20\x32\x32\x34\x2e\x30\x31\x39\x35\x36\x2c\x33\x34\
-\x2e\x32\x36\x39\x32\x33\x38\x20\x6c\x20\x2d\x33\x30\x2e\x32\x33\
-\x38\x38\x2c\x32\x30\x2e\x37\x37\x37\x35\x36\x37\x20\x43\x20\x31\
-\x38\x35\x2e\x30\x38\x39\x38\x31\x2c\x34\x39\x2e\x39\x30\x36\x38\
-\x35\x20\x31\x37\x35\x2e\x37\x33\x37\x31\x34\x2c\x34\x35\x2e\x39\
-\x36\x32\x39\x37\x36\x20\x31\x36\x35\x2e\x35\x38\x32\x36\x37\x2c\
-\x34\x33\x2e\x37\x33\x30\x34\x35\x38\x20\x4c\x20\x31\x36\x30\x2e\
-\x30\x31\x37\x32\x2c\x38\x2e\x34\x38\x32\x38\x31\x30\x38\x20\x63\
-\x20\x2d\x35\x2e\x30\x36\x35\x35\x37\x2c\x2d\x30\x2e\x35\x39\x35\
-\x38\x35\x32\x32\x20\x2d\x31\x30\x2e\x31\x37\x32\x38\x31\x2c\x2d\
-\x30\x2e\x39\x32\x37\x35\x38\x38\x31\x20\x2d\x31\x35\x2e\x33\x39\
-\x37\x36\x31\x2c\x2d\x30\x2e\x39\x32\x37\x35\x38\x38\x31\x20\x2d\
-\x31\x2e\x34\x31\x32\x31\x34\x2c\x35\x2e\x38\x31\x65\x2d\x35\x20\
-\x2d\x32\x2e\x38\x36\x35\x34\x36\x2c\x2d\x30\x2e\x30\x34\x36\x36\
-\x38\x31\x20\x2d\x34\x2e\x32\x36\x36\x38\x35\x2c\x30\x20\x2d\x30\
-\x2e\x36\x38\x33\x31\x36\x2c\x30\x2e\x30\x32\x33\x33\x34\x20\x2d\
-\x31\x2e\x33\x35\x39\x32\x34\x2c\x2d\x30\x2e\x30\x34\x30\x38\x37\
-\x20\x2d\x32\x2e\x30\x34\x30\x36\x34\x2c\x30\x20\x2d\x30\x2e\x31\
-\x38\x34\x35\x33\x2c\x30\x2e\x30\x31\x31\x37\x31\x39\x20\x2d\x30\
-\x2e\x33\x37\x32\x35\x35\x2c\x2d\x30\x2e\x30\x31\x31\x37\x31\x39\
-\x20\x2d\x30\x2e\x35\x35\x36\x34\x39\x2c\x30\x20\x7a\x20\x6d\x20\
-\x34\x2e\x38\x32\x33\x33\x33\x2c\x39\x30\x2e\x31\x35\x39\x38\x31\
-\x32\x32\x20\x63\x20\x30\x2e\x36\x37\x37\x37\x39\x2c\x2d\x30\x2e\
-\x30\x33\x35\x30\x36\x20\x31\x2e\x33\x35\x34\x34\x35\x2c\x30\x20\
-\x32\x2e\x30\x34\x30\x37\x2c\x30\x20\x32\x31\x2e\x39\x35\x39\x36\
-\x35\x2c\x30\x20\x33\x39\x2e\x38\x38\x35\x34\x37\x2c\x31\x37\x2e\
-\x39\x32\x35\x38\x33\x37\x20\x33\x39\x2e\x38\x38\x35\x34\x37\x2c\
-\x33\x39\x2e\x38\x38\x35\x35\x30\x37\x20\x30\x2c\x32\x31\x2e\x39\
-\x35\x39\x36\x35\x20\x2d\x31\x37\x2e\x39\x32\x35\x38\x32\x2c\x33\
-\x39\x2e\x36\x39\x39\x39\x36\x20\x2d\x33\x39\x2e\x38\x38\x35\x34\
-\x37\x2c\x33\x39\x2e\x36\x39\x39\x39\x36\x20\x2d\x32\x31\x2e\x39\
-\x35\x39\x37\x2c\x30\x20\x2d\x33\x39\x2e\x37\x30\x30\x30\x31\x2c\
-\x2d\x31\x37\x2e\x37\x34\x30\x33\x31\x20\x2d\x33\x39\x2e\x37\x30\
-\x30\x30\x31\x2c\x2d\x33\x39\x2e\x36\x39\x39\x39\x36\x20\x30\x2c\
-\x2d\x32\x31\x2e\x32\x37\x33\x34\x32\x20\x31\x36\x2e\x36\x34\x39\
-\x33\x34\x2c\x2d\x33\x38\x2e\x38\x31\x39\x33\x34\x38\x20\x33\x37\
-\x2e\x36\x35\x39\x33\x31\x2c\x2d\x33\x39\x2e\x38\x38\x35\x35\x30\
-\x37\x20\x7a\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x70\x61\
-\x74\x68\x33\x32\x34\x33\x2d\x34\x22\x0a\x20\x20\x20\x20\x20\x73\
-\x74\x79\x6c\x65\x3d\x22\x63\x6f\x6c\x6f\x72\x3a\x23\x30\x30\x30\
-\x30\x30\x30\x3b\x66\x69\x6c\x6c\x3a\x23\x30\x30\x30\x30\x30\x30\
-\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\x3b\
-\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3a\x6e\x6f\x6e\x7a\x65\x72\
-\x6f\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\x74\
-\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x3b\x6d\x61\x72\
-\x6b\x65\x72\x3a\x6e\x6f\x6e\x65\x3b\x76\x69\x73\x69\x62\x69\x6c\
-\x69\x74\x79\x3a\x76\x69\x73\x69\x62\x6c\x65\x3b\x64\x69\x73\x70\
-\x6c\x61\x79\x3a\x69\x6e\x6c\x69\x6e\x65\x3b\x6f\x76\x65\x72\x66\
-\x6c\x6f\x77\x3a\x76\x69\x73\x69\x62\x6c\x65\x22\x20\x2f\x3e\x3c\
-\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\x64\x3d\x22\x6d\x20\x31\
-\x33\x38\x2e\x33\x34\x34\x38\x33\x2c\x32\x31\x2e\x31\x35\x33\x35\
-\x31\x36\x20\x63\x20\x2d\x32\x2e\x37\x36\x33\x30\x38\x2c\x30\x2e\
-\x31\x38\x39\x31\x39\x36\x20\x2d\x35\x2e\x34\x34\x38\x36\x38\x2c\
-\x30\x2e\x36\x31\x37\x30\x35\x20\x2d\x38\x2e\x31\x36\x32\x36\x2c\
-\x30\x2e\x39\x32\x37\x35\x38\x37\x20\x6c\x20\x2d\x30\x2e\x31\x38\
-\x35\x37\x2c\x30\x20\x2d\x36\x2e\x34\x39\x33\x2c\x33\x35\x2e\x34\
-\x33\x33\x31\x36\x36\x20\x63\x20\x2d\x31\x30\x2e\x35\x38\x33\x30\
-\x32\x2c\x32\x2e\x34\x31\x30\x31\x35\x32\x20\x2d\x32\x30\x2e\x35\
-\x33\x39\x35\x34\x2c\x36\x2e\x35\x30\x30\x33\x35\x37\x20\x2d\x32\
-\x39\x2e\x34\x39\x36\x37\x30\x35\x2c\x31\x32\x2e\x30\x35\x38\x34\
-\x31\x32\x20\x4c\x20\x36\x34\x2e\x38\x38\x31\x31\x34\x35\x2c\x34\
-\x38\x2e\x36\x30\x39\x35\x39\x39\x20\x63\x20\x2d\x37\x2e\x38\x37\
-\x33\x34\x33\x36\x2c\x36\x2e\x31\x31\x32\x37\x33\x38\x20\x2d\x31\
-\x35\x2e\x30\x33\x38\x32\x2c\x31\x33\x2e\x32\x34\x31\x38\x32\x34\
-\x20\x2d\x32\x31\x2e\x33\x33\x34\x31\x32\x2c\x32\x30\x2e\x39\x36\
-\x33\x30\x38\x32\x20\x6c\x20\x32\x30\x2e\x32\x32\x31\x30\x31\x36\
-\x2c\x32\x39\x2e\x34\x39\x36\x37\x31\x33\x20\x63\x20\x2d\x36\x2e\
-\x31\x33\x39\x36\x36\x32\x2c\x39\x2e\x33\x38\x32\x36\x32\x36\x20\
-\x2d\x31\x30\x2e\x37\x35\x36\x36\x33\x39\x2c\x32\x30\x2e\x30\x39\
-\x36\x32\x32\x36\x20\x2d\x31\x33\x2e\x33\x35\x36\x39\x38\x31\x2c\
-\x33\x31\x2e\x33\x35\x31\x38\x38\x36\x20\x2d\x34\x2e\x36\x37\x65\
-\x2d\x34\x2c\x30\x2e\x30\x35\x32\x36\x20\x2d\x34\x2e\x30\x39\x65\
-\x2d\x34\x2c\x30\x2e\x31\x37\x36\x33\x36\x20\x30\x2c\x30\x2e\x31\
-\x38\x35\x37\x20\x6c\x20\x2d\x33\x35\x2e\x32\x34\x37\x37\x30\x36\
-\x2c\x35\x2e\x35\x36\x35\x34\x20\x63\x20\x2d\x30\x2e\x36\x34\x34\
-\x33\x37\x38\x2c\x35\x2e\x32\x36\x33\x34\x36\x20\x2d\x30\x2e\x39\
-\x32\x37\x35\x33\x2c\x31\x30\x2e\x37\x30\x33\x30\x33\x20\x2d\x30\
-\x2e\x39\x32\x37\x35\x33\x2c\x31\x36\x2e\x31\x33\x39\x37\x20\x30\
-\x2c\x34\x2e\x34\x34\x38\x32\x31\x20\x30\x2e\x31\x32\x32\x36\x32\
-\x38\x2c\x38\x2e\x38\x33\x36\x39\x32\x20\x30\x2e\x35\x35\x36\x34\
-\x39\x36\x2c\x31\x33\x2e\x31\x37\x31\x35\x20\x6c\x20\x33\x35\x2e\
-\x32\x34\x37\x36\x34\x37\x2c\x36\x2e\x33\x30\x37\x34\x39\x20\x63\
-\x20\x32\x2e\x35\x30\x36\x38\x35\x32\x2c\x31\x32\x2e\x32\x34\x30\
-\x33\x20\x37\x2e\x32\x36\x38\x39\x33\x39\x2c\x32\x33\x2e\x36\x37\
-\x31\x36\x33\x20\x31\x33\x2e\x39\x31\x33\x35\x33\x33\x2c\x33\x33\
-\x2e\x37\x36\x33\x35\x31\x20\x6c\x20\x2d\x32\x30\x2e\x39\x36\x33\
-\x30\x38\x36\x2c\x32\x38\x2e\x37\x35\x34\x37\x20\x63\x20\x36\x2e\
-\x30\x30\x33\x37\x31\x37\x2c\x37\x2e\x34\x35\x33\x32\x39\x20\x31\
-\x32\x2e\x39\x33\x34\x39\x30\x35\x2c\x31\x34\x2e\x32\x33\x39\x32\
-\x36\x20\x32\x30\x2e\x34\x30\x36\x35\x33\x2c\x32\x30\x2e\x32\x32\
-\x31\x30\x32\x20\x6c\x20\x32\x39\x2e\x36\x38\x32\x32\x33\x37\x2c\
-\x2d\x32\x30\x2e\x34\x30\x36\x35\x33\x20\x63\x20\x31\x30\x2e\x33\
-\x37\x33\x35\x37\x39\x2c\x36\x2e\x36\x31\x37\x34\x34\x20\x32\x31\
-\x2e\x39\x35\x33\x34\x38\x39\x2c\x31\x31\x2e\x32\x35\x37\x37\x20\
-\x33\x34\x2e\x35\x30\x35\x36\x31\x39\x2c\x31\x33\x2e\x35\x34\x32\
-\x34\x39\x20\x6c\x20\x35\x2e\x35\x36\x35\x34\x33\x2c\x33\x35\x2e\
-\x30\x36\x32\x31\x33\x20\x63\x20\x33\x2e\x39\x35\x34\x37\x32\x2c\
-\x30\x2e\x33\x36\x30\x32\x39\x20\x38\x2e\x30\x31\x30\x33\x2c\x30\
-\x2e\x33\x37\x30\x37\x39\x20\x31\x32\x2e\x30\x35\x38\x34\x2c\x30\
-\x2e\x33\x37\x30\x37\x39\x20\x35\x2e\x37\x31\x34\x38\x39\x2c\x30\
-\x20\x31\x31\x2e\x31\x37\x33\x38\x2c\x2d\x30\x2e\x32\x31\x36\x36\
-\x32\x20\x31\x36\x2e\x36\x39\x36\x32\x33\x2c\x2d\x30\x2e\x39\x32\
-\x37\x35\x32\x20\x6c\x20\x36\x2e\x36\x37\x38\x35\x32\x2c\x2d\x33\
-\x35\x2e\x38\x30\x34\x32\x31\x20\x63\x20\x31\x31\x2e\x39\x31\x37\
-\x38\x31\x2c\x2d\x32\x2e\x39\x36\x35\x38\x38\x20\x32\x33\x2e\x31\
-\x31\x33\x33\x38\x2c\x2d\x38\x2e\x31\x31\x30\x39\x31\x20\x33\x32\
-\x2e\x38\x33\x35\x39\x38\x2c\x2d\x31\x35\x2e\x30\x32\x36\x36\x33\
-\x20\x6c\x20\x32\x38\x2e\x35\x36\x39\x31\x32\x2c\x32\x30\x2e\x37\
-\x37\x37\x35\x38\x20\x63\x20\x37\x2e\x34\x30\x38\x38\x35\x2c\x2d\
-\x36\x2e\x33\x30\x33\x33\x35\x20\x31\x34\x2e\x31\x38\x33\x38\x35\
-\x2c\x2d\x31\x33\x2e\x35\x34\x38\x35\x32\x20\x32\x30\x2e\x30\x33\
-\x35\x35\x36\x2c\x2d\x32\x31\x2e\x33\x33\x34\x31\x33\x20\x6c\x20\
-\x2d\x32\x30\x2e\x37\x37\x37\x35\x36\x2c\x2d\x33\x30\x2e\x30\x35\
-\x33\x32\x36\x20\x63\x20\x35\x2e\x36\x32\x36\x38\x34\x2c\x2d\x39\
-\x2e\x37\x31\x37\x38\x37\x20\x39\x2e\x35\x32\x35\x37\x35\x2c\x2d\
-\x32\x30\x2e\x34\x33\x39\x39\x39\x20\x31\x31\x2e\x35\x30\x31\x38\
-\x36\x2c\x2d\x33\x31\x2e\x39\x30\x38\x34\x20\x6c\x20\x33\x35\x2e\
-\x30\x36\x32\x31\x32\x2c\x2d\x35\x2e\x35\x36\x35\x34\x31\x20\x63\
-\x20\x30\x2e\x33\x30\x37\x37\x35\x2c\x2d\x33\x2e\x36\x35\x38\x39\
-\x20\x30\x2e\x33\x37\x30\x38\x32\x2c\x2d\x37\x2e\x32\x30\x37\x33\
-\x39\x20\x30\x2e\x33\x37\x30\x38\x32\x2c\x2d\x31\x30\x2e\x39\x34\
-\x35\x33\x20\x30\x2c\x2d\x36\x2e\x34\x39\x35\x37\x35\x20\x2d\x30\
-\x2e\x37\x35\x35\x30\x35\x2c\x2d\x31\x32\x2e\x38\x36\x34\x38\x34\
-\x20\x2d\x31\x2e\x36\x36\x39\x36\x37\x2c\x2d\x31\x39\x2e\x31\x30\
-\x37\x39\x38\x20\x6c\x20\x2d\x33\x35\x2e\x36\x31\x38\x36\x39\x2c\
-\x2d\x36\x2e\x34\x39\x32\x39\x39\x20\x63\x20\x2d\x32\x2e\x37\x39\
-\x31\x32\x39\x2c\x2d\x31\x30\x2e\x33\x30\x37\x20\x2d\x37\x2e\x33\
-\x37\x31\x31\x32\x2c\x2d\x31\x39\x2e\x39\x32\x33\x33\x32\x20\x2d\
-\x31\x33\x2e\x31\x37\x31\x34\x36\x2c\x2d\x32\x38\x2e\x35\x36\x39\
-\x31\x38\x20\x4c\x20\x32\x34\x36\x2e\x36\x38\x34\x35\x2c\x36\x39\
-\x2e\x33\x38\x37\x31\x30\x34\x20\x43\x20\x32\x34\x30\x2e\x31\x38\
-\x36\x36\x34\x2c\x36\x31\x2e\x34\x34\x30\x35\x36\x31\x20\x32\x33\
-\x32\x2e\x37\x37\x34\x33\x35\x2c\x35\x34\x2e\x30\x39\x39\x36\x38\
-\x31\x20\x32\x32\x34\x2e\x36\x30\x38\x33\x37\x2c\x34\x37\x2e\x38\
-\x36\x37\x34\x36\x39\x20\x6c\x20\x2d\x33\x30\x2e\x32\x33\x38\x38\
-\x2c\x32\x30\x2e\x37\x37\x37\x35\x36\x35\x20\x63\x20\x2d\x38\x2e\
-\x36\x39\x30\x39\x35\x2c\x2d\x35\x2e\x31\x33\x39\x39\x35\x33\x20\
-\x2d\x31\x38\x2e\x30\x34\x33\x36\x32\x2c\x2d\x39\x2e\x30\x38\x33\
-\x38\x32\x33\x20\x2d\x32\x38\x2e\x31\x39\x38\x30\x39\x2c\x2d\x31\
-\x31\x2e\x33\x31\x36\x33\x34\x32\x20\x6c\x20\x2d\x35\x2e\x35\x36\
-\x35\x34\x37\x2c\x2d\x33\x35\x2e\x32\x34\x37\x36\x34\x37\x20\x63\
-\x20\x2d\x35\x2e\x30\x36\x35\x35\x37\x2c\x2d\x30\x2e\x35\x39\x35\
-\x38\x35\x31\x20\x2d\x31\x30\x2e\x31\x37\x32\x38\x31\x2c\x2d\x30\
-\x2e\x39\x32\x37\x35\x38\x37\x20\x2d\x31\x35\x2e\x33\x39\x37\x36\
-\x31\x2c\x2d\x30\x2e\x39\x32\x37\x35\x38\x37\x20\x2d\x31\x2e\x34\
-\x31\x32\x31\x34\x2c\x35\x2e\x38\x65\x2d\x35\x20\x2d\x32\x2e\x38\
-\x36\x35\x34\x35\x2c\x2d\x30\x2e\x30\x34\x36\x37\x32\x20\x2d\x34\
-\x2e\x32\x36\x36\x38\x35\x2c\x30\x20\x2d\x30\x2e\x36\x38\x33\x31\
-\x36\x2c\x30\x2e\x30\x32\x33\x33\x36\x20\x2d\x31\x2e\x33\x35\x39\
-\x32\x34\x2c\x2d\x30\x2e\x30\x34\x30\x38\x38\x20\x2d\x32\x2e\x30\
-\x34\x30\x36\x34\x2c\x30\x20\x2d\x30\x2e\x31\x38\x34\x35\x33\x2c\
-\x30\x2e\x30\x31\x31\x36\x39\x20\x2d\x30\x2e\x33\x37\x32\x35\x35\
-\x2c\x2d\x30\x2e\x30\x31\x31\x36\x38\x20\x2d\x30\x2e\x35\x35\x36\
-\x34\x39\x2c\x30\x20\x7a\x20\x6d\x20\x34\x2e\x38\x32\x33\x33\x33\
-\x2c\x39\x30\x2e\x31\x35\x39\x38\x30\x34\x20\x63\x20\x30\x2e\x36\
-\x37\x37\x37\x39\x2c\x2d\x30\x2e\x30\x33\x35\x31\x20\x31\x2e\x33\
-\x35\x34\x34\x35\x2c\x30\x20\x32\x2e\x30\x34\x30\x37\x2c\x30\x20\
-\x32\x31\x2e\x39\x35\x39\x36\x35\x2c\x30\x20\x33\x39\x2e\x38\x38\
-\x35\x34\x38\x2c\x31\x37\x2e\x39\x32\x35\x38\x34\x20\x33\x39\x2e\
-\x38\x38\x35\x34\x38\x2c\x33\x39\x2e\x38\x38\x35\x35\x32\x20\x30\
-\x2c\x32\x31\x2e\x39\x35\x39\x36\x35\x20\x2d\x31\x37\x2e\x39\x32\
-\x35\x38\x33\x2c\x33\x39\x2e\x36\x39\x39\x39\x36\x20\x2d\x33\x39\
-\x2e\x38\x38\x35\x34\x38\x2c\x33\x39\x2e\x36\x39\x39\x39\x36\x20\
-\x2d\x32\x31\x2e\x39\x35\x39\x37\x2c\x30\x20\x2d\x33\x39\x2e\x37\
-\x30\x30\x30\x31\x2c\x2d\x31\x37\x2e\x37\x34\x30\x33\x31\x20\x2d\
-\x33\x39\x2e\x37\x30\x30\x30\x31\x2c\x2d\x33\x39\x2e\x36\x39\x39\
-\x39\x36\x20\x30\x2c\x2d\x32\x31\x2e\x32\x37\x33\x34\x33\x20\x31\
-\x36\x2e\x36\x34\x39\x33\x34\x2c\x2d\x33\x38\x2e\x38\x31\x39\x33\
-\x36\x20\x33\x37\x2e\x36\x35\x39\x33\x31\x2c\x2d\x33\x39\x2e\x38\
-\x38\x35\x35\x32\x20\x7a\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\
-\x22\x70\x61\x74\x68\x33\x32\x34\x33\x22\x0a\x20\x20\x20\x20\x20\
-\x73\x74\x79\x6c\x65\x3d\x22\x63\x6f\x6c\x6f\x72\x3a\x23\x30\x30\
-\x30\x30\x30\x30\x3b\x66\x69\x6c\x6c\x3a\x23\x38\x30\x38\x30\x38\
-\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\x74\x79\x3a\x31\
-\x3b\x66\x69\x6c\x6c\x2d\x72\x75\x6c\x65\x3a\x6e\x6f\x6e\x7a\x65\
-\x72\x6f\x3b\x73\x74\x72\x6f\x6b\x65\x3a\x6e\x6f\x6e\x65\x3b\x73\
-\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3a\x30\x3b\x6d\x61\
-\x72\x6b\x65\x72\x3a\x6e\x6f\x6e\x65\x3b\x76\x69\x73\x69\x62\x69\
-\x6c\x69\x74\x79\x3a\x76\x69\x73\x69\x62\x6c\x65\x3b\x64\x69\x73\
-\x70\x6c\x61\x79\x3a\x69\x6e\x6c\x69\x6e\x65\x3b\x6f\x76\x65\x72\
-\x66\x6c\x6f\x77\x3a\x76\x69\x73\x69\x62\x6c\x65\x22\x20\x2f\x3e\
-\x3c\x2f\x73\x76\x67\x3e\
-\x00\x00\x05\xb4\
-\x00\
-\x00\x13\xa2\x78\xda\xd5\x57\xdb\x8e\xdb\x36\x10\x7d\xdf\xaf\x50\
-\xb5\x28\x90\x45\x57\x14\x49\xf1\xea\xd8\x0e\xd0\x06\x29\xf2\x54\
-\xa0\x49\xd0\x67\xad\x44\xdb\x6a\x64\xc9\x95\xb4\x6b\x3b\x5f\x9f\
-\xa1\xac\xab\x61\x7b\x9d\x6c\x53\xa0\x96\x0d\x50\x73\xe1\x0c\xcf\
-\x1c\x0e\xe9\xe9\x9b\xdd\x3a\x75\x9e\x4c\x51\x26\x79\x36\x73\x09\
-\xc2\xae\x63\xb2\x28\x8f\x93\x6c\x39\x73\x3f\x7d\x7c\xe7\x29\xd7\
-\x29\xab\x30\x8b\xc3\x34\xcf\xcc\xcc\xcd\x72\xf7\xcd\xfc\x66\xfa\
-\x93\xe7\x39\xbf\x15\x26\xac\x4c\xec\x6c\x93\x6a\xe5\xbc\xcf\x3e\
-\x97\x51\xb8\x31\xce\xab\x55\x55\x6d\x26\xbe\xbf\xdd\x6e\x51\xd2\
-\x08\x51\x5e\x2c\xfd\x3b\xc7\xf3\xe6\x37\x37\xd3\xf2\x69\x79\xe3\
-\x38\x0e\xc4\xcd\xca\x49\x1c\xcd\xdc\xc6\x61\xf3\x58\xa4\xb5\x61\
-\x1c\xf9\x26\x35\x6b\x93\x55\xa5\x4f\x10\xf1\xdd\xde\x3c\xea\xcd\
-\x23\x1b\x3d\x79\x32\x51\xbe\x5e\xe7\x59\x59\x7b\x66\xe5\xed\xc0\
-\xb8\x88\x17\x9d\xb5\xcd\x66\x1b\xd4\x46\x44\x6b\xed\x63\xea\x53\
-\xea\x81\x85\x57\xee\xb3\x2a\xdc\x79\x63\x57\xc8\xf1\x94\x2b\xc5\
-\x18\xfb\xa0\xeb\x2d\xaf\xb3\x9a\xec\x52\x80\xe2\x6c\x32\xb5\x76\
-\x18\x1d\xe0\xdf\xc0\xaf\x73\x68\x05\xa8\xcc\x1f\x8b\xc8\x2c\xc0\
-\xd3\xa0\xcc\x54\xfe\xdb\x8f\x6f\x3b\xa5\x87\x51\x5c\xc5\x83\x69\
-\x5a\xf4\x47\x71\x47\x25\xc9\xc2\xb5\x29\x37\x61\x64\x4a\xbf\x95\
-\xd7\xfe\x03\x3e\x90\x5a\xb0\x4d\xe2\x6a\x05\xaf\x18\xff\x5c\xbf\
-\xaf\x4c\xb2\x5c\x55\x03\xc1\x53\x62\xb6\xbf\xe6\xbb\x99\x8b\x1d\
-\xec\x50\xa5\xec\xaf\x56\x24\xf1\xcc\x05\x2c\xa4\x08\x48\x9b\xda\
-\xa4\x0e\x39\x73\x37\x85\x29\x4d\xf1\x74\x08\xd9\xc6\x9f\x74\xb1\
-\x31\x62\x0a\x31\xa7\xd0\x3a\xd0\xb5\x49\xbb\xd0\x49\x9c\x47\x36\
-\xf3\x99\xfb\xcf\x63\x52\x21\x8b\xf4\x7c\xda\x29\xad\x26\xb6\xe9\
-\x58\x17\xc7\xd9\x84\x4b\xa0\x48\x9a\x17\x33\xf7\x76\x51\x7f\xdc\
-\x83\xe2\x21\x2f\x62\x53\xb4\x2a\x51\x7f\x46\xaa\x1c\xb2\x4c\xaa\
-\x3d\x2c\xb2\x11\xe7\x0f\x7f\x9b\xa8\xaa\xf2\xd4\x14\x61\x66\x17\
-\x40\x70\xa3\x59\x16\x80\xcf\x29\xf9\x63\x12\x9b\x53\x8a\x6e\xb5\
-\x36\xbd\x2e\xd0\x49\x6d\xb9\x0a\xe3\x7c\x3b\x73\xe9\xb1\x72\x9b\
-\x64\xa0\xf0\x9a\xd2\x08\x86\xcf\x18\xb4\xb5\x62\xaa\xb3\x80\x9a\
-\x74\x30\x05\xad\xb4\x5c\xe5\x5b\xbb\x90\x99\xbb\x08\xd3\xd2\x1c\
-\xcf\xf6\x25\xcf\xd7\xb6\x28\x8a\x68\x66\x3f\xc7\xfa\x08\x8a\x4f\
-\x4e\x88\xf7\x27\xc5\x4d\x6e\xe0\x23\xf9\x19\x1d\x38\x06\xe7\xfc\
-\xd6\xe1\x2e\x59\x27\x5f\x4c\x7c\x02\xb4\xe8\xb1\x28\xa0\x77\x78\
-\x69\xb8\x37\x50\xda\x25\xd1\xae\xe3\xcf\xa7\x6b\x53\x85\x71\x58\
-\x85\x3d\x04\xad\x44\x70\xe0\x0f\xb4\x82\xc9\x9f\x6f\xdf\xcd\xa7\
-\x51\x34\xf9\x2b\x2f\x3e\x1f\xcc\xec\xc7\x6a\xc2\x87\xfc\x11\x20\
-\x04\xbb\x38\x9a\xc0\xf6\x5b\x87\xd5\x3c\x59\x43\x75\xec\x3e\xff\
-\x05\x38\x3d\xf5\x7b\x85\xb5\xa9\xf6\x1b\xd3\x4f\x71\x98\x04\xe8\
-\x5e\x6f\xdf\x93\x1d\x2f\x8e\xd6\x89\x75\xf2\x3f\x54\x49\x9a\xbe\
-\xb7\x73\xd7\x69\xdb\xb9\x92\x2a\x35\x76\xec\x37\xb9\xc1\xa8\x4b\
-\xd7\x6f\x57\x01\xa6\x66\x51\xf6\xab\xb3\x6f\x22\x80\x8c\xa1\xb9\
-\x98\xb0\xf8\xbd\x08\xe3\x04\x60\x69\x93\xda\x11\x80\x17\xda\xbd\
-\x54\x9a\xb7\x15\x70\x9c\x3d\x48\x29\x41\x9c\x10\xa2\x7a\xe9\x8e\
-\x82\x6d\x80\x24\xc1\x82\x93\xde\x16\xa4\x44\x21\x0c\xcc\x6b\x36\
-\x68\x1b\x7a\x1c\x51\x6b\x4c\xfb\xa9\x6c\xab\x9b\xac\x0a\x03\xad\
-\xf9\xf6\xc8\x4e\x69\xd1\xd9\x2d\x1b\xe1\xa7\x2c\xa9\xa0\xc9\x3e\
-\x42\xa3\xf8\x60\xbb\xc6\x1f\xd9\xa7\x8e\x9a\xbd\xd5\x47\xd8\x5f\
-\xa5\x45\x1f\x8a\x1a\x56\x45\xb2\x7b\xc5\x11\x65\x58\x6b\xc5\xee\
-\x31\x3c\x02\x41\x3b\xe2\x81\xd2\xf7\x4c\x20\xce\xa5\x96\xec\xde\
-\x53\x88\x42\xea\x1a\x93\xbb\x1a\xe8\xd3\x30\x9d\x58\x8e\x4d\x13\
-\xfa\x4d\x95\x6f\xfa\x02\xd7\x5d\x0e\x24\xa0\x54\x6e\x2f\x2e\xab\
-\x7d\x6a\x0e\x1a\xaf\xee\x34\x93\xdb\xc8\xd8\xe7\x75\x2d\x6a\x36\
-\xfe\x84\x0c\x5c\xf2\xc5\xa2\x34\x95\xa5\xb5\x4d\xea\x4c\x14\x8d\
-\xf1\xe5\x28\xda\xd8\xe7\xf9\x28\xa4\x8e\xe2\x8f\x57\xf8\x0c\x65\
-\x14\xa7\x7a\x48\x03\x90\x12\x8d\x08\x96\x92\xea\x31\x65\x18\xc2\
-\x58\x32\x22\x46\x94\xa1\x0c\x49\xc1\xb8\x62\x97\x28\xa3\x94\xb8\
-\x8e\x32\x0a\xff\x78\xca\x60\x24\xb1\x0a\x34\x79\x01\x65\x20\xcd\
-\xf3\x94\x51\xf4\x72\x31\x39\xb5\xcf\x0b\x29\xa3\x06\x80\x5f\x1d\
-\x05\x5f\x4f\x19\x3b\x08\xd3\x63\x2c\xec\xa1\x40\x25\x52\x2a\x80\
-\x6f\x37\x99\x3d\x13\x24\x22\x81\x16\x58\x76\x42\x68\xd5\x1a\x49\
-\x4a\x25\x19\xe0\xb1\x38\xe9\xbf\x38\xe5\x6f\x57\x3a\x4e\x42\x2b\
-\x79\x25\x8b\x84\xfa\xd7\x58\x44\x02\xc4\x98\x84\xa7\x66\x91\x42\
-\x8a\x32\x26\xa4\xba\xf7\x08\x27\x88\x09\x4b\x28\x4f\x48\x04\x3b\
-\x98\x72\xfe\xad\x34\x82\x3c\xcf\x17\x58\x3e\xd3\x13\x98\xb1\xcf\
-\x4b\x69\x24\x9f\x21\xab\x20\xf6\xf9\x6e\x1a\x9d\xef\x3c\xd0\xb9\
-\x15\xb4\x0d\xca\x8f\x3b\x8f\xc2\x8c\x10\x39\xea\x3c\xf6\x58\x0a\
-\x08\xa5\xe3\xc3\x0a\x88\x24\xb9\xc6\xe2\xe2\x61\xa5\x04\xbb\x8e\
-\x33\x9c\xfd\x2f\x0e\x2b\x48\xf3\x7c\x31\xb9\xf8\x2f\x28\xc3\x9f\
-\x39\x12\xc3\x07\xfb\xfc\x80\xc3\x0a\x68\x00\x67\xd2\xf0\x26\x63\
-\x29\xc3\xd8\x31\x57\x8e\x8d\x2c\x57\x34\x5c\x6c\x14\x26\x97\x4e\
-\x29\xc1\x64\x70\x0d\x57\x04\x34\x80\x1f\xce\x15\x82\x35\x90\x05\
-\xae\x5a\xdf\xcd\x95\x3a\xcd\x73\x55\x04\xa5\xbe\x5c\x45\x28\x61\
-\xfc\x20\x5e\xc6\x15\x40\x94\x7c\x7b\x94\x6f\x68\x2f\xbe\xbd\x15\
-\xcf\xa7\xcb\x83\x43\xd5\xa3\x5b\x0f\xd3\xb0\x32\xaf\x3c\x62\x5b\
-\xb8\x26\x3c\xb8\x07\x6a\x04\x98\x63\x05\x7d\xba\xbf\x57\x2f\x09\
-\x71\xbb\x19\x46\x73\xb4\x27\x00\x5c\x94\x39\x7c\x75\x5d\xa1\xfe\
-\xcd\xa3\x8a\x43\xdf\x27\xb0\x9b\x35\xdc\x81\x30\x95\x8c\xdd\x8d\
-\xe8\xb5\x24\xf6\xbe\xbe\xc9\xd3\xfd\x32\xcf\xfa\x35\x6d\xf2\x24\
-\xb3\x5c\x21\x4a\xa3\xe0\x5e\x50\x44\x9c\xc3\x50\x42\xa5\x1d\x0a\
-\x37\x73\x35\x1c\xc2\x2d\x1d\xc6\x07\x0b\x3b\x6e\xad\x09\xc5\x56\
-\xce\x29\x8c\x35\x85\xe1\x00\xb6\x53\xab\x80\x4e\x29\x55\x20\x9b\
-\x55\x08\xaa\xa5\x64\xc0\x2e\xf0\x87\x16\x4a\xb9\x80\x05\x31\xc0\
-\x87\x71\xc6\xef\xdc\x71\x2d\x9b\x25\x0c\xba\x72\x57\xcc\x05\xfc\
-\xbb\x99\xdc\xd2\x80\x2c\xe8\x81\x09\xfe\xf2\x22\x9a\x01\x82\x1b\
-\x01\xd3\x9a\xd6\x79\x50\x24\xb5\xa0\x54\x43\xf0\x40\x32\x44\x34\
-\xe6\xf6\x68\x85\x2b\x1a\x57\x5a\xf3\x63\x38\xf5\x45\x38\x0f\x48\
-\x08\x24\x1b\x80\x04\xb4\xdb\x66\xa8\x28\x12\x0d\x9c\x83\x21\x21\
-\xb8\x33\xb6\x63\xd1\x21\xcb\x60\x7c\x1a\x03\x1a\x9c\xc3\x40\x61\
-\xfb\xbc\xb6\x2f\x83\x0d\xd3\x42\x52\xff\xe0\xcf\xe5\xfc\x2b\x13\
-\x57\x6f\x00\
-\x00\x00\x08\xe3\
-\x3c\
-\x3f\x78\x6d\x6c\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x31\x2e\
-\x30\x22\x20\x65\x6e\x63\x6f\x64\x69\x6e\x67\x3d\x22\x55\x54\x46\
-\x2d\x38\x22\x20\x73\x74\x61\x6e\x64\x61\x6c\x6f\x6e\x65\x3d\x22\
-\x6e\x6f\x22\x3f\x3e\x0a\x3c\x21\x2d\x2d\x20\x43\x72\x65\x61\x74\
-\x65\x64\x20\x77\x69\x74\x68\x20\x49\x6e\x6b\x73\x63\x61\x70\x65\
-\x20\x28\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x29\x20\x2d\x2d\x3e\x0a\
-\x0a\x3c\x73\x76\x67\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x64\
-\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\x72\x6c\x2e\x6f\
-\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\x6d\x65\x6e\x74\x73\x2f\x31\
-\x2e\x31\x2f\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x63\x63\
-\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x63\x72\x65\x61\x74\x69\x76\
-\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\x72\x67\x2f\x6e\x73\x23\
-\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\
-\x67\x2f\x31\x39\x39\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\
-\x2d\x73\x79\x6e\x74\x61\x78\x2d\x6e\x73\x23\x22\x0a\x20\x20\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x73\x76\x67\x3d\x22\x68\x74\x74\x70\x3a\
-\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
-\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3d\
-\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\
-\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\x22\x0a\x20\x20\x20\
-\x78\x6d\x6c\x6e\x73\x3a\x73\x6f\x64\x69\x70\x6f\x64\x69\x3d\x22\
-\x68\x74\x74\x70\x3a\x2f\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2e\
-\x73\x6f\x75\x72\x63\x65\x66\x6f\x72\x67\x65\x2e\x6e\x65\x74\x2f\
-\x44\x54\x44\x2f\x73\x6f\x64\x69\x70\x6f\x64\x69\x2d\x30\x2e\x64\
-\x74\x64\x22\x0a\x20\x20\x20\x78\x6d\x6c\x6e\x73\x3a\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\
-\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\x65\x2e\x6f\x72\x67\x2f\x6e\
-\x61\x6d\x65\x73\x70\x61\x63\x65\x73\x2f\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x22\x0a\x20\x20\x20\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\
-\x31\x2e\x31\x22\x0a\x20\x20\x20\x77\x69\x64\x74\x68\x3d\x22\x31\
-\x30\x30\x25\x22\x0a\x20\x20\x20\x68\x65\x69\x67\x68\x74\x3d\x22\
-\x31\x30\x30\x25\x22\x0a\x20\x20\x20\x76\x69\x65\x77\x42\x6f\x78\
-\x3d\x22\x30\x20\x30\x20\x32\x38\x38\x20\x32\x38\x38\x22\x0a\x20\
-\x20\x20\x69\x64\x3d\x22\x73\x76\x67\x37\x36\x33\x31\x22\x0a\x20\
-\x20\x20\x78\x6d\x6c\x3a\x73\x70\x61\x63\x65\x3d\x22\x70\x72\x65\
-\x73\x65\x72\x76\x65\x22\x0a\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x76\x65\x72\x73\x69\x6f\x6e\x3d\x22\x30\x2e\x34\x38\
-\x2e\x34\x20\x72\x39\x39\x33\x39\x22\x0a\x20\x20\x20\x73\x6f\x64\
-\x69\x70\x6f\x64\x69\x3a\x64\x6f\x63\x6e\x61\x6d\x65\x3d\x22\x72\
-\x65\x6c\x6f\x61\x64\x2e\x73\x76\x67\x22\x3e\x3c\x73\x6f\x64\x69\
-\x70\x6f\x64\x69\x3a\x6e\x61\x6d\x65\x64\x76\x69\x65\x77\x0a\x20\
-\x20\x20\x20\x20\x70\x61\x67\x65\x63\x6f\x6c\x6f\x72\x3d\x22\x23\
-\x66\x66\x66\x66\x66\x66\x22\x0a\x20\x20\x20\x20\x20\x62\x6f\x72\
-\x64\x65\x72\x63\x6f\x6c\x6f\x72\x3d\x22\x23\x36\x36\x36\x36\x36\
-\x36\x22\x0a\x20\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x6f\x70\
-\x61\x63\x69\x74\x79\x3d\x22\x31\x22\x0a\x20\x20\x20\x20\x20\x6f\
-\x62\x6a\x65\x63\x74\x74\x6f\x6c\x65\x72\x61\x6e\x63\x65\x3d\x22\
-\x31\x30\x22\x0a\x20\x20\x20\x20\x20\x67\x72\x69\x64\x74\x6f\x6c\
-\x65\x72\x61\x6e\x63\x65\x3d\x22\x31\x30\x22\x0a\x20\x20\x20\x20\
-\x20\x67\x75\x69\x64\x65\x74\x6f\x6c\x65\x72\x61\x6e\x63\x65\x3d\
-\x22\x31\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x70\x61\x67\x65\x6f\x70\x61\x63\x69\x74\x79\x3d\x22\
-\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\
-\x3a\x70\x61\x67\x65\x73\x68\x61\x64\x6f\x77\x3d\x22\x32\x22\x0a\
-\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\
-\x6e\x64\x6f\x77\x2d\x77\x69\x64\x74\x68\x3d\x22\x36\x34\x30\x22\
-\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\
-\x69\x6e\x64\x6f\x77\x2d\x68\x65\x69\x67\x68\x74\x3d\x22\x34\x38\
-\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x6e\x61\x6d\x65\
-\x64\x76\x69\x65\x77\x38\x22\x0a\x20\x20\x20\x20\x20\x73\x68\x6f\
-\x77\x67\x72\x69\x64\x3d\x22\x66\x61\x6c\x73\x65\x22\x0a\x20\x20\
-\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x7a\x6f\x6f\x6d\
-\x3d\x22\x30\x2e\x38\x31\x39\x34\x34\x34\x34\x34\x22\x0a\x20\x20\
-\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x63\x78\x3d\x22\
-\x31\x34\x34\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x3a\x63\x79\x3d\x22\x31\x34\x34\x22\x0a\x20\x20\x20\x20\
-\x20\x69\x6e\x6b\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\
-\x2d\x78\x3d\x22\x37\x35\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\
-\x73\x63\x61\x70\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x79\x3d\x22\
-\x33\x34\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x3a\x77\x69\x6e\x64\x6f\x77\x2d\x6d\x61\x78\x69\x6d\x69\x7a\
-\x65\x64\x3d\x22\x30\x22\x0a\x20\x20\x20\x20\x20\x69\x6e\x6b\x73\
-\x63\x61\x70\x65\x3a\x63\x75\x72\x72\x65\x6e\x74\x2d\x6c\x61\x79\
-\x65\x72\x3d\x22\x67\x33\x22\x20\x2f\x3e\x3c\x6d\x65\x74\x61\x64\
-\x61\x74\x61\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x6d\x65\x74\
-\x61\x64\x61\x74\x61\x31\x33\x22\x3e\x3c\x72\x64\x66\x3a\x52\x44\
-\x46\x3e\x3c\x63\x63\x3a\x57\x6f\x72\x6b\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x20\x20\x72\x64\x66\x3a\x61\x62\x6f\x75\x74\x3d\x22\x22\
-\x3e\x3c\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3e\x69\x6d\x61\x67\
-\x65\x2f\x73\x76\x67\x2b\x78\x6d\x6c\x3c\x2f\x64\x63\x3a\x66\x6f\
-\x72\x6d\x61\x74\x3e\x3c\x64\x63\x3a\x74\x79\x70\x65\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x20\x20\x20\x20\x72\x64\x66\x3a\x72\x65\x73\
-\x6f\x75\x72\x63\x65\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x70\x75\
-\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x64\x63\x6d\x69\x74\x79\
-\x70\x65\x2f\x53\x74\x69\x6c\x6c\x49\x6d\x61\x67\x65\x22\x20\x2f\
-\x3e\x3c\x64\x63\x3a\x74\x69\x74\x6c\x65\x20\x2f\x3e\x3c\x2f\x63\
-\x63\x3a\x57\x6f\x72\x6b\x3e\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\
-\x3e\x3c\x2f\x6d\x65\x74\x61\x64\x61\x74\x61\x3e\x3c\x64\x65\x66\
-\x73\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\x22\x64\x65\x66\x73\x31\
-\x31\x22\x20\x2f\x3e\x3c\x67\x0a\x20\x20\x20\x20\x20\x69\x64\x3d\
-\x22\x67\x33\x22\x3e\x3c\x70\x61\x74\x68\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x64\x3d\x22\x6d\x20\x31\x34\x32\x2e\x38\x2c\x32\x31\x37\
-\x2e\x31\x20\x63\x20\x2d\x33\x39\x2e\x37\x2c\x30\x20\x2d\x37\x31\
-\x2e\x39\x2c\x2d\x33\x32\x2e\x32\x20\x2d\x37\x31\x2e\x39\x2c\x2d\
-\x37\x31\x2e\x39\x20\x30\x2c\x2d\x33\x39\x2e\x37\x20\x33\x32\x2e\
-\x32\x2c\x2d\x37\x31\x2e\x39\x20\x37\x31\x2e\x39\x2c\x2d\x37\x31\
-\x2e\x39\x20\x31\x34\x2e\x36\x2c\x30\x20\x32\x38\x2c\x34\x2e\x36\
-\x20\x33\x39\x2e\x34\x2c\x31\x32\x2e\x31\x20\x4c\x20\x31\x36\x37\
-\x2e\x39\x2c\x31\x31\x35\x2e\x38\x20\x32\x37\x30\x2e\x36\x2c\x31\
-\x30\x33\x2e\x33\x20\x32\x32\x31\x2e\x38\x2c\x35\x2e\x31\x20\x32\
-\x30\x36\x2e\x34\x2c\x33\x36\x2e\x33\x20\x43\x20\x31\x38\x37\x2e\
-\x37\x2c\x32\x35\x2e\x33\x20\x31\x36\x36\x2c\x31\x38\x2e\x39\x20\
-\x31\x34\x32\x2e\x38\x2c\x31\x38\x2e\x39\x20\x37\x33\x2c\x31\x38\
-\x2e\x39\x20\x31\x36\x2e\x34\x2c\x37\x35\x2e\x35\x20\x31\x36\x2e\
-\x34\x2c\x31\x34\x35\x2e\x33\x20\x63\x20\x30\x2c\x36\x39\x2e\x38\
-\x20\x35\x36\x2e\x36\x2c\x31\x32\x36\x2e\x34\x20\x31\x32\x36\x2e\
-\x34\x2c\x31\x32\x36\x2e\x34\x20\x34\x33\x2e\x35\x2c\x30\x20\x38\
-\x31\x2e\x39\x2c\x2d\x32\x32\x20\x31\x30\x34\x2e\x36\x2c\x2d\x35\
-\x35\x2e\x35\x20\x6c\x20\x2d\x34\x33\x2e\x33\x2c\x2d\x33\x33\x2e\
-\x36\x20\x63\x20\x2d\x31\x32\x2e\x35\x2c\x32\x30\x2e\x37\x20\x2d\
-\x33\x35\x2e\x32\x2c\x33\x34\x2e\x35\x20\x2d\x36\x31\x2e\x33\x2c\
-\x33\x34\x2e\x35\x20\x7a\x22\x0a\x20\x20\x20\x20\x20\x20\x20\x69\
-\x64\x3d\x22\x70\x61\x74\x68\x35\x22\x0a\x20\x20\x20\x20\x20\x20\
-\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x23\x32\x33\
-\x31\x66\x32\x30\x22\x20\x2f\x3e\x3c\x70\x61\x74\x68\x0a\x20\x20\
-\x20\x20\x20\x20\x20\x64\x3d\x22\x6d\x20\x31\x34\x32\x2e\x38\x2c\
-\x32\x32\x37\x2e\x31\x20\x63\x20\x2d\x33\x39\x2e\x37\x2c\x30\x20\
-\x2d\x37\x31\x2e\x39\x2c\x2d\x33\x32\x2e\x32\x20\x2d\x37\x31\x2e\
-\x39\x2c\x2d\x37\x31\x2e\x39\x20\x30\x2c\x2d\x33\x39\x2e\x37\x20\
-\x33\x32\x2e\x32\x2c\x2d\x37\x31\x2e\x39\x20\x37\x31\x2e\x39\x2c\
-\x2d\x37\x31\x2e\x39\x20\x31\x34\x2e\x36\x2c\x30\x20\x32\x38\x2c\
-\x34\x2e\x36\x20\x33\x39\x2e\x34\x2c\x31\x32\x2e\x31\x20\x6c\x20\
-\x2d\x31\x35\x2e\x36\x2c\x33\x31\x2e\x38\x20\x31\x30\x34\x2c\x2d\
-\x31\x33\x2e\x39\x20\x4c\x20\x32\x32\x31\x2e\x38\x2c\x31\x35\x20\
-\x32\x30\x36\x2e\x34\x2c\x34\x36\x2e\x32\x20\x43\x20\x31\x38\x37\
-\x2e\x37\x2c\x33\x35\x2e\x32\x20\x31\x36\x36\x2c\x32\x38\x2e\x38\
-\x20\x31\x34\x32\x2e\x38\x2c\x32\x38\x2e\x38\x20\x37\x33\x2c\x32\
-\x38\x2e\x38\x20\x31\x36\x2e\x34\x2c\x38\x35\x2e\x34\x20\x31\x36\
-\x2e\x34\x2c\x31\x35\x35\x2e\x32\x20\x63\x20\x30\x2c\x36\x39\x2e\
-\x38\x20\x35\x36\x2e\x36\x2c\x31\x32\x36\x2e\x34\x20\x31\x32\x36\
-\x2e\x34\x2c\x31\x32\x36\x2e\x34\x20\x34\x33\x2e\x35\x2c\x30\x20\
-\x38\x31\x2e\x39\x2c\x2d\x32\x32\x20\x31\x30\x34\x2e\x36\x2c\x2d\
-\x35\x35\x2e\x35\x20\x6c\x20\x2d\x34\x33\x2e\x33\x2c\x2d\x33\x33\
-\x2e\x36\x20\x63\x20\x2d\x31\x32\x2e\x35\x2c\x32\x30\x2e\x37\x20\
-\x2d\x33\x35\x2e\x32\x2c\x33\x34\x2e\x36\x20\x2d\x36\x31\x2e\x33\
-\x2c\x33\x34\x2e\x36\x20\x7a\x22\x0a\x20\x20\x20\x20\x20\x20\x20\
-\x69\x64\x3d\x22\x70\x61\x74\x68\x37\x22\x0a\x20\x20\x20\x20\x20\
-\x20\x20\x73\x74\x79\x6c\x65\x3d\x22\x66\x69\x6c\x6c\x3a\x23\x38\
-\x30\x38\x30\x38\x30\x3b\x66\x69\x6c\x6c\x2d\x6f\x70\x61\x63\x69\
-\x74\x79\x3a\x31\x22\x20\x2f\x3e\x3c\x2f\x67\x3e\x3c\x2f\x73\x76\
-\x67\x3e\
-\x00\x00\x07\xcb\
-\x00\
-\x00\x25\x99\x78\xda\xed\x5a\x5b\x6f\xdb\xc8\x15\x7e\xcf\xaf\x60\
-\x15\x2c\xb0\x41\xc5\xd1\x5c\xc9\xa1\x7c\x59\x60\x13\x6c\xb1\xc0\
-\x2e\x0a\x34\x49\xfb\x4c\x93\x23\x89\x0d\x45\x0a\x24\x6d\xd9\xfe\
-\xf5\xfd\xce\x90\x94\x64\x47\x4e\xec\x6d\x8a\x2e\x10\x51\x90\x3d\
-\x3c\x97\x39\xf7\x33\x3c\xb4\xcf\x7f\xba\x5d\x97\xc1\x8d\x6b\xda\
-\xa2\xae\x2e\x26\x82\xf1\x49\xe0\xaa\xac\xce\x8b\x6a\x79\x31\xf9\
-\xf8\xe1\x97\xd0\x4e\x82\xb6\x4b\xab\x3c\x2d\xeb\xca\x5d\x4c\xaa\
-\x7a\xf2\xd3\xe5\xab\xf3\xbf\x84\x61\xf0\xb6\x71\x69\xe7\xf2\x60\
-\x5b\x74\xab\xe0\xd7\xea\x53\x9b\xa5\x1b\x17\xfc\xb8\xea\xba\xcd\
-\x7c\x36\xdb\x6e\xb7\xac\x18\x80\xac\x6e\x96\xb3\x37\x41\x18\x5e\
-\xbe\x7a\x75\xde\xde\x2c\x5f\x05\x41\x00\xb9\x55\x3b\xcf\xb3\x8b\
-\xc9\xc0\xb0\xb9\x6e\x4a\x4f\x98\x67\x33\x57\xba\xb5\xab\xba\x76\
-\x26\x98\x98\x4d\xf6\xe4\xd9\x9e\x3c\x23\xe9\xc5\x8d\xcb\xea\xf5\
-\xba\xae\x5a\xcf\x59\xb5\xaf\x0f\x88\x9b\x7c\xb1\xa3\x26\x6d\xb6\
-\xca\x13\x89\x24\x49\x66\x5c\xce\xa4\x0c\x41\x11\xb6\x77\x55\x97\
-\xde\x86\x0f\x59\xa1\xe3\x31\x56\xc9\x39\x9f\x01\xb7\xa7\x7c\x1e\
-\xd5\xfc\xb6\x84\x2b\x9e\x54\xc6\x63\x0f\xa5\xc3\xfd\x1b\x7c\x77\
-\x0c\x23\x80\xb5\xf5\x75\x93\xb9\x05\x38\x1d\xab\x5c\x37\x7b\xf7\
-\xe1\xdd\x0e\x19\x72\x96\x77\xf9\xc1\x36\xa3\xf7\x1f\xc8\x7d\x10\
-\x92\x2a\x5d\xbb\x76\x93\x66\xae\x9d\x8d\x70\xcf\x7f\x90\x0f\xc2\
-\x03\xb6\x45\xde\xad\x70\xcb\xf9\x0f\xfe\x7e\xe5\x8a\xe5\xaa\x3b\
-\x00\xdc\x14\x6e\xfb\x73\x7d\x7b\x31\xe1\x01\x0f\xa4\xb5\xf4\xf5\
-\x88\x22\xbf\x98\xc0\x17\x71\xa4\xc4\xa8\xda\xdc\x8b\xbc\x98\x6c\
-\x1a\xd7\xba\xe6\xa6\x17\x39\xca\x9f\xef\x64\x73\xa6\x2d\xd3\x41\
-\x93\x24\x2a\xf1\x24\xa3\xa1\xf3\xbc\xce\x48\x73\xd8\xe5\xca\x0d\
-\x23\x4f\x5f\x9e\xef\x90\x84\xc9\x49\x1d\x62\x09\x82\x4d\xba\x44\
-\x8a\x94\x75\x73\x31\x79\xbd\xf0\xd7\xa4\x47\x5c\xd5\x4d\xee\x9a\
-\x11\x15\xf9\xeb\x01\xaa\x86\x96\x45\x77\x07\x23\x07\x70\x7d\xf5\
-\x6f\x97\x75\x5d\x5d\xba\x26\xad\xc8\x00\xc1\x07\xcc\xb2\x81\x7f\
-\x8e\xc1\xaf\x8b\xdc\x1d\x43\xec\xac\x25\xf5\x76\x82\x8e\x62\xdb\
-\x55\x9a\xd7\xdb\x8b\x89\x7c\x8c\xdc\x16\x15\x10\xe1\x10\x9a\x58\
-\x8b\x27\x08\xc6\x58\x69\xbb\xdb\x1f\x31\xd9\xb9\x49\x8c\x56\xb7\
-\xab\x7a\x4b\x86\x5c\x4c\x16\x69\xd9\xba\xc7\xbb\xdd\xd7\xf5\x9a\
-\x82\x62\x45\xa2\xe9\x7a\x8c\xcf\x10\x7c\x71\x04\x7c\x77\x14\x3c\
-\xe8\x06\x9e\x78\x88\xee\xe7\x48\x70\xea\xd8\x3c\x81\x5c\xa7\xb7\
-\xc5\xba\xb8\x77\xf9\x11\xb7\x65\xd7\x4d\x83\xee\x11\x96\xe9\x9d\
-\x6b\xf6\xe9\x17\xcc\x2e\xcf\xd7\xae\x4b\xf3\xb4\x4b\xf7\x8e\x18\
-\x21\x52\x20\x8b\xd0\x10\xe6\xff\x78\xf7\xcb\xe5\x79\x96\xcd\xff\
-\x55\x37\x9f\x7a\x32\xba\x08\x93\x5e\xd5\xd7\x70\x24\xe8\xf2\x6c\
-\x8e\x22\x5c\xa7\xdd\x65\xb1\x46\x8c\xa8\xda\xff\x8a\xcc\x3e\x9f\
-\xed\x11\x44\xd3\xdd\x6d\xdc\x7e\x8b\x7e\x13\x24\xbd\x2f\xe2\xa3\
-\x7d\x2f\xcf\xd6\x05\x31\xcd\xde\x77\x45\x59\xfe\x4a\x7b\x7b\xb5\
-\x69\xaf\xa2\x2b\x1d\xad\x67\x83\x6e\x58\xed\xd4\x9d\x8d\x56\x80\
-\xd4\x2d\xda\xbd\x75\x74\x27\x12\xb2\x2c\xcd\x8b\xb4\xfc\x1b\xfd\
-\x82\x6b\x46\xa5\x28\x68\xa1\x48\x98\x11\x26\x52\x76\xb2\x03\x53\
-\xd0\x22\x66\x8d\x89\x22\xb5\x83\xc2\x95\x96\xc5\x46\x45\x7a\x0f\
-\x5b\x1c\xdf\x60\x71\x74\x03\x52\xe8\xa1\x1e\x52\xab\x78\x87\xf6\
-\x6d\x70\xbe\x6a\x1c\xda\xf6\x6b\xac\x5d\xda\x1c\xd0\x89\x1d\xdd\
-\x72\x00\x7e\xac\x8a\x0e\x0d\xf8\x1a\x4d\xe4\x3d\x75\x94\xbf\x57\
-\x1f\x77\x69\xbb\xa7\xfa\x80\xda\x6b\x29\x26\x08\x75\xda\x35\xc5\
-\xed\x8f\x9a\x69\x6d\x92\x44\x4c\x39\x3e\x50\x32\x8a\xcc\x34\x8a\
-\x99\x34\x3c\x16\xd3\x50\x70\xcd\xa2\x28\x4e\xde\x78\xc7\x3f\x54\
-\xe3\xd0\x90\x23\x0a\xa2\x0b\x75\xf5\x66\x1f\x70\xdf\xfb\x00\x01\
-\x72\xef\x04\x14\x5a\x77\x57\xba\x1e\x13\xfa\xfe\x33\x1f\x3a\xd3\
-\x99\x07\x0d\xed\x60\x2e\x0e\x58\xea\xc5\xa2\x75\x1d\xa5\x3a\x29\
-\xf5\xa4\x14\xf3\x65\x29\x57\x96\x3e\x5f\x97\xd2\x97\xca\xec\xa1\
-\x85\x00\x50\x32\x5d\x9e\x2f\xf7\xd9\xb5\x54\x93\xdd\xfd\x00\x31\
-\x80\x6c\xd2\x6e\xb5\xdf\x15\xd0\xdf\x03\xb4\x00\x66\xa6\x42\x04\
-\x6f\x83\x58\x33\x45\x2b\x11\x33\x4d\x7e\x4f\xfa\x95\x50\x96\xc9\
-\x20\x0b\xf8\x34\xe6\x58\x98\x88\x25\x53\x21\x11\x96\xc0\xff\x1c\
-\xd6\x84\x9b\xf2\x01\x14\x12\xd1\xb8\xee\xf1\x6f\x03\x19\x0b\x16\
-\xf7\xfb\x4a\xa1\x99\xf5\xa2\x46\xe9\xf7\xc1\x1a\x02\xa4\xd4\x2c\
-\x86\xa8\xd0\x28\x08\xe1\x41\x98\xc4\x2c\x9a\x86\x5a\x01\x3a\xac\
-\xe9\x27\x28\x3d\x45\x40\x88\x01\x74\x80\x1d\x98\x3d\xc4\xb3\xfa\
-\xd5\xc0\x68\x74\xe0\xf7\xeb\xef\xc3\x3d\xea\x7e\xf2\x30\x72\xe4\
-\xab\xf8\xf3\xb0\x2d\x50\xfe\xf3\xd7\x52\x89\x85\xec\x63\x3e\x5b\
-\x3e\xf6\xb4\x10\xc7\x5c\xbd\x1e\x8c\x95\x8a\x29\x32\x71\x70\x58\
-\xef\x9e\xa9\x77\x58\x78\xe8\xd0\xff\xce\xdd\xf0\x90\x67\xf7\xa8\
-\x11\x18\x3e\x20\xd9\xbb\xdc\x22\x3a\x09\x87\x23\x24\x0e\x76\x11\
-\x68\x62\x91\xa8\x36\xdd\x2f\x85\xe1\xcc\x04\x1a\x2e\x8b\xc8\xd1\
-\x1c\xce\x33\x6a\xb0\xc6\x90\x2d\x5f\x76\xb8\xc2\xfe\x3b\x97\x9b\
-\xbd\xcb\xcd\x51\x97\x0b\xf5\x94\xcf\x2d\xa7\xcf\x19\xdd\x1c\x14\
-\xc9\x18\x02\xfa\xee\x7d\xee\xfd\x1d\x4a\x78\x00\x2a\x32\x1b\x1b\
-\xf2\x38\x9e\xa1\x4d\xc2\x05\x6c\x63\x91\x72\x21\x54\x91\x4c\x68\
-\x9c\x40\xf1\x94\x33\x21\x95\x54\x06\x19\xa1\x98\xb4\x02\x6c\x9c\
-\x29\xf4\x40\x43\x6c\x42\xc9\xc4\x43\x24\xbc\x22\xad\x22\x46\x65\
-\xb9\x88\x10\x02\x66\x40\x04\x7a\x62\x8c\x91\xca\x41\x1a\x60\x33\
-\xa5\x93\x08\xed\x78\xba\x5f\x06\xdc\x7f\xf0\x2c\xc8\x95\xdf\xfe\
-\x99\x64\xfd\xef\x6f\x47\xcc\x5f\x48\x55\x52\x08\x19\x0e\x11\xac\
-\xd3\x6f\xba\xf3\x17\xa9\x5e\x62\xd1\x1f\xa1\xfd\x3f\x50\x65\x01\
-\x32\x49\xe3\x30\xb0\x53\x44\x2c\x16\x09\xd7\x2a\x90\x4c\x2a\xa5\
-\x0c\x15\x25\x93\x51\x8c\x5e\x1b\x8c\x09\x08\x08\x39\x1d\x59\xab\
-\xad\xd0\x82\x98\x54\x84\x54\x8e\xc0\x04\x56\x21\x22\x02\x21\x30\
-\x3a\x46\x47\x65\x09\xf2\x70\x00\x90\x0f\x12\x9d\x48\x61\x91\xea\
-\x82\x32\x1d\x5b\x69\x3d\xe4\xb0\xe0\x46\x1b\x30\xf8\x98\x02\xd0\
-\xd3\x1b\x6e\x63\xa9\x70\xab\xb9\xe4\x09\x00\x31\x94\x80\xaa\xd8\
-\xc9\x2a\xae\x07\x00\x12\x1c\x9a\x5b\x5f\x16\xdc\x85\x11\xd1\x5b\
-\x1e\x99\x98\x92\x10\x1d\x41\x58\xcf\x61\xa0\x2f\x41\xa8\x80\xc0\
-\xd1\xd7\x11\x44\x5b\xe9\x4f\x77\xf0\xc4\xa8\x1e\x02\xc5\x10\x17\
-\x11\x0d\x87\x90\xc4\x57\x5b\xcf\x63\xc8\x9e\xe0\x37\x5f\xc4\xde\
-\x34\x3c\xb5\x8c\x65\x2c\xb9\xc0\x73\x02\x31\x59\x30\x11\x24\xb1\
-\x09\x1c\x0b\x08\xf6\xe7\x52\xfa\x02\x05\x8f\x1c\x95\x85\xeb\x2c\
-\x3c\x46\xf6\xc5\x02\x7a\x7a\xd9\x64\x3f\xf7\xb2\x44\xa2\xa4\x1e\
-\x41\xe0\xf2\x0a\x97\x3e\x57\xc9\xe8\xef\x30\xf1\xcb\x20\x62\xdc\
-\xfb\x9d\x7f\xcd\xfa\xff\x41\xb1\x84\x2f\x31\xe9\x79\xc4\x2f\x26\
-\x2b\xfb\x9b\x31\xe7\xa8\x8c\xe8\x5e\x47\x98\xb3\x22\xda\x44\x5b\
-\x1c\x1c\x80\x20\xf5\xac\xa6\x8a\xf1\x05\x28\xfa\xea\x0d\xe8\xb0\
-\x90\x32\xf1\x3c\x2a\x11\x20\xa1\x12\x42\xc2\xc6\x8a\x40\x89\xe1\
-\xca\xe0\xcc\xa6\xfd\xe2\x5d\xad\x97\x54\xed\x51\x6f\x93\xcf\xff\
-\xcc\x03\x22\x63\x7d\xcf\x48\x2c\x9e\x3b\x00\x41\x41\x46\x86\x4e\
-\x75\x66\xad\x8e\xf0\x44\x23\xc7\x96\x21\x49\x5f\x28\x89\x5a\x8f\
-\x12\xaf\x1c\x0a\x4c\x93\xba\x10\xa3\xad\x6f\x33\x36\x56\x5a\xf6\
-\x10\xcf\x91\x44\x7d\x3d\x33\xeb\x4d\x44\x63\x90\x11\x6a\xb2\xaf\
-\x4e\x15\xd3\x3e\x38\xda\x14\x0a\x35\x8e\xa8\xb0\xa4\xf0\x8c\x78\
-\x6c\x18\xcf\x47\x0c\x83\x22\x89\x69\x6f\x81\xee\x22\x8d\xa4\xc3\
-\x30\x82\x21\xda\x1b\x06\xc9\xb1\x42\x87\x88\x46\x0f\x79\x81\xf4\
-\xf8\x01\x32\x5f\x71\x98\x53\x9e\x73\xc2\xfc\xd9\x4e\xc5\xde\x01\
-\xa7\xe6\xf0\x9d\x36\x87\xe7\x26\xc0\xb7\xd4\x21\x7c\x91\x61\x7f\
-\x90\xfa\xb9\xcf\xa6\x70\x43\xf8\xdc\x4c\x78\xf9\xe6\xe3\x74\xd0\
-\x7d\xf6\x9e\x00\x32\x25\x8f\xd1\x5e\xfd\x8b\x02\x84\xc1\xca\x58\
-\xe1\x70\x47\xcf\xc3\xd1\xad\x78\x32\x55\x78\x88\x52\x46\xe9\xe8\
-\xcd\xc1\x9b\x35\x3f\x5e\x18\xa3\xc3\x71\xb4\x1e\xc7\x8b\xba\xea\
-\xc2\xb6\xb8\x77\x73\xa5\xd1\x87\x94\x94\x36\x8e\x36\xb7\x67\x3d\
-\x9c\x68\xe6\x15\xbd\x3a\x2a\x7b\xc8\x4d\xda\x14\x69\xd5\x3d\x80\
-\x6d\xfd\xab\xbc\xf9\x55\x5d\xe6\x23\x5b\xe3\xba\x6c\x35\x12\x75\
-\xee\xb6\x0b\xd3\xb2\x58\x56\xf3\xb6\x4b\x9b\xee\x8c\x46\xf8\xe1\
-\x05\xe0\x1c\xe6\xfe\x70\xb6\x6d\x8a\xae\xa8\x96\xe1\xba\xce\xdd\
-\xbc\x6c\xc2\xee\x6a\x60\xaa\xb2\x55\xdd\x0c\x5c\xfd\x20\xc4\xfd\
-\xf5\x68\x10\x3a\x83\xc4\xfa\x13\x69\x5a\xb9\x5e\x85\x45\xba\x2e\
-\xca\xbb\xf9\xcf\x45\x47\xca\xa4\xeb\xe0\x9f\xae\x49\x83\xf7\x70\
-\xa6\x1f\x9a\x4e\xc3\xd2\x69\x58\x3a\x0d\x4b\xa7\x61\xe9\x34\x2c\
-\x9d\x9e\x87\x4e\xc3\xd2\x69\x58\x3a\x0d\x4b\xa7\xe6\x70\x1a\x96\
-\xbe\xbb\x61\x49\x4c\x95\x65\x4a\x58\x93\xc4\xc7\x66\xa5\xaf\x4f\
-\x4a\x26\xf1\x57\x6c\xe4\x9f\x78\x64\x3a\xfa\xb7\xa3\x17\x8f\x4c\
-\xf4\xdf\x04\x97\xff\x01\x37\xa4\x74\x5f\
-\x00\x00\x1e\xf1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3\x3e\x61\xcb\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x03\x76\x00\x00\x03\x76\
-\x01\x7d\xd5\x82\xcc\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1e\x6e\x49\x44\
-\x41\x54\x78\x9c\xed\x9d\x79\x7c\x14\x65\xd2\xc7\xbf\xd5\x21\x80\
-\x0a\x28\x2a\x1e\xe0\x81\x08\xab\xa0\x0b\xb9\x09\xc8\xe1\x85\xd7\
-\x2a\x28\x6e\x94\x24\x80\x08\x82\x2c\xbb\x8a\x8a\x37\x2a\x97\x07\
-\x2a\x8a\xeb\xb1\x1e\x88\xcb\x72\x24\x6a\xf0\x40\xd7\x5d\x7d\x3d\
-\x20\x20\x90\x90\x63\x82\x8b\x28\x2c\x28\xde\x2b\xe0\x81\x8a\x5c\
-\x49\xd7\xfb\x47\xcf\x24\x73\x74\xcf\xf4\x24\x93\x4c\x30\xf9\x7d\
-\x3e\x0d\x93\xae\xa7\x9f\xa7\xba\xab\xfa\xe9\x7a\xea\xa9\xa7\x1e\
-\x51\x55\x9a\xd1\x74\x61\xc4\x9b\x81\x66\xc4\x17\xcd\x0a\xd0\xc4\
-\xd1\xac\x00\x4d\x1c\x2d\xe2\xcd\x40\xbc\x70\xeb\x80\xf7\x7a\x03\
-\xff\x07\x1c\xe4\x3d\xf5\x15\xb0\x59\x61\x33\xc2\x27\xc0\x66\xe0\
-\xc3\xfb\x0b\xcf\xfc\x30\x5e\x3c\x36\x04\x9a\xac\x02\xa8\x90\xa9\
-\xd0\x0e\x00\x01\xe0\x38\xef\x71\x06\x08\x3e\xd3\xf8\xa6\xd3\x97\
-\x6e\x01\x5e\x47\x58\x02\x14\x3e\xb8\xf4\x8c\xca\x86\xe7\xb6\xfe\
-\xd0\x64\x3f\x01\xa6\x21\xdd\xd5\x10\xd4\x10\x54\x04\x33\xe0\x00\
-\x15\x50\x03\x4c\x83\xce\xa6\xc1\x35\xa6\xf0\x8e\x29\x6c\x9e\x74\
-\xe6\xd2\x1b\x27\x9d\xb9\xf4\xe0\x78\xf3\x1f\x2b\x48\x53\x1d\x06\
-\x4e\x3a\x73\x69\x21\x30\x20\xe0\xa4\x40\xb8\xa7\xa1\x52\xfd\xf3\
-\x67\xe0\x39\x60\xe6\xec\x77\xce\xf8\x5f\x7d\xf0\xd7\x50\x68\xb2\
-\x3d\x80\x0a\xdd\x4d\xeb\x0d\xaf\x39\x7c\x6f\xbe\xf7\x30\x25\x90\
-\xee\x47\x6b\x6b\x0a\x13\x4d\x61\xfd\xc4\x73\x96\x5e\x11\xef\x7b\
-\xa9\x0b\x9a\x64\x0f\x70\xdd\xa0\xa5\x87\x01\xdb\x83\xcf\x57\x3f\
-\x09\xa9\xfe\x27\xf0\x7c\xe0\x69\x7f\xfa\x9b\xc0\xd5\x8f\xbd\x75\
-\xfa\xe7\x31\x63\xb2\x81\xd0\x24\x7b\x00\x15\xe9\x1e\xf0\xcd\x37\
-\xac\xc3\x67\x13\xf8\xec\x00\xdf\xa1\x46\xcd\xe1\x7f\xde\x8f\x7e\
-\x9e\x1a\xac\xfb\xf3\xf9\xcb\x2e\x89\xf7\xbd\x45\x8b\x26\xa9\x00\
-\xa6\x41\xf7\x6a\x81\xda\x08\x55\xfd\x84\x1e\x4c\x0f\xa1\xd5\xd0\
-\xdb\xaa\x50\x30\xe1\x82\x65\x57\xc6\xfb\xfe\xa2\x41\xd3\x54\x00\
-\xa1\x7b\x80\x40\x9d\x85\x5a\x63\x0f\x84\xa3\xd5\xd0\x13\x4c\x43\
-\xe6\x8e\xbf\xb0\x70\x52\xbc\xef\xd1\x2d\x9a\xa4\x02\xa8\xd0\x3d\
-\x0a\xa1\x5a\x9f\x07\xb1\x19\x2e\xfa\x7f\x3a\xaa\xe9\x88\x29\xcc\
-\x1a\x77\x51\xe1\x3d\xf1\xbe\x4f\x37\x68\x72\x46\xe0\xf8\x0b\x97\
-\x1d\x08\xf2\x39\x70\x98\xef\x5c\x38\x23\xcf\x35\x2d\x88\xee\xa5\
-\x6d\x07\xd6\x00\x8b\x81\x25\xcf\x2e\x19\xf8\x7d\xf4\x1c\xd7\x2f\
-\x9a\x94\x02\x5c\x7d\x51\xe1\x51\x40\x81\x42\xbf\xea\x93\xa1\x42\
-\xfb\x05\xd8\x0b\x1c\xea\x40\x0f\x84\x84\xa1\xf9\xae\xb3\xca\xfc\
-\x04\xfc\xf9\xb9\x57\x06\x2e\x8c\x8e\xeb\xfa\x45\x93\x50\x80\xb1\
-\x83\x0b\x8f\x00\xfa\x03\x8f\x01\x47\x07\x09\xed\x7b\xe0\xef\x40\
-\x19\x50\x0e\xfc\xf7\xd9\x25\x03\xcd\xab\x2e\x2e\x3c\x41\x21\x0d\
-\xeb\xb8\x1c\x38\xde\x57\x9f\x06\xf5\x04\xc1\xd0\xa0\x61\x64\xf5\
-\x79\xeb\xbf\x45\x08\x13\xe6\xbd\x34\xe0\xa7\x5a\xdf\x50\x0c\xf1\
-\x9b\x54\x80\xab\x86\x14\xb6\x00\xce\x00\x2e\x05\x2e\x06\x8e\x74\
-\xf0\xf2\xfd\x13\x18\x37\xf7\xd5\x81\xdf\x84\xab\xef\xca\xa1\x85\
-\x6d\x41\x1e\x04\xc6\x11\x24\xd9\x40\xdf\x41\x20\xc2\x7c\x3e\xd6\
-\x2a\xf4\x9d\xbf\x78\xc0\xaf\xe1\xda\x6d\x08\xfc\x66\x14\x60\xcc\
-\xc5\x85\xad\x80\x41\x58\x42\x1f\xac\xe2\xed\xc2\xed\xf1\x8b\x0a\
-\xd7\xfc\xfd\xe5\x81\xf3\xa2\x69\x63\xd4\xa5\xcb\xcf\x52\xab\xb7\
-\x38\x36\x1a\x81\xfb\xf5\x34\xdf\x00\x87\x63\x29\xe4\x0b\x0b\x5e\
-\x1c\x30\x2c\x9a\xf6\xeb\x03\xfb\xbd\x02\x8c\xbe\xa4\xf0\x6c\x60\
-\xb4\x0a\x7f\x00\x69\x67\x57\xc6\xe6\x2d\xbd\x62\xde\x4b\x03\xe6\
-\xd7\xa6\xbd\x91\x59\xcb\xd3\x80\xd5\x6a\x37\x93\x1a\xde\x1e\x98\
-\xb7\xf0\xc5\x01\x57\xe6\x5e\xbe\xfc\x00\xe0\x61\x60\x3c\x70\xfe\
-\xa2\x17\x06\xbc\x59\x1b\x3e\x62\x85\xfd\x56\x01\x46\x0d\x5d\xde\
-\x15\x61\x36\x70\x61\x30\x2d\x82\xe5\xfe\xfa\xfc\xc5\x03\x06\xd7\
-\xa5\xed\xe1\x97\x2d\xbf\x07\xb8\x1d\x22\xd9\x03\xe2\x4f\xdf\x07\
-\x74\xc9\x7b\xbe\xff\x97\x39\xc3\x56\xb4\x00\xd6\xaa\xb0\x07\x48\
-\xcd\xcf\xef\x1f\x37\x21\xec\x77\xf1\x00\x57\xfc\x71\x79\x1b\xe0\
-\x0e\x0c\xae\x07\x5a\x82\xf3\x77\xd8\xe6\xa9\x7e\x8f\x30\xce\xff\
-\xc4\xf0\xcb\x96\x9f\x01\xdc\x05\x9c\x02\x7c\x81\x30\x67\xe1\x0b\
-\x03\x9e\x0a\xc7\x83\x69\xc8\x34\x60\x30\x70\x6a\x30\xcd\x49\x21\
-\x14\x12\x81\x51\xc0\xdd\x79\xcf\xf7\xaf\x1c\x96\xb3\xa2\x02\xc8\
-\xc1\xb2\x55\xde\x0b\xd7\x5e\x7d\x62\xbf\x71\x04\x8d\xcc\x5a\x2e\
-\x23\xb3\x96\x8f\x30\x85\x8d\xa6\x70\x8b\x29\xb4\xf4\x39\x6b\x9c\
-\xfc\xf4\xfe\x5e\x3e\xaf\x53\xe7\xb9\x05\x2f\x0e\xa8\x9e\xbe\xcd\
-\xbd\x7c\xf9\x60\x15\x79\xd7\x34\xe4\x74\xd3\x90\x0e\xa6\x21\x29\
-\xa6\xc8\x93\x39\xc3\x56\xcc\x0c\xc7\x4b\xde\xf3\xfd\xf7\xaa\xf0\
-\x40\x75\x5b\x36\x33\x86\x01\xbc\xd4\xf0\x98\xed\xab\xc3\x14\xf6\
-\x7a\x69\x7d\xeb\xf3\xb9\x45\xc2\x7e\xd1\x03\x0c\xbf\x6c\xf9\x11\
-\x08\x2f\x03\xa7\x01\x11\xe7\xed\x83\xba\x5e\x7f\x94\xfa\xff\x61\
-\x1a\xf2\x30\x7e\xfd\x86\x5f\x4f\x72\xd3\xb0\x9c\x15\x4f\x3c\x9f\
-\xd7\xff\x0b\xa7\x16\x4c\x83\x92\x90\xeb\x6a\xae\x0f\x80\x1f\xbd\
-\x47\xd6\xf0\x15\x3d\x11\xb6\x62\xf0\x47\x2f\xad\x93\x53\x1b\x0d\
-\x81\x46\xaf\x00\xb9\x97\x2f\x3f\x11\x91\xb7\x54\x38\xd1\xa9\x4c\
-\xb8\xef\x70\xd0\xe7\xa1\x5a\x01\x86\xe5\xac\x38\x22\xa0\xce\xc0\
-\x3a\x0c\x85\x14\xc0\x59\x01\x84\x8d\x58\x81\x21\x6d\x83\xaf\x0f\
-\x54\x08\xa9\xfe\xcf\x7b\xfe\x6e\xac\xba\xdb\x78\x0b\xb4\x75\xe6\
-\xbe\xfe\xd1\xa8\x3f\x01\xd9\xd9\x2b\x52\x4c\x43\x56\x9a\x06\x27\
-\xba\x0c\xd4\x70\xea\x7a\x31\x85\x1f\x9f\xcf\xeb\xbf\xd9\x57\xb7\
-\x69\xb0\x43\x0d\xf6\x3a\x7e\x3e\x0c\xbe\x0b\xc7\x5b\xc1\xc2\xfe\
-\xa6\x1a\x52\xee\x9b\x0f\xf0\x9f\x23\xa8\x9e\x17\x30\xc4\x2e\xd8\
-\xe4\x22\x53\xe8\xe4\xc7\x7f\x5c\x83\x4e\x1b\xad\x02\x0c\xcb\x59\
-\x71\x96\x0a\xcb\x4c\xe1\xc8\xe0\x6f\xad\x1a\x36\xc2\x0e\x16\x78\
-\xe8\x34\xee\x4e\xff\xfa\x5f\x5c\xd8\x7f\x8f\x29\x2c\xb1\xe8\x5e\
-\xa1\x19\xd5\x13\x3c\x5b\x4c\x91\xb2\x48\x3c\x9a\xc2\x2f\x4e\x4a\
-\x69\x6b\x0f\x04\xf1\xef\xa5\x79\xea\xef\x29\x46\x46\xa3\x54\x80\
-\xcb\x72\x57\xfc\xd1\x14\xfe\x65\x1a\xb4\x0d\x17\x8c\x11\x7e\xde\
-\x3e\x44\xa8\x9d\x2e\x1d\xf9\xfe\x91\xfe\xed\xa8\xc8\x35\xa6\x21\
-\xa5\x41\x6f\xe9\x37\x2a\x0c\x7b\x69\x7e\xbf\x5d\x91\xf8\x34\x85\
-\xd4\x68\x94\xd2\xa6\x87\xaa\x54\x83\x88\x8a\x56\x9f\x68\x74\x0a\
-\x90\x35\x62\x45\xb2\x1a\x2c\x50\xc3\x6b\xe5\x07\x0b\xb5\x46\xa0\
-\x01\x5d\xaf\x46\xee\x7a\x31\x85\x34\xff\xb6\x5e\x9a\xdf\xef\x5b\
-\x15\xfa\xa8\x30\x54\x85\xe9\xa6\x70\xa5\x69\x70\xca\xcb\xff\xe8\
-\x57\x1c\x89\xcf\x21\xa3\xdf\xef\xa4\x06\x47\xd9\x7c\x3a\x1c\x22\
-\x88\xbc\x7c\x1a\x7e\xf7\x20\xf2\xc8\x6b\x73\xfb\x6d\xab\xbf\xa7\
-\x19\x19\x8d\xca\x08\xbc\x74\xe4\xfb\x87\x20\xb2\x18\x68\xed\x7f\
-\x3e\xa2\x91\xe7\x3c\xf6\xb6\x50\x43\x4f\x03\xde\xf0\x2f\xf3\xca\
-\xbc\x7e\x95\xc0\x2b\xde\xc3\x35\x4c\x91\x1a\x65\x8a\x34\x23\x68\
-\x3f\x6a\xf9\x12\x98\x16\x4d\x9b\xf5\x81\x46\xd3\x03\x0c\xbd\xe2\
-\x7d\x51\xe1\x1f\xa6\xd0\xc5\xe9\x5b\x1a\xee\x7b\xea\xb2\xeb\xcd\
-\x1e\x3c\xfa\xfd\xd6\x91\xb9\x89\x0c\x35\x18\xed\x2e\x98\x24\xc8\
-\x27\x51\x43\x9f\xf8\xc6\x9c\xd3\x7e\x89\x05\x2f\x75\x41\xa3\xe9\
-\x01\x4c\x83\x9b\xb0\xbc\x6b\xd5\xa8\x63\x30\x46\xe0\x49\xeb\xe7\
-\x49\x0a\xd3\x81\x9b\x6b\xcb\x27\xc0\x05\xe3\x56\x0e\x47\x6a\x78\
-\x0d\xd7\x0b\x39\xd0\xcb\xde\x7c\xea\xb4\x97\xeb\xc2\x43\xac\xd0\
-\x28\x7a\x80\x21\xa3\xdf\x4f\x52\xe1\x5e\xc7\x37\xd8\xee\x5b\x1a\
-\xfa\x3d\x0d\xb5\x07\xec\x43\xbe\x26\xfd\x61\xec\xca\xcc\xda\xf2\
-\x7a\xfe\xd5\x2b\x3b\x9a\xc2\xa3\x61\xac\xfa\x08\xbd\x94\x60\x8a\
-\x7c\x19\xcb\xe7\x57\x17\x34\x0a\x05\x30\x45\x1e\x30\x45\x12\x9c\
-\x04\x1a\x38\xb6\xb6\x15\x6a\xc4\xae\xd7\x8f\x66\x98\x06\x0b\xce\
-\xbf\x7a\x65\x8f\x68\xf9\x3c\x77\xfc\xca\x8e\xa6\xc1\x0b\x6a\xd0\
-\xbe\x46\xa8\x41\x7c\x46\xba\x07\x8b\x87\x1d\xf5\xf1\x1c\x6b\x83\
-\xb8\x2b\xc0\x85\x63\x57\x9e\x63\x1a\x0c\x72\x25\x50\x3b\x7b\xc0\
-\x08\x7d\xd3\x5c\x8c\xbd\xbb\x9a\x42\xf9\xb9\xe3\x57\xde\x72\xee\
-\x9f\x56\x26\xb8\xe1\xf3\x9c\x09\xab\x72\x4d\x43\xd6\x99\x22\xfd\
-\x02\x05\x8e\x53\x4f\x13\x3c\x0f\xe1\xaf\x94\x8d\x46\x01\xe2\x6a\
-\x03\x5c\x30\x6e\xa5\x81\xf0\x80\xef\x6f\x57\xdf\x52\x9b\x32\xee\
-\x7c\xf1\x21\xf6\x40\x2b\x85\x99\xc0\xd0\x41\x13\x56\x3d\x00\x94\
-\xbc\xfd\xb7\xbe\x9f\xfb\x5f\x77\xf6\x9f\x57\x75\xc0\x1a\x39\x8c\
-\x45\xb8\xc4\xff\x7a\x97\x6b\x08\xed\xe9\x34\x2b\x00\x60\x59\xe5\
-\x40\xaf\x88\xd1\x35\x60\x63\xe4\x89\x2d\xbd\x16\x81\x9b\x19\xc0\
-\x62\x15\x38\xeb\x2f\xab\xb6\x61\xcd\x17\xec\x02\xd2\x10\x8e\xab\
-\x6e\xb3\x16\x8a\xe9\x87\x4a\x85\x6d\xc0\x36\x84\xad\xc0\x5b\xce\
-\xb5\x35\x2c\xe2\xaa\x00\x6a\x70\x4d\xf5\x6f\xc0\xe6\x2d\x0d\x3b\
-\xb6\x8e\x44\xaf\xc5\x5b\xda\x01\x38\x3f\xa0\x5e\xfb\x72\xa6\xc2\
-\x77\xc0\x56\x6a\x84\x6a\xfd\x86\xad\xea\xf7\x1b\xd8\x8a\xc8\x8f\
-\x85\x8f\xf4\x69\x94\x91\x37\x71\x8b\x08\x1a\x34\x61\x55\x4f\x60\
-\x6d\x0d\x27\xd6\x7f\x61\xb9\xa9\x43\xd7\xeb\xe2\x2d\x75\x1b\xe0\
-\x79\x1b\xf0\x60\xe1\x5f\xfb\x56\x85\x61\x65\xbf\x41\xdc\x7a\x00\
-\x15\xc6\x46\x9e\xd7\xaf\x95\x50\x3f\x06\xa6\x00\xbb\x15\x66\x01\
-\xdd\x6c\xca\x04\x5e\x0f\x20\xa1\x05\x1c\x3e\x27\x9d\x80\x6e\xfd\
-\xaf\x5f\xbd\x0d\xf8\x61\xc5\xec\x3e\xa6\x33\x87\x8d\x1f\x71\xe9\
-\x01\xce\xbc\x66\x95\x81\xd5\x45\x86\x44\xee\xba\x36\x04\x6d\xca\
-\xa9\x15\x79\xdb\xb3\xf0\xaf\x7d\xbf\x1a\x38\x71\x55\x2f\x44\x8a\
-\x81\x56\x8e\xd7\x07\xd5\x51\x8b\xcf\x8d\x89\xf5\x29\xd8\x0e\x6c\
-\x57\x61\x3b\xd6\x7d\x6d\xf7\x1e\xfe\xbf\xb7\xab\xb0\x6d\xd5\xac\
-\x3e\x3b\x43\xab\x89\x1f\xe2\xd2\x03\xa8\x35\x29\x73\x28\x84\x17\
-\x68\x28\x3d\xe2\x5b\x7a\xdd\xf2\x47\xfa\x7c\x35\xe0\xfa\xd5\x07\
-\x61\xc8\x0b\x1a\x24\x7c\x2f\x76\x02\x07\x20\xd6\x10\xb8\x4e\xd6\
-\xbc\x55\x47\x07\xef\xe1\xcc\x9b\x5f\x3d\x7d\x6e\x5a\xbd\x1b\x9f\
-\x42\xf8\x2b\x88\xb0\x0d\x78\xa1\xe8\x81\x3e\x1b\xc3\xb7\x1a\x5b\
-\xc4\x45\x01\x4c\x61\x50\xf5\x1f\x6e\xba\x5e\x77\x6f\xe9\xc7\xc0\
-\x22\x6f\xfd\x0f\x02\x27\xd9\x15\x53\x21\x17\x6b\x15\xd0\x95\xde\
-\xe3\x84\x20\xba\x23\x62\x64\x47\xb4\x06\x8e\xf1\x1e\xfe\xf7\xef\
-\xeb\x8b\x67\x38\xd7\x1e\x7b\xc4\xa9\x07\x90\xb3\xeb\xd8\xf5\xfa\
-\xd5\x55\xfd\xf3\x9e\x95\x0f\xf5\x31\x4f\x9b\xb4\xfa\x94\xe0\xc8\
-\x5f\xbf\x32\x8b\x57\xcd\xea\xb3\xc4\xfb\x7b\x46\xdf\x1b\x57\xdf\
-\xad\x56\x54\xee\x18\x84\xa1\x04\xcd\x42\x86\xb4\xed\x6a\xb8\x2a\
-\xe1\xe9\x56\x3d\x0a\x6c\x02\xca\xd4\x1a\x76\x96\x01\xe5\x25\x33\
-\x33\x1b\x7c\xb9\x58\x7c\x7a\x00\x83\x2e\xe1\xe8\xee\xd6\xde\x05\
-\x60\x13\x90\xef\xa5\xcd\x52\x48\xb0\x11\xd6\x8f\x50\x33\xec\x04\
-\x58\x35\xab\x8f\x62\x85\x64\xbf\x97\x79\xf3\xea\xf6\x40\x8e\xc2\
-\x18\x20\x39\xe0\xca\x48\x42\x0d\xef\x98\x52\xac\xdc\x83\x65\x40\
-\xa9\x7a\x85\x5d\x7a\x5f\x66\xa3\x70\x06\xc5\xc5\x08\x3c\x6d\xd2\
-\xea\x5d\x44\x3b\xe7\x0f\xe1\xe6\xfd\xaf\x2c\x7a\xb0\xcf\xbc\xcc\
-\x9b\x56\x0f\x42\xf8\x3f\x87\xeb\xc7\x16\x3f\xd0\xe7\x59\x37\xfc\
-\x65\xdc\x52\x94\x8c\x30\x06\x2b\x6e\xbf\x7d\x94\x3d\xd4\x66\x2c\
-\x21\x5b\x6f\xb6\x50\x5e\x7a\x6f\xe6\x8f\x6e\xda\x8d\x07\x1a\x5c\
-\x01\xfa\xde\xb8\xba\x2d\xf0\x93\x0b\xa1\xd6\x20\xfc\x1b\xf6\x29\
-\xf0\x3b\x44\xaa\x80\x0a\xa0\xa7\x4d\x99\x65\x08\x67\xae\x99\x99\
-\x19\xd5\xcd\xa6\xdd\x56\xd4\x1a\xb8\x04\xab\x57\x38\xb3\x9a\x93\
-\x9a\xe1\xeb\x27\xf8\x0b\x1b\xca\xcb\xee\xcd\xfc\x21\x9a\x36\xe2\
-\x8d\x06\xff\x04\x98\x62\xad\xd4\x0d\x86\xfd\xb7\x52\x22\xd0\x01\
-\x78\x6d\xcd\xcc\xcc\xca\x8c\x5b\x8b\xce\x52\xaf\xf0\x83\xca\xec\
-\x06\xc6\x95\xdc\x17\x9d\xf0\x01\x4a\xef\xcb\xdc\x8d\xf5\x69\xc9\
-\x4f\xb9\xbd\xe8\x04\x84\x3f\x60\x3d\xb3\x75\x40\x59\xf9\x3d\xfb\
-\x97\xb0\xed\xd0\xe0\x0a\xa0\x86\x1c\x51\xfd\x3b\x98\x18\x69\x92\
-\x27\xa8\x9c\x97\xbe\x15\xc0\x14\x3a\x07\x97\xf1\xd2\xff\xe3\x2b\
-\x13\x09\x29\x93\x8b\x0c\x2c\xc7\x51\x4f\x2c\x97\xee\x6a\xcf\x3d\
-\x99\x7b\x01\xca\xef\xcd\xfc\x14\x78\xdc\x4d\x3d\xfb\x13\x1a\x7c\
-\x3a\xd8\x14\x8e\xb0\x9b\x32\x0d\xbb\xb4\x2b\x78\x5a\x35\x90\x3e\
-\x04\x40\x85\xbf\x9b\xc2\x02\x9b\x58\x80\x74\x15\xd6\xa7\x4c\x2e\
-\xba\xc8\x89\xa7\xe4\x3b\x8a\x5a\x24\xdd\x51\x34\xd9\x14\x7e\x32\
-\x85\x8f\x4d\x83\x17\x4d\x83\x65\x6a\xb0\x31\xe9\xce\xa2\x41\x4e\
-\xd7\xfd\x16\xd0\xe0\x36\x40\xda\x6d\x45\xe3\x80\xa7\xad\xd6\x23\
-\x0c\xf1\xbc\x65\xc2\xc1\x7b\xfd\x64\xcf\x3d\x99\xf7\x26\xdf\x51\
-\x94\x00\x2c\x04\x86\xf9\xd1\xf0\xb5\x05\x7c\x00\x3c\x03\x2c\x01\
-\xbe\xaa\x98\x91\xa9\xbd\xee\x2c\x4a\x05\xe6\x02\xbd\x1c\xac\xfd\
-\x2a\xa0\xff\x07\xd3\x7b\xaf\x0e\xcf\x49\x0d\x7e\x3f\xa5\xf8\x70\
-\x15\x8e\xc4\x72\x76\xed\x04\xd6\xad\x9b\xda\x7b\xaf\xdb\xeb\x1b\
-\x12\x0d\xae\x00\x29\xb7\x17\xdd\x89\x30\xdd\x89\xee\xda\x38\x0c\
-\xa5\x4f\xab\x98\x91\x39\xb5\xd7\x9d\x45\x2d\x80\xfb\x81\x09\x40\
-\xeb\x30\x76\xc4\x6e\xaa\x0d\x48\x12\x1c\xca\xf8\xf0\xe2\x7f\xa6\
-\xf5\xbe\xdc\x89\x67\x80\x53\xa7\x15\x1f\xa0\x90\x0b\x8c\xc4\xca\
-\x41\xe4\xcf\xe1\x3e\xa0\x42\xe1\xee\xf5\x53\x7a\xbf\x16\xae\x9e\
-\x86\x46\x83\x7f\x02\xd4\xe0\x40\x37\x4b\xb9\x6c\xe9\x02\x1a\x92\
-\x96\xad\xfa\x98\xd2\xf3\xae\xe2\x65\x2a\x72\xe2\xda\x19\x99\x93\
-\xd4\x90\x13\xd4\x90\x59\xa6\xb0\xd3\xf6\x93\x22\xb4\x56\x83\xee\
-\xa6\x41\x82\x5f\xfd\xcf\x79\xd7\x08\x4c\x53\xa1\xca\xef\xb3\x53\
-\x18\xee\x9e\x7a\x4c\x2f\x4e\x33\x05\x8f\x0a\x73\x54\xe8\xaf\x82\
-\x04\x45\x2d\x25\x9a\x06\xe9\x6a\xb0\xa4\xfb\x8c\xe2\xf7\xba\xcf\
-\x28\x3e\xa5\xa1\x9e\x77\x24\x34\x78\x0f\x90\x74\x67\xd1\x04\x85\
-\x27\x02\xb9\x88\x60\xed\x83\xeb\x49\x1b\x85\x3d\xc0\x7d\xc0\x7d\
-\xeb\xa6\xf6\xde\x7b\xea\xd4\xe2\x83\x80\x4c\xac\xb7\xb2\x9f\x0a\
-\xc9\x58\x79\x05\x0c\x20\x81\x40\x7f\x44\xfb\x0f\xa7\xf4\xfe\x11\
-\xa0\xc7\xf4\xe2\xbe\xc0\x45\xc0\x9b\xeb\xef\xea\xed\xa8\x00\xdd\
-\x67\x14\x77\xc5\x32\x34\x5b\x07\xf1\xf6\x23\x42\x22\x70\xa0\x3f\
-\xf7\x5e\xfa\xf7\xc0\x80\x0d\x77\xf4\x8e\xfb\x66\x14\x0d\xae\x00\
-\x3d\xef\x2a\xbe\x00\xdf\xe2\x8c\x18\xc4\x00\x84\xa1\x57\x00\x67\
-\xf8\x04\xea\x84\x1e\xd3\x8b\x3b\xa9\x35\x85\xdc\x06\x61\xfc\x47\
-\x77\xf6\x7e\x3a\x5c\xf9\x60\x9c\x74\x77\xf1\xdb\xc0\xd9\xde\x3f\
-\x15\x91\x27\x80\xc7\x37\x4c\xce\xd8\x00\x70\xd2\x3d\x6b\x44\x2d\
-\xcf\xe2\xe3\x40\x1f\x1f\xcf\x58\x2b\x8f\x7b\x6c\xbc\x3d\x23\xae\
-\x6b\x03\xe2\xf1\x09\xd8\xe2\x18\x40\xe9\x60\xf1\x07\xd3\x03\x82\
-\x41\x9d\xe8\x42\x92\x77\xad\x41\x58\xac\xbf\xab\xf7\x57\x6a\x45\
-\xfa\xa2\xe2\xcd\x3f\xe0\x12\xbf\xbb\x67\xcd\x70\x15\x39\xdb\x2f\
-\x44\xfd\xf2\x0d\x93\x33\xae\xf1\x09\x1f\x60\xc3\xe4\x0c\xdd\x38\
-\x39\xa3\x5c\x85\xd3\xd4\xe0\x7e\xbf\xd1\xce\xb1\xa6\x30\xb9\x36\
-\xcf\x30\x96\x68\xf0\x1e\xe0\x94\x69\xc5\x07\x02\x21\x73\xe2\x2e\
-\x02\x29\x2d\x44\xe7\x39\xdc\x09\x74\xf9\xf8\x8e\xde\x61\xfd\x00\
-\x27\xdd\xb3\xe6\x50\xb5\x72\xfe\x3c\xb5\x71\x72\xc6\xa6\xf0\x9c\
-\xd4\xa0\xdb\xbd\x6b\xde\x45\x38\xd3\xdb\xfe\x5f\x37\xdd\x96\x71\
-\x1d\x40\xd7\xfb\xd6\x74\x07\xfe\x02\x1c\x0b\xec\x50\x61\xe6\xe6\
-\x5b\x33\x3e\x3c\x71\xe6\x9a\xd6\xc0\x06\xa8\x8e\x35\xdc\x05\x1c\
-\xb6\xf9\xd6\x8c\x88\x0b\x51\xeb\x0b\x0d\xee\x08\xfa\x70\x4a\xef\
-\x5f\x7b\x4c\x2f\xde\xaa\x60\x39\x84\xea\x1e\xa2\xe5\x2d\x63\x3b\
-\x84\x3b\x08\xb8\x16\xb8\x23\x1c\x4f\x1b\x26\x67\x7c\x0f\xdc\x18\
-\xae\x8c\x1d\x4c\x83\x93\xfd\xfe\x7c\x0d\xe0\xc4\x99\x6b\x8e\x42\
-\x28\x56\x09\x48\xfc\x30\xa4\xcb\xfd\x6b\xce\xfa\xe4\xd6\x8c\x92\
-\x2e\xf7\xaf\x99\xa2\x56\xaa\x39\x10\x0e\x00\x06\x62\xed\x37\x10\
-\x17\xc4\x65\x5d\x80\x29\x6c\x09\xb6\xf6\x43\x47\x04\x12\xce\xe2\
-\xf7\x9d\x7b\x47\x0d\xb9\x49\x0d\x79\xda\xeb\xc4\xb1\xfb\xac\x9c\
-\x1d\x99\xa3\xe8\xd1\xe5\xfe\x35\xad\x55\xe8\xe8\xc7\xfb\x7a\x00\
-\xd3\xda\x63\xa8\xad\x0a\xeb\x54\x78\x4c\x85\xdd\x6a\xed\x30\x32\
-\xc3\x7b\xef\x9e\xa0\x7b\x1f\x10\xbe\xa5\xfa\x45\x5c\x14\x40\x0d\
-\xf9\xc4\x51\xa8\xd5\x42\x0f\xe3\x19\xb4\x1e\xa0\x9a\x06\xc3\x36\
-\xde\x9e\x31\x6b\xe3\xed\x19\xe3\x55\xe8\xa6\xc2\x9b\x01\x0a\x65\
-\xd9\x09\xa9\x27\xce\x5c\x73\x60\xcc\xef\x41\xd8\x67\xd6\x24\x7a\
-\x42\x0d\x2b\xf6\xf0\xd3\x9b\x33\x8a\x54\xe8\x6c\x0a\x49\x9f\xde\
-\x9c\x71\xad\x69\x25\xb4\x42\x85\xb3\x8f\x9f\x55\xd2\x4a\x0d\xd9\
-\x1e\x74\xdf\x47\x44\x6a\xab\x3e\x11\xaf\x1e\xe0\x4d\x37\xee\xe0\
-\x10\xe3\x2e\xd0\x78\x5c\xbf\xe9\xb6\x8c\xea\x34\x2e\x9b\x6e\xcb\
-\xd8\x6a\x1a\x0c\x35\x0d\x96\x07\xad\x22\x6a\xa1\x12\x9a\xce\xad\
-\xae\xf8\xf4\xe6\x8c\x2a\x35\xa4\xc0\xaf\x87\x1a\xe1\xa3\x6d\xb9\
-\x29\xe3\xb3\xcf\x6e\xca\xa8\x02\x50\x43\xda\x78\x97\x8a\x89\x57\
-\x61\xbe\x0b\xba\xb7\xc3\x9c\x5b\xa9\x7f\xc4\xa7\x07\x10\x5e\xf1\
-\x76\x8d\xce\x4b\xaa\x82\x85\x6e\x84\xd0\x3e\x0f\xae\xf7\x93\x5b\
-\x32\x76\xa9\x70\x91\x5a\x4e\x19\xff\x5e\xe4\x28\x5f\x99\xce\x0f\
-\xae\x39\xb0\xf3\x83\x6b\x8e\x8d\xc5\x7d\x98\xc2\xe3\x7e\x0a\x3b\
-\xf6\xd8\x87\x4a\xe6\x1f\xfb\x50\xc9\x01\x3e\xfa\x31\x0f\x97\x1c\
-\x67\x0a\xd7\x7a\xef\x6b\xe5\x17\x93\xd2\x55\x85\x13\x82\xee\x2d\
-\xae\xeb\x05\xe2\xa2\x00\x9b\x6e\xcb\xf8\xc9\x34\xf8\xa7\x8d\x50\
-\x43\xd7\xf4\x39\xd1\x05\xdb\xb8\xfc\x4f\x6f\xce\xf8\xc9\x14\x86\
-\x98\xc2\x6e\x3f\xcf\xe1\x91\x00\xc7\xcf\x2a\x39\xd7\x14\xf9\xc4\
-\x14\xf9\xfc\xb8\x59\x25\x51\x0d\xf9\xec\xf0\xc5\xa4\xf4\x22\x15\
-\x16\xfa\x09\x74\x84\x69\xf0\x51\xa7\xd9\x25\x85\x9d\x66\x97\xbc\
-\xad\xc2\xc7\x2a\x1c\xe9\xa5\x3f\x02\x50\xbd\x0e\xb2\xe6\xde\xc2\
-\x26\xaa\xae\x6f\xc4\x6d\x71\xa8\x0a\x79\x76\xc6\x5f\x44\x57\x70\
-\x8d\x50\x1d\xdf\x9c\xcf\x6e\xca\xf8\x42\x0d\x79\xcc\xda\x00\xca\
-\x8a\x41\x38\xf6\xa1\x92\x01\xa6\xf0\x6f\xaf\x40\x3e\x56\x83\xaf\
-\x62\x71\x1f\xa6\x30\xca\x34\xac\x59\x48\x2f\xcf\xc7\xab\x30\x40\
-\x85\xb3\x55\x38\xc0\xab\xcc\xd3\xbe\xba\x3e\xfd\x65\xef\x7d\x0f\
-\x0a\x52\x68\xd7\x93\x4c\xf5\x81\xb8\x29\x80\x29\xfc\xcb\x14\x76\
-\x04\xf8\xf7\x6d\x76\xf1\xd4\x60\xe3\xb0\x46\xa8\xe9\xc7\x3e\x54\
-\xe2\x38\x88\x34\x85\xfb\x4c\xe1\x07\xdf\x48\x40\x85\x7b\x54\x10\
-\xd3\x60\x8e\x69\x70\xea\x17\x37\xa4\x6f\x89\xc5\x7d\x7c\x7d\x7d\
-\x7a\xd5\xd7\xd7\xa5\x8f\x54\x6b\x1b\x9a\x29\xa6\xf0\xa1\x97\xbf\
-\xbd\xa6\xc1\xab\x6a\x30\xf4\x9b\x89\xe9\x53\x01\x8e\x7a\xb4\x24\
-\x51\x85\xd3\x83\xe6\x36\x56\xc6\x82\x8f\xda\x22\xae\xc9\xa2\x8f\
-\x7b\xa8\x64\x2e\x30\xba\x0e\xae\xe0\x3e\x5f\xde\x90\x5e\xe4\x44\
-\xec\x34\xbb\xe4\x66\xe0\xfe\xa0\x69\xe5\x8b\xbf\xbe\x2e\xdd\x17\
-\x19\x4c\xc7\x47\x4a\x92\x15\x06\x23\x3c\xfd\xcd\xc4\xf4\x98\xec\
-\x02\x7a\xe4\x63\xa5\x06\x20\xdf\x5e\x93\x16\xf0\x99\x3a\xe2\xb1\
-\xd2\x09\xf8\xe6\x41\x2c\x7e\xbe\xde\xfa\x97\xb4\xa6\x9b\x29\xd4\
-\xb4\xb2\x7d\x8f\x0c\xe6\x23\x92\x57\x10\xf0\xc5\x0a\x0c\x01\x1c\
-\x15\xc0\x34\x78\x14\x2b\x12\xf8\x18\xbf\xd3\xb7\x1d\xf5\xd7\x92\
-\xe5\xc0\xaf\xc0\xb5\x18\x4c\xc7\x9a\xc8\x49\x25\x28\x45\x4d\x6d\
-\xf1\xed\x35\x69\x21\xcb\xc5\x3a\x3c\x5e\xda\x19\x83\xfb\xab\x79\
-\xb7\x90\x17\x8b\xf6\xea\x82\xb8\xa7\x8b\xef\x34\xbb\x64\x16\x30\
-\xc9\x55\xf0\x47\x28\xfd\x6b\xa0\xe7\x37\x13\xd3\x1d\xb3\x7a\x1e\
-\xf5\x68\xc9\x50\xe0\xa5\xa0\xbb\xac\x42\x64\x27\xbe\xdd\xc3\x01\
-\xb5\x02\x3f\x5a\x6e\xb5\x11\x5e\x5d\x71\xf8\xdf\x4a\x45\xe1\x1d\
-\xac\xc0\x52\x1f\xf6\x02\x27\x7c\x37\x21\xed\xeb\x58\xb7\x17\x0d\
-\xe2\x9e\x21\xc4\x34\x98\x6a\x1a\x7c\x15\xec\x15\x74\x39\x22\xe8\
-\x68\x0a\x0b\x8f\x7c\xd4\xd9\x16\xf8\xdf\xb5\xe9\x2f\x9b\x22\x8b\
-\x83\x6c\x89\x04\x15\xda\x05\x19\x97\xa6\x5a\xae\xd9\xd8\xdf\xa3\
-\x70\xb3\x0a\x67\x06\xf1\x3f\x3f\xde\xc2\x87\x46\xa0\x00\xdf\x4c\
-\x4c\xff\x45\x85\xeb\x6c\x2d\xfe\x30\xae\x60\x3f\xcf\xe1\x79\x6a\
-\x48\xd8\x59\x35\x35\xb8\xca\x34\x78\xcd\x26\x7d\xac\xbf\x23\x6a\
-\xd1\xb6\xbf\xa4\xc5\x74\xe1\x66\xfb\x27\x4b\xa5\xfd\x53\xa5\xf7\
-\xab\x30\x33\x48\xf8\xa6\xfa\x65\x46\x89\x27\xe2\xae\x00\x00\xff\
-\xbb\x36\x7d\xb1\x29\xf2\x56\x88\xc5\x1f\xde\x15\xec\xef\x40\x9a\
-\x7a\xf8\x13\xa5\x67\x39\xd5\xbf\xed\xcf\x69\x3b\x54\xb8\x58\x85\
-\x71\xfe\x4e\x22\xef\xb1\xdb\x34\xb8\xcb\x14\xae\x8e\xe5\x3d\x1d\
-\xf2\x54\x69\x4b\x15\x16\x29\xdc\x6c\xb5\x13\x90\xcd\xf4\xe5\x1f\
-\xc6\xa7\xfd\x37\x96\xed\xd5\x16\x71\xb7\x01\x7c\xe8\xf0\x44\x69\
-\x17\xac\xb5\x72\x87\x38\x16\x0a\x3f\x22\xd8\x03\xdc\xf4\xdd\x84\
-\xb4\xc7\x22\xb5\x75\xe8\x93\xa5\x9d\x80\x8e\x0a\x95\xc0\x67\x3f\
-\xfc\x29\x2d\xa6\x1b\x3a\x1e\xfc\x74\xd9\xef\xb1\x82\x4f\xad\x74\
-\x74\x81\x1f\xa8\x9d\x40\xca\x8e\x71\xa9\x0d\xba\x0a\xd8\x09\x8d\
-\x46\x01\x00\x0e\xfb\x5b\xe9\x39\xc0\xbf\x80\x90\xcc\x5d\x6e\x46\
-\x06\x00\x6a\x5d\xff\xa7\x1f\xfe\x94\x16\xe2\x2a\xae\x6f\xb4\x7b\
-\xa6\xac\x0d\x56\xfa\xd7\x6b\xf1\x1f\xd9\x04\xf2\x7e\xd5\x4f\x63\
-\x53\xe7\x36\x28\x63\x61\xd0\xa8\x14\x00\xe0\xd0\x27\x4b\x27\x82\
-\xe5\x36\x85\xc8\x81\x20\xfe\xf0\xbb\x93\x3d\x08\x4f\x00\xf7\xfe\
-\x78\x75\x5a\xd8\xbc\xff\xb1\x40\xbb\x39\x65\x07\x7b\x23\x82\x6f\
-\xc7\x6e\x07\x90\x1a\xde\x17\xff\x7c\x55\x6a\x56\x7d\xf3\x13\x0d\
-\x1a\x9d\x02\x00\xb4\x7f\xaa\xf4\x59\x60\x8c\xf3\xca\xa1\x50\x6d\
-\x70\x58\x3a\xb6\x03\x98\x07\xcc\xd9\x31\x2e\x35\xe6\x01\x98\x6d\
-\x9f\x2d\xeb\x07\x8c\x05\xb2\x94\x08\x23\x08\xa1\x14\x38\xf3\x97\
-\x31\xa9\x3f\xc7\x9a\x8f\xba\xa0\x51\x2a\xc0\x21\x4f\x97\xb5\x04\
-\x5e\x57\x38\x27\x80\xe0\xd0\x0b\x84\x59\x37\xe8\x8f\xd5\x0a\xcf\
-\x02\x6f\xfd\x3c\x36\xb5\xd6\xf3\x00\x6d\x9e\x2d\xeb\x00\x8c\x44\
-\xb8\x0a\x38\xd9\xe5\xd3\xfb\x58\x85\xfe\xbf\x8e\x4e\xdd\x5e\xdb\
-\x76\xeb\x0b\x8d\x52\x01\x00\xda\x3d\x53\x96\x88\xf5\xf6\xe6\x54\
-\x9f\xb4\x51\x80\x48\x6e\x64\x87\xb2\x9f\x01\x2b\xbd\x47\x09\xf0\
-\x03\xf0\x0b\xd6\xae\x22\x3b\x7f\x19\x93\x6a\x1e\x34\xb7\xac\x15\
-\x56\x96\x91\xee\xde\xa3\x87\xf7\xff\x93\x80\xc4\xf0\x06\x69\x40\
-\xc3\x9f\x2b\xf4\xdb\x35\x3a\xc5\x71\xff\xa1\x78\xa2\xd1\x2a\x00\
-\x40\xdb\x39\x65\x02\x3c\x04\x5c\x5f\x7d\xd2\xef\xd9\xba\xe2\x3c\
-\xfc\xc8\xc1\xa9\xec\xaf\x58\xf9\x85\x12\x42\x1a\xf5\x6f\x3b\xb2\
-\x5d\x52\x08\xe4\xec\xba\x32\x25\xee\x0e\x1f\x27\x34\x6a\x05\xf0\
-\xa1\xcd\xb3\x65\x37\x62\xa5\x75\xad\xce\xfc\x51\x77\xe1\x07\x4a\
-\xcf\xa5\x40\x03\xdb\x76\x2e\x6f\x02\xf7\x02\x53\x77\x8f\x4a\x69\
-\xd4\xf9\x04\xf7\x0b\x05\x00\x38\x68\x6e\xd9\x69\xc0\x02\x84\x13\
-\xec\x39\xae\xf5\x5b\x5a\x53\xd6\x45\xf9\x48\x4b\xda\xb1\x96\xa2\
-\x8f\xd8\x73\x45\x4a\x48\xa6\x92\xc6\x88\xfd\x46\x01\x00\x0e\x78\
-\xae\xbc\x1d\xc2\xe3\xc0\x88\x88\x85\x71\xaf\x00\xe1\xb2\x91\x38\
-\x96\xb3\x2f\x5b\x08\xe4\xec\x1d\xd9\x78\xbb\xfc\x60\xec\x57\x0a\
-\xe0\x43\xeb\x79\xe5\x17\x61\xad\x00\xee\x6e\x47\x77\x21\x28\xfb\
-\x72\x61\xca\x46\x28\xff\x05\x30\x1b\x78\x74\xdf\x88\xc6\xdd\xe5\
-\x07\x63\xbf\x54\x00\x80\x56\xff\x28\x4f\xc0\xca\xdd\x33\x0d\x6a\
-\x82\x3e\xa3\x11\xaa\x9b\x85\xa8\x61\xcb\x21\xa5\xc0\xc3\x08\x05\
-\x95\xc3\x93\x2b\x1d\x8b\x35\x62\xec\xb7\x0a\xe0\x43\xcb\xf9\xe5\
-\xad\x81\xa1\xc0\x55\xc0\xe9\x6a\x27\x6e\xd7\xc3\x47\x09\x29\x6f\
-\x53\xce\xc4\x5a\x05\xf4\x70\xd5\xf0\xe4\x15\x51\xb2\xdb\xe8\xb0\
-\xdf\x2b\x80\x3f\x5a\x2c\x28\x3f\x11\xab\x57\x18\x05\x1c\x6d\x9d\
-\x75\x25\xd4\x40\xd8\x97\xdd\x82\x25\xf8\x47\xcd\xdc\xe4\xcd\xfc\
-\x46\xf0\x9b\x52\x00\x1f\x12\x16\x7a\x12\x80\x74\xac\x2c\xa0\x49\
-\x08\x27\x60\xa5\x84\x3d\xdc\xe5\xf0\xf1\x7b\xb5\x9c\x45\x15\xc0\
-\x32\xa0\x50\x73\x92\x3f\xab\x27\x76\xe3\x8a\xdf\xa4\x02\x38\x41\
-\xf2\x3c\x6d\xb0\x14\xe1\x68\x2c\x27\x8f\xe1\x3d\x04\x2b\x44\xeb\
-\x0b\xe0\x33\xcd\x49\x8e\xfb\x7e\x7e\x0d\x85\x26\xa5\x00\xcd\x08\
-\x45\xa3\x88\x08\x6a\x46\xfc\xd0\xac\x00\x4d\x1c\xcd\x0a\xd0\xc4\
-\xd1\xac\x00\x4d\x1c\xcd\x0a\xd0\xc4\xd1\xac\x00\x4d\x1c\xcd\x0a\
-\xd0\xc4\xd1\xac\x00\x4d\x1c\xcd\x0a\xd0\xc4\xd1\xac\x00\x4d\x1c\
-\x0d\x96\x1f\x40\x16\x7d\x70\x0c\x54\x9d\x03\x1c\x8f\xa1\x47\xa3\
-\x62\x00\x5f\xa3\x7c\x8d\xc8\xbb\x9a\x93\xe4\x6a\xad\x9c\xcc\x5f\
-\x73\x18\x89\x09\x35\x1b\x35\x56\xb1\x43\x87\xa7\xba\xce\xb3\x23\
-\x05\x05\x09\x54\x76\xe9\x16\x70\xb2\x32\x71\x8f\x8e\xe8\xf9\x69\
-\xc4\x6b\xe7\x55\x1c\x42\x22\xdd\x80\x6e\x08\xdd\x40\xab\x10\x36\
-\xa3\xc6\x66\x12\x13\x37\x69\x56\x8f\x5a\x2d\x31\x93\x85\xe5\x5d\
-\x69\x61\x1c\x81\x49\x07\x84\x0e\x98\x74\x00\x6d\x87\xb0\x96\x4a\
-\x63\x85\x8e\xec\x15\x93\x74\x36\xb6\x6d\xd7\xf7\x5c\x80\x2c\xf4\
-\x0c\xc6\xe0\x2e\xac\x04\x0c\xe1\x50\x8a\x32\x97\x96\x9b\xe6\x68\
-\x56\x96\x63\x54\x8d\xe4\x79\x3e\xc7\x4a\xc1\xea\x83\x89\xe8\x5c\
-\xb2\x53\xae\x56\x37\x33\xbd\x8b\x3c\xd3\x10\xee\x0a\x3a\xad\x88\
-\x39\x40\xb3\x53\xdf\xb7\x6f\x73\x6d\x06\x6a\x4e\x43\x38\x2f\x7c\
-\xe5\xbc\x86\x30\x43\x87\x25\x97\x46\xe4\x63\xc1\x07\x47\x90\x50\
-\x35\x0e\x2b\x41\x46\xb7\x08\xc5\x3f\x05\xde\xc2\x34\xa7\x47\xa3\
-\xec\x6e\x50\x6f\x9f\x00\xc9\x2f\x3b\x5c\x16\x79\xf2\x30\x58\x42\
-\x64\xe1\x03\xa4\x21\x3c\xc9\xbe\xae\x1e\xc9\xf7\x0c\x0c\x53\x2e\
-\x38\xb1\xa2\x81\xca\x58\xf2\x3d\x77\xba\x64\xed\x48\x3b\x76\x21\
-\xe1\xf0\x90\x93\x05\x65\x07\x4b\x5e\xc5\xeb\x60\x16\x47\x14\x3e\
-\x80\x32\x18\x93\x12\xc9\xf3\xbc\x21\x79\xff\x69\xef\x54\x4c\xf2\
-\x3d\x03\x31\xaa\xd6\x62\xed\x12\x1a\x49\xf8\x60\xcd\x60\x8e\xc7\
-\x90\x0d\x92\x5f\x71\x95\x8b\xf2\xae\x51\x2f\x0a\x20\xf9\xe5\x97\
-\xa1\xc6\x7a\x84\xec\x5a\x5c\xfe\x7b\x94\xa5\xb2\xa8\xfc\xba\xa8\
-\xae\x52\xa6\x4a\x7e\xb9\xe3\xbe\x40\xd1\x42\xa6\x61\xb0\xcf\xc8\
-\x07\xbd\xb0\x16\x97\x5f\x80\x56\xfe\x53\x0a\x56\x87\x2c\x17\x93\
-\x3c\xcf\x30\x94\x77\xf1\xcb\x5d\x18\x05\x57\x6d\x51\x9d\x23\xf9\
-\xe5\x31\x5b\xca\x1e\x73\x05\x90\x45\x9e\xd1\xa8\xbc\x80\xc3\x86\
-\xca\x6e\xab\x41\x64\xb6\x2c\xaa\xb8\x3b\xaa\x6b\x54\x16\xc8\xc2\
-\x0f\x6c\xf7\x0c\x8e\x1a\xdd\x3c\xf7\x02\xe7\xd7\xfa\x7a\xa1\x2f\
-\x95\xad\x9f\x0f\x38\xb5\xb0\xbc\x2b\xe8\x33\xd8\xac\x7e\x8e\x0a\
-\x2a\x4f\x4a\xfe\xda\x98\xec\x3a\x12\x53\x05\x90\xe7\x2b\x3a\x23\
-\xfa\x48\xe4\x92\x6e\x2b\xd4\xde\x51\x5e\x71\x30\x52\xf5\x8a\x3c\
-\xb7\xa1\x6d\xe4\xa2\x61\x9a\xb5\x96\xa5\x5d\x1b\xa6\xc8\x37\x40\
-\x01\xe8\x22\x24\x4c\xbe\x41\x65\xb0\x2c\xf2\xf4\xa8\xa9\xd8\x98\
-\x02\xe2\xc4\x9b\x09\x94\x22\x3c\x04\x3c\x89\xb0\x0c\xec\x93\x61\
-\x02\x02\xe6\x0d\x61\xf8\x73\x8d\x98\x8d\x02\x64\x1a\x06\xdd\xf4\
-\x1f\x61\x6f\x50\x79\x01\x43\xde\xc7\xa4\x04\xc3\xdc\x03\xa4\xa2\
-\x46\x26\xe8\x28\xac\x6d\x5c\x7c\xd8\x83\xea\x5d\x6c\x4a\x99\x15\
-\x3d\x23\x74\xa7\xf5\xaf\x0b\x04\x2e\x71\x63\x14\xda\xe2\xa0\x84\
-\x24\x50\xfb\xd5\xbe\xca\x18\xcd\x4d\x7e\x2e\xa0\xc9\xe7\x3d\x69\
-\x98\xbc\x8d\x5d\x72\x0b\x83\xc1\xc0\x7a\x29\x58\xdf\x12\x51\xa7\
-\x4f\xd4\x5e\xc4\x3c\x2b\xd8\x08\x95\x45\xe5\x99\x88\x2c\x07\x12\
-\x6d\xf8\xb8\x18\x2b\xfe\xb1\x4e\x88\x5d\x0f\xd0\xad\xe2\x06\x70\
-\x4c\x7d\xfe\x5f\x54\x06\x68\x6e\x72\x8e\x66\x27\xfd\x4d\x73\x93\
-\x4a\x34\x3b\xe5\x03\xcd\x4e\xf9\xbb\xe6\x24\x5d\x8d\x9a\x69\xa0\
-\x1e\x6f\xd9\x32\xc4\x48\xd5\xdc\x94\x07\x74\x0a\xb5\xcd\xd8\x35\
-\x24\x0a\xa3\x30\x14\xa2\x7d\x1c\x28\x7b\x31\xcc\x90\x5d\xbf\xbc\
-\x56\x7f\x16\xd6\x4e\x64\xc1\x38\xd7\xfa\x6f\xe7\xa1\xc0\xc1\x36\
-\xf4\x4a\x44\xc7\xdb\x8d\x40\x34\x37\xa5\x08\x61\x81\x03\x2f\xed\
-\xa5\xa0\xa0\x6e\x9f\x12\x62\xd4\x03\xc8\xbc\x65\xad\x69\x79\xf0\
-\x14\x07\xf2\x66\x12\x5b\xa5\x68\x56\x0f\xc7\x38\x3b\xcd\x4d\xfd\
-\x8f\x3c\x53\xd6\x9b\x83\xf4\x64\x3a\xfd\xfc\x91\x9e\x7e\x7a\xdd\
-\x63\xec\x2d\xa3\xd0\xa3\xd9\x29\xaf\x47\x7d\xad\xe8\xcf\x0e\x29\
-\x49\x5a\xa2\xc6\x73\x52\x50\x36\x42\xb3\x52\x03\x76\xff\xd6\x9c\
-\xe4\x77\x24\xaf\xa2\x0f\xaa\x99\x81\x7c\x68\x05\x80\x66\xa5\xff\
-\x4f\x16\x55\xf4\x03\xf3\x98\x00\xba\x91\xb0\x4e\xb3\x7b\x85\xc9\
-\x5d\x20\x1f\x3b\xaf\x76\xe8\xd2\x06\xa8\xd3\x2e\xe4\xb1\xf9\x04\
-\xb4\x6a\x37\x08\xa5\x8d\x0d\x45\x11\xc6\x84\x13\x7e\x75\xc1\x71\
-\xa9\xfb\xb0\x76\xdf\x8a\x15\x7c\x46\x61\x6f\x1d\xde\x73\x43\xe4\
-\xe2\xfe\x57\x56\xbd\x83\x3a\x3e\x9a\x8b\xd8\x67\x7c\x2d\x79\xe5\
-\x2f\x22\xf2\x8c\x66\x27\x57\xe7\xfa\xd5\x9c\xa4\x0a\xac\x48\x62\
-\x5b\x68\x6e\x52\x54\x69\x61\x25\x7f\xdd\x91\xa8\x5e\x63\x4f\xd5\
-\x0d\xc1\x4a\x58\x1b\xc4\x46\x01\x4c\xce\xb3\x5d\x7d\x23\xbc\xae\
-\xd9\xc9\x85\x31\x69\xa3\x76\xf0\x19\x85\xbd\x75\xf4\x49\xae\x33\
-\x73\xe8\xb0\xf4\x2f\x24\xcf\xb3\x11\xf8\x9d\x43\x91\x03\x41\x46\
-\xa1\x8c\x92\x45\x9e\x8f\x10\x9d\x43\x65\xe5\x7c\x1d\x99\x51\xab\
-\x74\x34\xb2\xa0\xec\x38\x0c\xe3\x02\x00\x0c\x69\x0b\xda\x1e\xe8\
-\x88\xf2\x47\xac\x6d\x6f\x6c\x2e\x32\xfe\x5d\x9b\xb6\x82\x11\x1b\
-\x05\x10\xe3\x38\xfb\x6e\x4a\xd7\xd8\x16\xcf\x5b\x7b\x06\x98\x73\
-\x71\x65\x83\xe8\x06\xfe\x9b\x72\xbe\x0b\x7b\xe0\x07\x20\xd4\xf9\
-\x52\x5b\xa3\x50\x74\x22\x2a\xaf\x61\x67\x80\x05\xd7\x8f\x3c\x4c\
-\x8b\xc4\xfb\x64\x91\xe7\x19\xcc\x84\xbb\x75\x44\x4f\x57\x9b\x55\
-\x57\x23\xc1\x78\x05\x48\x01\xc0\x95\x67\x56\x3e\xa1\x45\xcb\x19\
-\x51\xb5\xe1\x80\x18\x19\x81\x7a\xb4\xed\x69\x53\xca\x6d\xcf\x8b\
-\xd9\x1b\xcb\xbb\x75\x7c\xe4\x43\xce\xe1\xf8\x65\x2d\x6d\xeb\xa9\
-\xc1\x5e\x12\xcd\x13\x50\x3e\x72\xa0\x47\x6d\x14\x6a\x76\xca\x9b\
-\x08\x57\xe0\x5e\x69\x5a\x21\x5c\x43\x42\xd5\x66\xc9\xab\x98\x22\
-\xcb\x96\x45\xf1\x72\x89\x73\x6a\xbc\x50\xfc\x48\x95\x31\xa4\xb6\
-\xf3\x0e\xc1\x88\xd5\x28\x20\xe6\xf9\x75\xa3\x84\x6a\x56\xea\x0e\
-\x5a\x18\x17\xe3\x64\x14\xf9\x3c\x85\xe2\xde\x09\xa3\xd9\xc9\xf9\
-\x20\x97\x80\x7c\x12\x05\x2f\x6d\x40\xa7\xf2\xf5\xc1\x0b\xdc\x5b\
-\xe9\x1a\xcd\x8a\xe2\x56\xb4\xa8\xaa\x93\x9f\xc3\x1f\xb1\x51\x00\
-\xa7\x5d\x2f\x0c\x4d\x89\x49\xfd\x2e\xa1\x97\xf7\xda\x08\x92\x83\
-\xbd\x42\x0a\x2a\x05\xc0\xf0\xa8\xea\xcc\x49\x5a\x42\x62\xcb\xee\
-\xa0\x37\x00\xd1\x24\x79\x1a\xc6\xbe\xae\xcf\xc9\x34\x57\xcf\x38\
-\x9a\x9c\x86\x07\xa0\x2c\x96\x82\x92\x5a\xb8\x92\x43\x11\x1b\x05\
-\x50\xb5\x9f\x4a\x35\x71\x18\x4f\xcb\xc7\xb8\xef\x5a\x95\xcf\x4e\
-\x77\xbd\xf5\xba\xe6\x24\xfd\x0b\xc4\xa9\xbb\x6f\x45\xe0\x5e\xc1\
-\xee\xea\xcc\xea\xb1\x57\x73\x52\x66\x93\xd8\xaa\x13\xaa\x43\x41\
-\x5f\xc5\xda\x11\x3c\x12\x46\xd2\xb5\xc2\x85\xb3\xa6\x45\x16\x22\
-\x97\x20\x72\x09\xd6\xec\xe0\x44\x54\x1f\xc4\xca\x36\x62\x87\x8e\
-\xec\x4b\xb8\xd5\x2d\xff\xe1\x10\x93\xe9\x60\x59\xb4\xf6\x1c\xc4\
-\x7c\xcb\x81\x3c\x48\x73\x92\xdf\x71\x57\x8f\x27\xcf\x66\x02\xe9\
-\x07\xcd\x49\x3e\xb4\xba\x4c\x9e\x67\x37\x96\x20\xfd\xb1\x47\x73\
-\x92\x03\x04\x2b\xf9\x9e\x02\xaf\x15\xed\x0e\x22\x97\x68\x76\xd2\
-\xab\xae\x8b\x17\x78\x3a\xb0\x57\xae\x42\x74\x3c\x35\x3b\x81\xda\
-\xe1\x03\xcd\x49\xee\xe5\x9a\x0f\xff\x36\xe6\x55\x1c\x42\x4b\xf5\
-\x00\x9d\x6d\xc8\x9b\x35\x27\xb9\x6b\x6d\xea\xf5\x47\x6c\x7a\x80\
-\x9d\x95\x4b\xb1\x76\xc4\xb6\xc3\x5c\x29\x28\xb3\xf3\x80\x05\x40\
-\xf2\xcb\x4e\x46\xe8\x17\x4a\xd1\x2d\xb5\xe2\xa9\x32\x61\x14\xb1\
-\xf5\x2b\x04\x40\xb3\x92\xb7\x69\x6e\xd2\x7d\x24\x6e\xea\x82\x92\
-\x05\x38\x0d\x01\x7f\x2f\xff\xde\x14\xac\xb0\xee\xda\x18\x95\xf4\
-\x23\x38\x7a\x02\x4f\x74\xf3\x5c\x23\x21\x26\xc3\x40\x1d\x97\xba\
-\x4f\xf2\x2b\x6e\x41\x75\x8e\x0d\xf9\x38\xf6\x19\x1e\x59\x58\x31\
-\x5a\x87\x27\x2d\xb3\xbb\x5e\xf2\x2b\x06\xa1\x46\x01\x76\xae\x52\
-\x31\x6a\xe5\x47\xd0\x11\x3d\x77\x4a\x5e\xe9\xc5\x90\x50\x02\x1c\
-\x1a\xf1\x02\xff\x26\xf3\x3c\x63\x80\x1b\x03\x33\x14\xcb\x4f\x28\
-\xa3\x34\x37\x79\x7d\x40\x3b\x56\xf0\xca\x62\xc9\xf7\x24\xa2\xb6\
-\x3b\x80\x08\xdf\xff\xda\x41\x0a\x56\x7f\xc7\xbe\x56\x2b\x41\x3a\
-\x06\x71\xba\x96\x04\x9d\xa0\x97\xa7\xda\xe7\x1c\x50\xd2\x1d\x32\
-\x9c\x98\xac\xaf\x7b\xd6\xd1\x98\x4d\x06\x69\x76\xd2\xb3\x92\x57\
-\x31\xc4\x61\xfe\xfc\x04\x0c\x7d\x4f\xf2\x3c\x8b\x41\x56\x22\x55\
-\x65\x48\x82\x89\xa9\xfd\x41\xfa\x81\x9e\x8f\xe3\x14\xa9\xbe\x58\
-\x6b\x9e\x72\xd2\x3e\x91\xfc\x8a\x61\xa8\xfe\xdb\xb9\x7e\xbb\x0b\
-\xb5\x35\x22\x27\x87\xa4\x16\x11\x96\x49\xbe\x67\x88\xbf\xf7\xcf\
-\x8f\x98\xe1\x60\xd6\x7c\xaf\xb9\x3d\xbf\x94\xf9\x6b\x0e\xa3\x85\
-\xf4\x0c\xe5\x43\xce\xa1\x4a\x8a\xe4\xf9\x8a\x21\x3a\x2c\x69\x55\
-\x00\x25\xdf\x73\x69\x98\x40\x94\xed\x75\x98\x2b\xa9\x46\x6c\x63\
-\x02\xa5\xc5\x55\xe8\xbe\x75\x40\x48\x74\x0d\xd6\xd3\xcc\x02\xcd\
-\xb2\x12\xfe\xfb\x1e\x56\x38\x1b\x44\x5f\xd5\xec\x94\x3a\x6d\xab\
-\xa6\xd9\x49\x6f\x4b\x5e\xc5\xad\xa0\x0f\xba\xbe\xa8\x2a\xe1\x55\
-\x5a\x98\x8f\x11\x9a\x5c\xa6\x03\xca\x32\x59\xe4\x29\x45\x64\x1d\
-\xca\x16\x0c\x8e\xf0\xfa\xff\x33\x6d\x6a\x02\x28\x06\xd0\x91\x19\
-\xdf\x49\xbe\xe7\x0d\xd4\x76\x5f\xa2\xc3\x31\xf5\x5d\xc9\xf3\xbc\
-\x05\xe2\x01\x3d\x06\x48\x03\x92\xc2\x70\x59\xeb\x17\xc3\x1f\x31\
-\x8d\x07\xd0\xec\x53\xbf\x45\x75\x1c\xb5\x9d\x86\x0d\xc4\x46\x4c\
-\x9d\x10\x83\x7a\xd0\x9c\xa4\x59\x28\xf9\xae\xcb\x5b\x41\x98\x4b\
-\x1d\xc8\x2d\x11\xfa\x82\x8e\x43\xf4\x5e\x54\xaf\xc3\x59\xf8\x20\
-\xba\xa4\xe6\x37\x33\x70\x1e\x3d\xb4\x06\x86\x80\x4e\xc5\xca\x77\
-\x14\x4e\xf8\x95\x20\x8f\x86\xa1\xbb\x46\xcc\x23\x82\x34\x37\xe5\
-\x15\x84\x33\x80\xda\xe7\xd1\x51\x56\x51\xb9\xaf\x6f\x4c\x03\x20\
-\x5b\xee\x1e\xe3\x37\xe5\x1c\x19\x89\xad\xb2\x10\xd6\xd6\xb1\xd5\
-\xb9\x9a\x9d\xf2\xb4\xef\x0f\x1d\x96\x5c\x8a\x30\x89\xba\xbd\x20\
-\x26\xc2\x48\xb7\x51\xd4\x91\x50\x2f\x31\x81\x9a\x9d\x5c\xc8\x2f\
-\x66\x4f\x90\xd9\x44\xeb\x25\x54\xf2\x69\xb9\xfb\xec\xda\x4e\xac\
-\x38\x56\x9b\xd5\x67\x97\xe5\xd5\x73\xe7\xcc\xb1\x5c\xad\xe6\xd9\
-\x58\xc9\xa4\xa3\x87\xc8\x2b\x74\xdc\x31\x3e\xa4\xde\xec\xe4\xc7\
-\x50\xe3\x3c\x60\x5b\x2d\x6a\xdd\x0a\x32\xcc\xf2\x50\xc6\x06\xf5\
-\x16\x15\xac\xe3\x52\x7f\xd5\x9c\xa4\x1b\x10\xfa\xa1\xfa\x06\xf6\
-\xc1\x12\x3e\xfc\x82\xca\x8b\x18\xa4\x6b\x6e\x72\x8e\x25\x2c\x47\
-\xd8\x65\xdd\x76\x95\x89\x5b\x73\x92\x3f\xc3\xd4\xa1\x58\x09\xa0\
-\xfc\x51\x85\x54\x85\xf4\x36\x9a\x9d\xba\x5d\x73\x92\x33\x50\xe3\
-\x5c\x94\x37\x89\xfc\xe6\x2a\xf0\x3a\x42\x5f\xcd\x4e\x1a\xea\x14\
-\xd7\xa0\xb9\xbd\xfe\x8f\x44\x4e\xb1\x7a\x83\x88\xbd\xd2\x3e\x60\
-\x35\xe8\x34\x74\x6f\x37\xcd\x49\x2a\x88\x50\x3e\x2a\x34\x58\x8e\
-\x20\x59\xf0\xc1\x41\x24\x98\x03\x41\x8f\xa7\x3a\x85\x1b\x9f\x61\
-\xca\x66\x0e\x6b\xb3\x5a\xcf\xef\xba\xc7\x55\x3d\xcf\x94\x1d\x48\
-\x7b\xb3\x5d\xc0\xc9\x1f\x8c\x9f\x74\x5c\xea\xaf\xae\x79\x59\xb6\
-\xac\x05\xdb\x0e\xaa\x31\x54\x77\xe9\x3e\x37\x3d\x8e\xe4\x79\x8e\
-\x07\x3d\x19\xa1\x33\xa6\x74\xc6\xe0\x68\x90\x6f\x51\xdd\x82\xb2\
-\x85\x04\xf9\x48\x87\x25\x6d\x71\xcb\x47\x75\xbd\xcf\x7b\x3a\x52\
-\x65\x9c\x8a\x68\x77\x44\x0f\x06\xad\xc2\x94\xdd\xa8\x94\xd1\x6a\
-\x57\x71\x84\x17\xa2\x4e\x68\x4e\x12\xd5\xc4\xd1\xbc\x36\xb0\x89\
-\xa3\x59\x01\x9a\x38\x9a\x15\xa0\x89\xe3\xff\x01\x27\x88\x66\x10\
-\xc7\xdc\x21\x26\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\xb0\x54\
-\x00\
-\x05\xa5\x96\x78\xda\xec\x5d\x07\x5c\x14\xc7\xf7\x5f\x38\xe0\xe8\
-\xbd\x57\x15\xa4\x28\x0a\xa8\x34\x1b\x4d\x01\x45\xae\x1f\xd5\x46\
-\x11\xb1\x60\x6f\xb1\x62\x8d\x2d\x1a\x8d\xdd\xd8\x8d\x1a\x4b\x8c\
-\x25\x76\x11\x14\xbb\xa6\x27\x26\xf6\x9f\x29\xc6\x18\x23\x52\x04\
-\x15\xee\xfd\x67\x76\xaf\xed\xf5\x43\x30\x9a\x7f\xe6\xf3\xf9\x66\
-\xb3\x78\x77\xbb\x33\xef\x3b\x6f\xde\xcc\xbc\x37\x8f\x20\x0c\x08\
-\x13\x22\x36\x96\x40\xd7\x16\x44\x60\x3c\x41\x14\x10\x04\x11\x1a\
-\x4a\xdd\xef\x6a\x4d\x10\x4b\xd0\xdf\x8a\x8b\xc5\xff\x6e\x6a\x40\
-\x44\x14\x12\x44\x8b\x16\xe2\x7f\xb7\x25\x88\xfe\xa3\x0c\x08\x5b\
-\x5b\xea\xbe\xd0\x88\x20\x4c\x66\x1a\x10\xb8\x90\x9f\x6f\x61\x44\
-\x8c\x98\x6b\x40\x04\xa2\x7b\xf4\x08\xa2\x58\xfc\xf7\x7f\xb8\x58\
-\x22\x44\xfb\xb8\x12\x43\xdb\xb4\x20\xd6\x44\xb4\x25\x3e\x4b\xee\
-\x4c\x7c\x91\x14\x4d\x1c\xe9\x19\x49\x1c\xef\x1a\x4a\x94\x76\x6e\
-\x4f\x1c\x08\xf6\x23\xb6\x04\xf8\x10\xd3\xac\xad\x89\x14\xc2\xde\
-\xde\x5a\x78\x0f\x42\x85\x77\x61\xb8\xe0\x0e\xac\x16\xde\x81\x23\
-\x08\x57\xd1\xfd\x97\xe8\x7a\x0d\xdf\xa7\xdd\x81\x35\x82\xdb\x50\
-\xc4\xbf\x05\x61\xc5\x00\x86\xc4\xdb\x55\x7c\x02\x5b\x18\x2e\xe9\
-\x11\x6e\x50\x9e\x9b\x6a\x70\xff\xa3\x71\x06\x2f\x3e\x5b\x68\x08\
-\x97\x36\x19\xc2\x97\xdb\xc4\xd8\x2e\x81\x01\x89\xeb\xdb\x0c\x60\
-\xf7\x46\x7f\x18\x7b\x70\xa9\x28\xed\xab\xdf\xeb\x51\x1d\x41\xf0\
-\x5d\x15\xf0\xf7\x5f\x04\xee\xf2\xad\xc0\x99\xb9\x04\x38\xb3\x96\
-\x52\xd7\x0f\x37\x03\xef\xb3\xf3\x20\xfc\xae\x12\xf0\xe7\x10\x7e\
-\x45\xf8\x30\xfd\x0e\xf8\xff\x93\x95\x76\x75\x22\x7a\x87\xb7\x31\
-\x38\x39\x22\xcd\xf0\xe1\xa9\x15\x46\x70\x7d\x0b\xc2\x56\x79\x30\
-\x68\xf8\x52\x8c\x92\x3d\xfe\x30\xfd\xca\xa7\x90\x76\xbb\x01\x04\
-\x57\x1f\x01\x67\xde\x0a\x60\x8f\x98\x00\xac\x7e\x39\x90\xca\x62\
-\x41\x6a\x6a\xaa\x6a\xf4\x1d\x48\x7e\x8e\x33\x77\x39\x08\xae\x3c\
-\xc4\xed\x20\x42\x9c\xf8\x54\x78\x1b\xfc\xde\x68\xbd\xad\x89\x08\
-\x54\xef\xb2\xc5\x23\x8c\x2a\xaf\x6e\x32\x81\xeb\x9b\x25\x30\x96\
-\x61\x8b\x32\xae\x21\xac\x3e\x35\x0e\x32\x6f\x3d\x07\xc1\xa5\xdf\
-\x80\x3d\x79\x2e\xb0\xfb\x0d\x94\xd6\x8f\x95\x99\x0d\xec\x21\x23\
-\x81\x3d\x66\x0a\xb0\xdf\x9b\x03\x9c\xa9\xef\x93\x57\xf6\x98\xc9\
-\xe8\xef\xa3\x20\x35\x23\x5b\xf6\xd9\xec\x01\xe8\xdf\x66\x83\xe0\
-\xc2\x03\xdc\x0e\xb5\x69\x77\x61\xdc\x1b\xe8\x17\x16\xed\x7c\x0d\
-\x77\x4c\xec\x67\xf4\xf8\xea\xc7\x4c\xb8\xbe\x11\x61\x93\x3a\x98\
-\xc8\x80\xda\xe6\xe2\x56\x7b\x98\x7c\xe5\x00\x08\x6f\x8b\x80\xbb\
-\xe2\x13\x60\xf5\x1d\x40\xd5\x45\x20\x04\xf6\xf0\x71\xc0\x59\xb9\
-\x03\xc9\xf4\x0f\x09\xbf\x55\x02\x73\x85\xbb\x66\x37\xb0\x8b\xc6\
-\x03\x4b\x98\x46\x7d\x3f\xab\x3f\x70\x51\xff\xc0\xbf\x8b\x3e\x73\
-\x30\xfb\x16\x58\x37\x47\xc5\xdd\x9c\x88\x6e\x31\x61\x86\xdf\x1c\
-\x5f\x62\x2a\xba\xb6\xc1\x0c\xae\x2b\x62\xa3\xa9\x5a\x5c\xdc\xe2\
-\x0c\xa3\xbe\xba\x00\xc2\x1f\x6a\x80\x3d\x76\x2a\xa4\xf2\xf8\x88\
-\xe7\x6c\x54\xef\xb1\xc0\xff\xfc\xa2\xc6\x3a\xab\x03\xff\xd0\x55\
-\xd4\x0e\xe3\x20\x95\xc3\x85\x54\x2e\x17\xd8\xa3\x27\x83\xe0\x5b\
-\x52\x3f\x5c\x42\xb0\x69\xca\xba\xfb\x7b\x19\x8e\x1d\x29\x34\x79\
-\x78\x75\x9d\x05\x5c\xfb\x18\xc3\x5c\x33\x50\x7b\x48\x70\x75\xa3\
-\x25\x4c\xbc\x7a\x0c\x84\x3f\xbd\x00\xf6\xa8\x49\x94\xcc\xd2\xb3\
-\x80\xf3\xfe\x4a\x10\xde\xaa\x6f\x54\xdd\xa5\xb8\xd5\x00\x9c\xc5\
-\xeb\x50\xbf\xe9\x47\xfe\x2e\x6e\x4f\xe1\x8d\x5a\xfc\x6f\x65\xc2\
-\x1f\xc0\xa4\x29\xea\x1e\xe4\x6d\xb8\x60\x41\xa1\xd9\xdf\xd7\xd6\
-\x59\x02\x0d\xeb\xe5\x61\xa1\x1a\xa8\xad\x3e\x28\x59\x4c\xd6\x93\
-\x94\x3b\xd2\x6d\xac\xec\xfe\xc0\xff\xf4\x8c\x8c\xd3\x25\x3f\x53\
-\xff\x86\xe5\x88\xc0\x1e\x3f\x1d\xf8\xa5\xb7\xf4\x6a\x07\xde\xbe\
-\x72\x48\x45\xbf\x4b\xb6\xc1\xa8\xf7\x40\x78\xf3\x15\xd2\xad\xb0\
-\xf8\x75\xeb\xde\xd6\x87\xb1\x7e\xcd\x18\xf3\xea\x6b\x6b\xad\x41\
-\x06\x2b\x65\xac\x93\x07\xd5\x3e\x87\xe7\x5b\x40\xdf\xc2\xee\xbf\
-\x23\x19\x89\x38\x8b\xd6\x41\x2a\x9b\x03\x2c\xa4\xbf\x78\x9b\x0e\
-\xc9\x38\x7c\xe4\x2b\xaa\xde\x8a\x7a\x9e\xcb\x03\xfe\x81\xcb\xfa\
-\xb5\xc1\xf6\x63\x90\x8a\xf4\x27\x6e\x63\xce\xfb\x2b\xf0\xdf\x1a\
-\xd2\xef\x41\x54\x63\xeb\x1e\xe8\x63\xb4\x78\xfd\x18\xcb\x9a\xab\
-\xab\x6d\x80\xc4\x1a\x0a\xd7\x94\x60\x2d\x03\x6a\x9f\x15\x23\xcd\
-\xab\xe3\xc3\x8c\xaf\xb4\xf6\x32\x9c\xcd\xff\xf9\xe5\x59\xc1\xc5\
-\x5f\x91\xae\xa3\x74\x3c\x67\xf6\x52\x39\xee\xd6\x53\xe3\x1d\x96\
-\xd9\xa0\xa1\xc0\x47\x32\xe4\xed\x3d\x47\xfe\x3f\xd9\x06\xa8\x5d\
-\xf4\x6d\x03\x2e\xaa\x37\xc9\xb1\xac\x7e\x20\x28\xbf\x87\xff\x56\
-\xde\x98\xba\xfb\xb9\x33\xf2\xe6\xe5\x59\xfc\x7d\x75\x95\x1d\xd0\
-\x61\x4b\x61\xb5\x32\x76\x4c\xb1\x7a\x19\x13\x62\x7c\xdd\xc7\x99\
-\x91\x8d\x7f\x03\xd9\x26\xe1\xf8\x9d\xf0\x18\x45\xd6\x31\x7f\x08\
-\x08\x90\xfe\x93\xca\xfe\xd4\x8f\x52\x79\xe3\xb1\x50\xda\x1f\x90\
-\x0e\x63\x15\x8e\x6c\x5c\x1b\xdc\xa8\x03\x76\xc1\x70\xea\x79\x13\
-\x66\x88\xdb\x19\xa2\xf5\xa9\xbb\x83\x15\x11\x98\x1d\x6f\x7a\xef\
-\xea\x0a\x07\x20\xb1\xd2\x5e\x3d\x50\x9b\x5c\x5e\x69\x07\xc3\xd8\
-\x66\xbf\x05\x7a\x19\xcd\x43\x5f\x67\x48\x7e\x07\xdb\xab\xd8\x5e\
-\x63\x0d\xc8\x25\xdf\x07\x8f\x79\x34\xbe\xa2\x7a\x49\xea\x88\xf5\
-\x18\x6d\x9c\x43\x6d\x80\xc7\x38\xac\x17\x38\x0b\x56\xcb\xdb\x7d\
-\xda\x39\xb0\x6e\x1f\xc5\x01\x64\x57\x08\xbe\xfa\x1b\xeb\x81\xf5\
-\x7a\x54\x9f\x11\x19\x68\x7c\xe9\xd2\x32\x27\xb8\xfa\x11\x86\xa3\
-\x32\x56\x38\x82\xa4\x6d\xae\x7c\xe4\x00\x7d\xa2\x98\x37\x5d\x1d\
-\x8c\x23\x14\x7f\x08\xbd\xcb\x03\xee\x86\xcf\xa9\x77\x41\xfc\x17\
-\x7c\xfd\x94\x5e\x47\x64\xbf\x49\xe4\xcf\xdb\x71\x52\xf5\x18\x57\
-\x76\x1b\xf8\x7b\xcf\x02\xff\xe8\xd7\x20\xfc\xf9\xa5\x6e\x6d\xf0\
-\x7d\x35\xb0\xfa\x8b\xdb\x1c\xd9\x0a\xe8\x6f\xbf\x13\x00\x06\x3a\
-\xf5\x79\x2f\xa3\x45\x9f\xbe\xe7\xf0\xea\xca\x32\x17\xa0\xe0\x2c\
-\xc5\xd5\xe5\xf2\x70\x22\x91\x97\x6c\x7e\xdf\xd3\xc1\x38\x52\xf1\
-\x77\x7a\xec\xbb\xda\x0a\xbf\x0b\x67\xca\x3c\x8a\x8b\xa3\xdf\x53\
-\xf9\xae\xd8\xbe\x23\xdb\x00\xe9\x46\x9e\x9c\x1d\x20\xf8\xf2\x89\
-\x6c\xac\x94\xd8\x7b\xa8\x0d\xc9\x76\xd0\xa1\x0d\xd8\x63\xa7\x51\
-\xfa\x06\xf5\x3d\x92\x6b\x77\xc1\x47\x17\x13\xa7\x5f\xbc\xc5\xfd\
-\x2b\x4b\xdd\x80\x82\x2b\x85\x0f\x15\xe1\x42\x62\xfb\x04\xfb\x17\
-\x01\x1e\x46\xd3\x54\xfd\x50\x97\xbc\x01\x47\xc8\xf7\x18\x39\x91\
-\x7a\x0f\x54\x4f\x95\xef\x8a\xed\xa1\xa1\xa3\x65\x6d\xb0\xff\x02\
-\xf9\x77\x16\x1a\xc7\xa5\x75\x4f\xcb\x90\xcd\x09\x74\xd4\x07\x9c\
-\x19\x8b\xa8\x76\x47\xf6\x11\xbe\x4f\xbb\x07\x49\xda\x2a\x1f\xd2\
-\xc2\x64\xf7\x99\xb9\xee\x70\xe5\x03\x0f\xb8\xb2\x04\xc3\x5d\x35\
-\xc4\xed\xd3\x33\xcc\xec\x2b\xf4\x35\x55\xf6\xb6\x73\xdf\xc9\xb9\
-\x8f\xc9\xfa\x8b\xeb\x26\x1e\x8f\x54\xdb\xb4\x68\xce\xa7\xd8\x06\
-\xfc\x63\xdf\x00\x7b\xdc\x34\xe0\x7f\x71\x1d\x04\xc8\x6e\xc2\x7d\
-\x45\x1f\x9d\xc8\xf9\xe0\x63\xaa\xfe\x85\x23\xa8\x67\xdc\x86\x0c\
-\x2d\xd5\x77\xce\xed\x61\xf3\xe0\xca\x62\x2f\xa0\xe0\xa9\x8c\x0f\
-\x3c\xa9\xb6\x41\xc0\xed\x14\xe4\x65\xbc\x52\xd5\x0f\xb5\xf1\x34\
-\x5e\xbb\x66\xcb\x20\x8a\x87\x43\x47\x51\xfd\x70\xe1\x5a\xcd\x76\
-\xbd\x62\x1b\xac\xdd\x03\x82\xd3\x37\x80\x8b\xe6\x04\xb8\xbe\x78\
-\x1e\x2c\xc4\x3a\x71\xd8\x18\xb9\x36\xb8\xa4\xbe\xfe\x68\xfe\x4c\
-\xd6\x7f\x70\x11\x25\xff\xbb\xd0\x57\xa3\x8d\xe7\x69\xfc\xe1\xb1\
-\xe9\x9e\x70\x79\xa1\x0f\x82\xb7\x14\x57\x16\xc9\xc3\x4b\x8a\x55\
-\x85\x4e\xaf\x6c\x98\x46\x89\x8a\xbf\x63\x63\x4a\xb4\xca\xed\x69\
-\xfd\x60\xe7\xd6\x2c\xaa\xfe\x23\xc6\x53\xf2\x9f\xbe\x40\x2b\x67\
-\x71\x1b\xb0\x24\x6d\xa0\x00\xcc\x05\x6c\x2f\x90\xe3\xc2\x90\x51\
-\xb2\x36\xf8\xe2\x4b\xd5\xf5\x9f\xf9\x01\xf5\x3d\xd4\x5e\xe4\x6f\
-\xdf\x81\x3e\x9a\xea\xdf\x33\xc4\xe2\xcb\xcb\xf3\x5b\x02\x85\x16\
-\x70\x79\x81\x2a\xf8\x50\x40\x6d\x34\x33\xd3\xb1\x02\x37\x9b\xe2\
-\xef\x84\xb5\x62\x9e\x2c\x7f\xdf\x0b\x76\x2e\xec\x42\xbd\xc7\xa4\
-\x59\xd4\x7b\x20\x9b\x56\xb7\xf1\xbb\x16\x38\x0b\xd7\x40\xaa\x30\
-\x9d\xd2\x79\x19\x59\xc0\x5d\xba\x89\xec\x03\xb4\xb1\x51\xd2\x06\
-\x99\x7d\x25\xf6\x3e\x5d\xff\x4d\x9c\x49\xb5\xbb\xd8\x06\xe0\xdf\
-\x83\x40\x75\x75\x67\x32\x89\x80\xc9\x5c\xe7\x27\x97\xe7\xf9\xc2\
-\xe5\xf7\x5b\xa9\x81\xa4\x6d\x28\x2c\xe8\xef\x52\x83\xbe\xda\x81\
-\x36\x47\x72\x37\x99\xb1\x76\xb0\x6b\x35\x6e\xab\xad\x23\x3d\x40\
-\x70\xe3\x45\x35\xf7\xa3\x6d\x54\x3d\x72\x0a\x40\xf0\x63\xad\xee\
-\x76\x0c\x9a\xcb\x62\x3e\xe0\x31\x4f\xde\x36\x92\xb6\xc1\xf5\xc7\
-\xa4\x8d\x4c\x8e\x9d\x62\x9d\x29\x05\xfa\x0e\x2b\xaf\x90\xaa\xff\
-\xe2\xf5\xf8\x6f\xcf\x62\xcf\x80\x91\xda\xb9\x9d\xbb\xe9\xfc\x63\
-\x93\x51\x1d\xe7\xb6\x46\xf0\xa3\x63\x9e\x04\xbe\x34\x7c\x3e\xde\
-\x07\x7c\x9d\x4d\x26\x48\x7f\xc3\xcd\x64\xf2\x0c\xa1\xf3\x63\x49\
-\x7b\xbd\xdf\xd7\xb9\x26\xf5\xd2\x1f\x27\xf0\x7c\x1e\xcb\x28\x95\
-\xcd\x06\xde\xb6\xa3\x3a\xd7\x1f\xb7\x15\x5e\xf7\x20\xeb\x28\x37\
-\x2e\xc8\x03\xb7\x29\x59\xff\xcd\x87\xe9\x76\x15\x9a\x5b\xe1\xbe\
-\xc1\x4a\xcf\x04\xc1\x79\x72\x6d\x64\xaf\x26\xee\x47\xf9\x99\x1f\
-\xbc\x34\x3b\x00\x2e\xcd\xf6\x97\xe2\xf2\x1c\x79\xb4\xa6\x63\x2e\
-\x85\xd8\x36\x16\x5f\xb5\xf5\x34\x5d\xdf\x25\xc0\xfc\xdc\xaa\x3c\
-\x8f\x6a\x59\x7b\xf9\x82\x20\xca\xe6\x26\xff\xc7\x1a\x0e\xc9\x45\
-\x34\x2f\x27\x39\x80\xfa\xb6\xa2\x9d\xa7\xd5\x8e\x51\x31\x36\x52\
-\x76\xd1\x1d\xb2\x4d\xf1\xbf\xe1\x31\x42\x9e\x37\x78\x2d\x85\xec\
-\x73\x23\x27\x50\xba\xef\x36\x70\x34\xd5\x3f\xa9\x9d\xf5\x95\x4b\
-\x33\x83\xe0\xd2\xcc\x40\xb8\x34\x4b\x15\x02\x28\xcc\x56\x84\x3f\
-\x9c\x9f\xd9\x5a\x65\x7b\x45\xb7\xb6\x38\x85\xd7\xa2\xd0\xf3\x6f\
-\xf0\xd0\x1c\x0f\xcb\x02\xd7\x81\xa3\x60\x03\xeb\xd5\x06\xc8\x06\
-\x60\x4f\x9b\x4f\xae\x1b\xb0\x24\xfa\x21\x77\x30\x6d\x0d\x81\xb7\
-\x6e\x2f\xb0\x30\x67\x04\x42\x49\x7b\xdd\xd6\xc4\x7d\x6c\xef\x0a\
-\x23\xec\xef\x5e\x2a\x6e\x03\x2a\x41\xb6\x8b\x2a\xa8\x6f\xab\xd5\
-\xb9\x5e\xb5\x9e\x8e\x26\xe4\x1c\x08\xe9\x5d\x9e\xfc\x1c\x08\xdb\
-\xa5\x82\x93\x3f\xe8\xdd\x06\x78\xcd\x53\x69\x5c\x40\xf3\x7d\x41\
-\xf9\x7d\x19\x27\x4a\x7e\x46\x73\x8d\x3c\x9a\xde\x43\xe3\x5e\x9a\
-\x96\x71\xdf\xbe\x30\xde\xf9\xb7\x4b\xd3\x83\x81\x86\x19\x18\x6d\
-\x55\x43\x5d\x5b\x15\x07\xc1\x89\x49\xfe\xd0\xa1\xa5\xf9\x39\x79\
-\xbb\x48\xf0\xf3\xab\xcf\xc8\xb1\x0d\x8d\xc5\x64\x1b\x0c\x1c\x04\
-\xfc\x73\xf7\xf4\x5c\xe7\xa9\x07\xde\x27\x27\x80\x83\xe4\xcf\x46\
-\x63\x0a\x77\xf5\x2e\x34\x0e\x3c\x93\xe9\x8b\x8b\xbf\x48\xf5\x01\
-\xbb\x60\x18\x08\xbe\xa9\x20\xd7\x02\x75\x99\xea\x4e\x4e\xf1\x7c\
-\x72\x71\x6a\x7b\xc0\xb8\x34\x4d\x1e\xed\xe8\x98\x2e\x41\xb0\x12\
-\x2e\x20\x8c\xef\xed\xf6\x67\x3b\x2f\xb3\xdd\x78\x79\xb8\xa5\x03\
-\x73\x78\xa7\x96\x96\x07\x52\x42\x6d\xbf\xee\x9b\xdc\xfa\xd7\x8c\
-\x4b\xf7\x5f\x09\xae\xfd\x09\x2c\x34\x07\xa6\xc6\x83\x41\xa4\x9e\
-\x7a\xad\xb5\x2f\x89\xdc\xf7\x95\x4b\xeb\x8e\xfb\x83\xe0\xf2\xef\
-\xf8\xef\xf7\xd0\xbc\xd7\x49\x87\xfa\x87\xcd\xe3\xb5\xa8\xb9\x38\
-\x25\x14\xe8\x08\xa1\x30\x55\x11\xed\x41\xb1\xad\x0e\x8f\x0a\x12\
-\x45\xfb\x59\x5e\xb7\x35\x35\x8a\x09\x74\x33\x5b\xc2\xeb\xe0\x70\
-\x73\xc7\x10\xff\x06\xf9\xb6\x3a\xba\x38\x05\x72\xbe\x7b\x04\xfc\
-\xf3\xff\x03\x96\x78\x7e\x8e\xed\x7a\xce\xf4\x85\x4a\xf3\x42\x9d\
-\xc7\x08\x24\x63\x6c\xe7\x60\x1b\x81\xac\x7b\xfe\x50\x10\x20\xbd\
-\x88\xe7\x7b\xc2\xbb\x10\xa0\xe3\x7c\xb7\xcd\x4c\x56\xcb\x67\x17\
-\xdf\xeb\x00\x34\x4c\x0e\x53\x03\x7a\x3b\xed\x2f\x6a\xd3\xd0\xd6\
-\xdd\xfc\x28\x93\x20\x7c\x23\x5a\x5a\x5d\xd9\x37\x3c\xa8\x41\xbe\
-\xbd\x0e\x8c\x08\x82\x7e\x9d\x9d\xef\x77\xf7\xb7\x39\x1d\x15\x1f\
-\xf5\x05\xaf\xfc\x5e\x9d\xf0\xc7\xe7\xe4\xbc\x2c\x95\x2f\xa4\xde\
-\x1b\xf5\x59\x3c\x5f\x11\xa0\xb9\xae\x78\x0d\x5b\xa3\x5d\x80\x75\
-\x3f\x67\xd6\x12\x69\x5f\x4f\xe5\x09\x80\x33\xb1\x98\xd4\x13\xe8\
-\x33\x37\xf9\x77\xa0\xb5\x1e\xf3\xfd\x56\x93\x92\x7c\xfe\xba\x38\
-\xb1\x13\x90\x98\x84\xd1\x51\x35\x14\xdb\x08\x21\x2e\xc0\xf6\x3a\
-\xfa\x0d\xeb\x88\x96\xd6\x57\xca\x26\x84\x48\xdb\xe9\xe4\x98\xf6\
-\xc0\x0d\x73\xbc\xe9\xe7\x62\x36\x1f\xeb\x18\xe9\x7a\xe2\xc8\x62\
-\xef\xde\x7b\xcb\x1e\x50\xeb\x75\xc7\x49\xdd\xce\xe2\xf3\xc5\xfb\
-\x00\x69\xc0\x1e\x34\x8c\xb4\xdd\xb0\xbd\x8f\xd7\xf4\xf1\xfa\x01\
-\xbe\xe2\x75\x33\x6c\x4b\xe2\xb5\x1d\x89\xee\xc7\x6b\xe8\x2c\x64\
-\x07\xf2\xb6\x1e\x91\xb4\xcf\x1e\xce\x3d\xb0\xd5\x73\xa9\xcb\x65\
-\x78\xac\xd7\xc3\x8b\x13\x22\x80\x42\x38\x1d\x13\x25\xe8\xa4\x0c\
-\xd4\x56\xed\x3c\x2d\x76\x78\xda\x9b\x16\x6c\xca\x41\x72\x97\x6b\
-\xab\xf8\x40\xbb\x3b\x78\x4e\xa5\xee\xa1\x3d\x76\x9d\x1d\xc2\xbd\
-\xf6\xf8\x09\x96\x27\xef\xd3\x12\x72\x9d\x07\xeb\x45\x95\x6b\xa1\
-\xf2\xc0\x76\x0d\xfa\x1c\xde\x1f\x22\xd7\x4c\x28\xbe\xdc\xc4\xe3\
-\x4c\x23\x97\x39\x0d\x05\x61\x2e\xb7\x2e\x8c\x8b\x02\x0a\x91\x14\
-\xc6\x2b\x22\x42\x0a\x59\x5b\x45\x40\xe7\x56\x36\x25\xe8\x37\xdc\
-\x07\x75\xf1\xf8\x55\xbe\xbd\x76\xe4\x07\xbf\xf2\x77\x31\x9f\xa7\
-\xe9\xc1\x78\x5c\x4e\xbb\x03\x99\xe8\xfd\xcf\x91\xfb\x78\xc8\xc6\
-\xc7\x7b\x1a\x78\x2f\x90\x33\x63\x21\xb0\x27\x14\x93\xed\x42\xf2\
-\x01\xdd\xe3\x3d\x3f\xde\xe7\x97\xc8\x7d\x04\xfc\x79\x84\xf3\x08\
-\x59\x05\xd7\xc0\xf8\x75\xd6\xb8\x7b\x05\x39\x5d\xbd\x30\xa6\x33\
-\x5c\x18\x13\x0d\x17\xc6\xaa\x42\x14\x85\x71\x8a\x88\x84\xf1\x3d\
-\x5a\xfc\x65\x67\x61\xd2\xae\xad\xbb\xe5\xce\xa3\xc3\x3b\xd2\xda\
-\xaa\x7f\xa4\xfb\x03\x6b\x26\x53\x53\x5f\xb4\x0b\x70\x35\x9f\xd6\
-\xcd\xcf\xf6\xf2\xd4\xfe\x5d\xab\x56\x6f\x9c\x0b\x33\x8e\x1d\x86\
-\xe1\x97\x7f\x84\x7e\x3f\x3c\xa3\xf5\xfb\xf4\xef\x9f\x89\x84\xa5\
-\x3f\xd5\xb2\xb6\x7f\xf1\x28\x66\xea\xdc\xeb\x81\x71\x09\xd3\x71\
-\x77\x52\xb3\xfe\xa0\x57\xe9\xda\xca\xfe\xc4\x85\xd1\x5d\xe1\xc2\
-\xe8\x2e\xca\x18\x83\xd1\x59\x35\x50\xdb\x94\x8d\x8a\x84\xf6\x1e\
-\x56\xfb\xd0\xcf\x38\x0a\xc3\x5c\x6f\x4b\xdb\x0b\xb5\x4f\xd9\xe8\
-\x08\xe8\xe0\x4d\xf2\x83\x66\x6f\xb9\x5a\x9a\x08\x3b\x7a\x5b\x1f\
-\x1b\x10\xe5\x7e\xef\xe0\x90\x30\xb5\xdc\xc2\x7c\x3a\x3f\x29\x5a\
-\xa9\x2f\x9e\x9f\xd0\x11\x3e\xc9\x6d\x0b\x13\x93\x7c\x9e\x72\x43\
-\x9d\x6e\xc6\xf9\xdb\x95\xb5\xf7\xb4\xc4\xfd\x30\x0f\xfd\x7e\x4b\
-\x7d\xeb\x1f\xec\x66\xbd\xe5\x6c\x11\xaa\xff\xc8\x6e\x32\x8c\x92\
-\xa0\xab\x32\x14\xda\xaa\xa0\xb3\xf7\xaf\xd6\x4c\xc2\xcf\xdf\xc9\
-\x62\xfe\xee\xdc\x0e\xf5\xf2\x6d\xb4\x2a\x2d\xb8\xc6\xd7\xc1\x72\
-\x38\x1a\x1f\xfc\xda\xba\x59\xae\xef\xd5\xc6\xe9\xbb\x15\x69\x6d\
-\xea\xce\xcb\x73\x6b\x9c\x6a\x6e\xe9\xd3\x0f\xcb\xc7\x75\x82\x6d\
-\x39\x6d\x61\x5c\x0f\xef\xc7\xa9\xed\x9c\x7e\x44\x9c\x3a\x1d\xe4\
-\x6c\xc5\xd5\xa5\xfe\x8e\x56\xcc\xd4\x8f\x78\x21\x2f\xce\x17\xc5\
-\xc0\xf9\x11\x8a\xe8\x2e\xc5\x85\x91\xf2\x90\xb5\x55\xe9\xf0\x2e\
-\x10\xe2\x6e\x7d\x0c\x4f\xa5\x23\x7d\x6c\xaf\x9d\x1b\xd1\x85\xd6\
-\x56\xf9\xd1\xde\xbf\x8c\x8a\x69\xf5\xe8\xc4\xd0\x28\xbd\xb8\xa5\
-\xb6\x2f\x8a\xdb\xa8\x7c\x6c\x24\x1c\x1e\x8a\xb8\x90\x13\x02\xab\
-\x32\xda\xc0\xac\xd4\xd6\xcf\x8a\xe2\xbc\x1f\x66\x74\x72\xfb\x1f\
-\x27\xc4\xf9\x27\xd4\x27\x67\xea\x48\x01\x26\xbf\x9d\xe7\xad\xf3\
-\xc3\xe3\x80\x8e\x58\x38\x5f\xa4\x0a\x31\xa0\xd8\x56\x1f\x72\xda\
-\x57\xb5\xb4\xb7\x18\xeb\x60\x69\x12\x94\xd5\xc1\xf3\x7f\xea\xda\
-\x4a\x17\x6e\x9d\x1a\x16\x05\x0b\x58\x41\xb5\x13\x12\xfc\xfe\xca\
-\x8d\xf4\x7a\xc0\x0b\x71\xbd\xd5\x27\xd8\xf9\x9b\xc4\x20\xc7\x4b\
-\x71\xfe\x0e\xa7\xa3\x5b\xda\x1d\x0c\xf3\xb0\xde\x15\xe0\x62\xb1\
-\xa1\xb5\x93\xe5\x6c\xc4\xfb\x7c\x23\x23\x22\x0e\x53\x19\xaf\xe1\
-\x22\xe8\xad\x0f\x43\xdd\x6d\x3f\x2b\x2b\x8c\x87\xf3\x43\x13\x28\
-\x0c\xc3\x88\x57\x01\xc5\x36\x92\xb5\xd5\xfc\xde\xed\x2a\x92\x02\
-\x5c\xbe\x9a\xda\x23\xf0\x91\x52\x5b\x15\xe9\xce\xab\x1e\xfe\x4e\
-\x78\x5d\x15\xef\x27\xf8\x88\x7d\x89\x9a\xbd\xd8\x99\x99\x75\x9d\
-\xd5\xb3\xdd\xb3\xf3\x85\x3d\xe1\xfc\x10\x09\x7a\x28\x63\x68\x0f\
-\x59\x1b\xc9\x43\x65\x5b\xc5\xab\x69\x2b\xcd\xdc\x5a\xce\x09\xa9\
-\x48\x69\xe3\xf2\x75\xcf\x00\xe7\xf2\x6e\x2d\x1d\x8e\x77\xf2\xb2\
-\xfd\xbc\xad\x9b\xf5\x8e\x00\x27\xcb\x0f\x5b\xd8\x9b\x8d\xb2\x35\
-\x67\xe0\xf9\x7c\x38\x82\x37\x82\x59\x53\xb5\x41\x67\x6f\xc7\xcb\
-\xe5\x05\x49\x50\x3e\x58\x1e\x89\x32\x14\xca\x40\xb6\x93\x04\xea\
-\xda\x4b\x45\x5b\x9d\x19\x1c\x07\xa3\xe2\xdb\xbd\xea\x11\x15\x56\
-\xd5\x3b\xa6\xcb\xd3\xde\xb1\x5d\x2b\x7a\x84\x87\x54\x8e\x88\x0b\
-\x7e\x55\x32\xb8\xbb\xfa\xb6\x42\x38\x55\xd8\x0d\xf6\xf4\x8f\x84\
-\x75\xc2\x0e\xb0\x20\x25\xb8\x76\x5c\x6c\xeb\xc7\xfd\x3a\x7a\xfd\
-\x8f\x13\xec\x7e\x33\xd4\xc3\xf6\xd0\xeb\xd6\xdf\xd3\xd2\x92\x37\
-\xaf\x47\xc7\xca\xf2\x41\xbd\x80\x8e\x64\x28\x2f\x50\x44\x12\x28\
-\xb7\x55\x92\xca\xb6\x2a\x17\xb7\xd3\x90\xd8\xb0\xda\xac\x74\x61\
-\xf5\x95\x2b\x57\x1a\x50\x01\x49\xc1\xff\x7f\xe1\xc2\x85\xfa\x7e\
-\x59\x19\xd5\xb9\x31\x21\xb5\x8d\xe1\x16\x6a\x83\x9f\x9a\x82\x03\
-\x1d\xdd\x1c\xcf\x94\xe5\xf4\x86\xf2\xbc\x14\x19\xf2\x31\x7a\x2b\
-\x43\xa9\x9d\xd4\xb5\x55\x32\xa4\x44\x85\x55\x1f\x3a\x74\xb0\x0e\
-\xb4\x94\xa3\x47\x8f\xd6\x26\x47\x86\x56\xe9\xcb\xad\xfe\x1d\x5b\
-\x3c\x40\xaf\x6f\xfe\xba\xf5\x77\x34\x37\xef\x58\x14\xd1\xf6\xd1\
-\xb9\x9c\x54\x20\x91\x2b\x41\x1f\x12\xe5\x12\xe4\x49\x90\xa2\x0c\
-\x85\x76\xca\xe8\xdc\xb1\xa6\xfc\xdc\xb9\x17\xa0\x63\xb9\x74\xe9\
-\xd2\x0b\x4e\x54\x68\x8d\x3e\xdc\x1a\x1e\xed\xff\x10\xaf\x3b\x34\
-\x89\xaf\x8f\xbd\xdd\xda\x4f\x79\x3d\xeb\xcf\x0d\x64\x03\x1d\x2c\
-\x19\x72\xe4\x91\x0a\xea\xda\xeb\x53\x61\x3c\x14\x0d\x1d\x5a\x09\
-\x7a\x96\x45\x0b\x17\xd4\xac\x64\x75\x16\xe9\xc2\x2d\xdc\x0f\x67\
-\xf7\x0c\x7d\xe6\x65\x65\xce\x69\x22\x55\x68\x12\xee\xe6\x72\xb5\
-\x24\x1b\xd5\xb9\x3f\x57\x01\x1c\x38\x37\x40\x11\x6c\x0a\x2a\xda\
-\xab\x57\x64\xc7\xca\xbf\xff\xfe\x5b\xdf\xea\xc3\xab\x57\xaf\x20\
-\xa9\x4b\x74\x95\x4e\xfd\x30\x9f\x6a\x9f\x44\x5f\x52\x07\xd8\x37\
-\xd1\x78\xe8\x9d\xd4\xca\xfb\xe6\xd9\xbe\x7c\x90\xe0\x1c\x46\x3f\
-\x0c\x9e\x32\x94\xda\x89\x6a\x2b\x21\x87\xfd\x54\xbe\x5e\x35\x35\
-\x35\xb0\x76\xcd\x9a\x17\x33\x8b\x67\xd4\xde\xbe\x8d\x26\xaf\x1a\
-\x4a\xff\xec\xac\x67\x9a\xb8\x45\xef\x8b\x29\x70\x38\xbb\x27\x04\
-\x3a\xda\xad\x69\x32\x7f\x3f\x2b\xab\x6e\xe9\x81\xfe\xf7\xcf\x66\
-\x09\x81\x44\xb6\x04\x02\x3a\xfa\x4a\x40\x6f\xab\x33\xd9\x5c\x18\
-\x35\x62\x44\x95\xa4\x3e\x7f\xfc\xf1\x87\x28\xa9\x4b\xe7\xba\xed\
-\x9c\x44\x38\x96\xd1\x07\xb2\xa3\x3b\xbd\xd8\xb9\x63\x47\xad\xba\
-\xfa\x8f\x1d\x33\xa6\xf2\x58\x56\x8a\x5a\x6e\xa9\xea\x87\xbd\x5b\
-\x7b\xff\xd0\x14\x73\x42\xb9\x31\x31\x56\x18\x10\x70\xbf\x2c\x33\
-\x1d\xce\xd2\x90\x46\x21\x4b\x11\xb2\xb6\x3a\x92\xc6\x81\x89\xe3\
-\xc7\x4b\xfb\xfe\xe0\xdc\xdc\xe7\x27\xd2\xb9\xb4\xb6\xe2\xf5\xec\
-\xa1\xb6\xfe\x0b\xe6\xcf\xaf\xdc\xca\xea\xa1\x96\x5b\xca\xfd\x90\
-\x03\xd3\xbb\x75\x7c\x26\xb6\x83\x9b\xac\x78\x9a\x99\x45\xc6\x79\
-\x7b\xdf\x38\xce\x47\xf5\x4a\xcf\x94\x21\x23\x43\x05\xd2\x29\xa0\
-\x36\xc2\x6d\x56\x34\x6c\x58\xb5\xa4\x3e\x19\x2c\x56\xb5\x62\x5b\
-\x65\x76\xed\xd2\xa0\xae\xfe\x33\x8b\x8b\xab\x0f\x09\x53\x55\x72\
-\x4b\xbe\x1f\x0e\x8b\xe9\xfc\x82\x13\x1d\x59\x5d\xd6\x97\x0b\xeb\
-\x7a\xc7\x82\x83\x99\x09\xb7\x19\x4c\x64\xe7\x10\x27\xe7\x73\x1b\
-\x12\x53\x5e\x94\x09\xb3\x81\x44\x1a\x46\x16\x0d\x67\x31\xe4\xda\
-\x88\x9f\x9a\x5a\x21\xa9\xcf\xb0\xc2\xc2\x9a\xc3\x3c\x1e\xad\xbd\
-\x78\x89\x89\x6a\xe5\x3f\xa0\x6f\x76\x65\x69\xa6\x90\xce\x2b\x5a\
-\x3f\xa4\xfa\x62\x3a\x9b\x55\xf3\xed\xb7\xdf\x36\xa4\x85\x77\x7a\
-\xbe\xb4\x47\xf7\x57\xa6\x46\x46\x31\xcd\x34\x4d\x30\x6c\x6d\x6b\
-\x3f\xbb\x5f\x40\xbb\x07\xa7\x78\xa8\xbe\x82\x7e\x08\x7d\xe9\x10\
-\x4a\x40\xb5\x51\x4a\xc7\x4e\xd5\x4f\x9f\x52\x2a\xf0\xd9\xb3\x67\
-\x90\xc6\xe1\xd4\x4d\x8e\x89\x83\x55\xf1\x89\x90\x1a\x1e\x51\x7b\
-\xfc\xf8\x71\x95\x36\x11\xfe\x4e\x72\xa7\x4e\x55\x4a\xdc\x52\xe8\
-\x87\xdb\xfb\xa4\xc0\x47\xcb\x97\x93\xbf\xc1\x4a\x48\xa8\x28\xea\
-\x10\xfa\x08\x53\xb6\x39\xe7\x4a\x78\x4d\x2b\xc4\xd1\xe5\xd0\xc8\
-\x90\x88\x3f\x4f\x73\x50\x1b\xf0\xfa\x53\xe0\x2b\xa2\x1f\xec\xed\
-\xcd\x87\x21\x83\x07\xd7\xc8\xd7\xed\xa7\x9f\x7e\x82\xc3\x87\x0f\
-\xd7\xff\xf5\xd7\x5f\x6a\x75\x7f\x4e\xff\xfe\xcf\x76\xf7\x61\x6b\
-\xe4\x16\x06\x37\x3a\xba\xae\xb2\xb2\x12\x9e\x3f\x7f\x0e\x49\x11\
-\x11\x95\x51\xee\xee\x17\xdf\x54\x0c\x80\xad\x85\x45\x48\xa8\xa3\
-\xfb\xe1\x6c\xff\xf6\xf7\x77\x27\x0b\xa1\x8c\x3b\x50\x01\x03\x50\
-\xbb\x0c\x80\x21\xd1\xdd\x6b\xb7\x6f\xdb\x56\xa3\xeb\xd8\xbf\x75\
-\xeb\xd6\xea\xfc\xf0\xce\x35\xda\xb8\x75\x46\x90\x05\x3c\x16\xab\
-\xf6\xd7\x5f\x7f\x85\x34\x1e\xef\xf9\xf0\xb0\x8e\x35\xee\x56\x56\
-\x1c\xe2\xcd\x17\x07\x5f\x6b\xbb\x39\xdd\xdd\x5b\x5c\x18\x10\x10\
-\xfa\xcb\xba\x18\x76\x43\x09\x2b\x07\x4a\xd9\xb9\x50\xca\xc9\x21\
-\x31\x20\xbc\x4b\xcd\xac\x99\x33\xab\xe5\xe7\x3d\x8a\x45\x24\x12\
-\xc1\x07\x8b\x16\xd5\x64\x74\x88\xac\xc2\xed\x46\x41\x15\xb7\xfa\
-\x91\x38\xc3\xeb\x0b\x63\x3b\xc7\x88\x72\x22\xbb\xd4\x6f\x4e\x4c\
-\x15\xb5\xb1\x73\xfc\xfc\x2d\x88\x03\xb2\x77\xb5\xb0\x1a\xd8\xce\
-\xde\x75\x37\x6a\x8f\x92\x49\x61\x31\x8f\x4b\x59\x79\x80\xb1\xa0\
-\x4b\xef\x86\xc4\x6e\x31\x55\x2b\x56\xac\x78\xfe\xe4\xc9\x13\x69\
-\xbd\x7f\xf9\xe5\x17\xf8\x78\xfd\xfa\xda\xa4\x98\xd8\xca\xe2\xce\
-\x3d\x5e\x49\xda\x4c\x0a\x25\x5e\xc9\xb8\x85\xf1\x69\xb2\xa0\x21\
-\xc4\xd1\xf9\x6c\x53\xae\x05\x34\x55\x69\x61\x69\x9f\xce\x6d\xd1\
-\xf6\x4e\x49\x4a\x3e\x94\xf6\x19\x04\xa5\xa9\x83\x60\x75\x37\x0e\
-\xf0\xc3\xa2\x6a\x7b\x47\x77\xab\xee\x15\xd9\xa5\x9a\x1f\x12\xf1\
-\x7c\x79\x97\x14\xd4\x46\xf9\x20\x69\x2b\x29\xd8\x12\xe4\xd2\xc1\
-\xc9\x85\xc3\x29\xd9\x50\xd8\x36\xfc\x8f\x20\x3b\xa7\x2d\xd8\x66\
-\x27\xde\xd2\x62\x6b\x62\xce\x59\x16\xc5\x7e\x79\x26\x65\x30\x94\
-\x2a\xa1\x00\xb5\x8b\x22\x06\x49\xdb\x4a\x86\x7c\x29\x8a\xda\x46\
-\xff\x16\xeb\xde\xb2\x3c\xd0\xd6\xe9\x23\xbc\xae\x4c\xbc\xfd\xc5\
-\x65\x70\x60\xf4\xc3\x33\xbd\x86\x80\x12\x7a\x17\xaa\xc1\x60\x38\
-\xa3\xa2\xad\x0a\x02\x22\x7e\x6d\x69\x69\x2f\x24\xde\xb1\xd2\xc7\
-\xab\xed\x8f\x67\x92\x86\xc3\x99\xa4\x61\x74\x24\x63\x0c\x55\x86\
-\x42\x3b\x9d\x4e\x2e\x84\xf4\x96\xa1\xf7\x7d\x2c\xed\xf9\xc4\x3b\
-\x58\x62\x5d\x5b\x9f\x3b\xd3\x73\x04\x50\x28\xa2\x90\x28\x8f\xe1\
-\x32\x24\x49\x40\xb5\xd1\xfe\xb8\x5c\xe8\xee\xd2\xea\x5b\x47\x73\
-\xf3\x0e\xc4\x3b\x5a\x3a\xd8\x7b\x7d\x56\x92\x30\x0a\x28\x8c\x84\
-\x92\x1e\xaa\x30\x02\x4a\x7a\x52\x90\xb4\xd5\x94\xe0\xc4\xbf\xdb\
-\xda\xb8\xe2\xfd\x35\x2b\xe2\x1d\x2e\xad\x2d\x5d\x3e\x3c\xdc\x7d\
-\x38\x94\xc4\x8d\x81\x92\x78\x8c\xd1\xca\x10\xb7\xcf\x69\x84\x39\
-\x21\xec\xaa\x48\xc7\x96\x97\x3c\x99\x76\xbd\x88\x7f\x41\x71\x32\
-\xb1\x14\xae\xee\xd0\x57\x54\x12\x3b\x0e\x64\x18\x2b\x43\xdc\x58\
-\xd8\xdb\xa5\x10\x86\xb5\x8e\x7b\xd4\xd1\xde\xe7\xb4\x2b\xd3\xba\
-\x37\xf1\xef\x2a\xbe\xa3\x5b\x27\x3e\x39\xdd\x7d\x02\x60\x1c\xea\
-\x32\x0a\x36\x75\xca\x83\xc9\x81\x29\xcf\x78\x1e\x1d\x6f\x77\x76\
-\xf0\x2d\xf1\xb3\x70\x9a\xd7\x98\xfd\xdb\x77\xa4\x18\xf8\x59\x3a\
-\xcf\xf4\xb5\x70\xd9\xd5\xda\xd2\x6d\xbb\x9f\x95\xeb\x62\x0f\xa6\
-\xdd\x60\xf1\x1e\xbe\xd1\x9b\x7a\x09\x64\x6e\x16\x13\x84\x0f\xba\
-\xd4\xe3\x6d\x4f\x74\xc5\x6e\xdc\x06\xe8\x5a\x8a\xff\x79\x06\x00\
-\xf9\xb1\x18\x10\x91\x57\x1f\xf2\x63\x04\x61\x03\x75\xe2\x6b\x05\
-\xb5\x5f\x0a\xf7\xc5\xd7\x52\xf2\xb0\x01\x06\xfa\xd5\x81\xe4\x95\
-\x30\xb8\x4f\xfe\x20\xc1\xc0\x3f\x68\x20\x22\x98\x92\x6b\x31\xbe\
-\xd6\x13\x36\x92\x2b\x21\x7f\xad\x23\xac\xc5\x57\x72\xbb\x8f\x51\
-\x27\xf6\x15\x90\x5c\xd1\x63\xb1\x5f\x0f\xb3\x82\x5a\xe3\xb6\xa1\
-\x5e\x43\x7a\xf5\x11\x5f\x63\x2a\xa8\xf8\xab\x19\xe8\x6a\x53\x8a\
-\x5e\x03\x5f\xef\xa3\xd7\x42\xbf\xc3\xbc\x8f\x5e\x17\x5f\xf1\xbf\
-\x8b\x7f\xd7\x46\xe1\x1a\x53\x4f\xd5\x4a\x5c\x6d\xa6\xb8\x19\x0c\
-\xa4\x57\x90\x34\xa3\xe4\x5a\x4c\xbb\xce\xa0\x9a\x11\x5d\xef\x8b\
-\xdb\xb1\x42\x7c\xad\x13\x5f\xeb\x69\xed\x1b\x23\xfe\x22\x6a\xf7\
-\xfb\xe2\x6b\x9d\x58\x4c\x20\xb9\x56\x50\xf2\x21\x5f\x5d\x7c\x8d\
-\x01\x4a\x80\x33\xc4\x57\xa0\xae\x06\xe2\x2b\x53\x7c\xf5\x11\x5f\
-\x67\x50\x57\x06\xfa\x0f\x76\x82\x0f\x45\xc0\xc2\x7a\x13\xe7\x44\
-\x98\x9a\x12\x3e\x61\x81\xc4\xd8\x9e\x91\xc4\xb2\xb4\x1e\xc4\x8e\
-\x42\xbe\xc1\xb1\x02\xae\x41\x69\x0e\x8b\x38\x9b\xcb\x22\x4e\x67\
-\x25\x13\xbb\x53\xbb\x11\xab\xc2\xa3\xdc\xa6\xf6\xfc\xfc\x62\xbe\
-\xf0\x36\x7c\x24\xbc\x03\x87\x10\xae\x60\xbf\x26\xb1\x8f\xcf\xfe\
-\xb4\xbb\x30\x5b\x70\x17\xba\x69\xf1\xe5\x6d\xaa\x62\x15\xdd\xce\
-\x70\x66\x6e\xaa\xc1\xb9\xe5\xe3\x0c\x2b\xce\x7f\x2c\x3e\xb7\x60\
-\x9b\x04\xb2\x33\x1d\x4e\xed\x09\x80\xd9\x17\x37\x42\xfa\x8f\xcf\
-\x80\xb7\xeb\x34\x70\xe6\x2c\x03\xce\xf8\xe9\x54\x7c\x7a\xe1\x08\
-\xea\xac\x82\x89\x33\x81\xbb\x60\x35\xf0\x0f\x5f\x03\xe1\xcd\xfa\
-\x27\x69\x77\xa0\x58\xf8\x0b\xd8\x37\xc3\x7b\x9b\x77\x0b\x35\x5c\
-\x34\xb1\x1f\xe3\x76\xf9\x5a\x13\x0d\xe7\x10\x18\xc1\x95\xad\xe6\
-\xb0\xe8\xec\x52\x10\x7e\xf5\x17\x70\xe6\xaf\x92\xf9\x8f\x66\xf5\
-\x23\x63\xaf\x70\xbc\x09\x7b\xca\x5c\xca\x2f\x0d\xc7\x1d\x09\xd2\
-\xa9\xf8\x5d\x54\x27\xee\xaa\x5d\x38\xc6\xe0\x99\xe0\x0e\xe4\x34\
-\xd5\x8b\x87\xb5\x66\xf0\x0b\x39\xc6\xdf\x9e\x5b\x2d\x89\x99\x57\
-\x7f\xa6\xc0\x99\x1d\x2d\xa1\xe8\x9b\xeb\x64\x7b\x93\xef\xcd\xe3\
-\x93\x3e\xf6\xdc\x8d\x07\xd5\xc6\x49\xe2\x38\x04\xee\x8a\xed\x54\
-\xdc\x08\xf6\x23\x1f\x36\x86\xf4\x97\x46\xff\xf6\x49\xaf\x5b\xc0\
-\x7c\x8d\x57\x67\xc4\x86\x31\x56\x6f\x7c\x8f\x59\x21\x8b\x7d\xa7\
-\xc7\xbf\xcb\x9f\x11\x50\xbe\xd5\x1d\x86\x7c\xf7\x23\xe9\xd3\x88\
-\xfd\x3f\xc9\xb8\xdf\xbd\xe7\xf4\xf2\x83\xe6\xac\xdc\x49\xc6\x90\
-\xe3\xf3\x13\x78\xbb\x4b\xf1\xdf\xf7\x0b\x01\x18\x8d\xe9\x9e\x89\
-\xe1\x46\x07\x4f\x2f\xb5\x68\xa0\xc7\xb3\xab\x8e\x63\xbf\xba\xc1\
-\x12\x46\x7d\x79\x11\x78\xab\x3f\xa5\xda\x7c\xe4\x04\xa9\xef\x2e\
-\xf6\x41\x66\x4f\x99\x47\xc6\xf9\x91\xe7\x94\x68\xf3\x59\x3e\x7d\
-\x83\x8c\x51\x21\x63\x1a\x51\xbf\x40\x7d\x62\x81\x9e\xef\xce\xec\
-\x13\x6d\x7c\xb2\x7c\xb9\x15\xd0\x63\xd3\xad\x95\xe2\xd2\xaf\xa0\
-\xeb\xd2\xe1\xe6\x4f\x32\x97\xcd\xfc\x01\xc7\xda\xe3\x18\x74\x1c\
-\x6b\x26\xf8\x86\xf2\xb1\xc3\xbe\xe4\x92\x18\x0b\x12\xd8\x7f\x7e\
-\xe1\x1a\xad\xbe\xb8\x38\x7e\x19\xfb\xf3\xb3\x06\x0d\xc3\x31\x48\
-\xf5\xf8\xfc\x1a\x5d\x5f\x3e\xa1\x83\xf1\xce\xb2\x0f\x6d\x54\xc4\
-\x51\xcb\x62\xcd\xaf\xa0\xeb\xcc\x1c\xf3\x5f\xe2\xc2\x8c\xd7\x04\
-\x25\xc6\x06\xa3\x67\xfe\x8d\xfd\x3e\x71\x2c\x05\xff\xf8\x77\xd2\
-\x98\x31\xaa\x5f\x8e\xa4\xce\x7e\x40\xfc\x97\xc4\x9b\x90\x71\xc3\
-\x5a\xea\xc0\xc5\xb2\x24\xe3\xe5\x57\xe2\xfb\x53\xba\xbc\x7b\xb7\
-\xb6\x26\xb3\x0e\xcc\xb2\x7d\xa9\x2e\x1e\x1a\xe3\xf3\x59\x36\x2f\
-\x7a\x47\x98\x7c\x6e\x6f\x4f\x78\xe1\xef\xe0\xf8\x43\x2c\x73\xd2\
-\x57\x79\xfa\x42\x59\x1b\x96\xde\xa2\xe2\x03\x57\xee\xa0\xc7\x70\
-\x63\xfd\x53\x34\x8e\x16\x13\xab\xee\xfc\x07\x16\xea\xcb\x64\x1c\
-\xc8\xcf\x2f\x45\xda\xe2\x5c\x03\x3d\x8d\x62\x96\x0f\xb1\xf9\x93\
-\x8c\xdf\xfd\x48\x45\x8c\xf3\x0a\x47\xd8\x35\xc5\xb6\x26\x32\xc0\
-\x64\x96\xfc\xf7\xf8\x3f\x54\x7f\x81\xdb\x48\x29\x4e\xf7\x87\x1a\
-\x60\x61\x3f\xe4\xfc\xa1\x64\x2c\xab\xfc\xdf\xb1\x7f\x2e\x77\xed\
-\x1e\x89\x9e\x51\x2f\x03\x1c\xab\x89\x64\x80\x3f\x8f\x74\xea\x28\
-\x4d\xba\x26\x3b\xd6\xf2\x02\x2d\x0e\x77\x99\x3c\x9c\xe1\xdc\x62\
-\x27\x88\x69\x67\xb2\x51\xb1\xaf\xa4\x5d\xba\x57\xcb\x99\x50\x8c\
-\xf8\x9a\xa7\x14\x83\x44\xc6\x68\x4b\xce\xce\x40\xef\x4d\x9e\x57\
-\x20\x8e\x9f\x96\xc4\xdd\x70\x97\x6e\x54\xcb\x25\xfe\x89\xef\xc4\
-\x31\x9e\x6b\x70\x9c\xe9\x3a\x75\x2f\x1f\xe1\xcf\x1c\x73\x74\xa6\
-\x6b\xbd\xba\x78\x5a\x8c\xb1\x1c\x6b\xbc\x87\x6d\x41\xe3\x5b\x30\
-\x73\x61\xf6\xcf\x55\xe4\xb8\x84\x79\xae\xb2\x0d\x25\xf1\x9e\xf8\
-\x3c\x15\xc4\x29\x1c\x6f\x88\xe3\xcd\xf8\x27\xbe\x97\xc6\x51\x73\
-\xd5\xf4\x69\x1c\x6b\x4d\xc6\x22\x14\x2f\x06\xe1\x5d\x38\xaa\xce\
-\x7e\xcf\xeb\x61\x7d\x89\x8c\xff\x54\x17\x23\xfb\x81\x07\xa4\x46\
-\x98\x6f\x56\xb4\x25\x46\x73\x6d\x6e\xa4\xdd\x7c\x21\xc2\x63\x8e\
-\x24\x1e\x53\x63\x1d\x0a\x86\x03\x77\xd3\x41\x32\x46\x00\xeb\x79\
-\xc1\xf9\xff\x51\xe7\x83\xe0\x3e\x3d\xef\x23\xa5\x3a\xe0\x38\x18\
-\xac\xd3\xc4\x31\xa6\x2a\xfb\x70\x80\xbb\x09\x7b\xf7\x38\x8f\x17\
-\x8a\x71\x9c\x8a\xf1\xae\x51\x01\xa6\x73\xe4\xbf\x17\xdf\xce\x7c\
-\x5d\xf9\x7c\x4f\xe0\x5f\x7b\x58\x8d\xfb\x24\x1e\x6f\x35\xe9\x14\
-\xee\xfa\xcf\xa4\x71\x89\xe4\xfb\xce\x5d\x4e\xc5\x67\xe1\x3e\x8d\
-\x74\x17\x29\x07\xc4\x37\x1a\x7f\xce\xdc\x24\x63\xd9\xb0\x1d\x82\
-\xee\x37\xa9\x7a\xff\xde\x1d\xac\x36\x6a\x8b\xc9\xc4\x40\xef\x3f\
-\x5b\xf2\x9d\x10\x6f\x66\x9f\x55\x05\x2e\x8f\x71\x5d\x79\xa7\xbf\
-\xbf\x8f\x63\x0a\xf0\xb8\xa5\x35\xfe\xea\x9b\x0a\x32\xce\x5e\x50\
-\xfe\x3f\xc0\xb1\x1a\xf2\x7a\x09\xd7\x9f\x85\x63\x4e\xe5\x63\x6d\
-\xc5\x31\x9e\xbc\x8d\x07\x30\x7f\xa6\xa8\x7a\xff\x82\x04\x87\x2b\
-\xb2\xd8\x41\x55\x31\x96\x54\x5c\x65\x9f\x0e\x56\x1b\xf0\xe7\xdb\
-\xb7\x30\xcb\x2c\x4e\x73\xbe\x8b\xeb\x79\x76\x56\x4b\x48\x5a\xbe\
-\x7e\x1f\xff\xe0\x15\x2a\x86\x0e\xd9\x98\x5a\xcf\x80\xc0\x72\x40\
-\x9f\x95\xf4\x69\xe9\xbb\x22\x8e\xe0\xfe\x2c\x94\x8b\xa7\xe5\x8c\
-\x99\x4c\xc5\xa5\xa1\xcf\xf1\x6f\x41\x5b\x55\x5b\x7e\x33\x05\xee\
-\x0f\x55\xc7\x01\xd2\xe3\x25\xd7\x17\x78\x3e\x1e\x9e\xe4\xf8\xf5\
-\x8e\x22\xef\xe7\x92\x38\xc9\xe5\x39\xee\x95\x81\xc2\x01\x1d\x11\
-\x6f\xea\xf0\xfb\x90\xe7\x52\x5c\xfe\x4d\x7b\x1d\xc4\xfd\x01\xc7\
-\x88\xe0\xb1\x03\x9f\x03\x41\xda\x1d\x38\x8e\x52\x12\xef\xf7\xc9\
-\x09\x92\x6f\x38\x7e\x06\x9f\x15\xa7\xaa\xed\x5d\x6d\x4d\xe3\x76\
-\x0d\xf7\x6d\xd0\x1c\xd7\xa7\x26\xee\x11\xd5\xb1\x6f\x57\x07\x72\
-\x56\x87\xe7\x20\xfc\xfd\x17\x48\xbb\x8d\x85\xb8\x8c\xcf\xd8\xd1\
-\x5a\x87\x55\x3b\xe9\xe7\x99\xa5\x67\x81\x40\x7c\xb6\x8f\xe0\xfa\
-\x9f\x64\xbc\x0b\x6b\x40\x3e\xfa\xff\xbf\xb0\xee\x54\xb9\xd6\xd5\
-\xd6\xd3\xbc\xe0\xe4\x84\x36\xa0\x53\x8c\x9e\x42\x4c\xde\x1c\x81\
-\xe7\xef\x1d\xbc\xcd\x53\xf1\xd8\xe1\x1e\x1c\xdc\x99\xf7\x6d\xe5\
-\x23\xac\x43\xc8\x31\x7f\xf2\x5c\x9d\xea\x80\xdf\x17\xdb\x09\xbc\
-\xcd\x87\xc8\xf3\x44\xc8\xbf\x23\xbb\x8f\x8c\xc5\x17\x66\x50\x71\
-\xbd\x77\x61\x97\x5a\xdb\xde\xc7\x72\xda\xf9\xc9\xaa\xe3\xc8\x54\
-\xc6\xda\x4d\x6f\x07\xfb\x47\x06\xbe\x64\x85\xd9\x1d\x75\xb7\x37\
-\x49\x4f\x09\xb5\xdb\x31\x32\xc9\xed\xc6\xe6\x41\xbe\x2f\xf6\xce\
-\x49\x84\xfe\xdf\x3d\x06\xce\xb4\x05\xa4\xce\xc0\xf3\x2b\x1c\x53\
-\xa6\xd7\x39\x41\xc8\x3e\x25\xe3\xf0\x04\x69\xa4\x2d\x8b\xfe\x76\
-\x59\xf8\x03\xa8\xf5\x33\x0e\xf3\xb4\x9c\x7e\x41\x6d\x5c\x98\x62\
-\xdc\x5c\x28\x6c\xcc\xf5\xaf\x88\x6c\x65\x39\xb3\x6b\x6b\xeb\x65\
-\x1f\x64\xb4\x7a\x2c\xa9\xeb\xbe\xe1\x81\xaf\x8a\x12\xdc\xbf\xe9\
-\x97\xcf\x39\x9f\xfe\xd5\x9f\xaf\x30\xbf\xb1\x2e\xc1\xe7\x97\xe1\
-\xb1\x47\xa3\x9d\x80\xe3\x1f\x11\xf7\x70\x4c\x0c\x7e\xef\x54\x1c\
-\x3f\xb8\xab\x84\x3a\xeb\x4b\xcb\x5c\xb2\x9d\x87\xc5\x98\xb2\xb1\
-\x1d\x40\x63\x8c\xd7\x7b\xb2\xf8\xae\xde\xed\x1c\x3e\xe9\xe6\x6f\
-\x3b\xf3\xe0\xf0\xe0\x57\xb8\x8e\x25\xe3\x43\xa0\x5f\xb4\xeb\x95\
-\x40\x77\x8b\x4c\x89\x6f\x51\x74\x5e\x51\x18\xff\xe8\xd5\x87\x3c\
-\xa4\x4b\x71\x6c\x2b\x2b\x2d\x13\x58\x7c\x01\x79\xde\x02\x3e\xf3\
-\x84\x8d\xe7\xc1\x48\x9f\xe3\xf8\x3c\xf2\x0c\x00\x3c\x4f\xc3\x76\
-\x2a\xea\xfb\x58\x0f\x23\xee\x8b\xd0\x7c\x7e\x99\x2e\x67\x74\xf9\
-\xbb\x58\x66\x1c\x1a\xda\x81\x16\xff\xa0\x18\x27\x22\x1f\x23\xd2\
-\xb9\x95\xcd\x82\xf4\x4e\xce\xfb\x25\xf5\xdd\x57\xd8\xfe\x65\x88\
-\xa7\x65\x91\xaa\xdf\xee\x75\xea\x67\x0e\xff\x46\xdd\x35\x1c\x8f\
-\xca\x59\xb2\x11\xcd\xdd\x67\x90\x75\xc0\x7d\x92\x9c\x63\x61\x7d\
-\x8f\x6c\x0e\x3c\xaf\x21\xe7\xbd\x5f\x3f\x6d\xc0\xeb\x13\xfc\x3b\
-\xd0\x49\x9f\xe5\xef\x55\x19\xc1\xcf\x35\xc5\x32\xc8\xc7\x7c\xf4\
-\x8d\x74\x2f\x0f\x72\xb7\xe2\x6c\x1e\x10\x5c\x2d\xa9\xef\xa8\x78\
-\x9f\x9f\xac\x08\xc2\x41\xc5\x6f\x5b\x86\x7a\x59\x8d\x4b\xef\xcf\
-\x39\x3f\x7e\xf5\x92\xe7\xe3\xca\x2e\xc1\xa0\xaf\x1e\x40\xd6\x4f\
-\x35\xe4\xd8\x95\xfe\xdd\xb3\xfa\xb4\xcb\xbf\x54\xf3\xbe\xb8\x7c\
-\x2f\x79\xd9\xc6\x4f\x3b\x8c\x9e\xd6\xad\x11\xf3\x44\xe3\x09\x09\
-\x7e\xff\xa3\xe2\x13\x54\xc5\x08\xd1\x63\x37\x76\x0d\x0c\xad\x0b\
-\x74\xb6\xe4\xa7\x06\x3b\x1d\x92\xd4\xf5\xdc\xe8\x48\xe8\x19\xe4\
-\xb8\x43\xf2\x83\x2d\xed\x2d\x12\x53\xda\x39\xef\x18\xdf\xb3\xc5\
-\xdd\x13\x23\x3a\x69\x97\x2d\x92\xeb\xc9\x51\x1d\x60\x79\x7a\x40\
-\xd5\xf0\x58\x8f\x1f\xb3\x23\x5d\x8f\x24\x06\xd9\xad\x0a\xf6\xb0\
-\x2c\x24\x28\x3f\x78\x8d\x65\x40\x84\x77\x89\x72\xbc\x81\x62\x4c\
-\x86\x2c\x0e\x23\x3d\xcc\xbd\xac\x85\xad\x45\xe8\xdc\x94\xc0\xdf\
-\x25\xf5\xdc\x98\xd5\xbe\x32\xc2\xdb\x76\x6b\x4e\x94\xe7\xa5\x2d\
-\xfd\x43\xea\xd4\xc7\xaa\xe8\x12\xcf\x43\xd5\x75\x5f\x41\x08\x8c\
-\x4e\xf0\xae\xee\xd2\xca\x76\xbb\xa6\xf7\x8f\xf3\x73\x5e\x59\xae\
-\x36\x76\x40\x39\xbe\xe2\x40\x5e\xd4\xab\x70\x6f\xfb\x99\x51\x3e\
-\x76\x53\xf6\xe5\x44\xbe\x94\xd4\xb3\x7c\x84\x9a\xf8\x13\xb9\x98\
-\xa6\xbd\x79\x9d\x1a\x16\x73\xda\x3c\x9d\xd4\xc3\xef\xd7\x11\x31\
-\x2d\x7e\x1e\xda\xcd\xe7\x5a\x7e\xb4\xd7\x99\xbe\xe1\x1e\x07\xf9\
-\xa1\x6e\x3b\x7a\xb5\x75\x5e\x1b\xe7\x6f\xff\x41\x07\x6f\xdb\x19\
-\x88\xa7\x79\x1e\x36\xa6\x09\x78\x8b\x43\xd3\xfb\x7b\xa0\xb6\x5c\
-\xce\xea\xf0\x4c\xab\x5f\xbb\x9c\x4f\xfb\xb6\xac\x88\x9a\x11\x5d\
-\xfd\xbe\x3a\x90\xd7\xf9\xa5\x52\x7d\xd5\xc4\x92\x94\x0d\xef\x0a\
-\x3e\x76\x66\x3b\xd1\x23\x71\xff\x6c\xd2\xd8\x91\xb4\xf6\x3e\xa7\
-\xe5\xfd\xaf\x35\xfa\xa8\xab\x8a\x13\x51\xa8\xeb\xde\xfe\xd1\x30\
-\xbd\x67\x50\xc3\xcc\x5e\xed\xea\x3f\x1b\x10\x2d\x95\xed\xde\x01\
-\x51\xf5\x0b\xfa\xb4\xfb\x7b\x7c\x9c\xff\x2f\x45\x5d\x5b\xdd\x18\
-\x12\xdd\xf2\xd2\xc0\x70\xef\x53\xe9\xa1\x9e\xfb\x39\xed\xdd\xb6\
-\x26\x06\xba\x2c\xc7\xb2\x25\xa8\xb5\x6c\x9d\x4b\x3b\x27\x1b\xe1\
-\x56\x41\xd7\xe7\xaa\x7d\xa9\x15\xe3\x19\x14\x7d\xcd\x65\xf1\x1e\
-\xcb\xb8\x9d\xeb\x0a\xfa\x66\x3e\xde\xb5\x73\x67\xf5\x0f\x3f\xfc\
-\x00\xdf\x7f\xff\xbd\xe8\x93\xed\xdb\x2b\x47\x0c\xca\x79\xbc\x88\
-\x13\x5d\xa7\x8b\x6c\xb7\x66\x86\x37\x58\x9b\x29\x9f\x9b\xa5\xad\
-\xb0\x03\x7d\x8e\x2a\xf9\xdd\xab\xf2\x8b\x56\x8c\x4b\x10\xd7\x73\
-\x72\xaf\xce\xcf\x76\xee\xf8\xe4\x99\x3a\x1f\xa4\xcf\x3e\xdb\x57\
-\x31\xb6\x77\xd7\x0a\x6d\xb2\xfd\x22\xa7\x1b\x04\x38\x5b\xf7\xd5\
-\xf7\xfd\x03\x1c\x6d\x3a\xcd\x8d\x0b\xff\x8d\xee\xbb\xab\xc1\xbf\
-\x59\xae\xae\x5b\xf9\x31\xf5\x6b\x56\xad\xaa\xd0\xe6\x3f\x86\xeb\
-\xb7\x82\xdb\xb5\x9e\x26\x5b\x85\x38\x82\x13\xb9\xf1\xd0\xd6\xc5\
-\x76\x74\x63\xfa\x41\xb8\xab\xf3\xd8\x1d\xdc\x9e\xb5\x52\x5f\x5c\
-\x55\xfe\xf0\x8a\xbe\xca\xa8\x9e\x03\xb9\xa9\x7f\x6a\xf2\xff\x92\
-\x2f\x83\xb3\x32\x1e\x6b\x93\x6d\xbf\x50\xdf\x6b\x44\x23\x63\x3e\
-\xe2\x7c\x3c\x77\x9c\xc8\xe0\x68\xf7\x6d\x97\xf3\x39\x9e\x39\x6d\
-\xda\x23\xc9\xfb\x1d\x3b\x7a\xb4\x66\xea\xb8\xb1\x7f\x21\x79\x54\
-\x62\xbf\x35\xc5\x32\x7f\xee\x9c\xbf\xb4\xc9\xf6\x64\xff\x64\x88\
-\xf2\x72\x9a\xdd\x48\x75\xc4\x4c\x6c\xe1\x73\xf4\x44\x1a\x5f\xd9\
-\xf7\x3a\x4b\xd9\x4f\xfd\x64\x26\x17\xd6\xac\x59\x43\xf2\xfe\xc4\
-\xf1\xe3\x35\x1f\xa4\xf4\x6c\xc0\xf5\xdb\x27\x48\x81\xe5\x4b\x96\
-\x28\xf5\x87\xcd\x9b\x37\x3f\xdb\x2f\x48\xd6\x12\xe7\xc0\x82\xfe\
-\xed\x5b\x97\xbe\x86\x4a\x65\xc6\x7b\xf9\x7c\xb6\x9f\xc5\x79\xa5\
-\xda\x9f\x5a\xe6\xe7\x5a\x8a\xf0\xd1\xb2\x65\xe4\x7b\x16\x4f\x9a\
-\xf8\x97\x7c\x7d\x47\xe7\x0c\x50\xea\x13\x5b\x37\x6f\xae\x3c\x4c\
-\xfa\x4e\xab\x96\x6d\x4e\x7c\xf7\xea\x83\xe9\xbd\xa1\x28\xbc\xfd\
-\xcd\xd7\xdd\xd7\xed\xec\xee\x3e\x7f\x41\xd7\xb8\x47\x1a\xfd\xa2\
-\x51\xfd\x26\x8d\x19\x43\xf2\x67\xdf\x9e\x3d\x35\x9b\x52\x52\xc8\
-\x3a\x9e\x14\x0a\x61\xe6\xe4\xc9\x4a\xef\x5f\x3c\x79\xf2\x5f\x65\
-\x99\xaa\xfd\xea\x37\xa5\x26\xc3\x91\x2f\xbe\xa8\xcd\xe5\xb0\xff\
-\x1a\xda\xa1\xfd\x77\x4d\x31\xb6\x05\xda\xdb\x47\x0b\xfd\x82\xca\
-\x76\x26\xf3\x5e\xca\xfb\x58\x52\x3e\xce\x94\x9f\x73\x4e\x7c\x8f\
-\xa7\xa8\x90\x64\xdf\xb6\x79\x73\xf5\xb8\x41\x83\x9e\xa2\xf7\x7c\
-\x5a\x57\x57\xa7\xe8\xbb\x2c\xea\x1f\x1f\xff\x44\x9d\xaf\x7c\x6e\
-\x72\x72\x25\xd6\x03\xa3\xf2\xf3\x7f\x4f\x0b\x08\x38\xda\x94\x7b\
-\xec\x6d\x1d\x5c\x07\xa6\xb7\x0e\x2e\x5b\xd1\xbd\x57\x95\xa2\xaf\
-\xe4\x49\x4e\x3f\x18\xd4\xbf\xff\x93\xfa\xfa\x7a\xb5\x7a\x07\xbf\
-\x57\xc1\x80\x81\x7f\x1d\xe7\x66\xc8\xf9\xdc\x66\x4b\x51\x8a\x64\
-\x3b\x6e\xd4\xa8\x8a\x63\xc7\x8e\x55\x67\x45\x46\x57\xb4\xb1\x77\
-\x6a\x16\x5f\xb4\x96\x66\xd6\x11\x09\x9e\xbe\xeb\x07\x06\x86\x9d\
-\x9f\x15\x91\xf0\x64\x7f\x72\x16\xe9\xf7\xf8\x69\x72\xba\xa8\xbf\
-\x30\xed\xaf\xdf\x7e\xfb\x4d\xa9\x12\x7f\xfc\xf1\x47\x43\x5e\x76\
-\xbf\x27\x9f\x24\xf2\xea\xd5\xf9\xcf\x96\x22\x99\x4e\x8f\xe9\xf1\
-\xea\xc3\x84\xde\x10\xe7\xe5\xbd\xeb\x0d\xb9\x1d\xb8\x06\xd8\x39\
-\xf4\xe5\xb6\x6c\x53\x76\xa4\xd7\x00\x38\xdd\x27\x0f\x0a\xba\x24\
-\x54\x8e\x1a\x54\xf8\x67\xf1\xd4\x69\x4f\x66\x4d\x9d\xfa\xd7\xe8\
-\xfc\xc1\x0f\x07\x75\x4d\xa8\x38\x9d\x3a\x50\xc1\xcf\x93\xee\x0b\
-\x8b\xe5\xb9\xb5\x07\xb7\x36\xde\xab\xe5\x6e\x7d\xed\x9f\x26\x28\
-\x26\xe9\xad\xda\x97\xd1\x7c\x37\x53\x34\xf9\x6d\xca\x7c\x36\x4f\
-\xf4\xc9\x81\xc2\xb6\x91\x37\x50\x1b\xec\x09\xb6\x77\x4a\xff\xa7\
-\x9c\x50\x92\x3d\x02\xd7\x52\xfe\x85\x43\xb5\xfb\x62\x8a\xeb\x79\
-\x2c\x39\x0f\x92\x3d\x03\x4a\xdf\x06\x1f\xb4\x30\x7b\xaf\x69\xa7\
-\x7a\x0e\x53\xeb\x2b\xa8\xe8\x53\xb9\x37\x6e\x60\x7d\x8c\xab\x2f\
-\xf6\x9f\x7b\x2b\xfc\x83\x5d\x4c\x6d\x12\xb6\x45\x0f\x14\xa9\xf3\
-\xfd\x93\xf7\x91\x2c\x0e\xe9\x75\xbf\xbd\x9d\xc7\x5c\xa2\x09\xe3\
-\xb9\x9a\xa0\xd8\x17\x07\xf7\xf9\x93\xf4\xe3\x53\xe1\xcb\x77\x1a\
-\x61\x4e\xfb\xd4\x3f\x7b\x7b\xb4\xdd\xe7\x6d\x6a\xd3\xea\x6d\x74\
-\xc4\x1a\xdc\x2a\xf6\xbb\xd3\x31\xe3\x01\xa3\x24\x66\x1c\x1c\xed\
-\x36\x0a\x3e\x0c\xcd\xa8\xce\x69\xd9\xe5\x6a\xbc\x73\xe0\x3a\x27\
-\xa6\xf5\x5b\xed\x53\xdd\xdd\x31\xb0\x98\xe5\xd6\x61\x1f\xdb\x2d\
-\xec\x93\x04\xa7\xb6\x2b\x83\x6d\xbc\xc6\xd9\x9b\x58\xb6\x69\x5a\
-\x3f\x31\xec\x3d\x85\xae\xd8\x4f\x69\x06\xba\x62\xb7\xa4\x18\x74\
-\xc5\xfe\x4c\x36\xe8\x5a\x4a\x69\x5f\xd2\x7d\x09\x5f\xc9\xdd\x49\
-\xd9\x55\x44\x90\x09\x6b\x88\x7a\x62\x14\x79\xad\x23\xee\xd3\xae\
-\x15\x06\xa5\x0a\xd7\x62\xf1\x95\x74\x4c\x22\xee\x8b\x7f\xe7\x3e\
-\x61\x2a\xbe\x52\xcf\xa1\x5d\x6d\xf0\xd5\x80\x3c\x25\xe2\x3e\xf6\
-\x33\x9b\x81\xaf\x8c\x52\xfc\xde\xf7\xf1\x97\xd0\xbf\x57\x88\x3f\
-\x2f\x7f\x8d\x01\xfc\x1e\x54\x7d\x24\xd7\x7a\x85\x2b\xe9\x9e\xe5\
-\x23\xae\x8f\xfc\xb5\x58\x7c\x2d\x15\x5f\x2b\xc4\xd7\x3a\xf1\x15\
-\xc4\xed\x84\xfd\xb9\xc8\x6b\x1d\xf9\x65\xec\x86\xc5\x10\x5f\x99\
-\xe2\xab\x8d\xf8\x1a\x43\x5e\x45\xe4\x77\xd1\x95\x89\xaf\xd8\x4f\
-\x8b\xf4\x0c\x33\x78\x2b\xf2\xf9\xfc\x93\x05\x9f\x65\xe2\x41\x50\
-\xe7\x81\xb0\x10\xf2\x11\x86\x20\x4c\x44\xc0\x7b\x6d\x33\xc5\xff\
-\x8f\x81\xd7\x78\xfb\xe1\x61\x0e\x6f\xa1\x11\x3a\xc6\xc3\xe3\x73\
-\x2a\x33\x6e\x83\x97\xf0\x1e\xc4\xa4\xdd\x81\x5c\xc1\x5d\x98\x25\
-\xb8\x0d\x8b\x84\x77\x61\x2d\xf6\x0f\x12\xdc\x81\x1d\xf8\xff\x71\
-\x3e\x05\xb1\x1f\x5a\x3e\xfa\xff\x38\xec\x6b\xf0\x16\xe6\x21\x7a\
-\x57\x0b\xf6\x5f\xc2\xfe\xfd\x05\x66\x4c\x62\x85\x8d\x25\x71\xd1\
-\xc2\x8c\x78\x6c\x68\x48\x34\x58\x9b\x13\x35\x2d\xdc\x89\x8a\xf0\
-\xb6\x44\x45\xaf\x2e\x44\x25\x27\x96\xa8\xeb\xdf\x9b\xa8\xcb\x63\
-\x13\x50\xc8\x37\x80\x81\xa9\x04\xf4\xeb\x4d\xd4\xf2\x13\x88\xba\
-\x84\x08\xa2\x32\xa4\x35\xf1\xd4\xd3\x99\x78\x66\x6e\x4a\x3c\x37\
-\x36\x22\x6a\xad\x2d\x89\x5b\xd6\x16\xc4\x21\xf4\x5b\x93\xd0\xef\
-\xc7\x7a\x77\x4d\xb1\x13\xde\x86\x78\x24\xdb\xe9\x78\xbf\x1f\x5d\
-\x2b\x5e\xe3\xfc\xc5\x4a\x84\x13\xa4\x4f\xdf\x5d\xe8\xd9\x54\x39\
-\x47\xfe\x9f\x14\x77\x24\x93\x11\x48\xd6\x65\x26\x46\xc4\x73\x37\
-\x47\xa2\xb2\x77\x17\x83\xea\x51\x99\x06\xb0\x6c\xac\x01\x1c\xfc\
-\xc0\x10\xae\x6d\x91\xcf\x9b\x25\xcb\x9d\xa5\x2b\xca\xd6\x19\xc0\
-\xd6\x99\x06\x30\x6b\xa8\x09\xa4\x4f\x60\xbd\xea\xb1\x76\xfb\x0b\
-\xf6\x97\x7f\xeb\x26\x5b\x7c\xf6\xf2\x77\x55\x94\x5f\x95\xdc\x7e\
-\xb9\x16\x54\x20\x2e\x6c\x47\xfc\xe2\xbe\xa6\x5f\xe1\xbf\xb5\xd8\
-\x21\x99\x17\x59\x59\x10\x5f\x9b\x9a\x10\xb5\xbd\xa2\x0d\x6a\x16\
-\x16\x19\xc2\xe9\x95\xf2\xfe\xb5\xaa\x7d\x6d\x75\x86\x1c\x5f\xca\
-\x77\x39\xc3\xaa\x92\x49\x90\xf7\xa3\xea\x3d\x62\x2c\x5b\xec\x57\
-\x81\xf7\x62\xd9\x13\x67\x01\x1b\x9f\x9b\x2d\xa0\xf2\x4a\xb1\x38\
-\x1c\xd2\xb7\x00\xfb\x77\x91\x7e\x81\x78\x1f\x5f\x20\x24\xf7\x04\
-\xf1\x3e\x2c\x67\xe9\x26\xea\x0c\x7a\xea\xac\x59\x55\x78\x84\xc6\
-\x8e\xf9\xbc\x5b\xe0\xf9\x9f\xd8\x89\xb6\x16\xa6\xc4\x66\xa6\x31\
-\xf1\xbc\x47\xb8\x41\xcd\x87\x63\x18\x70\x69\xa3\xe6\x5c\x71\xea\
-\x72\xc7\xd1\x7d\xb1\x55\x73\xe5\xdc\x2e\x57\x98\x5f\xbe\x02\x32\
-\x6f\xd5\x29\x9f\x9f\x7a\xe6\x26\x99\x1f\x81\xcc\xbd\x83\xcf\xd3\
-\x94\xcf\x2f\xa1\x0f\x70\x5e\x13\xfc\x5d\xcc\x91\xec\x01\xc0\x5d\
-\xb0\x86\xf4\x09\x55\xe1\x1f\xf5\x02\xdb\x0f\x19\x0f\xc0\xfd\xff\
-\xa1\xdc\x7b\x59\x99\x13\x97\xf0\x18\x3e\x98\xcb\x78\x75\x72\x39\
-\xdd\x0f\x5d\x2b\xb6\x6a\x82\x32\x47\x2e\x6f\xb7\x84\xe5\x67\x8a\
-\x21\xfb\x66\xa5\xd2\x59\xc1\xd8\x17\x07\xe7\xd7\x63\xe1\xfe\xcd\
-\xe1\xe8\x2f\x6f\x6d\xc0\xfe\x0d\xf8\x6c\x5a\xc4\x09\xee\x87\x5b\
-\x40\xf8\x95\xd2\x38\x53\x83\xec\xca\xb9\x9a\x7c\x4d\xfe\x45\x25\
-\xc1\xd2\x9c\xf8\xce\xc3\xd9\xa0\x6a\x6e\xa1\x11\x5c\xfa\xd8\x98\
-\x9e\x1b\x51\x4b\x9e\x44\x55\x31\x0b\xda\x70\x70\x7f\x57\x28\xfc\
-\xee\x27\xa5\x7c\x81\x64\x2e\x18\xec\xa3\xcb\xe3\x6b\x97\x21\x97\
-\xd2\x07\x14\xd2\xa9\x1c\x83\x48\xe7\xa7\xe2\x2b\x92\x2d\xd9\xdf\
-\xb5\x9d\xd1\x2b\xce\x5f\x86\x9f\x87\x7d\xe2\x55\xe4\x6f\xb8\x87\
-\xc6\x85\x84\x7f\xa9\xdc\xfd\x2d\xcd\x88\x33\xce\xf6\x06\xd5\xf3\
-\x90\xdc\xaf\x6e\xa4\xe7\x80\xd4\x1d\xba\xf3\xe5\x2a\x19\xcb\xb2\
-\x84\xcc\x25\x2a\x3f\xae\xe3\x9c\x33\x64\x9e\x45\x75\xf2\xc2\x3a\
-\x1f\xf7\x57\x3c\x06\xa0\x31\x9d\x3c\x73\x7a\xfd\x67\x54\xfe\x1d\
-\x34\x46\x60\xbf\x5b\x9c\x77\x07\x73\x08\xe7\xd8\xc4\x7e\x70\x38\
-\xef\x0e\xf6\x5f\xc5\x7e\xad\x64\x8e\x0d\xfc\xdb\xf8\x37\xc4\xb9\
-\x18\x94\x75\x02\x9b\xf4\x8b\xe2\xcc\xfe\x50\xf1\x9c\x73\x11\xb2\
-\x13\x57\x0e\xbc\x07\xa6\xff\x12\xb9\x9b\xa1\x79\xdb\x52\x84\xe7\
-\xa3\xd2\x8d\xea\x2f\x7f\xac\x29\x2f\xa8\x86\x3c\xa1\x7a\x72\xa5\
-\x7c\xbb\x3b\x8c\xbb\x5e\x42\xf7\x27\xfe\xec\x3c\x25\x13\x39\x3f\
-\x64\x1a\x04\x54\x5f\xc6\xf2\x26\xf3\xe7\xdc\xa8\x6d\xfc\xf9\xfb\
-\xf8\xcc\xea\x63\xdf\x90\x67\x56\xb3\xd2\xb3\x64\x39\x49\x55\x9c\
-\xdb\x4d\xe6\xa4\xd8\x79\x8a\xfe\x7d\x2a\xbf\xb1\xf7\x3b\x2e\xfb\
-\xae\x68\xae\xfd\x6b\x42\x47\xc3\x9a\x93\x1f\x32\x35\xe6\x41\x95\
-\xc6\x76\x6d\xd4\x96\x3b\x56\x3b\x5f\x8e\xee\xe9\x04\xb9\x3f\xfe\
-\x42\x8b\xb9\x20\xf3\x6c\xa0\xfe\xa6\xb2\xaf\xe3\x31\x60\xf8\x38\
-\xd2\xde\xd7\x7a\xce\x7e\x63\x80\x6d\xcb\xa3\x5f\x93\xb9\x7a\xa9\
-\x39\x83\xb2\x4e\x60\xe1\x5c\xb7\x63\xa7\xd0\x72\x57\x20\x3c\xe4\
-\xdf\x83\xc8\x77\x50\xee\xc6\x16\x4c\x62\x99\x8d\xb9\x41\xcd\x07\
-\xc3\x4d\x94\xf3\xe1\x92\x30\xd5\x81\x0f\xfa\x73\xe5\xc8\xee\x48\
-\xe8\xff\xf3\x13\x99\xec\xd1\x18\x4b\xc6\xac\x28\xf6\x79\x2c\x77\
-\xec\x97\x8a\x73\xe3\xca\xe5\x4a\x69\x6e\xf0\x2f\xfe\x4a\xce\x27\
-\x59\xe2\x1c\x0f\x4a\x67\xf8\x67\xf5\x03\xfe\xd9\xbb\xf2\xdf\xa9\
-\x16\xdc\x82\xd8\x77\x48\xf6\xde\x16\x66\xc4\x37\x91\x6d\x19\xd5\
-\xa7\x3f\x34\x53\x19\xf7\xa8\x0a\xd7\xb5\x42\x3b\x27\x0e\xef\xed\
-\x0a\xfd\x7e\x96\x8d\xa5\x38\x16\x8e\xd4\xe9\x2c\x7a\x7f\xc3\xe3\
-\x2e\x9e\xe3\x49\x62\xe5\xfe\x09\x60\x3b\x82\x8c\x73\x54\xe4\x81\
-\x98\x97\x0a\x39\xec\xaa\xd2\xee\x42\xf7\x77\x40\xf6\x3d\x4c\x4d\
-\x88\xca\x91\x02\xe3\x57\x57\xd7\x9b\x6b\xcf\x05\xad\x32\x3f\x74\
-\xe3\xb8\x72\x7a\x47\x10\x0c\xf8\xe9\xb1\xac\x7d\x91\xbe\x55\xa5\
-\xef\xb1\xec\xb9\x8b\xd7\xd1\xf2\xc6\xfd\x63\xb8\x55\x4f\xe5\x3b\
-\x57\xf3\x9e\x7c\x7a\xbc\x2c\x5e\x4f\x6e\xf7\xb6\x0a\xde\xd0\x90\
-\x18\x6c\x61\x6a\x50\xb3\x6e\xbc\xa9\xfa\x9c\xd7\x0a\x71\xc3\x32\
-\x98\x37\x1e\x88\x2f\x17\x36\xbb\xc0\x90\x6f\x7f\x90\xeb\xf7\xdf\
-\x2a\xcb\x1e\x8f\xb9\xa8\xaf\xe1\x3c\x22\x5a\xe5\x82\x63\x5f\x5e\
-\x37\xff\xb8\x3e\xba\xe0\xc4\xf7\xe2\xb9\x02\x47\x99\x03\xf4\x38\
-\xd7\x7b\xdc\xdb\xe0\xfc\x96\x89\xde\x00\xdb\xf7\x2e\x68\x5e\xb7\
-\x7f\x8e\xb9\x86\x3c\xe8\x5a\xf2\xa1\x37\x92\x2b\x57\xd1\xdf\xde\
-\xbb\x7c\x44\x2e\xdf\xd7\xaf\xd2\x75\x5a\x99\x4e\x65\x93\xb9\x06\
-\xf1\xbf\xa9\x95\xc1\x17\xd7\x81\x3d\x7d\x21\x19\xdb\x21\x5d\xc3\
-\xeb\x3b\x80\x8c\x53\xd1\x35\xb7\xee\xeb\x80\xcc\x01\x86\xed\x14\
-\xc5\xf5\x27\xcc\x01\x9c\xff\x49\x36\x2f\x38\xf3\x16\xed\x2d\x1a\
-\x98\x9b\x10\x9b\x02\xbc\x0c\xab\x4b\x96\x5a\x2a\xe4\x7a\xa7\xe7\
-\x7c\xd7\x09\x8d\xe0\xcb\x86\x23\xc3\xe9\x79\x52\xf1\xda\xad\xfc\
-\x9a\x2d\x92\x3d\x19\x2b\x8b\xe6\xea\x2a\xdb\x1d\xe7\x53\x16\xc7\
-\xc5\x6b\x02\x99\x37\x4f\xfd\x7a\x7e\xd3\x00\xfd\x3e\x6b\x60\x3e\
-\xb0\xb8\xf4\x75\x09\x1c\xc3\x2b\xbf\x66\xa8\x25\x16\xfc\x8d\xa9\
-\x7c\x0b\x53\xe2\x93\xb6\x3e\x8c\xea\xb3\xcb\xac\x94\xcf\x57\x50\
-\x87\x75\x9a\xa0\x1f\x57\xd6\xce\x0f\x02\xa1\x5c\x3e\x24\xce\xd4\
-\x79\x4a\x76\x3e\x99\xeb\x53\x9d\xec\x2f\xfc\x42\xf6\x71\x5d\xd7\
-\x71\xc9\x58\xd8\x0b\xbf\x34\x3f\x07\x24\x3a\x48\x6e\x5e\x80\x63\
-\xd5\xe5\xe6\xa6\xb5\x6a\xe2\x71\xdf\x58\xbf\xc7\xb2\x6f\xdf\x8a\
-\x51\x7d\x0e\xcb\x7e\x8d\xb5\x32\xd6\xea\x02\xfd\xf9\x72\x70\x9e\
-\x05\x14\xa4\x32\x5f\x39\xdb\x19\x54\xc5\x6c\xfa\xa2\x56\x1a\xbb\
-\xb9\xaf\x5c\x9a\x37\x4f\x0a\x9e\x00\x04\x6a\x62\x27\x49\x5d\x91\
-\x3b\x58\xff\xb5\x7c\xac\x4b\x9a\x99\x03\x78\x4d\x51\xa9\x2e\x78\
-\x8d\x68\xdb\x31\xf9\xcf\x1d\xff\xc7\x16\xf4\x4c\x88\xf9\xad\x3d\
-\x70\xbf\xb7\x26\xcf\x23\xc1\xb8\xa6\x15\xd6\xea\xa1\x03\x57\x56\
-\x8d\x36\x87\xc8\x20\x46\x15\x13\xcd\x2f\xcc\x99\xc4\x9a\x90\xa9\
-\x4b\x72\xc4\xb9\xde\xc8\x75\x3a\x32\x17\xbc\x62\x7b\x6d\x55\x9f\
-\x57\x98\xbb\x68\x9d\xea\x7c\xda\xf8\xbc\xa0\x95\x3b\x48\xbb\x5c\
-\x65\x6e\xd5\x37\xc4\x01\x8a\xcf\x02\xa5\x35\x22\xda\x18\x74\x17\
-\x7a\xbe\xf1\x85\x1d\x63\x62\xa8\xb3\x9d\x61\xf5\x89\x45\xaa\xce\
-\xa8\x51\x71\x5e\x8d\x3c\xd6\xd8\xe8\xcd\x97\x25\x43\xcd\xc1\xc7\
-\xc5\xb0\x0a\xcd\x2d\xee\x31\x18\x44\x01\x21\x3e\xcb\x18\xd5\xbf\
-\x4c\x2a\xcb\x8f\xb6\xd1\xe7\xd1\xf8\x7c\x03\xba\xbe\x54\x3a\x17\
-\x43\x69\x3d\x08\xdd\xab\xca\x25\xcd\xc3\x67\x0b\xa8\x5a\x2f\x7e\
-\x03\x1c\xc0\xb1\xc5\xb4\xbd\x29\x7c\x9e\x01\x3e\xe7\x43\xf6\x99\
-\xeb\x04\x80\xc1\x1b\x14\x7f\x4f\x6b\x33\x83\x9a\xcf\x67\xd9\x48\
-\xcf\xf3\xa1\x60\x2b\xc3\xea\xc6\x40\x99\x2b\x1b\xc6\x5b\x82\x9f\
-\x3b\xa3\xca\xd2\xd4\x00\xe7\xcb\xe4\x50\x1e\x8f\x54\x41\x63\x5f\
-\x98\xfc\xfe\xad\xd2\x5c\x0f\xdd\xe3\x3c\xe8\x6a\xfb\xd6\xae\x12\
-\x25\x79\x72\x3f\xde\xaf\x7e\x6e\x70\xf8\x9a\xea\x3d\xc2\x66\xe6\
-\x00\xde\xab\x22\xf7\x18\x69\x63\x1a\x9f\xdc\x7b\x92\x7c\x06\xfb\
-\x1b\xbe\x21\xd9\x7b\x9a\x99\x18\x54\xac\x1b\x8d\x74\xfe\x4a\x3b\
-\x05\xf9\xeb\x0b\xf5\x7c\x39\x89\xf4\x4a\xcf\x8e\xc6\x35\xe8\x59\
-\x7f\xa1\xfe\x9e\x2d\x2f\x77\x49\x41\xf6\xef\x06\xf9\x73\x34\xfa\
-\xc8\xf5\x4f\x2c\x27\xce\xe2\x75\x9a\xfb\xd5\x92\x0d\x4a\xf6\x95\
-\xb6\xbd\x1e\x75\x1c\x60\x35\x33\x07\xf0\x39\x51\x34\x7e\xe3\x73\
-\x5e\xe6\xaf\x96\x71\xe4\x36\x7c\xfa\x46\xd6\xf3\xcd\x0c\xbe\x1e\
-\xce\x32\x7b\xa5\xf2\x6c\x2f\x8d\xd0\x9d\x17\x1f\x14\x5a\x02\xd6\
-\x2f\x66\x4c\x62\x19\xa1\x70\xd6\x93\xa4\xa0\x3a\xdb\x60\x7f\x09\
-\xe9\x19\x5f\x99\xd9\xca\xfd\x03\xd9\x76\x1a\xe5\x8f\xcf\xfb\x91\
-\x97\x21\x9a\x33\xea\xb4\x4e\xf3\x0f\x70\x00\xaf\x53\xb2\x54\xd8\
-\x36\x72\x7e\x87\x2f\x33\xef\x82\x4b\x73\x0a\x1f\xd9\x5b\x2b\xa2\
-\xdb\x18\x57\x5f\xf9\xc8\x01\xae\xae\xd0\x01\x2b\x1d\xf4\xe2\x48\
-\xf9\x87\x76\xd0\x3b\xc2\xe4\xb9\x39\xd3\xe0\x77\xf4\xb8\x2e\x9a\
-\xde\x45\x78\x1b\xd2\xe5\xd7\x6c\x68\x6b\x3d\xf8\xac\x28\x24\x5b\
-\xad\xe3\xaa\xa2\xed\x87\x64\x8a\x7d\x3a\x75\xe6\xc0\xc0\x41\xc0\
-\x9d\xbf\x0a\x78\x7b\xca\xc8\xb5\x3b\xbc\x3e\x23\xd0\xf3\xac\x19\
-\xbd\x74\xc0\xd2\x4d\x34\x1b\x04\xef\x25\xcb\xe7\x88\xc7\xbe\xe9\
-\xcd\x28\xfe\x38\x5b\x0b\x83\x9a\xd3\x0b\x1c\xe8\xe7\xe1\xa9\xc2\
-\x0a\x09\x1c\x74\xc6\x99\xc5\xf6\x80\xe7\x12\x48\xf6\x7b\xd4\xf5\
-\x79\x9a\xee\xbf\x0b\x9b\xa5\x72\x9c\xbb\x9c\xbe\xd6\x83\x6c\x40\
-\xc1\xd9\x3b\xda\xdb\x73\xeb\x11\xa5\x3e\x2c\xdf\x9e\x6f\x1b\xf0\
-\xfa\x45\xaa\x82\xde\xc1\x67\xe7\xc8\x7d\x66\x4f\x33\xc9\xde\x1a\
-\xc9\xe5\xd1\xf2\x21\xc8\x26\xc3\xe7\x22\xaa\xc2\x47\x8a\x70\xd4\
-\x0d\x88\x27\xe7\x96\x38\x40\x80\xa7\x51\x35\x9e\xcf\xe9\xf4\x36\
-\xc8\xd6\xc5\x7b\xe2\x92\x7a\xe3\x35\x5d\x9a\x1e\x56\x38\x7f\x4d\
-\xd3\x5a\xab\xa2\x5f\x27\x79\x76\xa6\xae\xfb\xc0\x78\x3f\x1f\xf5\
-\x7b\xee\xb2\x2d\xa4\x8d\x8e\xd7\x06\xb1\xde\xe1\x6d\x3e\xac\xd1\
-\xee\x7c\x1d\x28\xae\x55\xe0\xf9\x8e\xdc\x1e\x45\x45\x73\x9c\x7f\
-\x6c\x61\x6a\xf8\x49\x6a\x94\x69\x2d\x3e\x3f\x52\x11\x57\x97\xab\
-\x83\x93\x66\x88\x79\x72\x05\xfd\x7f\x4c\x7b\x93\xe7\xe8\x19\xbb\
-\x55\xd9\x78\xaa\x0a\x19\x8b\x43\xeb\x13\x02\xda\xbe\x29\xf6\xa5\
-\xd2\x79\x6e\x85\x7d\xff\x14\xc7\x71\xbc\x47\xa0\x85\x03\x7c\x7c\
-\xae\x15\x3e\x2b\x58\x83\xaf\x27\x1e\x1b\x84\xdf\x57\x37\xed\x18\
-\x80\xcf\xbc\x93\xf7\x57\x13\xa6\x4b\xcf\x8b\x23\xf3\xc0\xdf\x87\
-\xa0\xa6\x9e\xeb\x39\x58\x1b\x56\x97\x2e\x70\xa6\xce\x13\x95\x60\
-\x99\x26\x38\x83\xae\x5c\x79\x2f\xdd\xaa\xc1\x82\x69\x80\x73\x12\
-\xea\xec\xe7\x16\xbb\xf3\xec\x40\xe9\x1c\xee\xc0\x65\x6a\xcf\x4c\
-\x3a\x26\xa6\x93\xe7\x00\xea\xb5\xdf\xa2\xa0\x3f\x48\xa0\xbf\xa9\
-\xd3\x03\x3c\x3c\x6e\xb0\x75\xf3\x0f\xc6\xf1\x02\x7c\x0d\xfb\x4d\
-\x7a\xef\x11\x1e\xfd\x9a\x6e\x07\xe2\xf5\xad\x1d\x27\x65\xf5\xb9\
-\x0b\x4d\x79\xde\x80\xa1\xb9\xa9\xc1\xed\x45\xb9\xb6\x70\x65\xa9\
-\xe4\x4c\x59\x5d\xe0\xa2\x13\x57\x8e\xcd\x71\x02\x34\xae\xd4\x10\
-\x54\x8e\x03\x5d\x0b\x23\x64\xcc\x8c\x47\x52\x59\xac\xdd\x4d\xdb\
-\x2b\xc3\x36\x91\xbe\x36\x18\xb9\xef\xaa\x6a\x5e\xaf\x82\x03\x78\
-\x6d\x48\xdf\x58\x00\xec\xcb\x83\xd7\x72\x9b\xc4\x06\xf8\xfa\x29\
-\xfd\x5d\xf1\xd9\xbb\x8b\xd6\xc9\xdb\x80\xc5\x4d\x25\x7c\x34\xef\
-\x1e\x18\xe8\x69\x5c\x25\x7f\xfe\xae\x76\xb8\xca\xa0\x85\x27\x09\
-\xa1\xcc\x1a\x33\x63\x62\xb1\xbe\xef\x14\xb7\xf0\xa3\x97\x92\xfa\
-\xb2\x8b\x17\x43\x9f\x3e\x7d\x64\x6d\x8d\xb8\xa0\xcb\x99\x95\xaa\
-\x38\xc0\x12\x08\x35\x8f\x05\x68\xbc\x67\x17\x8e\x50\x2d\x63\x34\
-\x17\xc0\xe7\x5d\xb2\xe4\x74\x51\x73\xad\x11\x29\xae\x73\x71\xc6\
-\x4e\x95\x5f\x07\x5a\xdf\x44\xe2\x37\x35\x63\x1a\x3c\xde\x30\xc2\
-\x11\x94\xce\x63\xd6\x04\x1d\x79\xb2\x77\xb2\x13\x98\x19\x1b\x54\
-\x10\xfa\xe5\xa4\x63\x20\x7d\xf1\xc7\xa8\x43\xdb\xa5\xf5\x65\x23\
-\x9b\x4b\x71\xcd\xef\x75\xfc\x2f\xb4\x71\x00\xdb\x75\x92\x5c\x08\
-\xe4\xbf\x61\xfd\x8e\xbe\x27\xef\x33\xc2\xdb\x74\xb0\x59\xd7\x8a\
-\x71\x2c\x11\xed\xfd\x90\x1d\x22\xd7\xff\x77\x37\x85\xf0\x4d\x8c\
-\x0c\x27\x76\x6d\x63\x5a\x8d\xcf\xac\xd6\x09\x4b\x3c\xf4\xe2\x49\
-\x66\x77\x8b\x17\xfa\xf6\x7d\x54\xd2\xda\x78\x1b\x57\x4e\x3d\x77\
-\x48\xd6\x16\xc3\xc7\x29\xc8\x2a\xfb\xb5\xc7\x57\x6d\x63\x01\x19\
-\x3b\xb0\x76\x0f\x75\x9e\xf3\x8d\x3a\xa9\x0f\x97\xfc\xde\x3c\x5e\
-\x93\x68\xae\xb5\x62\x32\xae\x40\xde\xc6\xc8\x2d\x68\xea\xfd\x40\
-\x23\xbc\xee\xba\x63\xac\x8b\xf2\x19\xe6\x4a\x67\x9a\x4b\xe0\xa1\
-\x33\x2e\x2c\x74\x07\x0b\x53\x83\xe7\xe8\x39\xbe\xfa\xbc\x94\xa5\
-\xa9\xc1\x0f\x8b\xf3\xec\x60\xf2\x79\xd9\xfe\x27\x3e\xeb\x59\x71\
-\x0d\xae\x29\x6c\x2c\x75\x1c\x90\xb7\xb5\xa5\x9f\x3f\x70\x89\x1c\
-\xe3\x49\x5d\x3c\x71\xa6\x74\x0d\x19\xc7\x0e\xa8\x5c\x27\xc4\xf6\
-\xc0\x6b\xac\x13\xe1\xf3\xdf\x69\xbf\x37\x20\x8f\xe6\x17\xd4\x04\
-\xf2\xe7\x05\x7a\x18\x57\x92\x67\xd9\xab\xc3\x62\x45\x78\xea\xcc\
-\x95\xad\xa3\x9d\xc1\xca\xcc\xe0\x9e\xbe\x3e\xa5\x2e\x76\x8c\xaa\
-\x4b\x1f\xb8\x43\x71\xe9\x1e\x59\x5b\x88\xcf\xbd\x97\xb7\xff\x9b\
-\xca\xce\x56\xc9\x01\xbc\xee\x8e\xe7\xf8\xdb\x8f\x03\x77\xfd\x3e\
-\x52\xde\x4a\x36\xff\xa8\x49\x20\xf8\xb1\xf9\x38\x40\xcb\xbd\x20\
-\xce\x07\x20\x27\xff\xd7\xce\x71\x6b\x65\xc6\xb8\x32\x27\xdb\x91\
-\x76\xee\x3f\xc6\x95\x45\xea\xe0\x05\xfa\x70\x65\x12\xdf\x0e\x2c\
-\x4d\x0d\x77\xe8\x33\x0f\x41\x7d\xff\xe6\xfc\x01\xf6\xa4\xfe\x98\
-\x77\x72\x93\x4c\xfe\x53\xe6\x29\xc9\xa7\x29\xfd\x31\x55\xd9\x03\
-\xba\xcc\xf9\xe4\xcf\xd4\x57\x37\x16\x34\x76\xbf\x80\x95\x91\x45\
-\x7f\xde\x88\x09\xb2\xf1\xff\x2e\x6c\x79\x4d\xf1\xb7\xb1\x36\x33\
-\xac\x39\x3f\xcf\x5b\x45\x1e\x08\x75\xf0\x56\x09\x75\x7c\xe1\x44\
-\x5a\x60\xdd\x3f\x5c\x0f\x9b\x3f\xcf\xdf\xdd\xb8\xea\xf2\x22\x4a\
-\x8f\x2c\x38\x28\x5b\xdb\xe7\x2e\x5e\xaf\xbc\xef\xf3\xe5\x93\x26\
-\x9d\x6f\xa7\xf2\xf5\xe0\x00\xb6\x13\xce\x3f\x50\xe1\x57\xaa\x46\
-\x0f\x20\xdd\x2d\xd0\xc3\x9f\x10\xef\x03\x29\xae\x3d\xb0\xa9\xbc\
-\x1e\x12\xfb\x6f\xe9\x6b\xf9\xf4\x30\x0d\x57\xe4\xc4\xd9\xbc\xba\
-\x3c\x1f\xe7\x01\xd1\x05\x3e\x74\xe8\xc0\x95\x98\xb6\x66\x95\xe8\
-\x51\x99\x3a\xbe\x92\xab\xa9\xb1\x41\xe5\x27\xa3\x5d\xa5\xfa\x64\
-\xf9\x26\x99\xbe\xc3\xf1\x72\xb4\xbd\xf1\xb4\x0c\xe0\x1f\xf9\xaa\
-\x69\xd7\xdd\xcf\xdd\xa3\xd9\xfc\x6a\xe7\xf9\x38\x67\x94\x1a\x1f\
-\x43\x4d\x7a\x40\x3e\xdf\x91\xd6\x77\x39\x7b\x87\xb6\xde\x85\xd7\
-\x02\xb9\x1f\x7f\x26\xbf\x0f\x3c\xf8\x35\xd7\x7a\x7f\xdf\x3a\xc2\
-\x43\x29\x6f\x8a\x7a\xb4\x00\xdd\xb9\x42\xf1\xa5\xa3\x2f\x4e\xd3\
-\x48\xf4\xd1\xe9\x7d\x98\x06\x47\x07\xc4\x5b\xbf\x90\xd7\x2b\x6b\
-\xde\x4f\xa0\xe5\x9e\xa0\xad\x87\xa1\x79\x17\x77\xcd\xa7\x4d\xbf\
-\xf6\x8e\xe7\x75\x5b\x8f\x50\xbe\x60\xf2\x71\x7b\xd8\x27\x13\xd9\
-\x20\x64\x9e\x35\x1d\x62\x06\x55\x72\x80\xc5\x52\x8c\xf5\x52\xef\
-\xb3\x82\xec\x0e\x9a\x3e\x42\x5c\xe0\x1d\xbe\x2e\x3f\xff\xef\xf2\
-\x3a\xb1\xd9\x36\x48\xf7\x5f\x9a\xa7\x98\x47\x47\x1d\x5a\xea\xc1\
-\x13\x19\x57\xba\xb7\x21\xfb\x7f\x86\x2e\x73\xd0\x96\x2e\xc6\xd5\
-\xe7\xe6\x7a\xd3\x74\xcb\xca\xa1\x5e\xc0\xff\xf9\xa5\x48\xaa\x0f\
-\x15\xe6\xda\x6c\x35\x39\xa0\x9a\x0c\xf8\xdc\x9f\xeb\x8f\xd1\x38\
-\xf3\x57\xa3\xe2\x43\xc8\x9c\x34\x8a\x3a\x60\xd9\x16\xdd\x6c\xff\
-\x71\xd3\x95\xfc\xd5\xe4\x72\x1a\x36\x70\xee\x81\xed\x6b\xc4\xee\
-\x8c\x4d\xed\x68\xf5\x5c\x92\x6b\x48\x2d\xde\xf7\xd5\x91\x1f\xaa\
-\xb9\xc2\x8b\xb2\xc2\xa7\xe1\x8d\xd4\x66\xef\x5b\x9b\x1a\xd6\x1c\
-\x7c\xcf\x53\x49\x87\x4c\x13\x3a\x42\xf2\xd1\xaf\xff\x94\xda\x43\
-\x23\x27\x2a\xb7\x49\x13\xef\xbb\x68\xd4\xc9\x88\x07\x78\x2f\x59\
-\x9f\x7d\x43\xbc\x5e\xa8\x38\x67\xd0\x85\x77\x8a\x73\x12\x32\xaf\
-\x9c\xec\x33\x57\x5e\x6f\x93\x97\x71\x65\x71\x5f\x37\xe5\xfc\x53\
-\xb4\x3c\x54\xf4\x7c\x54\x3a\x41\x81\x2f\x13\x39\x8e\xda\xec\xff\
-\x64\x33\x13\x83\xea\xb5\x83\xdd\x54\xea\x91\xdc\x78\xdb\x86\xc8\
-\xc5\x5b\x4e\x4a\xfb\xd3\x96\xc3\x74\xbf\x4f\xbe\x00\x78\x38\xd7\
-\x67\x33\xfa\x65\x63\xff\x60\xf6\x90\x91\x94\x8f\xbe\x78\x3f\x80\
-\xa5\x61\xcf\x48\xa9\x1f\xa3\x31\x9f\x26\xc7\x9c\x02\xed\x7a\x63\
-\x4f\x19\xcd\xcf\x85\x85\xc7\x3a\xf9\xbc\x88\x77\x60\xe6\xeb\xb8\
-\xf7\x18\x33\x0c\x5e\x94\x4e\x47\xb2\xc2\x79\xc8\xe4\x31\x57\x11\
-\x7e\xba\x41\x0d\x57\xb6\x0e\xf7\x04\x64\x67\xfc\xa2\x6e\x7d\xdf\
-\x82\x69\x58\xb3\x61\x88\x87\x5a\x5d\x12\xee\x67\xfe\xac\x85\x20\
-\x77\x14\xcd\xf7\x53\xb1\x5f\xa0\x39\x72\xb3\xc4\xf0\x6b\x8b\x2b\
-\xd5\x61\xef\x98\x94\x3f\x3e\x87\x40\xfe\x7b\x38\x47\xa8\xb6\xef\
-\xe0\x3c\xbb\x0a\x73\x1d\xf9\xbd\xc5\xd7\x3c\x23\xa0\x6b\x0b\x27\
-\x93\x0a\x49\xbe\x36\xf9\x9c\x6d\xca\x68\xad\x1e\x73\xb5\xf3\xe5\
-\xd2\x1c\x3f\xb0\x35\x67\xe0\x7d\xbf\xce\x12\xb1\x23\x74\xb7\x34\
-\x65\x94\x7a\xd8\x1b\x57\xef\x1a\xe5\xa5\x51\x9f\x20\xdd\x81\xbf\
-\xeb\x2d\xce\x01\x2d\x6b\x4f\xf9\x7d\x39\x34\x27\x50\x88\x9d\x7e\
-\x6b\x38\x80\xcf\xa1\x48\x55\xd8\x27\x62\xe3\x75\x43\x2d\xfe\x06\
-\x8a\xcf\x62\x0f\x1f\x27\x37\xa6\xc0\x8f\xaf\xe3\x03\x8e\xc6\xfe\
-\x31\xdc\x70\x9b\x5a\x7a\xee\x3e\x55\xf0\x57\x09\x7d\xb9\xb2\xa4\
-\x9f\xbb\xc8\x9c\x69\x58\xcb\x34\x32\xa8\x32\x42\x7a\xc7\xc3\xc1\
-\xb8\x72\x3c\xcb\x59\x54\x3e\xcb\x57\xa3\x4e\xd9\x33\xda\x07\xd0\
-\xd8\xf0\x44\xec\xff\x9b\x43\x6f\x1f\xa1\xb2\x0e\x50\xc8\x65\xfa\
-\x46\x39\x80\xe6\x8d\xaa\xc6\x7e\x45\xbf\x53\xd2\xef\x7c\x93\xe6\
-\xf1\x8a\x35\xb8\x48\x89\xdf\xb4\x3c\xb3\xb7\xa1\xe8\x35\xd7\xfc\
-\xf6\x4e\xe1\xb8\xa9\xc8\x71\xa8\x90\xef\x50\x11\xaf\xc1\x15\xfc\
-\xff\xc7\x27\xfb\x42\xe9\x74\x3f\xed\x7a\x45\xac\x5b\x46\xf6\x76\
-\x12\xa1\xb1\x63\x2b\xe9\x03\xfa\x0b\x98\xa1\xba\x3f\x96\xea\x00\
-\x3c\x37\x53\x6c\x23\xbc\x47\xd3\xdc\x71\xdb\xea\x38\x80\xe7\x66\
-\x1f\xef\xa7\xce\x87\xc2\xe7\x48\x1e\xff\x8e\xcc\x3b\xab\xea\xbc\
-\x21\x4d\x6b\x40\x64\x9c\x82\xc2\x3a\x24\xde\x03\x92\x1b\xdf\x2a\
-\x5f\xc7\xee\xa7\x6c\x3f\xc3\x1f\xd7\xe5\xb5\x50\x91\xf7\x52\x21\
-\x07\xe6\xcc\x40\x2d\x1c\xd1\xc0\x97\x26\xd0\x2d\xde\x48\x4f\x60\
-\x9f\x24\x39\x3f\xd0\xb1\x52\x39\x94\xdd\x56\x8e\x95\xc2\xb1\xfe\
-\x4d\xe8\x7f\xa3\x2f\x07\x74\x01\x77\xdd\x5e\x0d\x73\x8b\x27\x4a\
-\x71\xec\xf8\x7c\x42\xf9\x58\xf4\xa6\xf0\xf9\x30\x31\x32\xa8\x39\
-\x36\x21\x40\x29\x3f\xa8\x0c\x41\x5a\xb8\xa1\x86\x2b\x33\x1b\xc9\
-\x15\x15\x7c\x59\x95\xeb\x05\xc8\x36\xbc\x2f\xef\x27\x88\xcf\x47\
-\x43\x6d\xf0\x3f\xa9\x3f\xdf\xcc\x0f\xe8\xeb\x2b\x38\xee\x3b\x7f\
-\x88\x3e\xe7\xf3\xbe\x51\x0e\xe0\xfd\x0b\xb5\x76\xea\xad\x7a\x32\
-\x3f\x2f\xcd\xdf\x0f\xaf\x37\x8d\x9f\x21\xff\xb9\x3f\xb3\x6f\x81\
-\xf5\xeb\x6e\xf9\x20\xdb\xff\xa5\x52\xae\x58\x69\xce\xd8\xb6\x1a\
-\x78\xd1\xc4\x7c\xd1\xc0\x91\x4e\x2d\xcd\xab\xc5\xb1\x7f\x8a\xb1\
-\x20\x59\xb4\x7c\xeb\x8a\xfe\xc0\xf8\x7c\xa7\x89\xc5\xcd\x3a\x1f\
-\x90\x5f\x9f\x25\xcf\x1e\xd0\x41\xf6\x98\xab\x9a\xce\x9f\xc1\x79\
-\x9c\x95\xf8\x84\xfd\x3d\xe5\xce\x09\x4c\xbb\x0b\x83\x9a\x60\xbf\
-\xd7\xdf\xd1\xca\xa8\x52\x75\xfe\xe0\x60\x50\xcb\x8b\x37\xc8\x95\
-\xf9\xe9\x9e\xd8\x5e\x7c\xa0\xce\x4f\x14\xb5\xc5\x5e\x8d\xe7\xbe\
-\xa0\x71\x80\xf3\xfe\xca\x37\xc3\x01\x7c\x96\xec\xa2\x75\x6a\xf7\
-\x0e\xb1\x0f\x19\x3e\x27\x52\xa3\x9f\x2f\xce\x19\xae\xb8\xef\x84\
-\xd7\x35\xe8\x67\x01\x9d\x6a\xa2\xb8\xcf\x18\x7f\x17\xb3\xa7\x92\
-\xdc\xca\x74\x04\xeb\x86\x19\xcd\xc7\x97\x8f\xfa\xfb\x00\x92\x7d\
-\x35\x7a\xcf\x28\x75\x15\x88\xdf\x7d\xc1\x43\x70\xb3\x5e\x6a\x0b\
-\xf2\x36\xec\x57\x6e\x7f\x7c\xce\x26\xce\x8d\xfe\x06\x38\x20\x59\
-\x9b\xc6\x7b\x51\x78\xdf\x00\xdb\x81\x38\xb6\x44\xc5\x59\xaf\xca\
-\xb2\xff\x70\x8b\xd2\xbb\xe3\x7b\xee\x87\x9b\x69\xe7\xc8\x37\xe1\
-\xb9\x90\xac\x4e\x2d\x2d\x2b\x64\xb9\xb6\xd5\xe4\xdd\x56\x85\xc6\
-\xf0\x45\x47\xae\x6c\x2b\xf4\x45\x3a\xdf\xb2\xca\xcc\xd8\xf0\x11\
-\x7a\x47\xf9\xf3\x70\x31\xe7\x3b\xa2\x39\xeb\x44\x1b\x33\x46\x09\
-\xe2\xc6\x9f\x46\x86\x06\xaf\x7c\x7b\xf6\xaa\x15\xc8\xf9\x7e\xb2\
-\xb1\x2d\xa0\x82\x03\xe4\xf8\xf9\x3a\x67\x7a\x36\xe3\xbe\x02\x1b\
-\xc7\x23\x28\xea\x2e\x7c\x4e\x30\x5e\x1f\x90\xf1\xb6\x41\x70\x0b\
-\xd8\x4d\xe8\xe7\x9d\xd9\x3d\xc0\xe6\x19\x3d\xff\xba\x2c\x07\xbb\
-\x22\x54\xf3\xa4\xe9\xb8\x72\xe6\xbd\x36\x90\x16\xe1\x50\x67\x6a\
-\x6c\xf8\xcc\xd0\xd0\x70\x04\x21\xcb\xcd\x15\x8c\x64\xbd\x1e\xf1\
-\xe1\xa9\xb3\xb5\x71\xa5\x20\xdc\xfe\xc5\x5c\x81\x27\xec\x2d\x6a\
-\x0d\xe7\xa7\xb5\x21\x39\xb3\x7e\xfb\x34\x39\xfb\xa9\x01\xd8\x38\
-\x76\x5e\x91\x03\xf8\xec\xe5\x81\x83\x34\x9e\x03\xf5\x4f\xc4\x76\
-\xe1\xbc\xe2\xca\xb2\x17\x90\xe7\x81\xca\xc7\x25\xa2\xb9\xfe\x84\
-\x26\x8e\xf1\xc8\x4f\x6e\x67\x5f\xad\x98\xa7\xfe\xe2\x94\x10\x3a\
-\xa6\x6a\xc3\xeb\xf3\x65\x73\xbe\x1f\x20\xd9\x56\x9b\x33\x19\x38\
-\x96\x4d\x92\xcf\x3c\xc6\x92\x69\xf8\x95\xb5\x29\xa3\x26\xaf\xbb\
-\xf3\xab\xbd\xc3\xfd\x35\xea\x96\xf9\x87\xb6\xd0\x38\x80\xf7\xd7\
-\x95\xda\x95\x45\x9d\xbb\x8c\xfd\x38\x9b\x7b\x8d\x48\xdb\x5e\x10\
-\x1e\x1f\x30\x47\x59\x2a\xce\xfc\xc2\xf9\xe6\xe5\xfd\xd9\x91\xec\
-\xd7\x35\x43\x7c\x5f\x41\x4a\x7b\x87\x9a\x8b\x93\xc3\x40\x86\x50\
-\x19\xa6\xe8\x82\xd7\xe7\xca\xf8\xde\x1e\xf5\xa8\xcf\x57\x31\x08\
-\x22\x4d\xfc\x5e\x3e\x96\x4c\xc6\x31\x7b\x0b\xa3\xea\x59\x5c\x2f\
-\x38\x3f\x25\x58\x27\xdd\x72\x71\x46\x7b\x3a\x07\x50\x1b\x93\x71\
-\x53\xaa\xe6\x66\x7c\x2a\x5f\x87\xfc\x1e\xfa\x9b\x3c\xef\x8f\x5d\
-\x50\xa4\xd2\xbf\x88\x1c\xef\x17\xac\x56\xdc\x5f\xfe\xb8\x99\xce\
-\x7c\xcb\xef\x15\xec\x50\x7d\xf1\xbd\x0e\x20\x05\x8d\x0b\xba\x40\
-\x1f\xae\xd0\xf9\x72\x01\x21\x2d\xdc\xa9\xce\xdc\xc4\xf0\x7f\x72\
-\x3e\xc1\xf1\x58\xff\x17\xc6\xb9\xbe\x2a\x9b\xd4\x5e\x27\xdd\xb2\
-\x29\xbf\x35\x0c\x4d\x70\x13\x45\xf9\x5a\x3d\xf3\xb2\x37\xa9\x88\
-\x98\xb6\xf8\x05\x6d\x1d\x0d\xd9\xce\xe4\x58\xa0\xee\xdc\xe5\xa1\
-\xa3\x29\xbb\xbc\x39\xed\x43\x1c\x33\xfa\xc5\x97\xe4\x7e\xaf\x4a\
-\xbf\x32\x52\x2f\xe1\x98\x2e\xfa\x39\xe0\x82\x3b\xb0\xa2\x19\xcf\
-\x78\xc9\x4b\x6a\x8b\xf4\xff\xa4\x8e\x48\xf6\x1d\x81\xc6\x03\x9d\
-\xd0\x48\xae\x88\xf9\x52\x18\xeb\xfa\xd2\xc2\xc4\x10\xe7\x29\x26\
-\xd7\x30\x8d\x0d\x0d\x87\xa0\x7e\x5f\xb3\xba\x9f\x9f\x56\xdd\x72\
-\x62\x5c\x30\x60\x8e\x38\x58\x1a\x55\x59\x30\x0d\x7f\x43\xb6\xc1\
-\x0a\xb1\x6f\x09\xce\x15\xd6\xb2\xd3\x9c\xd5\x1b\x78\x3f\xd6\xd2\
-\xc7\xd9\xa2\x71\xea\x7d\xfa\x04\x69\xe4\xfa\x01\x9e\x7f\x35\xe5\
-\x79\xd0\xd8\xd6\xe0\xae\xde\x45\xae\x0d\x90\x67\xc0\xab\x8a\x21\
-\x43\xef\x84\x6d\x00\x05\x9f\xd0\xfa\xb4\x3b\x30\xb1\x99\xcf\xf5\
-\xc8\xea\xee\x6f\x5b\x79\x71\x52\x27\x20\x39\xa0\x0f\x5e\x93\x2b\
-\x5b\xf3\x03\x01\xc9\x0c\xfb\x83\xb9\x8b\xf7\x7f\x33\xed\xcc\x8d\
-\x6a\xf6\x0d\x6d\xab\x71\x1c\x3a\x3b\x29\x04\x86\xc4\xb9\xbd\x42\
-\x3a\xe2\xb9\xa5\x29\x03\xe7\x29\xee\xa8\xae\x72\xed\x26\x2e\x1c\
-\xc6\xbe\xfc\x47\x03\x7d\xcc\xfd\x82\xda\x83\x53\x97\xf3\x03\xaf\
-\xb9\xe1\xb1\x21\xbb\x3f\xb9\x57\x8f\x63\x2c\x49\x1f\xad\x1b\x75\
-\xba\xcd\xfb\x10\x77\x78\xbb\x4e\x93\x7b\x3d\xa4\xcc\x31\xdf\xd4\
-\xe5\x1b\xc0\xf6\x28\xd6\xf7\xeb\xf7\x29\xda\x22\x7f\xe2\x3c\x74\
-\x6f\xe0\x5c\x97\xde\x61\x5e\x56\x4f\x2f\x4e\x0c\x87\x8b\x13\x3b\
-\x69\xc7\x24\x79\xe8\xc3\x15\x65\xbe\xc4\x04\xd8\x56\xa1\xfe\x2e\
-\x39\xc7\xb2\x25\x92\x67\xf5\xf6\xfc\x20\x8d\xba\x65\x75\xdf\xd6\
-\xa4\x8d\x88\x74\xc4\x29\xfc\x1d\x5d\x2a\x18\x34\x76\x8e\x4f\xcc\
-\xe6\x23\x3f\x2a\xee\xc3\xe2\x39\x35\x19\x3f\xae\x2d\xf7\x0b\xb6\
-\xcf\x70\xbe\x17\xec\x7b\x8b\xf3\xbc\xe0\x1c\x5f\xa8\xaf\xb2\x8b\
-\xc6\x03\x0b\x01\xaf\xe9\xe0\x38\x1c\x56\x5a\x26\x69\xc7\x51\x79\
-\x61\xd2\xb4\xe6\x80\xc1\xcf\xe5\x2c\x5c\x23\xef\xc3\x25\xc1\xe1\
-\x37\x98\x0f\xaa\x8b\xaf\x93\xf9\xd3\x8b\x13\x90\xfc\x35\x61\xa2\
-\x22\x3a\xe9\xc9\x17\x65\x4e\x58\x98\x30\xb0\x2f\xb8\x07\xb9\x08\
-\xcd\x64\xec\x1f\x12\xe3\xf1\x4a\xd3\x38\xb4\x35\x37\x48\x64\xc1\
-\x64\x3c\x46\x1f\x4f\x69\x4c\x45\x13\x0f\x7f\x9d\xcb\xf9\xba\x82\
-\x9e\xcf\x11\xb5\x3d\x77\xcd\x6e\xf2\x7c\x55\xea\x9c\x78\x56\xd3\
-\xe7\x7e\xa2\xad\xe1\x8a\xf3\x8b\x2c\x47\x63\x8c\x72\x0e\xa8\xdf\
-\x91\x8d\x9f\x41\xbc\xd9\x12\xe8\x68\x69\x5c\x79\x61\x7c\x04\xa8\
-\xc2\xc5\x09\xea\xa0\x0f\x57\x54\xf3\x85\x61\x68\x80\x53\xea\x92\
-\x79\x10\x6d\xcc\x8c\x2e\x2d\xe0\xfb\x69\xe4\xcb\xaa\x2c\x7f\x3c\
-\x5e\x60\xf9\x37\x3a\xd7\x38\xce\xc1\x89\xf4\x6a\x01\xa9\x5f\x69\
-\xfb\x2d\x0d\x64\xee\x0f\xce\xf4\x05\xd4\x5c\x01\xf7\x73\x2e\xb7\
-\x69\xf2\x7e\xa5\xa5\x93\x7a\x86\x33\x79\x0e\xf0\xf1\xf9\x82\xca\
-\x31\xca\x55\x38\x17\x20\xeb\x27\xf8\x27\x72\xa8\x5b\xe2\xfd\x9f\
-\x0b\xe3\x22\x41\x8a\xf1\xda\xd0\x34\x5c\xf1\xb2\x63\x3e\x43\xcf\
-\xef\x26\x7e\x8f\xfe\x9d\x5a\x58\x57\x6a\xd3\x2d\xc9\xc1\x0e\xcf\
-\xcd\x8d\x0d\x57\xbf\xb6\xd1\xf3\x3f\xb0\x4b\xbb\x0b\x93\x51\xdb\
-\xff\xa2\x6a\xef\x0d\xef\xd7\x73\x57\xed\x00\x36\xf6\x2f\xc5\x7c\
-\x10\xe7\x02\x24\x63\xbc\x71\xee\x08\x85\x33\x19\xb1\x7c\xc9\x7f\
-\xc3\xbc\xc1\xff\x86\xd7\xed\x86\x8f\x05\xee\x8a\xed\xd4\x7e\xad\
-\xea\xb3\xa5\x1e\x22\xb9\xcf\xc8\xfc\x19\x1c\x89\x7f\xb0\x18\x33\
-\x0c\x9f\x1f\x1b\xd6\x09\xc9\x3e\x4a\x47\x44\x42\x53\xf0\x65\x6c\
-\x0f\x9f\x06\xa4\xf7\x8f\x48\xc3\x4f\x8c\x0c\x2b\x3f\xcd\x6f\xaf\
-\x51\xb7\x1c\x1b\x11\x06\x68\x0c\xc0\x3e\x60\x9d\x9a\xa2\xee\xf8\
-\xcc\x1c\x7c\x6e\x06\xce\xf5\x2b\xb8\x2d\x7a\xa5\xd6\xae\xfb\xae\
-\x0a\xf8\xa5\xb7\xc8\x79\x24\x6f\xfb\x31\x32\xcf\x17\x6f\xed\x1e\
-\x64\xd7\x7f\x4a\x9e\x1b\x89\xff\xc6\xdb\x7b\x0e\xf8\xf8\xac\x61\
-\xe5\xf1\x5c\x1e\xf8\x19\xa7\xc8\x7d\xcb\xb7\x24\x1f\xb0\x95\x29\
-\xe3\xfe\xd6\xfe\xed\xe1\xc2\xd8\x68\x1d\x10\x25\xc3\x6b\x72\xe5\
-\xf4\xc8\x4e\x58\x9f\x63\x1b\xa0\x85\xd8\xe7\x7f\x5a\x5c\x80\x7d\
-\x8d\x36\xdd\x32\x3d\xc5\x57\x84\xe6\x8c\x3f\xe3\x58\xe5\x26\xa8\
-\xbe\x3b\x7a\xee\x54\x73\xa6\xe1\x43\x6f\x6f\xb7\xaa\x82\xa9\xa3\
-\x45\xe3\x4f\x9c\x82\x01\xdf\x37\x61\x1c\xd9\xcd\x57\x4f\xd1\xbc\
-\xe3\x00\xe2\x58\x1e\xf7\x06\x38\x10\x6f\x59\xb1\x31\x35\x3a\x31\
-\x2b\xc5\x1f\x2e\x8c\xe9\xac\x05\xd1\x3a\x72\x44\x77\xae\x64\x76\
-\x72\x7f\x81\x38\xb0\x52\x1a\xe6\x6d\x64\xf8\xec\x93\x9c\xf6\x5a\
-\x75\x4b\x88\x87\x75\x0d\x92\x5b\x63\xd7\xc2\x71\xde\x78\x2e\x9a\
-\x3b\x9e\x41\x3a\xa7\x36\xb5\xbd\xe3\xf3\x8d\xfd\xda\x28\xd9\x2c\
-\x47\xe7\x72\x61\xc3\xc7\x33\x60\xe1\x67\x9b\x61\xca\xc9\x93\x30\
-\xfc\xf2\x8f\xd0\xff\x87\xbf\x21\xe3\xa6\xf2\xbe\x3d\xfe\x5b\xff\
-\x1f\x9e\xc2\xb0\x2b\x3f\xc1\x44\xc4\x9f\xf1\x5b\xd7\x43\xc1\xb4\
-\x31\x90\x94\x18\x59\xeb\x6a\x63\x52\x89\xfd\xab\x91\x8d\xf3\x13\
-\xd2\x5d\x1f\x63\xd7\x15\xbc\x9f\x21\xf6\x7d\xfd\xc7\x8b\x91\x21\
-\x31\x2f\x37\xd2\xab\xe1\xc2\xe8\x2e\xa0\x16\x63\xba\xe8\xc0\x0f\
-\xfd\xf9\xf2\x79\x41\x47\x40\x32\xc0\xfa\xdc\x9a\x7a\x17\xc3\x31\
-\xa1\x9e\xd6\xd5\xda\xf4\xca\xee\xfc\x50\x30\xa5\xbe\xa7\xcf\x3e\
-\x68\x10\xe2\xda\x32\xf4\xbc\x67\x81\x2e\x16\xcf\xa6\xf7\x6e\x05\
-\x25\xa3\x3a\x35\xce\xc6\x45\x28\x9d\x1e\x4f\xe2\xc2\xa4\x08\xad\
-\x73\xa2\x92\xd1\x1d\x60\x4d\x76\x20\x8c\x4a\xf0\x82\xb8\x40\xbb\
-\x2a\xbc\x87\x85\x38\x51\x87\xfa\xde\x77\x68\xde\x8b\xcf\xbe\xeb\
-\x87\xe3\x6f\xb1\x3b\xee\x3f\x40\x81\xac\x2e\xad\xec\x2b\x2f\x8c\
-\xea\x0a\x4a\x18\x2d\x41\x17\xdd\xa1\x27\x57\xe2\xfc\x1d\xaa\x91\
-\xdc\xc7\x4a\xe8\x68\x6e\xc2\xb8\x37\x9f\x1d\xa0\x55\xb7\x14\x74\
-\xf1\x7c\x65\xc9\x64\x94\x6a\x1b\xde\x50\x27\xcb\xb7\x62\x1a\x7d\
-\x67\x6d\x6a\x54\xd3\x37\xc2\xfd\xe5\xee\xfc\x10\x1d\xec\x96\x26\
-\x9c\x0f\xa9\x99\x3f\x9f\x1e\x1d\x86\xe6\x34\x01\x50\x14\xef\x25\
-\x8a\xf1\xb7\xab\x74\xb4\x12\x73\xc2\xcc\xe8\x1b\xf1\x5a\x26\x3e\
-\xfb\x38\xe0\x0d\x70\x22\xd8\xc9\xd2\xa4\xf2\xc2\xc8\x6e\x40\x62\
-\x94\x2a\x74\xd5\x8e\xd1\x8d\xe3\xcb\x96\x7e\xa1\xd8\x0e\xf8\x1b\
-\xeb\x7f\x89\x59\x66\x6f\x6e\x5c\x7d\x66\x44\x94\x7a\xde\x20\x0e\
-\x9c\x1d\x1d\x85\xe6\x10\xa6\xd8\x2f\xac\xbf\xaa\x75\x0d\x0b\x13\
-\xc6\x4e\x34\x46\x3c\x8f\x6a\x69\x57\xb5\x98\x1b\x08\xe5\x63\x22\
-\xdf\xb8\x8d\xab\x2f\x5f\x4e\x8e\xec\x00\x2b\x32\x03\x60\x58\xac\
-\x97\xa8\x9b\x9f\x6d\xa5\x83\xa5\x71\x15\xe2\x44\x2d\xe2\xc4\x57\
-\xa8\x8d\x96\x8b\xd7\xb7\x9b\xda\x86\x60\xa0\x39\x40\xed\x91\x02\
-\xd4\xaf\x46\x76\x57\x81\x6e\x9a\xd1\x04\x5c\x49\x68\xed\x58\x83\
-\xf4\xf9\x5c\xe9\xa4\xd4\x84\x71\x60\x60\xa4\xd7\x4b\x6d\xba\x65\
-\x73\xdf\x10\x3c\x7e\x60\xbf\x60\x7c\xfe\xb1\x0b\xd2\x23\x93\x90\
-\xdc\x7f\x71\xb5\x66\x56\x0e\xef\xe6\xd3\xf0\x45\x61\x78\xb3\xd8\
-\x2d\x6f\x92\x2b\x27\xd0\x9c\x67\x79\x7a\x00\x0c\xe9\xee\x29\xea\
-\xec\x6b\xf3\x0c\xb5\x13\xee\x2b\x36\x4d\x49\x00\xa4\x1b\x4f\xce\
-\x48\x0a\x82\xf3\x23\x62\x14\xd0\x5d\x25\x54\xf3\xa4\xf1\x5c\xd9\
-\x9f\x17\x2e\xb1\x03\x24\xeb\x9e\x1e\xa8\x9e\x55\x5b\xb2\xc3\xb4\
-\x8e\x43\xd9\x9d\x3c\x5f\xa0\xcf\x3e\xc4\xb6\x5c\x72\x90\xf3\xf3\
-\x75\x19\xed\x5f\xc3\x6e\xd1\x97\x2b\xd1\x7a\x72\xa5\x71\x7c\x39\
-\x37\x36\x1c\x0e\x0d\x0d\x83\x4f\x72\xda\x01\xd2\x09\x95\xfa\x9e\
-\x9f\xa4\x43\x19\x14\xeb\xe7\x54\x7d\xbe\x28\x16\xe8\x88\xa1\x63\
-\x84\x36\x34\x9e\x2f\x59\x1d\x3c\x5f\xa0\xb1\x7f\xbf\x5c\x3c\x60\
-\x3f\xd4\x8f\xab\x4f\x0f\xeb\xac\x51\xb7\x94\x0e\xef\x0c\x33\x92\
-\xfd\xe1\xf4\xb0\xe8\xd7\x1a\x87\x9a\xcb\xc6\x55\xc5\x95\x93\x45\
-\xe1\xa4\x0d\xbb\x3e\x3b\x18\x16\x71\x03\x60\x4a\xb2\x2f\x14\xc5\
-\xfa\x40\x56\xb8\xdb\xab\xc4\x20\xc7\xea\x4e\x3e\x36\x15\xbe\x8e\
-\xe6\x4f\xf1\xda\x2c\xe2\x76\x9d\x81\x01\xd1\x80\xf5\x1c\x9a\xb3\
-\x3c\x40\xf3\xf5\x8f\x9b\xc1\x26\xf0\x34\x37\x66\x3c\x3f\x37\x0c\
-\xc9\x7c\x78\x9c\x18\xb1\x32\x14\xe9\x82\x18\x3d\xf9\x42\xe7\xc8\
-\xe9\xa1\x5d\xc1\xd9\x92\x59\x83\xec\x35\xe9\x39\xa6\x66\x26\x8c\
-\x1d\x31\x7e\x8e\xcf\x9b\x6d\x1c\x6a\xac\x8d\x3b\x9a\xce\x95\xe3\
-\x43\x23\xe0\x93\x01\xa1\xb0\x3a\x3d\x18\x16\x72\x02\x61\x5a\x72\
-\x6b\x18\xda\xcd\x07\x04\xa1\xae\xf5\x09\x01\x8e\xcf\x3b\x78\xd9\
-\x54\xb4\x72\x34\x7f\x82\xec\x9a\x2a\xbc\xee\x8d\xf0\x0a\xef\x7d\
-\xa2\xf9\xe0\x03\x64\x9b\x7e\x8b\xe6\x01\xc7\x6c\x4c\x8d\xb1\x5c\
-\x8b\xc5\xf1\xf1\xd8\xa6\xe9\x41\x50\xe7\xa3\xba\xbf\x89\xb9\xa2\
-\x15\xd3\xf8\xf6\x0a\x6e\x07\x38\x3f\x2c\x5e\x8c\x38\x39\x2e\xe8\
-\x02\x7d\xb8\xa2\x5a\xb7\xac\x4b\x0b\xc3\xf3\x3a\xac\xdf\x42\x25\
-\xb1\xc9\x48\x27\xdc\x19\x17\xe7\xd7\xd0\xa4\x63\x91\x9e\x36\xee\
-\x22\x76\x1b\xc8\xe8\xe0\xf1\x32\xc1\xdf\xa9\x3a\xcc\xd3\xe6\x69\
-\x0b\x7b\xf3\xa7\x58\x96\x26\x0c\xc3\x17\x86\x06\x06\xf5\x66\x46\
-\x86\x15\x56\x4c\xc6\x7d\x1b\x33\xe3\x2f\x91\x2c\x8f\x20\x1b\x64\
-\x83\x58\x96\xc3\xc5\xe7\xdd\x60\x1f\xd6\xf6\xe2\xfd\x2e\x26\xf1\
-\x16\x16\x64\x3b\x4d\xe8\x15\xe0\xf6\xfc\xfc\xd0\x04\x24\xfb\x04\
-\x39\x1e\xe8\x82\x46\x72\x45\x05\x5f\xde\xef\x1d\x2c\x32\x43\xba\
-\x08\xb5\x63\x09\x6e\x4b\x6c\x17\xf4\xeb\xe4\xfd\xe2\x4d\x8d\x43\
-\x8a\x28\x4e\x0e\x10\x21\x0e\x62\xff\xa4\x09\xe2\xb5\x9b\x3e\x62\
-\x7f\x74\x3f\xc9\xba\xc5\xbf\xa4\xb8\x9b\x1a\x31\x6a\x4b\x0a\x90\
-\x3c\x87\xf6\x10\x23\x41\x3b\xf4\xe6\x4a\xbc\x56\x7e\x1c\x1f\xd4\
-\x0d\xe6\x24\x07\xc3\x8c\xc4\x36\x70\x28\xb7\x4b\x93\xe8\x96\xc6\
-\xf2\x25\xb3\x83\xe7\x4b\x43\x43\xc3\x62\xe2\xff\x41\x41\x63\xd1\
-\x99\xf7\xe2\xda\x88\xce\x0f\xe9\x09\x14\x7a\x68\x87\x3e\x5c\xf9\
-\x87\x75\x4b\x63\xb8\xf2\x49\xdf\x70\x40\xed\xf2\xdc\xda\xd4\xf8\
-\xa6\xad\x99\xf1\x59\x4b\x53\xe3\x4f\x8d\x0d\x0d\x3f\x40\xcd\x35\
-\x46\x3c\x4e\xf7\x12\xfb\x20\x79\x11\xfa\x9d\x69\xfc\x36\x96\x9e\
-\x9e\x36\x66\x95\xe5\x85\x89\x20\x03\xe2\x81\x3a\x0c\x51\xc4\xbf\
-\x93\x2b\x25\x43\xba\xc3\x7a\x61\x07\x58\xd0\x27\x18\xde\x4b\x08\
-\x80\xc2\xe8\x96\x90\x16\xea\xf1\x2a\xde\xcf\xf9\x79\x98\x87\x6d\
-\x95\xb7\x9d\x59\x25\x1a\xab\x6a\xb0\x6d\x67\x8c\x6c\x02\x4b\x26\
-\xe3\x31\xb2\xe7\x7e\x42\x36\xc2\x79\x07\x73\x93\xcf\x2c\x8c\x8d\
-\x96\xbe\x23\x7c\x31\x40\x63\xdd\x83\x15\xac\x70\x28\x1f\x9c\x24\
-\x87\x44\x65\x14\xaa\x42\x4f\xf5\x7c\x69\x34\x57\xf4\xe1\x8b\x7a\
-\x6e\x9c\x1e\x1c\x03\xcb\xd8\xa1\x30\xaa\x9b\x3f\xe4\x47\xb4\x42\
-\x68\x09\x93\x13\x02\x61\x6b\x06\x9a\x5f\xd3\xe6\x3d\xaf\x67\xe3\
-\x9e\x1c\xdc\x0d\x3e\xed\x1f\x09\x6b\xe5\xf8\x32\x18\xf1\x45\x18\
-\xe2\xf9\x32\xd6\xcf\xb1\xb2\xbd\xbb\xcd\x53\x4f\x1b\xd3\x67\xd6\
-\x4c\xa3\x6a\xcc\x17\x23\x43\x83\x3a\x0b\x63\xc6\x23\x64\x3b\x7e\
-\x8b\x7d\x9f\xff\x69\x02\xa0\x89\x46\x6e\xb0\x8b\x6d\x55\x79\x41\
-\x32\xd0\x91\x24\xc3\x60\x4d\xd0\x95\x2b\xcd\xaf\x5b\x0e\x0c\xe8\
-\x0a\x49\x81\x1e\xe0\xe2\x68\xdf\x60\x66\x66\x06\x7e\x7e\x7e\xa2\
-\xe8\xe8\xa8\xfa\xa8\xa8\xa8\xfa\xc8\xc8\x88\x57\xad\xfd\xfc\xea\
-\x6d\x6c\xac\x45\x4c\x26\x13\xdc\x9c\x1c\x1a\xe2\xfd\xdd\x60\x5b\
-\x66\xe4\x1b\xd5\x2d\x98\x2f\xbb\xfa\x45\xc2\x84\x38\x7f\xb0\x61\
-\x1a\x7f\xf5\x36\x4c\x05\x90\x0e\xf8\x7d\x65\x6a\x14\x94\x0f\xea\
-\x25\x87\x64\x0a\x05\xba\x40\x57\xae\x34\x8f\x6e\x39\x3c\xb0\x3b\
-\x74\xf1\x75\x07\x2b\x2b\x4b\x18\x36\x74\x68\xc3\xb5\x6b\xd7\x40\
-\x24\x12\x81\xba\xf2\xf2\xe5\x4b\x38\x7f\xfe\x3c\x8c\x1d\x3b\xb6\
-\xc1\xde\xde\x1e\x82\xbd\x5c\x44\x9f\x66\x45\xeb\xac\x5b\x9a\x82\
-\x2f\xfb\x07\x46\x83\x99\x11\xe3\xe9\xdb\x30\x08\x20\x1d\x30\xb0\
-\xad\xb3\x5d\x55\x79\x7e\x6f\xa0\x81\xc6\x07\x6d\xd0\x95\x2f\x49\
-\x4d\xaa\x5b\x46\x74\x09\x04\x6b\x2b\x4b\xd1\xb8\x71\xe3\x44\x4f\
-\x9e\x3c\x01\x7d\x4b\x5d\x5d\x1d\x2c\x5e\xbc\x58\x64\x65\x65\x05\
-\xfd\x3a\xb6\x7a\x63\x76\x0b\x1e\x83\x70\x2c\x2b\x5e\xf3\x78\x2b\
-\x74\x80\x31\xe3\x7f\xf3\x7b\x76\x82\xf2\xbc\x14\x0a\xf9\x12\xf4\
-\xd6\x11\xcd\xc1\x15\xf5\xba\xe5\x1c\x42\x8f\x00\x2f\xf0\xf1\xf1\
-\x11\x7d\xf5\xd5\x57\xf0\xba\xe5\xee\xdd\xbb\xe4\x6f\x75\x6e\xe5\
-\x26\x2a\x6f\x4e\xbb\x45\x8e\x2b\xd8\x26\x10\xdb\x85\x6f\x43\x89\
-\x77\x30\x63\x56\x9f\x1e\x80\xe4\x93\xdb\x07\x71\x40\x1e\x29\xda\
-\xa1\x17\x57\x1a\xa1\x5b\x14\x78\xd1\xd1\xc7\xad\xa1\x53\xa7\x4e\
-\xa2\x8a\x8a\x0a\x68\xaa\x82\x7f\x2b\x3a\x2a\xaa\xa1\xb5\x9b\x63\
-\xfd\x39\x5d\xec\x16\x7d\x6d\x16\x05\xdd\xe2\x6c\x49\xfa\xc4\x06\
-\xbd\x2d\x93\x01\x0b\x13\xa3\x43\x03\x43\xfd\x5f\x9e\xcb\x4d\x05\
-\x3a\xfa\xd0\x50\xae\x88\x46\x71\xa5\xf1\xba\x25\xb5\x4d\x0b\x08\
-\x0d\x0d\x15\x61\xdd\xdd\xd4\x05\xdb\x06\x9d\x3b\x77\x16\x75\xf5\
-\x75\x17\x35\xb7\x8d\xeb\x69\x63\x5e\x21\x8e\x5f\x7b\x5b\x8a\x97\
-\xa9\x11\xa3\x7a\x1b\x17\x8d\x4f\x39\x2c\x05\xa4\xaa\x46\xae\x2a\
-\xe8\xca\x97\x14\xbd\x75\xcb\xf4\xd8\x10\x70\x76\x76\x16\xfd\xf9\
-\xe7\x9f\xd0\x5c\x05\xeb\x01\x3c\x16\x0c\xec\xe8\xd7\x6c\x76\x0b\
-\x86\x9b\xb5\x29\xee\xff\x21\x6f\xd3\x82\x00\x83\xc1\x28\xf0\xb1\
-\xb5\xaa\x2e\xe9\x8f\xe4\x38\x90\xad\x00\x16\x1d\x39\xea\x90\xaa\
-\x07\x5f\x74\xd7\x2d\x67\x72\x7a\x81\xbd\x8d\x8d\xe8\xc4\x89\x13\
-\xd0\xdc\xe5\xce\x9d\x3b\x68\x3e\x61\x25\xda\x9b\x11\xdb\x6c\x73\
-\x22\x57\x2b\x53\xbc\xf7\xd5\xfd\x6d\x5b\x14\xb4\x30\x36\x3a\x99\
-\x1d\xdc\xfa\xc5\xb9\x01\x1c\xa0\x83\x4d\xc7\x40\x4d\x60\xbd\x3e\
-\x5f\x14\xb8\x22\x68\xdb\x0a\x7a\xf7\xee\x25\x82\x37\x54\xe6\xcd\
-\x9b\x27\x0a\xf3\x46\xf6\x60\xa3\xec\x16\xed\x5c\x99\x14\x13\x2c\
-\x42\x73\xc0\x5f\x09\x71\x3c\xf4\x5b\x54\x9c\x99\x46\x8c\x8a\x15\
-\xc9\xdd\xe1\x5c\x7f\xae\x02\x38\x14\x06\xe8\x02\x5d\xb9\xa2\x5d\
-\xb7\x94\x0d\x4c\x05\x1b\x6b\x6b\xd1\x97\x5f\x7e\xf9\xa6\xc4\x0f\
-\x35\x35\x35\x58\x07\xc0\x81\xcc\x1e\xcd\x66\xe3\x72\x82\xbc\xeb\
-\x2c\x4d\x8c\x3e\x27\xde\xbe\x92\x68\x69\x62\x5c\xb3\x87\x97\x0c\
-\xe7\xfa\xf1\xe8\x50\xe2\x84\x26\x34\x0d\x57\x26\x76\x0e\x85\xe0\
-\xe0\xe0\x37\xd6\xf7\x25\x85\xc7\xe3\xd5\x0b\xda\xb4\xd4\xdf\xc6\
-\xd5\x91\x2f\xa7\x07\x26\x81\xb3\x85\x29\x9e\x07\xa6\xbe\x6d\x04\
-\x60\x1a\x1a\x8e\xf2\xb0\xb2\xa8\x3e\x96\x8e\x64\xd0\x97\x4f\xa1\
-\x9f\x04\x3c\xdd\xa0\x2f\x57\xd4\xf0\x25\xc4\xdd\xa5\x61\xc1\x82\
-\x05\x6f\x5c\xfe\x3b\x77\xee\x04\x1f\x17\xa7\xfa\xe6\x9c\x13\x7d\
-\x90\x14\x01\x78\x1f\xe6\x6d\x89\x11\x91\x2f\xe6\xc6\xc6\x9b\xc3\
-\xdd\x5c\x6a\x4a\xb3\xf8\x70\xb6\xaf\x40\x0e\x7c\xb5\x68\x34\x57\
-\x34\xf0\xc5\xc9\xde\xbe\xe1\x9b\x6f\xbe\xd1\x28\xab\x1b\x37\x6e\
-\x40\x76\x76\x36\xb4\x6c\xe1\x23\xb2\x46\xb6\x5b\x50\x60\xa0\x68\
-\xfa\xf4\xe9\xa2\x67\xcf\x9e\x35\x5a\xfe\xbf\xfd\xf6\x1b\xe0\xdf\
-\x7a\x1d\xbb\x45\x17\xae\xb4\x76\xb0\xc1\xb6\x20\xef\x2d\x1c\x07\
-\x8c\x11\x07\x2e\x26\xb7\x6a\x51\x5b\x96\x2d\x84\xb3\x34\x08\x34\
-\xa3\x89\xf8\x52\xd6\x97\x0b\xa6\xa6\xa6\xf0\xe2\xc5\x0b\xb5\x72\
-\x5a\xb6\x6c\x19\x38\xd8\xd8\xc0\xb0\x88\xf6\xb0\x8b\x9b\x08\x27\
-\xb2\x52\x61\x63\x9f\x78\xe8\x1d\xe8\x07\x0e\xf6\xf6\x70\xf9\xf2\
-\xe5\x46\xc9\xbf\xa1\xa1\x01\x4c\x4c\x4c\xe0\x48\x56\xef\x66\xb5\
-\x71\x8b\x63\x3b\x80\x15\xd3\xf8\xdc\x5b\xea\x27\x60\x89\x38\x70\
-\x9d\xe4\x40\x56\x1a\x9c\xa5\x41\xa8\x1a\xd9\xaa\xd0\x38\xae\xec\
-\xe2\x24\x83\x93\x93\x93\x5a\x19\x6d\xdb\xb6\x0d\xbc\x9d\x1c\xe1\
-\x73\x41\x6f\x95\x3a\x65\x59\x62\x37\xb0\xb7\xb3\x15\x3d\x7a\xf4\
-\xa8\x51\x1c\x70\x74\x74\x6c\x58\x96\xd8\xa5\x59\x6d\xdc\x63\x7d\
-\x7b\x83\x31\xc3\xb0\xee\x6d\xf5\x17\x94\x72\xa0\x65\xcb\xda\xb2\
-\xcc\x74\x38\x4b\x43\x1a\x1d\x59\xea\xd0\x38\xae\xac\x49\x8a\x07\
-\x1f\x6f\x6f\x95\x63\x7f\x75\x75\x35\x92\xad\x1d\x6c\x67\x25\xaa\
-\xd7\x2b\x08\x99\xed\x82\x60\xe8\x90\x21\x8d\x92\x7f\x40\x40\x40\
-\xfd\x7b\x5d\x3a\x36\x81\x8d\xab\x99\x2f\xbe\x76\xd6\x15\x6f\x83\
-\x4f\x80\x36\x0e\x24\xb6\x68\x51\x5b\x92\x86\xe4\x99\x91\x21\x46\
-\xba\x0c\x99\xda\xa0\x2b\x57\x64\x7c\x59\x95\x18\x0f\x2d\x5b\xb6\
-\x54\x29\xff\xc3\x87\x0f\x43\xc7\x16\x3e\x5a\x75\xcb\x6e\x6e\x6f\
-\x70\x73\x71\x69\x94\xfd\x18\xd2\xbe\x7d\xfd\xa4\xe8\x8e\x1a\x6c\
-\x16\x5e\x93\xd8\xb8\xc2\x20\xdf\x17\xa8\x8d\xc7\xbe\xe5\x3e\x63\
-\x16\x16\x46\xc6\x27\x82\xec\x1d\xaa\x0f\x72\x78\x70\x36\x3d\x53\
-\x8c\x0c\x39\x3e\x68\x83\x7e\x7c\xd9\xcf\x65\x81\x1d\xea\xe3\xaa\
-\xca\x9c\x39\x73\x20\xbb\x4d\xa0\x4e\xba\xc5\x0c\xd9\x10\xf5\xf5\
-\xf5\x7a\xcb\x3f\x34\x34\xb4\xa1\xb8\x6b\xa4\x5a\xdd\xa2\xaf\x8d\
-\xdb\xbf\x7d\x20\xf4\x6b\x17\x00\xa7\xb3\x59\x34\x6e\x0c\xed\x18\
-\x0c\x4c\x23\xa3\x65\xef\x80\xdf\xa0\x21\x7a\xcf\x05\x76\x4c\xd3\
-\x9a\x0d\x89\xbd\xa0\x2c\x2d\x0b\xc9\x3f\x4b\x8e\x0b\xba\x40\x77\
-\xae\x94\x21\x98\x32\x99\x2a\xed\xbf\xc5\x8b\x17\x43\x5a\x50\xa0\
-\x56\xdd\x52\x9a\x89\xe5\xcf\x24\xed\x39\x7d\x8b\x8f\x8f\x0f\x6c\
-\x49\xe9\xd9\x24\x36\xee\xc9\x4c\x0e\x39\x9f\xe8\xd3\xa7\x0f\xf8\
-\x38\x39\x36\x9c\xc8\x64\x4b\x79\x31\xb9\x73\x47\x64\x03\x9a\xec\
-\x79\x57\x9c\x47\xf1\xf9\xad\xa6\x46\x46\xd5\xd3\xa3\xba\x8a\xca\
-\xd2\xb2\x81\x42\x96\x56\x9c\x4d\xd3\x9f\x2b\x6e\xc8\x06\xbb\x78\
-\xf1\xa2\x92\x6c\x8e\x1c\x39\x02\xc1\x9e\x9e\xca\xba\x45\x41\x8f\
-\x6c\xec\x95\x04\xbe\xad\x5a\xe9\xad\xff\x6b\x6b\x6b\xc1\xdc\xdc\
-\x5c\x74\x2a\x9d\xd7\x24\x36\x6e\x71\xb7\x48\x48\x88\x8f\x27\xfd\
-\x93\x72\x72\x72\x1a\x42\x3d\xdd\x1b\x24\x1c\x19\x13\x11\x06\x16\
-\xc6\xc6\x1b\xdf\x31\x1f\xe2\x50\x33\x63\xe3\x07\x5d\xdc\x3d\x6b\
-\x0e\xb0\x04\x50\x26\xcc\xd6\x0e\x3d\xb8\x22\xd1\x2d\x51\x9e\x5e\
-\x30\x7b\xf6\x6c\x91\xaa\xfd\x5a\x77\x37\x37\xd1\xd2\xd8\x78\x8d\
-\xba\x25\xa6\x55\x2b\x3c\x56\xe8\x2d\xff\xcf\x3f\xff\x1c\x5a\xba\
-\xb8\x34\x34\xc6\x6e\x51\xc5\x95\x88\x16\xde\xb0\x6e\xdd\x3a\xf2\
-\xb7\x9f\x3f\x7f\x0e\xd6\xd6\xd6\xb0\x8f\x93\x42\xf2\x23\xb7\x7d\
-\x1b\x91\x91\xa1\xe1\xfb\xef\xa0\x1f\xb9\xa9\x99\x91\xd1\x52\xc4\
-\xdd\x9a\xe9\x91\xdd\x44\x65\x82\xbe\xa0\x16\x42\x45\xe8\xc6\x95\
-\x25\x31\x09\xe0\xe1\xe1\xa1\x52\x46\x58\x2f\xd8\xa3\xb9\xff\xbc\
-\xae\x31\x2a\x75\xcb\x90\xb0\x0e\xe0\xed\xed\x4d\xf6\x65\x7d\x4b\
-\xa7\x4e\x9d\x1a\x0a\x43\x43\x35\xea\x16\xad\x36\xae\x98\x2f\x47\
-\x85\x5c\xb0\xb2\xb4\xa4\xad\x47\x75\xef\xd6\xad\x61\x64\xc7\x50\
-\x92\x23\x5d\x3d\xdd\xf1\x1a\x50\xf6\x3b\x1c\x4f\x10\x8e\xe6\x07\
-\x77\x23\x5d\x3d\x6a\xf6\xf4\xe6\x41\x19\xbf\x1f\x1d\x02\x75\xd0\
-\x8d\x2f\x2e\xf6\xf6\x0d\xa7\x4e\x9d\x52\x29\x27\xec\x03\x16\xe0\
-\xef\x2f\x0a\x74\xf7\x80\xc1\x21\x1d\xa0\x38\xba\x2b\x14\x86\x84\
-\x82\xbf\x9b\x1b\x04\x06\x06\x92\xeb\x78\xfa\x96\xf2\xf2\x72\xb0\
-\xb5\xb6\x16\x95\xa6\x65\x34\x89\x8d\x9b\x1f\xd2\x1e\xb2\x32\x33\
-\x69\xcf\x10\xf0\xf9\xf5\xfd\xdb\x06\x41\x69\x86\x10\x2c\x51\xff\
-\x41\x6d\xd8\xea\x1d\x8f\x29\x31\x41\x36\xc1\x5c\x26\xc3\xa8\x26\
-\xd3\x3f\xf8\xc5\x91\xd4\x4c\x28\xe3\xf5\x47\xf2\xd7\x84\x7e\xaa\
-\xa1\xc0\x93\x09\x1d\xa3\xb1\x2c\x45\xea\x7c\x7b\xf1\xdf\x4b\x4a\
-\x4a\xb0\x5f\x2f\xa4\xa7\xa7\x43\x51\x51\x11\x1c\x3c\x78\x50\xa3\
-\x2f\xb0\xba\x82\xbf\x83\xf7\x9b\xf2\x82\xdb\xbf\x96\xdd\x22\xe1\
-\x43\x19\x82\xab\xbd\x3d\x5c\xbd\x7a\x95\xf6\x9c\x76\xed\xda\x89\
-\xe6\x74\xed\x0a\x4b\x62\x63\xc0\xd2\xc4\xe4\x16\xf1\xef\x29\x1e\
-\x68\x3c\xd8\x69\x66\x64\xfc\x3c\x27\x30\xf4\xd5\x61\x92\x07\x03\
-\x34\xa0\x3f\x1d\x6a\xb8\xe2\xed\xe8\xd4\xb0\x6c\xd9\xb2\x66\xdf\
-\x07\x5a\xbe\x7c\x79\x83\xb3\x9d\x5d\x7d\x63\xed\x96\xb3\x0a\x73\
-\xa2\x05\xdd\x63\xa0\x4d\x9b\x36\xb4\x67\xdc\xba\x75\x0b\x2c\xd1\
-\x78\x70\x06\xe9\x97\x76\x8e\x8e\x38\x1f\xc2\x40\xe2\xdf\x57\xfc\
-\x31\x0f\x4c\x19\x46\xcf\xf9\xbe\x41\x75\x3b\x12\xd1\xb8\xc0\x1d\
-\xa8\x06\x03\x28\x68\xe0\xc9\x27\x89\x5c\x72\xfe\x84\x7d\xfc\x9b\
-\xab\xe0\x7d\x26\x3c\x4e\xaf\x8d\xef\xfd\xda\x76\x8b\x84\x0f\xed\
-\x3c\x3c\x45\x9b\x36\x6d\xa2\xf9\x16\x84\x85\x85\x89\x84\x81\x6d\
-\x60\x59\x5c\x0f\x40\xf6\xd3\x9f\x84\x2c\xff\xcd\xbf\xb1\x78\x33\
-\x8d\x8c\x3e\x40\xe3\xc2\xb3\x10\x47\xd7\xca\xe2\xf0\x38\x38\x9e\
-\xda\x1f\x4a\x39\x39\x74\xa8\xe5\x86\x0c\xd3\xc2\x63\xc0\xce\xd6\
-\x16\xb4\xed\x07\x36\xd6\xef\xcb\xd1\xc1\x41\x54\x14\x1a\xae\xc5\
-\x6e\xd1\xdd\xc6\x3d\xc9\xcb\x00\x5b\xb1\xdf\xda\x83\x07\x0f\x60\
-\xff\xfe\xfd\xe0\xeb\xeb\x2b\x8a\xf0\xf2\x6e\x38\xc5\xcf\x04\x4f\
-\x2b\xeb\x2a\xd4\x3e\x02\xe2\xff\x47\xc1\xfb\x1b\x7d\xad\x8c\x4d\
-\x2e\x22\x2e\xd4\x26\x78\xb4\xaa\x99\x1b\xd9\x03\x8e\xf5\xc1\x5c\
-\xc8\x55\xe6\x83\x1a\x14\xb5\x8f\x02\x5b\xc4\x81\x93\x27\x4f\x36\
-\x99\xec\xbf\xfe\xfa\x6b\x70\x76\x72\x12\xa5\x07\x04\x8b\xb4\x8d\
-\x43\x6a\xed\x16\x15\x5c\x39\xc1\xcd\x82\x8c\xa0\x60\x68\xe5\xea\
-\x26\x72\xb2\xb3\x17\x05\xb9\x7b\x8a\x26\x87\x77\x26\xb9\x92\x11\
-\xd0\xe6\x05\xd2\x8f\x25\xc4\xff\xcf\xe2\x6a\x68\x68\x38\xd2\xda\
-\xd8\xf4\x8a\xb1\x21\xa3\x2e\xc4\xc1\xf5\xd9\xd0\xe0\x48\xd1\x9a\
-\x18\x16\x9c\x66\x0d\x84\x52\x76\xae\x46\xcc\x8b\xea\x49\x8e\x05\
-\x63\xc6\x8c\x69\xc0\xfa\xb4\xb1\x05\xdb\x7a\x68\x4e\x8e\x63\x80\
-\x44\xa3\x43\xa3\x75\x1a\x87\xf4\xb5\x5b\x54\xf1\xa5\x38\xa2\x9b\
-\xc8\x8c\x61\x84\xcf\x38\x77\x24\xfe\x2b\xf8\x6c\x0d\x81\x39\xc3\
-\x78\x83\x85\xb1\xc9\x7d\x13\x43\xc6\x0b\x7f\x5b\xc7\xa7\x89\x9e\
-\x7e\x35\xf9\x41\x9d\xe0\x93\x04\x21\x94\xb2\xf2\x64\x60\x53\xd8\
-\x97\x9c\x09\x81\x2e\x6e\x0d\x0e\xf6\x0e\xb0\x7e\xfd\x7a\x91\xbe\
-\xeb\xfb\x78\x3e\x19\x12\x12\x22\xf2\x70\x70\x6c\x58\x1d\xd3\x47\
-\x4e\xc7\x68\x1f\x87\xf4\xb1\x5b\x14\xb9\x32\x2b\x32\x46\x84\xf4\
-\x1f\x9e\xef\xb7\xfb\x4f\xf4\x2a\x8b\x1d\x41\x9d\x89\x54\x60\x64\
-\x68\xb8\x14\xf5\x93\xea\x99\x9d\x12\x44\xa5\xa9\xf9\x48\xfe\x8a\
-\xc8\x83\x0f\xa2\x7b\xa1\xb9\x81\x73\x03\x1e\x13\x0a\x07\x0f\xae\
-\x3f\x7b\xf6\x2c\xa8\xf2\xfb\xc1\xfb\xc5\x78\xbd\x68\xf2\xe4\xc9\
-\x22\xec\xe3\xef\x62\xef\xd0\x50\xd4\x2e\x52\x59\xbf\xe8\x31\x16\
-\x61\xae\x94\xea\xc1\x95\xbc\x36\x61\x2f\x51\x7d\xb0\xbd\x17\xf2\
-\x9f\x98\x75\x2e\x61\xa8\xcd\xfe\x48\xf3\x6d\x57\x57\xd2\x07\xc9\
-\x3c\x75\x90\x02\xf2\x49\x6c\x8e\xe5\x43\x0f\xaf\xd6\xe0\xe5\xe4\
-\xd2\x80\xd7\xed\x71\x7c\xaf\x9b\x9b\x1b\xe9\x3f\x82\xb9\x61\x66\
-\x66\x26\x72\x47\x73\xc8\xae\x1e\x2d\x61\x51\x74\x32\x5d\xa7\x28\
-\xe8\x16\x6d\xe3\x8f\xbe\x5c\xd9\xd6\x83\x07\x61\x8e\xae\xd5\xe6\
-\xc6\xc6\xdf\xe3\xb1\xef\x3f\x91\xea\x5d\x1c\xcc\x8d\x8c\xcb\xdb\
-\x3b\xb8\x55\x9f\xe8\x8d\xe4\xd3\xa7\x40\x01\x83\x94\x70\x20\xa9\
-\x1f\xec\x48\xc8\x80\x9d\x08\x5f\xf4\x1a\xa0\xc4\x17\x25\xa8\xd0\
-\x2d\x1a\xc1\xd6\xce\x97\x4d\x71\x5c\xe8\xe3\x13\x50\x87\xf4\x7d\
-\x15\xd2\x65\xe3\x08\xea\x4c\xf2\xff\x4a\x23\xb7\x1d\x2d\x8d\x98\
-\x67\xa7\x84\xc6\x43\x69\xca\x60\x15\x28\x90\xa1\x8f\x26\x28\x73\
-\x45\x59\xa7\xe8\xcb\x15\x8a\x2f\xab\xbb\xb1\x60\x4a\x87\x18\x10\
-\xfa\x06\xbf\xf4\xb2\xb4\x79\x86\xf4\xd6\x5f\x26\x86\xe4\x79\xb7\
-\xce\xff\x89\xaf\x49\xca\xd0\xde\x9e\x81\xcf\xcf\xf4\x2e\x04\x65\
-\x0c\xa6\x90\x42\xa1\x54\x23\x74\xe5\x8a\xee\x7c\x19\xd6\x36\xaa\
-\x1e\xc9\xfb\xa9\xb5\x09\xf3\x30\xea\xeb\xd3\xd1\xbb\x76\x21\xde\
-\x42\xbf\xee\x77\xbc\xc4\xfb\xdb\x38\x3d\x3d\xd3\x6b\x08\xa8\x84\
-\x4a\x5e\xa8\x83\x8c\x2b\x67\x74\xe5\x8a\x1a\xbe\x8c\x6d\xdf\xad\
-\xde\x94\xb2\xeb\x5a\xfe\x27\xa2\x66\x2d\x6e\xe6\x46\x26\xcf\xcf\
-\x24\x0f\x05\x25\xf4\x92\x60\x88\x8e\xd0\x93\x2b\x6a\x74\xcb\x98\
-\xe0\xae\x0d\x66\x0c\x63\x2c\xfb\x16\xff\x89\xa7\xf9\x8b\xb1\x21\
-\xa3\xf6\x60\x7c\x1e\x9c\x49\x1a\x26\x43\xb2\x22\x86\x6a\x87\x5e\
-\x5c\x51\xd6\x2d\x25\x08\xfd\x5b\x77\x7c\x81\xe7\x26\xc4\xbb\xbf\
-\x77\xfb\xce\x14\x2b\x63\xe6\x8d\x15\x11\x02\x38\x93\x38\x5c\x86\
-\x24\x45\x0c\xd3\x8c\x46\x71\x45\xc6\x97\x13\x49\x05\x10\xe7\xe6\
-\xf7\x1c\xe9\x22\x9c\xd3\xd8\xe5\x3f\xa9\xbc\x41\xf9\x1b\x31\xf7\
-\x4c\x68\x93\x00\x67\x7a\x16\x51\x48\x54\x87\xe1\xaa\x91\xa4\x27\
-\x5f\x14\xb8\xb2\x3b\xb6\x3f\xb4\xb6\x76\xaa\x46\xb2\x3f\x48\xbc\
-\xfb\xe7\x80\xbe\x73\xc5\x90\x20\x26\x09\x7c\xc2\x5e\x96\xf4\x18\
-\x01\x25\x3d\xe9\x38\xa3\x84\x22\x3a\x12\x5f\x8f\x2f\xc5\xa1\xc9\
-\x22\x6c\x7f\x98\x1a\x19\x61\xfb\xde\xe0\x3f\x69\xfc\x23\x85\x1d\
-\x66\xe7\x55\x51\xd2\x63\x24\xe8\x86\x11\xd0\x28\xae\xc8\xf1\xe5\
-\x70\xfc\x60\xe8\xe9\x1e\x50\x6b\xc6\x30\xf9\x0d\x3d\x3f\xfc\x3f\
-\x11\xfc\xa3\xc5\xdf\xde\xc4\xa2\xb2\x24\x61\x14\xe8\x86\x91\x14\
-\xf4\xe1\x8a\x98\x2f\xa7\x11\x26\xb4\xe9\x21\xb2\x30\x62\xd6\x98\
-\x33\x4c\xb0\x7f\xb6\xe5\x7f\xcd\xff\x8f\x17\x23\x86\x81\xe1\xcb\
-\x63\xb1\x45\x50\x12\x3f\x5a\x37\xe8\xcc\x95\x51\x52\xae\x2c\xeb\
-\x24\x00\x3f\x2b\xa7\x2a\x0b\x23\x13\x7c\x5e\x6f\xc7\xff\x9a\xfd\
-\xed\x29\x96\xc6\xcc\x07\x1f\x47\x0c\x80\x92\xb8\x31\xda\x11\x2f\
-\x81\x6e\x5c\x59\xda\x41\x08\x6d\x6c\xdc\x90\xdc\x99\x7f\x30\x18\
-\x8c\xfe\xff\x8d\xf3\x6f\x5f\xb1\x36\x36\x3f\x31\xa3\x6d\x2a\x94\
-\xc4\x8e\x43\x18\xab\x1e\x71\x8a\x50\xcd\x91\xa3\xdd\x47\xc0\xb8\
-\xc0\x44\x51\x0b\x0b\x87\x4a\xa4\xe7\x7f\x13\xfb\x63\x1a\xfd\xd7\
-\xd2\x6f\xe9\x00\x60\x68\xf8\xfe\x00\x9f\xce\x0d\x25\x31\xe3\x81\
-\xc2\x38\x65\xc4\xaa\x82\x8c\x1b\x27\x63\x46\xc3\xc2\xf6\x7c\x48\
-\x74\x6d\xfb\xdc\x94\x61\x5c\x6b\x69\x64\x7a\x9a\xa0\xce\xec\x37\
-\xfc\xaf\x85\xdf\xfa\x92\xdd\xd5\xa1\x75\xe5\xe9\xee\x13\x80\xc2\
-\x78\x3a\x62\x54\x63\x5b\x44\x3e\x8c\xf5\x4f\x84\x2e\x8e\xad\xab\
-\xcc\x90\xcc\xad\x8c\x99\xdf\x1b\x52\x39\x69\x3d\xff\x6b\xd2\x77\
-\xaa\x74\x70\x65\xda\x3c\x3b\xd5\x6d\x22\x9c\x96\x62\x02\x89\xcf\
-\xa2\x8b\x60\x53\xa7\x3c\xf8\x30\x24\x0b\x46\xb7\x4e\x84\xde\xae\
-\xed\x6b\x5b\x59\x3a\x3d\x35\x31\x34\x7a\x81\x64\xfe\xc4\xd2\x88\
-\xf9\x19\x41\xe9\xf7\xff\x64\xfe\x0e\x2f\x03\x21\x7d\x7d\x01\xcd\
-\x03\x5e\x31\x0d\x8d\xeb\x4c\x11\xf0\xd5\x80\x30\x10\x21\x39\x57\
-\x5b\x30\x98\xbf\x5b\x19\x9b\x7d\x6b\xc1\x30\xfd\x04\x7d\xb6\x08\
-\x21\x96\xa0\xfc\xca\xfe\x2b\xff\xae\xc2\x14\xcb\x55\x82\xff\x77\
-\x36\x9b\xd8\xbd\x11\xfd\x4f\x31\x31\x43\xea\xed\x58\x4a\x35\x8e\
-\xd4\xd1\x99\xfe\x61\xa8\x10\xdf\xc7\xd0\x3e\x4e\x10\x36\xd2\x5f\
-\xa3\x0a\x83\xba\xad\x97\xdc\x1b\xd0\xbf\x4e\x88\x9f\x58\x2a\xbd\
-\xa7\x7e\xb0\x58\x7a\xef\x23\xff\x74\xc9\x03\xea\xe5\xc4\x47\xa6\
-\x62\x90\xdd\x33\xe8\x3f\x4f\x3d\xb0\x54\xa1\xba\xc5\x0a\xf7\xf2\
-\xcd\x31\x83\xf6\x38\xe5\xfb\x18\xea\xf1\x06\x72\x2f\x88\x1f\x6f\
-\x22\x77\x8f\x1f\xef\x2d\x77\x7f\x1f\x5d\xa6\xca\x55\x00\xdd\x1b\
-\xd4\xcb\xdd\xa3\xd7\x63\xc8\xdf\xa3\xd7\xb3\xa9\x93\xab\xa0\xe2\
-\x3d\xfe\x55\xb9\x7b\xfc\x7a\x31\x15\xf4\xfb\x19\x72\xf7\xf8\xa7\
-\x67\xdc\xa7\xdf\x83\xdc\x7d\x9d\xf2\xbd\x81\xac\xc9\xc4\xf7\xc5\
-\xb2\xfb\x0a\x55\xf7\x84\xfa\x7b\x5c\x5d\x91\xc2\x7d\xbd\x9c\x40\
-\xf1\x7d\x9d\xdc\x3d\x7a\xb4\x41\x05\xfd\x9e\x28\x56\xb8\x97\x99\
-\xd8\x3e\xaa\xef\x19\x32\x79\x29\xde\x93\xbf\xc5\x2c\x96\xca\x97\
-\xba\x2f\xa5\xdf\xdb\x94\x4a\xf9\x41\xde\xbb\xca\xf8\x44\xde\xb7\
-\x90\xf1\x8d\xbc\x2f\xa6\x89\x4b\xf6\x3a\xe2\x7b\x23\xba\x78\x09\
-\x53\x39\x3a\xe1\x7b\x5b\xc2\xa7\x58\x42\xb7\x62\xf2\xe7\x67\x94\
-\x4a\xe8\x49\xde\x1b\x50\xa4\x66\xc8\xee\xeb\x24\xf4\x17\xdf\x8b\
-\x24\xdd\xa5\x94\xfc\x3e\xf5\xf7\x19\xe2\x7b\x5b\xaa\x5e\x0c\x90\
-\xdd\xd7\x13\x72\xff\x6e\x2a\x66\x10\x43\x76\x5f\x2c\xa1\x6f\x29\
-\xf9\xfe\xde\xd2\xfa\x97\xca\xd3\x9d\xa0\xe8\x6d\xa8\x70\xcf\x50\
-\xb8\x37\x28\x96\xd5\xbf\x42\xd6\x5e\x06\xf4\xde\x1a\x43\x57\x0e\
-\x62\x65\x52\x47\xef\xdc\xf2\xbd\x9d\xfc\x86\xfc\x3d\x83\xae\x1d\
-\x54\xde\xcb\x77\x67\x03\x15\xf7\xa0\x78\x5f\xac\xe5\xbe\x54\xe1\
-\xfe\xbe\x82\x7a\x51\xbc\xaf\xa0\xab\x17\xa5\x0a\xd5\x6b\xb9\x97\
-\x7f\x61\x1f\x85\x17\xf6\x51\x78\x41\x1f\x85\x17\xf4\x51\x78\x21\
-\x1f\x85\x16\xf5\x51\xd0\xaf\x8a\xfa\xd7\x47\x95\x7e\x56\xd2\xdf\
-\x8a\x22\xad\x57\xb8\x07\x05\xfd\x2f\xfb\x01\x50\x90\x39\xd0\x07\
-\x14\x03\x85\x01\x88\x01\xf4\x0f\x48\x07\x2c\xf1\x2b\xda\x28\x0c\
-\x68\x31\xd2\xfb\xfb\xb4\x9f\x17\xdf\xdb\x28\xdc\xfb\xc8\x1d\xed\
-\x4f\xff\x3a\x75\x3f\x43\xe1\x1e\xe8\xf7\x06\x0a\xf7\x4c\x85\x7b\
-\x1b\x85\xfb\x18\xf9\xf4\x42\xf4\x9f\xa7\xb4\x30\xfd\x9e\xa9\x70\
-\x1f\x43\xbf\x37\xa0\xa7\x2b\x92\xaf\x0c\x96\xa9\xe4\xe1\x81\x62\
-\x6d\x16\x4b\x8e\x6a\x2d\x9a\xc4\xa6\x68\xd7\x82\x08\xcc\x65\x19\
-\x16\x17\x0f\x32\xdc\x3a\x7f\x98\xc1\xa9\x85\x45\x06\xd7\xc5\x38\
-\x33\xae\x38\xfa\x48\xd6\xde\x5d\x25\xbc\x73\xb7\xbf\xe1\x1f\xb8\
-\xfc\x80\xb7\xbb\xe4\x89\xe0\xf4\x8d\x9f\x84\xb7\x5e\x6e\x4d\xbb\
-\x03\x99\xbd\x6e\x41\xa3\xcf\x31\x4c\x8e\x30\x4a\x9a\x36\x90\x71\
-\x70\xdf\x7c\xa3\xca\xeb\x5b\x8c\xe1\xfa\x16\x23\x0a\x5b\x8d\xe0\
-\xec\x2e\x4f\x98\x7a\x7e\x17\xf0\xd6\x7c\x0a\xec\xa2\x71\xc0\xea\
-\x97\x03\xac\xa1\xa3\x81\x35\x72\x22\xb0\x72\x0b\x21\x75\x40\x1e\
-\x70\x8a\x17\x03\xff\xf8\xb7\x7f\x0a\xef\x42\x3f\x7d\x9e\xdb\xca\
-\x8e\xb0\x19\xc6\x35\xde\x7c\x6c\x09\xb3\xee\xfa\x46\x53\x90\x62\
-\x13\x93\xc4\x17\x7b\xa2\xa1\xef\xd1\xf3\xc0\x2a\x1c\x09\xec\xb1\
-\x53\x81\xf7\x69\x09\x08\x7e\x7a\x01\xc2\x3b\x20\x85\xe0\xc2\x2f\
-\xc0\x59\xba\x11\x58\xe8\x3d\xb8\x8b\xd6\xa1\x7f\x7f\xb9\xb1\x18\
-\x40\xeb\x5a\x52\xd7\x40\xa6\xff\xdc\x02\xb3\xab\xd7\xd6\x5b\x80\
-\x14\x1f\x63\x98\x93\x38\xfd\x49\x1b\xc8\x3a\x7a\x01\xd8\x03\xf2\
-\x81\xbb\x72\x27\x08\x7f\xac\x05\xde\xd6\x23\xc0\x45\x10\xde\xa8\
-\xa3\xbd\x03\xf9\x1e\x17\x7f\x01\xd6\xf0\x71\xc0\x2e\xfe\x00\xdd\
-\x37\x7c\xa0\xe9\xd9\xe1\xfe\xa6\xad\x96\x17\x59\x7c\x7f\x6d\x8d\
-\x0d\x5c\x5b\x63\x0d\xd7\xd6\xca\x70\x66\xa9\xe5\xab\x39\x79\x66\
-\xe7\xd2\x4b\xbf\xb9\x89\xeb\xcd\xfd\x68\x1b\x08\x6f\x8b\x80\x3d\
-\x6a\x12\xb0\x87\x8d\x21\xdb\x9e\x3d\x64\x24\x08\xbf\xab\x54\x7e\
-\x87\xeb\x8f\x81\x3d\x68\x28\xf0\x36\x1d\x10\x09\x6f\x41\xb4\xaa\
-\x67\xbb\xbb\x13\xe6\xd3\xfb\x5a\x9e\xbd\xba\xd2\x1e\xae\xae\xb2\
-\xa3\x61\x41\x81\xc5\x97\x29\x91\x26\x19\xe9\xf7\x21\x88\xf7\xf1\
-\x67\xa8\x3e\x63\x41\x78\xab\x81\xfc\xdd\x54\x16\x8b\xaa\xf7\xad\
-\x7a\xe0\x4c\x9b\x0f\x9c\xa9\xef\x93\xff\xaf\xf8\x0e\xfc\x1d\x27\
-\x80\x9d\x3f\x14\x84\x37\xeb\x3f\x53\xf5\xfc\x9c\x44\x8b\x25\x57\
-\x96\x39\xc3\xd5\xe5\x4e\x14\x3e\xc2\x70\x84\xf7\x32\x2c\x4e\xf9\
-\xd9\x53\xf9\x9e\xf9\xa7\xaf\xaf\xe3\x4c\x9a\x05\xbc\x55\x3b\xa9\
-\xdf\xbd\xf9\x0a\x52\xb3\xfb\x03\x6f\xcb\x17\xd4\x33\x4a\x6f\x01\
-\x67\xce\x32\xe0\x2e\xdf\x0a\xc2\x1f\x6a\xe8\xef\x80\xde\x89\x95\
-\x53\x00\xfc\xfd\x17\x5f\x0a\x7f\x00\x5a\x7c\x77\xd7\x76\xe6\x1d\
-\x3f\x9d\xe0\xfc\xe4\xca\x12\x37\xb8\xb2\x54\x02\x57\xd8\x36\xde\
-\xf1\xcf\x8e\x7e\x4c\x5f\xf1\xc7\x4c\x0a\x0e\xed\xff\x8b\x5d\x38\
-\x02\x78\x7b\xca\x64\x6d\x7b\xfa\x06\xb0\x84\xe9\xc0\xdb\x7e\x0c\
-\xd8\x53\xe6\x01\x67\xfe\x6a\x92\x93\xf8\x73\x8a\xb2\x60\x8f\x9f\
-\x01\xdc\x0d\x9f\x43\xc6\x3d\xa0\x29\x86\x51\xa9\xb6\xeb\xaf\x2c\
-\xf2\x86\x2b\x8b\xbc\x28\x2c\xc6\xf0\x84\x19\x19\x76\x07\x24\x9f\
-\x11\x74\xb1\x18\x37\xf4\x8b\x7d\xd5\xec\x82\xe1\xc0\xdb\x7b\x96\
-\xde\xb6\xa7\x7e\x24\xdf\x01\xb7\x3d\x6b\xe0\x20\xe0\xed\x2e\x25\
-\x65\x41\xbe\xc3\xf7\xd5\xb2\xe7\x4f\x28\x06\xee\xba\xbd\x88\x37\
-\xe0\x27\xf7\x78\x93\xe5\xb9\xae\xb7\x2e\xbf\xdf\x12\x2e\xcf\x97\
-\xa0\x05\x5c\x5e\xd0\x02\x26\x72\xec\x3f\xc6\x1f\xe8\xd6\xd6\xb2\
-\xcd\xfa\x61\xae\x77\x07\xed\xda\xfa\x03\x67\x02\xaa\xc3\xda\xdd\
-\xca\x1c\xbb\xf2\x10\xb8\xab\x3f\x05\xde\xce\x53\x24\x2f\x49\x3e\
-\xe0\xcf\xa2\x3e\x48\x7e\x06\xfd\x8d\x85\xe4\xcf\xdf\x73\xb6\x61\
-\xe0\x3d\x90\x5a\x6c\xb1\xc1\x96\xe9\xe7\x8a\x5b\xc3\xe5\x39\x62\
-\xcc\xc5\xf0\x23\x31\x33\xcd\xf5\x5c\x52\xa8\x79\xfe\x87\x03\xdc\
-\xbf\xb9\x3c\xcf\x17\x0a\x26\x0f\xd8\xc9\x5b\xbd\x0b\xd8\x63\xa6\
-\x50\xcf\x50\xe4\x58\xd9\x6d\x4a\x16\xdb\x8e\x92\xf7\xdc\x8f\xb6\
-\x03\x67\xfa\x42\xf2\xff\x79\xfb\xca\x51\xdb\xe4\x83\xf0\xa7\x17\
-\xc7\xe5\xdb\x3e\xb7\xbb\x63\xf1\xa5\x99\x41\x20\x43\x20\x5c\x9a\
-\x25\x41\x00\x5c\x9a\x4d\xe1\xe8\x24\xdf\x17\x09\x6d\x2d\x92\x91\
-\x4c\x2f\xb2\xf2\x0a\x81\xb7\xf1\x80\xd2\xf3\xa5\xb2\x48\xcf\x24\
-\xdb\x3e\x95\x2f\x44\xfa\xef\x3b\x10\xfc\xf8\x9c\xec\x9f\x9c\x15\
-\x9f\x40\xda\x3d\x48\xa2\xc9\x3e\xd1\x7d\xf9\xa5\x69\xed\xe0\xd2\
-\x74\x09\x82\x29\xcc\xc0\x68\x4b\xe2\xc8\xb8\x80\x17\x79\x31\xce\
-\xeb\xa2\xfc\xac\x52\x07\x8c\xc8\x5a\x8d\xe4\x5f\x9f\x8a\xf4\x2d\
-\x77\xdb\x31\x95\xef\x20\xf8\xfa\x29\xf0\xf6\x5f\x00\xc1\xd5\x47\
-\x20\xf8\xe6\x29\xe2\xdd\x74\x52\xf6\x69\x3f\xbd\xdc\xae\xd8\xef\
-\xc6\x27\x7b\xae\xbd\x38\x39\x0c\x28\x84\xc2\xc5\x29\x12\x84\xc0\
-\xc5\xa9\x21\xb0\x31\xa7\xf5\xff\xba\xb7\xb6\xfe\x70\x36\xd7\xeb\
-\xe2\x99\x49\xc1\xa2\xdd\x43\x03\xaa\x26\xcd\x1c\xfc\x93\x60\x5f\
-\x99\x88\x9d\x3b\x18\x38\x33\x90\x8e\x3f\xf5\x83\xf2\x3b\x60\xbd\
-\xf8\xf1\x7e\x52\xe6\x9c\x19\x8b\x40\xf0\x5d\xd5\x71\xc5\x7e\x87\
-\xcb\xe8\x78\xaf\x8f\x2e\x4e\x0c\x87\x8b\x13\x3b\xc9\x30\xa9\xa3\
-\x14\x31\x01\xb6\xb3\xd6\xf5\x0b\xf8\xfd\xe2\x7b\x1d\x60\x5c\xa2\
-\xd7\xc9\x10\x57\xcb\xb6\xf8\x7b\xbd\x8a\x67\x0b\x32\x8f\x5f\xfb\
-\x8b\x83\x74\x3b\x2b\xb7\x00\x58\x83\x86\x91\x75\xe4\x4c\x45\xbc\
-\x1f\x3d\x19\x52\xfb\x0d\xa4\xc6\x86\x5d\xa7\x6b\xd3\xee\xc2\x64\
-\x75\xba\x3f\x37\xca\x73\xc6\x85\xb1\xd1\x70\x61\x5c\x94\x1c\x22\
-\xe1\xc2\x78\x0a\x7d\x23\x5d\x17\x2d\xe2\xb7\xfe\xe1\xe2\x84\x08\
-\x98\xc7\xf1\xbb\xee\x49\xf7\x31\x33\x66\xcf\x9a\xb7\x68\xe0\xfe\
-\x63\xf7\x32\x77\x9f\x68\xe0\x6f\xfd\xa2\x81\xbb\xf9\xb0\x08\x8d\
-\x07\x75\xfc\x93\xdf\xdf\x4c\x2d\xbb\xf7\x7e\xe6\xcf\xa0\x31\xa6\
-\xb8\x67\xa0\xd3\xc0\xf2\x91\x5d\xe1\xc2\x28\x31\x46\x77\x91\x61\
-\x4c\x67\x58\xc6\x6f\x7b\x27\x29\xc8\x79\xc2\x99\x91\x91\xa2\xf2\
-\x31\xd1\x30\x30\xca\xe3\x83\x50\x2f\xeb\xf0\x21\xdd\xbc\x97\x2f\
-\xe6\x05\xfe\x5c\x36\x3a\x5c\xfa\xae\x17\xc6\x47\x90\xc0\xef\x7a\
-\x71\x42\x38\xec\x2d\x68\xff\x62\x31\xbf\xf5\x8d\xe2\x94\x96\x9f\
-\x0f\x8b\xf1\x5c\xd8\x3b\xd8\xb1\x8f\xe2\xf3\x3d\xac\xac\x1c\x36\
-\xa4\x75\x7c\x4a\xcb\xcb\x2d\x9f\x9f\x7d\x64\x77\xc8\xea\xe0\xb5\
-\x64\x74\xf7\x56\x5f\x5c\x18\xd9\x0d\x3e\xcf\x0b\xaf\xde\x9f\xd7\
-\xa9\x8e\x7a\x57\xd9\xfb\x96\x8f\xee\x0c\xdb\xfa\x87\xd5\x2e\x13\
-\xb4\xfd\x63\x09\x37\xe8\xa7\x79\xec\x80\xcb\xb3\x52\x5a\x9f\x98\
-\x92\xe4\xb7\x77\x7c\x8f\x16\x1b\x8a\x62\x7c\x3e\xe0\x86\xba\x0c\
-\x52\xd5\x06\x93\xe3\xda\x7c\x2e\xcb\xc9\xa6\x9c\xf7\xf3\x68\x7e\
-\xd7\x97\x2b\xb8\xa1\xbf\x49\xf3\xbb\xaa\x78\xd7\x75\x69\xa1\xbf\
-\x27\x05\xb8\xcc\x4f\x09\x76\x1d\xd2\xd1\xdb\x46\xe8\x67\x63\x8e\
-\xf3\x79\x39\xeb\xb2\x7f\x94\xd4\xda\x93\x7f\x64\x40\xc2\x4b\x69\
-\xbe\x20\xf9\xfc\x51\xe2\x1c\x51\xb2\xbc\x61\x3d\xe0\x60\x4e\x9c\
-\x68\x76\x51\xfe\x83\x8f\x57\x2e\xbf\xb7\x71\xf5\xf2\x9b\xb3\x47\
-\xe4\xdf\x3f\x9c\xdb\x4d\x24\x9f\x53\xf2\x50\x6e\x17\xd8\x9a\x19\
-\x5e\xfb\x21\xa7\xfd\x1f\x99\xa1\xde\xa3\xb4\xbd\xc3\xd8\xce\xc1\
-\x87\x64\xf9\x0a\x54\xe4\xad\x10\xe7\x29\xd9\xd3\xb7\x67\xfd\xa7\
-\x3b\x3e\xf9\x43\x31\x9e\x76\xc7\xd6\xcd\x0f\x77\xf6\x8d\x7b\x29\
-\x7d\x57\xb9\xf7\x1d\x1e\xed\xbf\x44\xdb\xf3\xa3\xdc\xdc\x82\x56\
-\xf7\x8a\xb9\x4f\x3b\x1f\x59\xfe\xac\x6c\xf1\xd9\xe9\x0b\x27\x4f\
-\xb8\xaf\x2e\x86\x7b\xd1\xb4\xf7\xee\x2b\xe7\x5c\x49\x86\xa9\xb1\
-\xed\x4a\x75\x59\x0b\x4c\xf1\xf7\xcd\xd8\xc5\x4e\xae\x90\x9d\xe7\
-\x29\x39\xd7\x55\x76\xfe\xfc\xa1\x03\x07\xfe\xc4\xb1\xe5\xab\x16\
-\xce\x7f\xb8\x74\xfa\xd4\x5f\xff\xfe\xfb\x6f\x69\xa0\xf9\xc1\xcf\
-\x3f\x7f\x58\x3a\x20\x95\x7e\xd6\x7b\x6e\x2a\x9c\x19\x98\x02\xac\
-\x00\xaf\x42\x5d\x6c\xcf\x14\x5f\xdf\x8c\x4d\x49\x49\x7f\x48\xcf\
-\x0e\x93\x3b\x4b\xae\x24\x43\x00\x27\x4f\x9c\x78\xf6\xc5\xc1\x83\
-\x7f\x9f\xc9\xa2\xce\x92\xdc\xb2\x6e\xad\xf4\x40\xb3\x73\xe7\xce\
-\x55\x1d\x49\x4f\xa5\xe5\x50\xd8\x9b\xd6\xe7\xd5\xd6\xb4\x3e\x75\
-\xa3\x22\x43\xd6\xe8\x6a\xff\x26\xf9\xf8\xc4\xcd\x8a\xee\xfe\x65\
-\xa9\xfc\xf9\x36\xe2\x33\x6c\xb6\xac\x5b\xf7\xcb\x9d\x3b\x77\x6a\
-\xe6\xb1\x39\xcf\x97\xf7\x4a\x79\x79\xfe\xdc\xb9\xbf\x25\xcf\xdf\
-\xbe\x71\xe3\x6f\xd2\x73\xef\xc4\x67\x20\xce\xca\xcf\xfb\x6d\xed\
-\x92\x25\xf7\x47\x75\x0a\x5b\xa3\x8f\x0d\xee\x4e\x10\xe6\x99\xfe\
-\x6d\x67\x2e\x88\x4e\xf8\xe9\x14\xa7\xaf\x34\x6e\x7e\x1e\x37\xed\
-\xc9\xc3\x87\x0f\x5f\xe0\x73\x1e\x9e\x3c\x79\x22\x3d\xff\xe9\xd1\
-\xa3\x47\x2f\x66\xf3\x84\x8f\x65\xef\x4b\x9d\xb7\xf3\xd1\xd2\xa5\
-\x7f\x4e\x1b\x36\xfc\x97\x78\x1f\x1f\x6e\x23\xa7\x21\xc6\x49\xde\
-\xfe\xfd\x47\xb6\xef\xbc\x6e\x66\x78\xc2\xc5\xcf\x7b\x65\xa2\xe7\
-\x64\xfd\x71\x60\xdf\x67\x0f\x71\xde\x41\x8c\xa3\x47\x8e\xfc\x35\
-\x53\x98\xfd\x48\x7a\x06\x80\x38\xce\xbf\x14\xbd\xef\xca\x44\x56\
-\x43\xdf\xa0\xf6\x1f\x37\xd5\xfa\x6e\x92\xa7\xff\xf0\xc3\x49\x03\
-\x1b\x8e\x24\xe7\xc0\xb4\x6e\x7d\xaa\x26\x77\x4b\xa9\x3a\x9c\x3c\
-\x40\x21\x16\x31\x0f\xf6\x26\x66\xd4\xcc\x0c\x8f\x2b\xe7\xb4\x0a\
-\x1a\xd9\xc4\x4b\xcc\x26\x4b\xc2\xd9\x0f\x65\xbe\xf0\xca\x31\x11\
-\xdb\x62\x32\x2a\xfa\xf8\x04\x0e\x6f\xae\x35\xee\xe2\x90\x3e\x97\
-\x25\x3e\x79\x52\x5f\x4d\xb1\x6f\xe6\xfb\x1d\x52\x7f\x48\xf6\x0c\
-\xe6\x12\xcd\x58\x26\x06\x26\xed\x95\xf7\x1f\x39\x11\x3b\x12\x16\
-\x84\xf0\xee\x0c\x68\x19\xb5\xd8\xdb\xc6\xa6\xd9\xf7\x95\x32\xbc\
-\x22\x87\xcd\x0e\xe2\x1f\x1f\xef\x9f\xbc\xa3\xa0\x65\xec\xe2\x58\
-\xe7\x36\xf8\xac\x48\xbd\x7c\xcf\xe1\x3e\xe1\x03\xc5\x84\x8d\x88\
-\x5a\xad\x66\xd4\x51\xcb\xb4\x06\x15\xc8\x32\xbe\x6f\x8b\x10\x4a\
-\x10\xa5\x68\x96\x80\x97\x6f\xc5\x60\x90\x30\x20\x98\xa5\x06\xc5\
-\x3e\x92\xfb\xfb\x04\xe1\x83\x60\x53\x41\x81\x89\x17\x32\xd0\xef\
-\x31\x45\x78\x41\x03\xa3\x94\xb0\x81\x7a\xf4\xac\x7a\x62\x06\x88\
-\x08\x00\x91\x01\x02\x93\x5c\xa7\xb0\x15\xaf\x55\xe8\xb3\x4e\xc1\
-\x89\x25\x6c\x3f\x1a\x6f\x34\x69\xd7\x5c\xc6\xa9\xcf\x16\x1a\x7e\
-\xbb\x61\x43\xd4\x83\xbc\x8d\xab\xfe\xe6\x2d\x5a\xfd\x82\xb3\x68\
-\xed\x73\x34\x07\xf8\x29\xed\xfa\x93\x34\x55\xdf\x9d\x9e\xc3\x4c\
-\x3a\x34\xdf\xf4\xe7\x6b\x1b\xcc\xe0\x3a\xc2\xf6\xcf\x84\xc0\x9d\
-\xb7\x1c\xcd\xdf\x0e\x23\x5b\xf5\x0f\xd2\xa6\xe7\x9f\xba\x01\x9c\
-\xb9\xcb\xfe\xaf\xbd\xeb\x80\x8b\xea\xca\xfa\x43\xef\x1d\x04\x14\
-\x41\xc1\x02\x2a\x02\xa2\xd8\xc5\x82\x05\xa5\x0f\x4d\xec\xbd\xc5\
-\x16\xbb\x46\x51\x13\x8d\xb1\xc6\xde\x12\x63\x4f\x34\xf6\x1e\x15\
-\x41\xc5\x6e\x62\xea\x9a\x44\x2c\x9b\xdd\xec\x26\xfb\xed\x66\xdd\
-\x54\x8d\xe5\x7c\xf7\xdc\x99\x37\x0c\xc3\x7b\x33\xef\xcd\xbc\xa9\
-\xbc\xf3\xfb\xfd\xbf\xcd\xe7\x05\x66\xe6\xcd\xfd\xff\xef\x39\xe7\
-\x9e\x7b\x2e\xc8\x4f\x7f\x5a\x85\xb3\xaf\x15\x79\xa4\x94\xae\xf4\
-\xf9\xf9\xd6\x46\x5f\x28\x59\xe1\xfd\x78\xed\x9c\xba\x6b\xb3\x57\
-\xbc\xf3\x34\xe7\xc2\x37\x90\x89\x71\xe7\x5b\x1b\x21\xf7\xd2\x7d\
-\xa5\xef\xf9\x3b\x64\xbd\xbe\xea\x65\xee\xdd\x67\xed\xa8\xaf\xd8\
-\x5a\xe6\x7d\x64\x5e\xd0\xdd\x9b\xab\x83\xe1\xe2\xb2\xc0\xa7\x33\
-\xf2\xbd\x7b\x8e\xda\xbb\x61\x1e\xf9\x19\xfa\x9a\x59\x0b\x57\x81\
-\xfc\xd8\x4d\x1a\x3b\xca\xcf\x29\x7c\xd9\xec\x4d\x24\x96\x39\x74\
-\x85\xf6\x00\x5e\xd2\xbf\xd6\x98\x1b\x6f\x45\xc0\x8d\xa5\x11\xb0\
-\x7f\x6a\xe8\x27\x89\x89\x32\xf7\x99\x2b\xc6\xdc\xa4\xbf\x8f\xfe\
-\x2e\x89\x35\xd1\x0f\xc5\x1c\x00\xfe\x6f\xee\xb5\xbf\xd3\x38\x8b\
-\xf8\xe9\x3b\xf1\xf7\x77\x8c\xae\xb7\x47\x11\x47\x34\x82\x92\xd7\
-\xa2\xfe\xbb\x7f\x62\xbd\x6b\x5b\xa7\xc6\x1d\xcc\x5a\xbe\xf5\x29\
-\xe6\x29\x54\x7f\x83\xbc\x8f\xec\x25\x1b\x20\xf7\xec\x17\xe4\xbf\
-\x57\x42\x7e\xc5\xb3\x2e\xf8\xfb\x7b\x46\x36\xbe\x80\xbe\xf8\xf5\
-\xb9\xcd\x01\x63\x85\x1d\xc3\x1b\x7c\xb2\x24\x2f\x62\xcf\xf4\x75\
-\xf3\xef\x64\xbd\xb1\xea\xa5\xfc\xe4\x27\xaa\x78\x98\xfe\xee\x22\
-\xf2\x4c\x8f\xdf\x3a\xc0\x3c\xbb\x9d\x83\x9a\x1d\x57\xf7\x0b\xa7\
-\x76\x0f\xff\x70\xef\x88\x66\x15\xb1\xe1\x3e\x7e\x83\xb6\x6e\x1b\
-\x23\x5f\xb3\xed\xc7\xec\xe5\x5b\x9e\x67\xaf\xd8\xfa\x22\x67\xf5\
-\xf6\x7f\xe6\x5e\xff\x7e\x2c\x99\x29\xaa\x4d\x19\xe2\x5b\xad\xbf\
-\x4a\xfc\x40\xf4\xff\xd0\xef\x7b\x2b\x3d\xe6\xf0\x89\x91\xad\xfe\
-\xb1\x26\xaf\xe9\x07\xef\x0f\x69\xf1\x05\xfa\xa5\x17\x26\x26\xbd\
-\xf8\x70\x78\xfc\x7f\x76\x0c\x68\x76\x6f\x5e\x9f\xc8\x13\xc3\x3a\
-\x84\xa9\x74\x6f\x7c\x52\x93\x8e\xa5\x23\x52\x9e\x2b\x7c\x92\x14\
-\xb8\x3c\xa6\x1b\x9c\x1d\x91\xfc\xb4\x6c\x4c\x17\xd8\x33\x7d\x48\
-\xc5\xae\xe9\x83\x2b\x76\x0f\x68\xf5\xe5\xb6\x82\x84\x1d\x9b\xf3\
-\xe3\x57\xbd\xd1\xab\xe9\x20\xcd\xb9\xb3\xb1\x77\xc7\x03\x74\x4d\
-\x57\xde\xe3\x83\xfe\xd1\xa9\x3d\xdb\x3f\x67\xd6\x9f\x93\x7b\xb6\
-\x7f\x45\xfd\x37\xe2\xb7\xed\xcc\x6b\x77\x43\xf3\xf7\xfb\xc7\xc4\
-\x84\xee\xea\x93\x7a\xbd\xb2\x07\x70\x2e\x5c\x2d\x2f\xff\xd7\x9e\
-\xe9\x93\xef\x93\xb5\xeb\xa7\x07\xf7\xef\xff\x52\x36\x50\x71\x1f\
-\xc4\x89\xa2\xb4\x67\xa3\x5a\x35\xe9\x56\xcd\x37\x08\x8f\xf5\x5b\
-\xd5\xa9\xfb\xdb\x47\xd2\xf2\x7e\xc6\x7e\x52\xe7\x8e\x1d\xbf\x77\
-\xee\x83\x0f\x3e\xff\xe5\x97\x5f\xfe\x28\x3f\x7b\xf6\x2e\xed\x31\
-\x48\xfc\x86\xa5\x73\x5f\xfb\xeb\xd8\xf8\xf8\x76\x5c\x1c\xea\x18\
-\xd2\x20\x68\x4e\x7c\xe7\x41\xeb\x7b\xe4\xdf\x39\xbe\x7e\xeb\x67\
-\xa7\x36\xbc\xf3\xc9\xe1\xac\xc1\xbf\x61\x6f\x8a\x83\xa9\x05\x3f\
-\xcc\x4e\xe8\xb8\x98\x0f\x17\x97\x25\x66\xcd\x52\x9c\x89\x50\x9c\
-\x87\xd9\xdc\x2e\xff\x62\x4e\x83\xd6\xbc\xeb\x28\x5e\x6d\xd8\x23\
-\xed\xbd\x56\xc3\xee\x6c\x6a\x39\xe0\xe0\xf4\xe8\x5e\x83\x3a\xb3\
-\xf8\x68\x8f\x1d\x88\x16\xd9\x51\x1d\xa2\xbb\x0c\x2a\xd8\xa9\x81\
-\xfc\x4c\x19\xc2\x4e\xf1\xb3\x4f\xc8\x7f\xbf\x74\x21\xf0\x91\xc9\
-\xa2\x65\xca\xed\x3d\x7b\xf1\xf2\xa1\x92\x49\x66\x4e\xeb\x77\x0f\
-\xbc\x31\x87\x27\xbf\x07\x09\x79\x15\xd0\x35\xff\x3e\xa4\xe4\xde\
-\x87\xb4\xdc\x07\x90\x87\xc8\x7b\x00\x19\xf8\x6f\x08\x32\x9e\x98\
-\xf7\x08\xea\x67\x3d\x04\x5f\xe9\xc9\x49\x66\xe3\x16\x40\x80\xf9\
-\x39\xec\x17\x86\x7b\x3e\xd3\x09\x56\x11\xbc\x4f\x70\x8e\xe0\x16\
-\xc1\x27\x04\xf7\x09\xf0\x9e\xc5\x9f\x08\x7e\x47\x77\x58\x0d\x7f\
-\x2a\xff\x1d\xf1\x77\xe5\xcf\x62\x3f\xe6\x2b\x04\x78\x3f\xeb\x66\
-\x82\x85\x32\x45\x1d\x59\x9e\x4c\x71\x6f\x73\x7d\x99\x88\x75\xc2\
-\x98\x9f\x2e\x78\x00\x71\x84\xbb\x05\x84\xd7\xc5\xe4\x7f\x77\x12\
-\xff\xea\x22\xe1\xf5\x7d\xf2\xbf\x4f\xd8\x72\xae\x3c\xf1\x27\xc1\
-\x23\x82\xcb\x04\x7b\xc8\xdf\x7d\x83\xfc\x6f\x11\x6a\xc4\x80\x1f\
-\xc0\x43\x9a\x3e\x92\x59\x81\xb9\x13\x24\x10\xf4\x25\x78\x9d\x00\
-\xef\xc9\xc1\x73\xf7\x4f\x34\x78\x6c\x6a\x3c\x51\xbe\x8f\x83\x04\
-\x78\x77\xc7\x10\x02\xdc\xeb\xf4\xd6\xf5\x81\xc8\x3a\xde\x94\x70\
-\x70\x64\x7e\x05\x6c\x25\x7c\xfc\x94\xe0\x99\x01\x1c\xd7\x17\x2f\
-\x08\xbe\x22\xfe\xc3\x76\xa2\x33\xaf\xe4\x3d\x84\x78\x3e\xfb\xd5\
-\x92\x49\x66\x44\xc3\xfd\x13\x39\xa6\x40\x08\x4e\x13\x3c\x20\x78\
-\xc1\xc5\x41\x2f\x77\x19\x44\xd6\x91\x41\xab\x26\x32\xe8\xdd\x5e\
-\x06\x03\x7a\xcb\x60\x4a\x3f\x3b\x58\x34\xd6\x0e\x36\xcd\xb2\x83\
-\x3d\xaf\xdb\xc1\xfb\x8b\xec\xe0\xf8\x4a\x3b\x38\xbd\xc6\x0e\xca\
-\x36\xdb\xc1\xb5\x6d\x76\xf0\xc9\xee\x4a\xdc\xd8\xae\xf8\x77\xc4\
-\xe9\xb5\xe4\x67\x57\xd9\xc1\xe1\xe5\x32\xd8\x56\x2c\x83\x15\x93\
-\x65\x30\x6b\x88\x0c\x46\xc9\x65\x90\xdf\x5d\x06\xdd\x92\x64\x90\
-\xd0\x58\x06\xc1\xfe\x5a\x75\x01\xdf\x2f\xf6\x79\xc4\x5c\xce\x28\
-\x82\xb8\xf4\xf2\xfb\xe1\xc8\xf7\xdc\x0a\xd8\x47\x38\xf7\x83\x19\
-\xb8\xce\x17\xff\x21\x5a\x70\x84\xea\x01\x89\x21\xa4\xe9\x28\x99\
-\x91\xcd\x8b\x20\x4d\xe9\xb3\x7f\x46\xf0\x52\x93\x4f\x4e\x8e\x32\
-\x88\x22\x1c\x4f\x49\xb2\x83\x61\x99\x0a\x6e\xef\x7d\xc3\x1e\xae\
-\xbc\x6b\x4f\xf8\xcb\xc0\xce\xe4\xb8\x42\x74\x64\x2f\xd1\x96\x25\
-\xe3\x65\x30\x26\x57\x06\xa9\xed\x64\xd0\x24\x52\x06\xce\x8e\x4a\
-\x6d\x8a\x6c\x0c\x4d\xc6\xcf\x83\x94\xa3\xb7\x59\x6b\x47\xac\x04\
-\x5f\xe4\xdf\x87\xc5\x18\x9b\x48\x53\x55\x32\x91\x2c\x54\xb9\x2e\
-\x9e\x21\x78\xaa\xce\x75\x57\x67\x19\xb4\x8d\xb5\x83\x91\xd9\x76\
-\xb0\x62\x92\x1d\x1c\x59\x66\x0f\xb7\xb6\x13\x7e\xef\xd2\x03\xbb\
-\xb9\x60\x3c\x4d\xb8\xbc\x2f\x04\xd6\x9d\x9f\x0a\xc3\x6f\x7d\x6c\
-\x14\x3e\x62\x8d\x13\xd6\x40\x62\xed\x5b\xee\xd5\xef\x68\xfd\x21\
-\x22\xb7\xfc\x91\xe2\xdf\xb0\xfe\x4a\xb3\x0e\x51\x2c\x54\xc0\x5f\
-\x48\xbc\x32\x97\xfc\x77\xb8\x34\x85\x25\x13\x68\x98\x8b\x1e\x4e\
-\x50\xaa\xee\xcf\xdb\xdb\xcb\x20\xae\xa1\x1d\x8c\xc8\xb2\x83\xad\
-\x73\xec\xe1\xfa\x7b\x0e\x84\xbb\x9a\xb0\x37\x3e\x0c\xd0\x8a\x8f\
-\xc9\xcf\x1d\x3e\xde\x0d\xe6\xde\xd8\x07\x85\x15\x4f\x0d\xe3\xf7\
-\x27\xff\x06\xf9\xd9\x2f\x69\x4d\x2b\xad\x25\x9d\xbf\x5c\x51\xeb\
-\xde\x6f\x20\xa4\x67\x65\x43\x7a\x7a\x3a\x3f\x64\x66\x41\x46\xdf\
-\xfe\x90\x39\x66\x12\xdd\xab\xce\x7e\x7b\x3b\xad\xdd\x94\x9f\xfe\
-\x94\x6a\x04\xd6\x52\x1b\xf0\x3e\x9f\x13\x9c\xc8\x7f\x00\xe9\x79\
-\x00\x52\x7f\x63\xc9\xb8\x0c\x73\x49\xa9\xca\xfc\x98\x2a\x57\xe7\
-\x42\xd6\xf8\xce\x2d\xec\x60\xfe\x08\x7b\xb8\xb0\xc1\x01\x3e\xde\
-\x59\x89\x4f\xb8\xb0\x8b\x2f\xec\x4d\xa6\x17\xb7\xf6\xb8\xc2\x8e\
-\x8f\x06\xc1\xd8\x2f\xbe\xd0\x8f\x47\x77\x9f\xd0\x5a\x6d\xac\x61\
-\xcf\x9c\xb1\x80\xd6\x70\xf3\xe6\xb7\x81\xc8\x90\xe7\xd1\x9a\x65\
-\xd4\x18\xf9\x89\xdb\x55\x6a\xf6\x05\xe2\x01\xc1\x44\x69\x2f\x41\
-\x32\x35\xc3\xc3\xb6\xb3\x09\x1e\xaa\xaf\xf3\xad\x9b\xd9\xc1\x82\
-\x91\x0e\x70\x69\xb3\xe2\x3c\x97\x02\x0e\x06\xc1\x30\xbd\xd0\x8f\
-\xfb\x37\xf7\x78\xc0\xe6\xf3\x93\x61\xc8\xdd\xef\x05\xfa\xcf\x2f\
-\xe9\x59\x8d\xac\x95\xef\xd2\xf3\x53\xb8\x46\x9b\x8a\xef\x3a\x91\
-\x91\x01\x78\xce\x07\x6b\xc1\xe4\x27\x3f\xa6\x75\x5d\x82\x3e\xdb\
-\x03\xf8\x37\xc6\x06\x19\x5f\x83\x97\x34\xfd\x6b\xac\xe1\xf9\x87\
-\xbd\x32\xc5\x7e\x3a\xe5\x7d\x58\x2d\x3b\x18\x9f\x6f\x0f\x1f\xad\
-\x76\xac\x72\x96\x53\x3f\x98\x53\x2b\x1c\xe0\xd6\x6e\x57\x78\xe7\
-\xfc\x2b\x30\xf4\xee\xdf\xf9\xf3\x82\xf8\xd9\x58\xdf\x89\xe7\x41\
-\x33\xfa\x0f\xb6\x1c\xbe\xeb\x42\x7e\x21\x8d\x1b\x72\x3e\x28\x21\
-\x7e\xca\x1f\x82\x74\x20\xb7\x02\xa6\xa7\xff\x03\xdc\x25\x3a\xd4\
-\x08\xc3\x4a\xcb\x5e\x04\xe7\x19\xce\x3b\x3a\xc8\xa0\x5b\x4b\x7b\
-\xd8\x30\x8d\x70\x66\xbb\x1a\xef\xf5\x85\x19\xf4\x42\x53\x23\x0e\
-\x1d\xeb\x01\x63\xbe\xfc\x8a\x7f\x1c\x5f\xfe\x88\xae\xa5\x19\x85\
-\xfd\xac\x87\xf3\x5c\x20\xb1\x02\x9e\xa7\xc4\xbc\x84\x80\x5c\xe1\
-\xf7\xb8\xdf\x29\xd5\x13\xd8\x34\xef\xf1\xde\xea\xcf\x19\xde\x7b\
-\xb8\xc9\x60\x40\xaa\x3d\x9c\x5a\x85\xbc\x75\x12\x08\x47\x71\x20\
-\xb2\x56\x9c\x3d\xd0\x0c\xa6\x7d\x52\xc2\xdf\xbf\x3f\xfd\x29\x64\
-\xce\x5c\x48\xfd\x69\xab\xe7\x3d\x0b\xb0\xdf\x03\xf6\x1d\x60\xeb\
-\x3b\xc1\x81\x9b\x05\xf7\x41\xea\x97\x6f\x5b\x96\x4e\x70\x87\xe1\
-\x7d\xb0\xbf\x1d\x4c\x2c\x20\x71\xfd\x46\xc2\xe3\xed\x3a\xb0\x43\
-\x2c\x18\x57\x2b\x6e\xed\x72\x83\xf5\x25\xb3\xa0\xef\x3d\x1e\xf3\
-\xfc\xcb\x5f\x21\x7b\xeb\x41\xda\xf7\xc5\x16\x39\xcf\x9a\x3f\x24\
-\x7e\x4d\xd6\xea\x1d\x74\xbf\x82\x57\x9d\xe1\x03\xd8\x2c\xe5\x06\
-\xac\xde\xba\x13\x5c\x67\x78\x5f\xcb\xcf\x0e\x66\x0f\x72\x84\xeb\
-\xef\x38\x13\x6e\x6b\x83\x93\x7e\x30\x93\x56\x9c\x38\xd8\x1a\x46\
-\x7f\x71\x57\xb7\x8f\xff\xf5\x53\x05\xef\x0b\x8a\x6a\x0c\xef\xab\
-\xe9\x40\x8e\x1c\xb2\x57\xbd\x87\xbd\x56\xf8\xe8\xc0\x23\x3c\xbb\
-\x24\xd1\xc8\xea\xac\x21\xc1\x7e\x86\xf7\xbe\x9e\x32\x18\x9f\xe7\
-\x00\x57\xb7\xe8\xe2\xbd\xbe\x30\x8f\x5e\xdc\xde\xe9\x4a\xd7\x7c\
-\x9d\x7b\xf8\xf7\x5e\xd0\xfd\x79\xec\x3f\x67\x08\x77\xd2\xd2\xd2\
-\x74\x72\x0b\x7b\xa8\x61\x3c\x81\xf9\x43\xd4\x1a\xf4\xbd\x73\xf6\
-\x95\x82\xfc\xf0\x55\x1a\x6b\xc8\x4b\xee\x82\xfc\xc2\x37\xf4\xbf\
-\x73\x8e\x5c\xa3\x7d\xc2\xf0\x67\xb2\xdf\x39\x4c\xfb\x60\x65\xcd\
-\x59\xac\xea\x0b\x65\x54\x1d\x28\xe8\x4b\xdf\x9f\x66\x4f\x3c\x16\
-\xbc\x44\x5f\x40\xca\x0f\x5a\x85\xe1\x39\x96\x65\x32\x65\x8d\x9e\
-\xa7\x1b\xf2\xde\x11\xca\x37\xb9\xa8\xfa\x22\x7e\xfc\x9e\x33\x3f\
-\x6c\xb7\x6c\xad\xb8\xf8\x41\x38\xbc\x7a\xe7\xb2\xce\x35\x0c\xf7\
-\xca\x71\x9f\x4c\x74\x0e\xe5\x15\x28\x7a\xe5\x6d\xfc\x40\x51\xa3\
-\xf3\xf1\xff\x89\x5f\x33\xfc\xd9\x63\xba\x17\x81\x3d\xd2\x50\x17\
-\x32\x8a\x06\x88\xaf\x03\x44\x13\xe9\x9e\x81\xee\xf7\xfe\x99\xfc\
-\x3e\x34\x94\x28\x66\x91\x86\x39\xdb\xa1\x04\x78\xaf\x31\xd8\xd9\
-\xc9\x20\xab\x93\x03\x9c\x5b\xed\xac\xc6\x7b\x7d\x61\x4e\xbd\x60\
-\xd7\x82\x23\x87\xbb\xc2\x90\xbb\xff\xd0\xee\xeb\x7f\xfe\x33\x64\
-\x2d\x58\x21\x1e\x57\xb2\x73\x14\xeb\xfa\xce\x53\x20\x2f\x7f\x64\
-\xb6\xf3\x01\xb9\x37\xfe\x41\xf9\x8a\xf9\x7d\xec\x63\x29\x5a\x9e\
-\xf0\xd5\x39\x8a\x3a\x43\xed\xaf\xff\x33\xf1\x05\x72\x25\xba\x59\
-\x94\xe1\x3d\xe6\x25\x8c\xaf\xdf\xb4\xbe\x1d\x6c\x9f\x43\x78\xb2\
-\xcd\xa5\x12\xef\x99\x0a\xc6\xd7\x8a\x2d\x67\x27\x43\xc1\x7d\xed\
-\xb5\x2e\xf2\xa3\xd7\x15\xf5\xb7\xca\x3a\x19\xfd\xf7\xd1\x72\x69\
-\xbf\x5e\xec\x95\x6b\xb4\x1a\x7d\x43\xb4\x80\xf8\xee\x39\x47\x6f\
-\xd0\x9e\x50\x19\x85\x45\xa2\xec\x1b\x62\x9f\x6a\x1d\xda\xf6\x32\
-\xff\x01\xbc\xae\xde\xfb\x49\x32\xb3\x18\xd6\x71\xbf\x4a\xf0\x1b\
-\xf2\x3e\xd0\xc7\x0e\x16\x8d\x22\x31\xf1\xbb\x6a\xbd\xd0\x75\xc2\
-\x85\x1d\x96\xa4\x17\x4a\xde\xdf\xde\xe1\x06\x4b\x2e\xaf\x33\xc9\
-\x9a\x4f\xf7\xcc\xf6\x9c\xa5\x67\x77\xac\xe6\xdc\xdf\xbd\xe7\xb4\
-\x9f\x33\xed\x6b\x2c\x86\x2f\x70\xf3\x07\x5d\xaf\xf9\xa1\x94\x13\
-\x30\x9b\xc5\x10\x5c\x63\xd6\xfc\xb4\xf6\x0e\x50\xba\xd6\x45\x00\
-\xef\xf5\x81\xf9\xb4\xe2\xc6\x0e\x5f\x98\x79\xeb\x94\x76\xee\x5f\
-\xf8\xa6\xb2\x5e\x4f\x9f\x35\x3f\x33\x8b\xf6\xc6\x17\x54\x33\x63\
-\xa1\xc0\x5a\xa6\xac\xc5\x6b\xa9\xff\xa2\xb7\x0e\xe4\xe6\x53\x3d\
-\xd1\x51\x33\x74\x2d\xef\x6f\xe0\x2f\xd1\xd1\xa4\x35\x3c\xd8\x2f\
-\xeb\x09\xb3\x9f\xb7\x66\xa2\x33\xed\x93\x5a\x1d\xae\x0a\x6c\x33\
-\x17\xc4\xd1\x8b\x6b\x3b\x03\x60\xda\xc7\x17\xb4\xce\x43\x9a\xdb\
-\xcf\x91\xeb\x37\xcf\x91\xf7\x6f\xae\x87\xdc\xdb\xff\xb2\x7a\xde\
-\xb3\xf9\x43\x78\x5e\x28\x43\xdf\xbd\x04\xa2\xa3\xd9\xeb\xf6\xe8\
-\x8a\x07\xbe\x2a\xfc\x0e\x6a\x4b\xd4\x34\xba\x05\x11\x9c\x62\xf2\
-\x7b\xd9\x9d\x1c\xa1\x6c\x9d\x2b\xdc\x66\xe5\xbe\x50\x58\xa6\x56\
-\x5c\xd9\x1d\x0a\xe3\x3f\xfb\x58\xab\xcf\x8b\xbd\x94\xf5\x9d\xdb\
-\xb8\xde\x63\x1f\x66\x5b\xe3\x7d\x35\x1d\xb8\xf3\x13\x64\x2d\xd9\
-\x50\x79\x7e\x49\xa0\x7f\x94\x39\xeb\x75\x5d\xf9\x8f\x7b\x85\x15\
-\x50\x57\xa2\xa8\xd1\xac\xa3\x4c\xd1\xe7\x12\x7c\x3d\xed\x60\x35\
-\x59\xf3\x91\xf7\xfa\xc2\x1a\xf4\xe2\xea\xce\x60\x98\xf0\xe9\x6d\
-\xee\x39\xf7\xc5\xcf\xf4\xee\x1e\xbd\xe2\xdb\x49\x33\x69\xbc\x60\
-\xeb\xbc\xaf\x96\x17\x25\x5a\x87\x77\x7e\x09\xd5\x49\xfa\xcc\x46\
-\x8c\x85\xdc\xeb\xdf\x6b\xd7\x00\xc9\x0f\x30\x86\xbf\x8f\x3d\xf2\
-\xe9\xf9\xbc\x66\x91\xf6\x70\x6c\x89\x9b\xea\x9e\x41\xad\x78\x97\
-\x81\x9b\xd5\x69\xc5\xb5\x1d\x41\x30\xe9\xce\x75\xad\xfb\xe2\x19\
-\xfa\xec\xe9\xe7\xe4\x2a\xef\xb6\x7b\x59\xe3\xb8\x5f\x25\x5e\x3a\
-\x7e\x4b\xbf\xb3\x8d\x7d\xfb\xd3\xdc\x82\xb6\x7e\x43\xd9\x15\x50\
-\x4b\xa2\xad\x28\x86\x79\x95\x33\x8c\xbf\x3f\xb4\x8f\x13\xdc\xd8\
-\xe2\xce\x8f\xfb\xfa\xc0\x22\xf4\xc2\x15\x6e\x6d\xf3\x82\xe9\xb7\
-\xce\x72\xcf\x31\xe2\xcb\xe2\x5a\x64\xa4\x9c\x76\x8d\x81\xbe\x7b\
-\x25\x78\x8e\x40\x7e\xe9\x81\xb6\xbf\x7d\x3b\xef\x2b\xf0\x94\xe8\
-\x6b\x90\xe1\x7d\xb2\x77\x91\xfb\x7e\x5e\x98\xe3\x73\x55\xde\x2f\
-\xac\x09\x77\xf3\xc0\x48\x5a\x81\x7f\xf3\xf5\xf2\xed\x5a\x7b\x6d\
-\x65\x0e\x1b\x2d\x70\xcd\x97\xf3\xd9\xd3\xae\xb1\xa0\xb5\x12\x64\
-\x5d\x17\xf4\x4c\x0b\x8a\x54\xf7\x68\x71\xe0\x64\xe7\x52\x70\x94\
-\x68\xac\x97\xe1\x5d\x15\xff\x46\xee\x47\x87\xdb\xc3\xa9\x65\xee\
-\x50\xe5\x9e\x71\x3e\x78\xc7\xc3\x02\xf5\x42\xb7\x1e\xac\x3d\x5f\
-\xcc\xcd\xfd\x8f\xff\x8f\xde\xcd\x2d\x68\xad\x22\x3e\xae\xbc\x06\
-\xc6\xf9\x82\x7d\x01\xbc\xfb\x1d\xfb\x1b\x09\xec\x37\xa2\xed\xd9\
-\xe6\x3e\x80\xd5\x12\x95\x05\xdb\x40\x99\xb2\x76\x3f\x39\xde\x01\
-\x2e\xaf\xf3\x10\xce\x7d\x2b\xd5\x8a\x03\x87\xd2\x20\xbf\xe2\x39\
-\xfb\x5c\xfa\xe2\x17\xc8\x10\xb8\xee\x67\x4e\x9c\x41\xef\x38\x17\
-\x85\x1f\x5f\xfd\x46\xf7\x07\x69\x8d\xff\x5f\x7e\xb7\x4d\x1d\xb8\
-\xfb\x84\xd6\x14\x0b\x3b\x43\x54\x44\xeb\x91\xb9\xfe\x66\xfe\x7d\
-\x18\x2a\x51\x9a\x77\x9e\x6f\xbe\x4c\xd9\x4b\xbf\xb0\xab\x13\xdc\
-\xdc\xec\x09\xb7\xb7\x10\x6c\xe5\x0b\x0f\xd3\xc0\x08\x7a\x71\x7e\
-\x77\x53\x18\xf0\xf5\x7f\x39\xf7\xf8\x84\xe6\xf9\xb3\x16\xaf\x13\
-\xde\x0f\x4f\xdd\x27\x2e\xf9\x1a\xb2\xd7\xec\x84\xcc\x09\xd3\xe9\
-\x3a\xc7\xe6\xff\x66\x4e\x9e\x05\xd9\xeb\xf7\x82\xfc\xe2\x7d\xdb\
-\xd1\x00\x12\x23\xe5\x6c\x3d\x08\xe9\x19\x99\xfc\x35\x60\xf8\x18\
-\x6d\xbd\x48\x7f\x2f\xb8\x07\x2d\x24\x7a\xeb\xac\xe3\xdd\x85\xbc\
-\x77\xb0\x97\xc1\xec\xfe\x2e\x0a\xde\xeb\x03\x2b\xd4\x8a\x9b\xef\
-\x7a\xc3\xc4\x4f\x6e\x70\xce\x49\xbc\xb3\x59\x10\xf7\x57\xbd\xa7\
-\x7f\xfd\xec\xde\x73\x74\x3e\x0b\xce\x2d\x8e\x9e\x40\xcf\xf1\xda\
-\x4a\x8e\x41\x7e\xe0\x92\xa0\x5e\xa7\x99\x53\xe7\xd2\xe7\xc7\xf1\
-\xf7\x2a\xa4\x3e\x22\x9c\xe6\x24\x53\x9e\xd3\xf7\x70\xb5\x83\xf5\
-\x93\x48\x1c\xbc\xc5\x8b\x05\x9e\xc6\x81\x05\xe8\xc5\xca\x0b\xcb\
-\xb8\xf7\xa9\xb6\x1f\x17\x54\xaf\x82\x3d\xf3\xf5\x9a\xef\xe7\xbe\
-\x12\xe5\x8c\x70\xc6\xd8\xc9\xf4\x6e\x0f\x9b\xd8\x23\x3c\x70\x59\
-\x90\x06\x60\xbd\x31\x67\xfc\x74\x1f\xde\x95\xa8\x5e\xcd\x9c\x09\
-\x0e\xcb\xe8\x39\x7d\x3b\xd8\x3e\x93\xac\x87\x9b\xbd\x2a\xb1\x45\
-\x5f\x58\x8f\x56\x1c\xdd\xdf\x8d\xc4\xfc\xec\xf7\x5a\xc8\xcf\x7c\
-\x26\x68\xfe\x61\x4f\x7e\x7d\xfc\x5d\x3c\xbf\x9f\x9e\x99\x29\xde\
-\x39\xe1\xac\x6c\xc8\x7e\xef\x98\x6d\xf8\x01\x07\xcb\xf9\x7d\x07\
-\x4a\x7d\xce\xd9\x75\x9a\x3b\x17\x50\x01\x59\x12\xe5\x55\xe6\x4a\
-\x70\x12\xb9\xef\xe3\x61\x07\xbb\xe7\x68\x70\x5f\x1f\x58\x92\x5e\
-\xf0\xd0\x89\xeb\xef\x06\xc0\x18\xae\x9e\x5d\x24\x9e\x14\xd2\xab\
-\x07\x39\xac\x8f\xbf\x8f\xe7\x66\x8d\xd5\x5f\x07\xfb\xff\xd8\x42\
-\x3c\x40\x35\x80\x6f\xbd\x70\x4e\x2e\xad\x31\xe4\xf8\x5b\xff\x28\
-\xfa\x2b\xf8\x49\xd4\xa7\x77\x63\x9f\x65\xf6\xf6\xdf\x9f\x4b\xd6\
-\xc2\xcd\xde\x3c\xe1\x25\x0e\xcc\xa8\x15\x98\xd7\xdc\x32\xd5\x0d\
-\x72\x57\x2f\xe2\x8e\xf9\x05\xf0\x12\x7f\x56\x9f\x75\x5f\xd4\xde\
-\x20\xda\x7c\x62\x1b\xd0\x00\xac\x99\xe4\x9d\x0b\x18\x3f\x8d\xf3\
-\xae\xb2\xdc\x0a\xd8\x52\xc3\xb9\xef\x26\x53\xdc\xa7\x07\x01\xde\
-\x76\xb0\xbf\x98\x70\x62\x93\x77\x75\x6c\x16\x0b\xe6\xd4\x8b\xaa\
-\xbc\x7f\x7f\x9e\x3b\x0c\xec\xe9\x4c\x7b\x0f\x7b\x86\x47\x81\x9c\
-\xa3\x1f\xb5\xfc\xe8\x0d\xfe\x73\x6d\xc2\x74\xc8\xfb\xe6\x4f\xc1\
-\xf3\x19\xfb\xe0\x9a\xaa\xdf\xa6\xad\x68\x00\x3d\x4f\xcc\xd7\xf7\
-\xc1\x1a\x6b\xae\xde\x21\x15\xd0\xbe\x06\xe7\xf9\xf1\x5e\x3d\x08\
-\xf2\xb5\x87\x43\x0b\x08\x47\x36\xf9\xa8\xc1\x5b\x3f\x58\xb0\x56\
-\x7c\xb4\xdc\x13\xc6\xe7\xb8\x40\x83\x3a\xf6\x55\xee\x07\xef\xf8\
-\xde\xe9\xdf\x58\xd7\x07\xac\xeb\xe7\xd9\xe3\x2e\x63\xd0\x70\xfa\
-\xf3\x82\xfd\xd9\x93\x1f\x9b\xbc\xd7\xbf\x4d\x68\x00\xd1\x59\xac\
-\xa9\xe0\xdb\x2b\x8d\xf3\x9c\x40\x05\x5c\xab\xa1\xbd\x83\x56\x33\
-\xb9\xbe\xbd\x73\x3d\x35\xb8\xaf\x0f\x2c\x57\x2f\xf6\xbe\xe6\x01\
-\x39\x1d\x9d\xc0\xc5\x49\xa6\xce\xfb\x9f\x08\x76\xc6\xcf\x5b\x33\
-\x8d\x73\x8d\xe1\x59\x7f\x82\x67\xfd\xb5\x9e\x43\xd1\x52\xe3\xa2\
-\x6f\xcf\x7f\xda\x6b\xcf\x80\x9e\xbc\xb6\xa0\x01\xa8\xb7\xe9\x4c\
-\x5f\x35\x5d\xbe\xd9\xd8\xc9\x9c\x9f\x37\xf7\x3e\xf4\xab\x61\xdc\
-\x9f\x89\x1c\x70\x76\x94\xbd\xdc\x32\xc5\x03\x6e\x6d\xf4\x61\xc7\
-\x26\x76\x58\x83\x56\xdc\xdc\xe8\x0d\x4b\x47\xbb\x41\x8b\x86\x0e\
-\xea\x9c\x7f\x4e\x70\x48\xa6\xb8\x7f\x04\xf7\x3a\x65\xe4\xfb\xbf\
-\xce\xb5\x07\xa7\x73\x5d\x56\x8e\x63\xdf\x6a\xbd\xf6\xb4\x36\x7f\
-\x28\xf0\xdc\xfb\x1b\xb4\x3e\xbe\x4a\xcd\xdf\x97\xbf\x42\xce\xc1\
-\x72\xc8\x9c\x36\xaf\x46\x6a\x80\xfc\xd8\x4d\xde\x9f\x17\x7b\xa8\
-\x71\xd5\x04\x8c\xbc\x0d\x4e\x35\x84\xfb\x03\xb0\xae\x0f\xcf\xf0\
-\x2d\x1d\x89\xdc\xf7\xe5\x01\x1f\x7e\xb0\x00\xbd\xb8\xb1\xc1\x1b\
-\xe6\x0d\x74\x83\x3a\x81\x55\x7c\xfc\xc7\x04\xcb\x09\xea\xa9\x3f\
-\x88\xfc\xfb\xd0\x9b\x2b\x1f\x87\xeb\x05\xef\x98\x9f\x23\xbf\xa4\
-\xab\x57\x26\xef\xd8\x82\xac\x71\x78\xcf\x37\xaf\x73\xb4\x02\xfb\
-\x6e\xda\x82\x06\x64\xbd\xb1\x9a\xf7\x73\xe4\xac\x97\x7e\x00\xc3\
-\x6a\x00\xf7\x7b\xc8\x94\x67\xf7\xa7\x15\xb8\xf1\xe4\xbe\x50\x98\
-\x47\x2b\x6e\x92\xbf\xf9\xfa\x50\x77\x08\xaf\x55\x85\xf7\xdf\x10\
-\xbc\x42\xc0\x7a\xfe\x93\x6b\xed\xcf\xc1\x7a\x33\x3e\xf3\x89\xf8\
-\xdf\xda\xea\xcd\xb5\x72\xf5\xd0\x15\xde\xfd\xf0\x69\x9d\xbf\x80\
-\x7e\xdc\x19\x03\x87\xd6\x28\x0d\xc0\xf3\x10\x7c\x3f\x73\xf6\x86\
-\xf7\xb9\xfe\xce\x43\x1b\x3f\x23\xd8\x9c\xe0\x67\xe4\xc5\xe0\x9e\
-\xae\x70\x6b\x83\x9f\x12\xbe\xec\xd8\x68\x2a\x18\xae\x17\x4b\x47\
-\xb9\x43\x64\x68\x35\xde\x17\xc9\x14\xf7\x10\xc8\x38\xb8\xdf\x81\
-\x6b\xed\xcf\x18\xce\xef\x3c\x7f\xce\xb6\xa3\xfa\xaf\x59\x7c\x72\
-\x0b\x99\x59\x7a\xd5\xef\x61\x5f\x81\x9a\xa6\x01\xf2\x93\x9f\xf0\
-\x3e\x27\xc8\x75\xd7\x58\xfe\x03\xc8\xb7\x51\xee\x63\xef\x8e\xfb\
-\xc8\x8d\xd4\x24\x67\xb8\xb9\xde\x4f\x8d\xff\x42\x60\x59\x5a\xf1\
-\xfe\x6b\x9e\xd0\xb2\x91\xa3\x3a\xef\x1f\x10\x0c\x26\xd0\xa9\xe3\
-\xe4\xfb\x3e\xc8\x59\x67\xca\x67\x5d\x1e\x3c\xc2\xa0\x33\x3d\x19\
-\xfd\x07\x19\x54\xc3\x2a\x69\x40\x75\x64\x4e\x2b\xe6\xe7\x03\x60\
-\x0f\x51\xf6\x18\xe0\xaa\x8d\xee\xf3\x7d\x84\xfc\x68\x12\xe1\x08\
-\x57\x56\xfb\xea\xc9\x7d\xcb\xd1\x8b\x92\xe5\x3e\x90\x97\xec\x42\
-\xcf\x27\x29\x79\xff\x7f\x04\x63\x98\x9c\x9e\x2e\xcb\x79\x00\x11\
-\xe4\xfb\x7e\xce\x3a\x87\x5e\x99\xc2\xeb\x6e\x3d\x3c\x93\x62\xc8\
-\x3d\x5a\x7c\xe6\xa9\xa1\x67\xf9\xf0\xfe\x9c\x8c\xc1\xc3\x85\x69\
-\x00\x89\xa5\xad\x55\x03\xb0\x0f\x10\xcd\xc9\xea\xc8\xdb\x62\x7f\
-\x91\x3c\x8e\x7b\x06\x6d\xf0\xae\xf1\x37\x91\x23\xfe\x5e\xf6\x70\
-\x72\x11\xe1\xcf\x7a\x7f\x0e\xf8\x29\xb0\xc1\x5c\xe0\xa7\x15\x8b\
-\x86\xb9\x83\x9f\xa7\x1d\xc3\xfb\x67\x04\x6b\x08\x04\xd5\x71\xe6\
-\xde\x87\x62\xd6\xf9\x73\xfe\x2f\xbc\xcf\xd7\x19\xc2\x11\xec\xf5\
-\xa9\xd3\xbf\x28\x1a\x20\x0a\x0f\xa9\x1f\x20\x70\x8f\xd1\x9a\xfd\
-\x00\xbe\x75\x94\x5c\x7b\x01\x64\x6e\x6c\xb4\x21\xee\xf7\xc6\x5c\
-\xbf\xa3\x83\x0c\xb6\x4c\xf6\xd6\xc2\x7d\x7d\x60\x5a\xbd\x38\xf5\
-\xa6\x0f\x74\x6a\xee\xa4\xee\xeb\x5f\x20\x68\x2a\xf8\x89\x00\xd8\
-\xe1\x7e\x0f\xeb\xda\x3f\x6f\x29\xbf\x75\xf9\xf4\xa7\x86\x9d\x65\
-\x3b\xf1\xb1\x6e\x8d\x21\x7e\x88\x68\xf9\xb1\xdb\xff\xaa\x31\x7e\
-\x00\xfa\x3c\x58\xef\xa3\x53\x5f\x47\x4f\xe4\xfa\x1b\x8f\x6d\xe4\
-\x1e\x21\xec\x7d\xfc\x2f\x9c\xf1\xe3\xb3\xdc\xe1\xd6\xba\x00\xc2\
-\x57\x06\xfe\x26\x86\x61\x5a\xb1\x78\x98\x07\xad\x53\x52\xf2\xfe\
-\xbf\x04\xc3\x65\x8a\x1e\x25\x82\x2d\xf7\x01\x74\x64\xfd\xde\xbf\
-\xfa\x8d\xf6\xe6\xe3\xb5\xf6\x1b\xea\xa7\x9e\xb8\xcd\xab\x5f\x90\
-\xa8\xbc\xd0\xc7\x0f\x58\xb4\xc6\x2a\x35\x80\xaf\x0f\xc0\x19\x5f\
-\x55\x40\x81\x0d\xc4\xfc\xb4\xae\xbf\x6d\x8c\x13\xdc\x58\x1b\xa0\
-\xe0\xbf\x50\x98\x59\x2f\x2e\xae\xf4\x85\xb4\x36\xce\xea\x6b\xfe\
-\x31\xa5\xae\xe9\x6d\xf9\xf7\x61\x15\xeb\x99\x92\x9d\xa7\xf8\xf9\
-\x8d\xbb\xcf\x18\xce\xff\xb3\x5f\xf2\xcb\x2f\x8a\xbd\x36\xb2\x68\
-\x40\x46\x6e\x1e\xed\x45\x8c\x7d\x4d\x72\xde\x3b\x46\xfd\x62\x3c\
-\x63\x97\xb3\xfb\x23\x5a\x37\x9f\x6b\x85\xfd\x03\x68\xed\x16\x1f\
-\x7d\xc3\x33\x91\xec\x79\xc0\x0f\xac\x9c\xff\x73\x91\x2f\x81\xde\
-\xf6\xf0\xd1\x9b\x84\x4f\xeb\x02\xd5\x10\x60\x1c\x88\xac\x15\x07\
-\x8b\x7d\xa0\x7e\xa8\xaa\x76\x0f\xef\x14\x1d\x29\xc6\x83\x21\xdf\
-\xef\x03\x56\xdf\x9f\xc7\x3d\x95\x58\x73\x9b\x77\xf7\x0f\x71\x7c\
-\x54\x1e\x67\xd8\x85\xec\xfb\x0b\xd1\x80\xcc\x31\x93\x20\x7b\xe9\
-\x26\xc5\xdd\x82\xdc\x7d\x72\xac\x1a\xbc\xfa\xa7\x60\x3d\x10\xbb\
-\x7f\xf3\xcb\xe0\x87\xe0\x6a\xa5\xdc\x6f\x8b\x79\x31\xac\xef\xdb\
-\xf0\x8a\x0f\xdc\x5a\x1b\xc8\x0f\xeb\xd8\x10\x60\x64\xbd\x60\xe7\
-\xfe\xa6\x49\x5e\xea\xfe\xfe\x97\x04\xd1\xa2\x70\xff\x21\xc4\xb3\
-\xf7\x9e\xff\x1f\xaf\x9e\x1b\xc8\x19\x71\xee\xc6\x7d\xc1\xab\x76\
-\x3f\x47\xcf\xba\x62\x09\xc4\x9f\xdb\x7e\x82\x5f\x0c\x50\x72\x97\
-\xab\x57\x68\x6f\x2b\xe4\xbe\x37\xb3\xcf\x3f\x30\x85\xc4\xfc\x6b\
-\x83\x34\x10\x28\x1e\x8c\xa4\x17\xef\xbc\xea\x03\x6e\x2e\x2a\xee\
-\xef\xe7\xaa\xdd\xd3\xcb\xf7\x7f\x00\x53\x59\xf3\x71\x7b\xcf\x99\
-\x64\x3f\xae\xca\xfa\x34\x75\x2e\xbf\xbe\xf6\x9f\xff\x2c\xf1\x59\
-\x1f\x60\x3e\x87\x47\x1e\x90\xab\x3f\x63\x7e\x05\x2c\xb7\x42\xfe\
-\xd3\xbe\x9d\x31\xe1\x8e\x70\x75\x15\xe1\xfb\x1a\x2d\x58\xab\x0b\
-\xa6\xd7\x8a\xed\xd3\x7c\x68\xdf\x41\x25\xf7\xdf\xd5\x37\xc7\xa7\
-\xc5\xf7\x3f\xa9\x6f\x2d\x1e\xd6\xe1\x8a\xba\x3e\x91\x58\x9b\xef\
-\xdd\x80\x86\xd4\x19\xf1\x02\xf9\xfb\xf2\xd2\x6f\x21\x67\x7f\x19\
-\xe4\xbc\x73\x18\xb2\x37\xed\xa7\xb1\x3f\xde\x63\x4c\x63\x04\x11\
-\x62\x1e\xf3\xd4\x03\xe9\x3e\x13\x95\x39\x66\x22\x57\x0e\xe0\x13\
-\x2b\xe3\x7e\x26\xf2\x06\xd7\xce\x43\x73\x09\x9f\xd6\xd4\xd2\x40\
-\x90\xfe\x58\x6b\x7c\xbd\xd8\x3f\xc7\x0f\xbc\xdc\x55\xdc\xdf\xad\
-\xad\x76\x57\x2f\xee\x03\x38\x90\xef\xf5\x7f\xac\xf5\xbe\x3c\xce\
-\x90\xd2\x1e\xde\x62\xce\x4f\xac\x01\xe2\xb1\x3e\xd1\xd7\x9e\xb7\
-\x54\xfc\x38\xfd\x9b\x3f\x21\x67\x5f\x29\x64\xce\x58\x40\x62\x91\
-\x5c\x9d\x75\xc8\x78\xce\x09\xfb\x9f\x5a\x93\x3f\x92\xfd\xee\x11\
-\x7e\x79\x16\x12\xff\xb1\xfc\xfe\x8b\xbc\xbf\x81\xbf\x95\x70\xdf\
-\x87\xe0\x7b\x7a\xae\x27\xd7\x0b\x6e\xae\xae\x55\x05\xd5\xb5\x40\
-\x17\x82\x8c\xac\x17\x55\xb9\x5f\xf2\x56\x00\x84\xd7\x52\xe5\xfa\
-\x0e\xf2\xa9\xdf\x15\xcc\xff\x7b\xd0\x84\x35\x57\x7c\xe5\x3b\x7e\
-\x79\xff\xc3\x57\xcd\x76\x6e\x8d\xae\x53\x73\x97\x88\xa3\x01\xd8\
-\x57\x9c\xf0\x98\x4f\xfd\x31\x2b\xe4\x79\xd4\x67\xd6\x71\xff\xb6\
-\x65\xd4\x02\x5c\xfb\x3b\xbf\xef\xf6\xd0\x15\xae\x1c\x40\x8a\x95\
-\xf0\x1f\xfb\x98\x41\x7c\xa4\x13\x5c\x7f\x3b\x98\x70\x5e\x13\xb5\
-\x04\xc1\x94\x7a\x71\x63\x75\x10\xb4\x8d\x51\xed\xf1\x7d\x2c\x53\
-\xf4\x23\x14\xdd\x72\x2b\x60\x20\x6b\xec\xff\x41\x09\xaf\x1e\xba\
-\xc6\xb8\x67\x87\xd6\xe5\xe4\xe6\x99\x4c\x03\xe4\xe5\x8f\x20\x63\
-\xd4\x78\x71\xfa\x08\x11\x9f\x09\xcf\x1b\x5b\xba\x06\xe0\x3e\xaa\
-\xbe\x7d\xda\xc9\x9c\x99\x6e\x05\xdc\xef\x82\x35\x7e\xce\x8e\x76\
-\xb0\x7f\x56\x00\x0b\xf7\x85\xc2\xb4\x5a\x31\xbc\x97\x3b\xc3\xfd\
-\x1f\x09\xc2\x8d\xf5\x90\x72\xbf\x7d\xbe\x86\xd5\x47\x5c\xb6\x45\
-\x77\xec\x8f\x3d\x24\x8d\xd5\xd7\x5e\x60\x0f\x10\x7d\x63\x01\x7a\
-\xae\x89\x47\x7d\x93\x20\x10\xdf\x19\xef\x1c\xb2\xe4\x1a\x21\x3e\
-\x7d\x02\xe9\x7d\x21\xec\xfc\xdf\x67\xe1\xdc\xc7\xf3\x2e\x5f\x21\
-\x7f\xc6\xf4\xf1\x84\x9b\x6f\x87\x68\x20\x58\x37\xcc\xa8\x15\xdb\
-\xa7\xf8\x31\x67\x78\x5e\x10\x24\x1b\xf3\x41\x75\x3f\xfe\xe9\x77\
-\xac\x39\xa2\x49\x33\x4d\x1f\xfb\x6b\xec\x05\xf2\xa9\x3d\x30\x44\
-\x03\x68\x6d\x93\x11\x7b\x0c\xd2\xe7\x63\xa1\x1a\xc0\x27\xcf\x4a\
-\xcf\x03\xb1\xff\xfe\x67\x16\xce\xff\x89\xc8\xfd\xf0\x20\x47\xb8\
-\xb2\x22\x98\x85\xff\x42\x61\x4c\xad\xa8\xaa\x17\x97\x97\x07\x41\
-\xbd\x60\x55\xcc\xbf\xcc\xc8\xcf\x29\x27\xb5\xb4\x82\xdd\x3f\xe4\
-\x91\xfb\xc3\x78\xd9\xd8\x7b\x55\x58\x57\x2c\x88\x73\x3c\x63\x01\
-\xba\xee\x9b\xa0\xbf\xa8\xa5\x9e\x17\xc0\xb3\x1a\x7c\xde\x3f\x47\
-\x4f\x80\xdf\x2c\xb8\x37\x68\x90\x4c\xd1\xc3\x12\x56\x0e\xf7\x87\
-\x9b\xab\x42\x35\x10\x52\x1d\x6f\x8b\x09\xc3\x7c\x8b\x61\x3d\x3d\
-\xd4\xeb\x7b\x8c\x59\x6b\xe5\x6b\xef\xe8\xf4\x63\x2e\xdb\x1e\xda\
-\xdd\x3f\x78\x71\x43\xfe\xd1\xe7\xc6\xcf\x55\x7d\xf2\x1f\xc8\x14\
-\x78\xa7\xb0\x2e\x3f\x00\x6b\x77\xf9\xee\x31\xd8\xaa\x06\xe4\xde\
-\xf9\x89\x5f\x6d\x47\xe9\xb7\x1c\xfb\x24\x50\xc7\x42\xf9\xbf\x89\
-\xd6\xf7\x47\xbb\xb0\x70\x5f\x1f\x98\x4e\x2f\x4e\x2e\x08\x02\x57\
-\x27\xba\xd7\x87\xf7\x0b\xb7\x33\xf2\x73\x7a\xdb\x2d\x24\x8c\x7d\
-\x6e\x94\x3f\xe2\x35\x37\xf2\xf4\xe8\xeb\xad\xd7\x5c\xfd\xf4\xbf\
-\xbc\x7b\x0f\xe9\xf4\x03\xc8\xbf\xe9\x73\x77\xa8\x2d\x6a\x40\x46\
-\x61\x3f\xdd\x3e\x1e\x57\x3f\x87\x07\x90\x64\x81\xdc\x6f\x4c\xf0\
-\x1c\xcf\xf5\xee\x9f\x49\xfc\xe9\x95\xb5\x35\x10\xaa\xc0\x2a\x63\
-\xc1\x30\xad\x48\x4b\x72\x53\xaf\xef\x33\xf6\x19\xc8\x27\xfe\xcd\
-\x12\xf4\xf6\x0d\x69\xcd\xbf\x29\xd7\x2b\x11\x35\x00\xcf\xf3\x08\
-\xf1\xfd\xf1\x75\xb3\x16\xae\x84\xec\x55\xdb\x28\x8f\x31\xef\xa9\
-\xcf\x5d\x84\x96\xa6\x01\xf4\x73\xe8\xda\x03\xe0\xbe\x23\xb1\x8f\
-\x05\xf2\xff\x7d\xe4\x4f\x4e\x5b\x77\x16\xee\x0b\x85\x69\xb5\xe2\
-\xf0\x6b\x41\x60\xaf\xc8\xf9\x3d\x25\x88\x34\xf2\x73\xc2\x1a\x4e\
-\xe8\x3d\x24\x9d\x3d\x36\xde\x5f\xa6\x9b\x13\x03\x87\x9a\xde\x67\
-\x35\xb1\x06\x60\xdf\x03\xac\x83\xe0\x7a\x2f\x59\x2b\xdf\x15\x1c\
-\x47\x58\x92\x06\x60\xdf\x74\x9d\xfc\x5f\xbb\x9b\xab\x1f\xc8\x10\
-\x0b\xe3\x7e\x2c\xe6\xcb\x9d\x1c\xed\xe0\xf8\x5c\xc2\xa9\x15\x75\
-\x14\x58\xc9\xa0\xb6\x91\x61\x98\x5e\x14\x74\x52\xc5\xfd\xdb\x8c\
-\xfc\x9c\xdc\x95\xbd\x02\x60\xc9\xc6\xe1\x1c\xf7\x79\xeb\x3e\x23\
-\x92\x31\x62\x9c\x79\xe2\x56\x53\x68\x80\x3c\x97\x77\x1f\x33\xf9\
-\x85\x6f\x04\xd7\x0c\x59\x8a\x06\xf0\xd9\x03\xcc\x5a\xb2\x81\xeb\
-\xf7\x5f\xb5\x30\xfe\xe3\xfd\x15\x50\xd0\xd1\xb3\x92\xfb\xfa\xc0\
-\x0c\x5a\x71\xe1\xcd\x10\x70\x77\x51\xc5\xfd\xb1\x46\x7e\x4e\x83\
-\xf1\x39\xc5\xd6\x73\x82\xf7\x0e\x8c\x67\xdf\x1b\xda\x7a\xd0\xac\
-\x7b\xff\xa6\xd4\x00\x3c\xd3\xaf\x5e\x0b\x83\x9f\x4b\x7e\xb1\xc2\
-\xf8\x3d\x44\x2c\x40\x03\xb2\xd1\x7f\xe1\xf3\x3e\xd9\xd7\xff\x59\
-\x16\xc4\xfd\x38\xe4\x0e\xe6\xce\x4e\xcf\x27\x9c\x5a\x11\xa6\x81\
-\x3a\xc6\x81\x48\xbe\xc5\x6b\x05\xbe\xcc\xda\x7f\xde\xc8\xcf\x09\
-\xf7\x6c\x70\xef\x16\xe6\x17\xf9\xc2\x3b\x87\xa6\xb2\xcf\x8b\x8d\
-\x1f\xe8\xae\x0d\x99\x56\x6c\xde\xfc\xb5\x5e\xfb\x02\x6f\x71\xef\
-\x0b\xdc\xf9\x89\xb3\xff\xb5\x82\xe3\xff\xa4\xfd\xc9\xb0\x97\x26\
-\x1b\x6f\xad\x51\x03\xf8\xdc\xaf\x8a\x67\xc0\x38\x6a\x80\xe7\x5b\
-\x10\xff\x77\xe0\x9c\x2e\xc4\xb5\x7f\x79\x18\x7f\xac\x08\xb3\x08\
-\xad\x68\xdd\xc8\x85\xe1\xbf\xb1\x63\xaa\x34\x7c\x9d\x5a\xbe\x0e\
-\x70\x65\x79\x08\x6c\x39\x3c\x93\x9d\xff\xeb\xf7\xea\x9e\x17\x73\
-\x16\x9b\x7f\x0f\x8b\x68\x40\x86\x98\x1a\xc0\xda\x03\xe1\x67\x12\
-\x27\xbf\x5e\xad\x47\x5e\xee\xd5\xbf\x59\x7d\x3f\x41\x5e\xdf\x33\
-\xfa\x4d\xec\xfc\x5f\x6c\x21\xdc\xc7\x7d\xc8\xa7\x58\x2f\x77\x74\
-\x36\x59\xfb\x97\xd7\xd5\x40\x98\x38\x58\x61\x1c\xbd\x38\xbb\x30\
-\x94\xc9\xfb\x3d\xc1\x3d\x79\x23\x3f\xab\x2b\xc8\xff\xc9\x59\x3e\
-\x54\x77\xde\x39\xc8\xb1\xfe\x6f\xda\xcf\x63\xfd\x9f\x67\x19\xfb\
-\xd8\x7a\x68\x40\xe6\x94\xd7\x78\x9d\xd7\xcb\xbd\xfc\x10\x32\x86\
-\x8c\x64\x8f\x7f\x0a\xfb\xd1\x71\x6b\xd6\x80\x6c\x3e\xeb\xff\x82\
-\x15\x5c\xfe\x7f\xb1\x85\xf0\xff\x2d\x9c\xd3\xdd\xe3\xdc\xe1\xe6\
-\xb2\xba\xdc\x58\xce\x07\x61\x46\xd6\x8b\xea\xfc\x7f\x73\x90\x3f\
-\xb3\xf6\x9f\x35\xf2\x73\xea\x86\xaf\xe3\xeb\x61\x0f\x17\x97\x84\
-\x52\xfe\xbf\xf7\xe1\x04\x8e\xf8\xff\x90\x6e\x0e\x8d\x9f\x6a\x39\
-\xb5\x2c\x7a\x68\x00\xf6\x10\xc1\xcf\x89\x75\x30\xd5\xfe\x1e\x59\
-\xdb\xb3\x96\x6e\xd6\x99\xdb\x47\x0d\xa0\xf1\x80\x95\x6a\x40\xd6\
-\xf2\xad\x7a\xc7\xff\x04\x33\x2d\x80\xfb\x5e\x4c\x2e\x7b\xfb\x84\
-\x10\xc2\xf3\x70\x35\xd4\x35\x0c\x26\xd2\x8a\xdc\x76\x9e\x0c\xff\
-\x67\x1b\xf1\x39\x61\xcf\x80\xdb\xf8\x3a\xaf\xf4\xf1\x56\xc5\x21\
-\xbb\xf6\x8d\x64\xcf\xff\xef\x38\xa9\x9b\xff\x23\xc6\x5a\x56\x3d\
-\x9b\x3e\x1a\xa0\x3c\xab\x83\xf5\x40\x78\xd6\x00\xcf\x3c\x08\xbd\
-\x1b\xc8\x9a\x35\x80\xcf\x39\x6b\xae\xde\x6e\x64\xfd\x9f\x64\x01\
-\xfc\x1f\x41\xcf\xf7\xd6\x77\x81\x1b\x4b\xc3\xab\xa0\xaa\x16\xf0\
-\x81\x31\xb5\x82\x5b\x2f\xa2\xeb\xa8\x7a\xf7\x77\x30\xe2\x73\xc2\
-\x3b\xff\x20\x98\xc4\xfd\x97\x97\xd4\x56\xf9\x1e\xfb\x77\xf5\x05\
-\x7d\xef\xf9\xcc\xe8\x3f\xd8\xf2\xce\xb5\xeb\xb1\x2f\x20\xc6\x59\
-\x3f\xae\x7b\x0f\x2c\x5d\x03\x32\x67\x2e\xd4\xcd\x7f\x3c\xc7\xc8\
-\xde\x07\x6c\x90\x05\xf0\xff\x3a\xcd\x65\x17\x06\x12\xce\x47\xa8\
-\x21\x5c\x10\x4c\xaa\x15\x6a\x7a\x71\x9d\xfc\xb7\x4b\x65\xbd\xaf\
-\x8f\x91\x9e\x91\x0b\xc1\x43\x7c\x4e\xc5\x85\xfe\x55\xe2\x90\x93\
-\xef\x74\x67\xdf\xd3\xfe\xe8\x73\x1e\xfd\x2e\x72\x2d\xf2\x5c\x8b\
-\xde\x7e\x80\x9e\xc0\x18\xda\x5a\xf7\x06\x33\xc7\xbd\xaa\xbb\xfe\
-\x97\xf8\x82\x1c\x67\x80\x53\xcd\xcc\x7d\xbc\xe3\x06\x3c\x5d\xed\
-\xe1\xd2\xa2\x70\x0d\xfe\x0b\x85\x79\xf4\xe2\xf0\xcc\x50\x66\xed\
-\xff\x9b\x11\x9f\xd3\x54\x7c\x8d\x86\xb5\x9d\x88\xde\x54\xf5\x3d\
-\x4a\xd7\xb1\xd7\xff\x62\xfc\xcb\xeb\x6c\x98\x11\xfa\x70\x5b\x93\
-\x1f\x40\xfb\x8e\xf0\xe0\xa9\x3e\x7e\x40\x36\x47\xff\x4d\xd1\x40\
-\xde\x77\x7a\x6e\xbe\xee\xf3\x3f\x5c\xfd\x9d\x2a\x20\xd1\xcc\xfc\
-\x5f\x89\xf3\x5a\xde\xc6\x0b\x6e\xbc\x55\x4f\x0d\x11\xba\x61\x21\
-\x5a\xb1\x79\x4c\x30\xc3\xff\xcb\x46\x7a\x46\xf5\x08\x7e\xc1\xd7\
-\x58\x3b\x32\xa8\x5a\x1c\x72\x63\x45\x38\x14\x7c\xfb\x84\xb5\x07\
-\x1e\xaf\xf3\x7f\x27\x6e\x5b\x6e\x8f\x2b\xf4\x03\x46\x8c\x33\x1e\
-\xf7\x71\xff\x53\x40\xff\x51\x7d\x34\x00\x7b\x30\x19\xf5\x3e\x30\
-\x3e\xe7\xff\x58\x72\x1b\x88\xbe\xdf\x40\xa0\x99\xfb\x7b\xd0\x3b\
-\xbc\x76\x4c\xa8\xad\xc1\x7f\x21\x30\xaf\x56\x2c\xea\x17\xc8\xf0\
-\xff\x80\x91\x9e\x13\xbd\xdf\xb8\x67\x82\x3b\x67\x1c\x32\xe4\x16\
-\xfb\xf9\x4e\x3e\x79\x30\xcc\x9f\x5b\x74\x9f\x3b\xdc\xbb\x17\xd8\
-\x43\x84\xd7\xda\x8c\xf7\xe3\xdc\x7b\xa1\xdf\xbd\xc3\x42\x62\x01\
-\x79\x1e\xd5\x0d\xa3\x9c\xff\x3f\x7e\x8b\x57\x6e\x83\xa3\xbf\xdb\
-\x63\x33\xaf\xfd\x3d\x70\x5e\x47\x05\x3b\xc3\x8d\x25\xf5\xd5\x50\
-\xaf\x3a\xde\x12\x13\xe2\x6a\xc5\x2c\x79\x00\xc3\xff\x2d\xc6\xaa\
-\xf3\xc5\xfd\xbe\x8f\xe6\x87\x71\xc6\x21\x63\x3e\xfa\x48\xef\x3e\
-\xfc\x59\x0b\x57\x59\x7e\xbf\x5b\xc2\xd3\xec\x8d\xfb\x20\x43\x8c\
-\x1e\x5f\xfd\x06\x72\xfb\xc3\x46\xd2\x00\xae\xfa\x1b\x83\xf7\xfe\
-\xf9\xd4\x78\x73\xf7\x76\xbf\x65\x66\xfe\xd3\xbe\x9e\x23\x52\xfc\
-\x34\xf8\x2f\x04\x66\xd6\x0a\x82\x69\xd9\xaa\xbd\xff\xf5\x22\x3f\
-\x9f\x60\x82\xff\x28\x72\xa3\x01\x5a\xe3\x90\x09\xbb\xd6\xb0\xcf\
-\x8f\xb7\xb7\xeb\xdf\x23\xde\x12\x7d\x81\x9b\xff\xa4\x7a\x85\x3d\
-\xbb\x85\xf2\x3e\xa3\xa0\x2f\x3d\x07\x27\x56\x6f\x5f\x41\xb1\x00\
-\xf6\xe1\xbe\x74\x5f\xfc\xbd\x3f\xe5\x5d\xa0\x69\x69\x69\xdc\xda\
-\x33\xeb\x75\xf6\xdc\xff\x03\xd8\x61\x46\xee\x3b\x30\xbe\xff\xde\
-\x49\x24\x86\x7d\x33\x52\x89\xfa\x06\x68\x81\x79\xf4\x62\x5a\x56\
-\x80\x31\xf8\x8f\x35\xfe\x47\xf1\xef\xb6\x8b\x76\xd3\x19\x8b\x4c\
-\x5e\x34\x8c\xdd\x3f\x3c\x58\xce\xcf\x3f\x34\x51\x0f\x10\xd1\x70\
-\xe7\x27\xc8\x7e\xe7\xb0\x22\x2e\xd0\xe2\x13\x64\x14\x16\xd1\x1a\
-\x67\xbc\x0b\x20\xf7\x2f\x7f\x18\x25\xfe\xe6\xeb\x07\x68\xa9\xc1\
-\xd1\x3b\xf7\x97\x51\x34\x40\xef\xbd\x3f\x82\x89\x66\xe4\x3f\xf6\
-\xf5\x85\x88\x20\x27\x35\xee\x0b\x45\x7d\x23\xeb\x05\x3f\xad\x78\
-\xa3\x28\x88\xe1\xbf\x98\xf7\xaa\x4e\xc6\xbf\xe9\xe5\x66\x0f\xc7\
-\x66\xd7\xd1\x19\x83\x8c\x1f\x9c\xc0\xb9\x46\xf1\xcb\x51\x5d\xb0\
-\xde\xbb\xb0\xee\x3d\x87\xdc\xeb\xdf\xd3\xfd\xfb\x9c\x23\xd7\x40\
-\x7e\xec\x26\xbd\xd7\x87\xee\x6b\x98\x60\xff\x0d\xfb\x8e\xf3\xc9\
-\xc1\xa7\x63\xaf\x95\x6f\xfe\x14\xef\x75\xb1\xff\x19\x9f\xdc\xdf\
-\xc9\x8f\xb9\xfe\x46\x07\x33\xf2\x7f\x2d\xce\xef\x21\x5d\x88\xef\
-\xff\x66\x94\x12\x91\x46\x86\x71\x74\x62\xdd\xf0\x10\x86\xff\x25\
-\x22\x3d\x1b\xec\x19\xf6\x94\x38\x00\xb0\x6c\x50\x2d\x5e\xb1\x48\
-\x41\x47\x6f\xc8\xb8\xf9\xa3\xde\x3d\xe2\xb9\xce\x87\x49\xe0\xd9\
-\x7f\x9c\x47\xad\xa5\xa2\xd7\xe2\x17\xe2\xc5\xfe\x3c\xce\x77\x62\
-\x9c\xc4\x91\xfb\xfb\x73\xc0\x0f\xe0\x61\x46\xfe\x7f\x8b\x9c\xd9\
-\x36\x86\xac\x6d\x8b\xa3\xf8\xc3\x94\x5a\xc1\x53\x2f\xf6\x4c\xac\
-\xc3\xf0\x5f\x8c\x7e\xca\xb8\xd7\x87\x77\x05\x40\x11\xe1\x34\xdf\
-\x18\xa4\x63\x13\x77\x68\xb3\x66\x9f\xde\xfd\x21\xb0\x8e\x5e\x9f\
-\x5c\xb8\x35\xfa\x0a\x46\xb9\x13\x1c\xfb\x11\xf2\xd9\x6b\xd9\xb4\
-\x5f\xbc\xba\x1f\x1e\x7d\xbf\xf0\x5e\x33\x8e\xdf\xbf\x6c\x46\xee\
-\x87\x33\xbe\xed\xb5\x37\x1a\x08\xe3\xbf\x50\x98\x40\x2b\xce\xcc\
-\x09\x67\xf8\xff\x1f\x03\x9f\x8b\x9f\x4c\xd1\x2f\x18\xda\x36\x72\
-\x83\xab\x8b\xeb\x71\xc7\x21\x1a\xb1\x48\x54\x88\x33\x44\x15\x8d\
-\x66\x5f\x9b\xf8\xe4\x00\x4c\xd4\x07\xd8\x2c\xb8\xfb\x07\xf5\x81\
-\xb3\x96\x6e\xa2\x75\xfe\x42\xcf\x0e\xf3\x5e\x8f\x79\xdc\xb5\x22\
-\xd6\x5e\x0b\xd6\x45\xf0\xba\xd3\x9d\xf8\x08\x1c\x7f\x63\x81\x19\
-\xf9\x3f\x14\xe7\x78\xe7\x26\x1e\x70\x63\x51\x03\xed\x58\xcc\x06\
-\x63\x6a\x85\x7e\x7a\x11\xe0\xa5\xea\xf5\x5f\x4f\xcf\x67\x82\x75\
-\xc3\x37\x99\xfd\xd0\x0b\x0b\x22\x04\xc5\x20\x6e\xce\xf6\xe0\x19\
-\x1e\xc5\x39\xff\xf9\xec\x9b\x65\xcd\x5f\x6e\xb5\x6b\x3a\xd6\xef\
-\xa2\x9f\x83\x77\xf7\xe1\x9e\x47\xf6\x92\x0d\x34\xef\x47\xeb\x07\
-\x59\xf6\x0a\x8c\xa1\x01\x98\x63\xe4\x73\x66\x59\x14\xad\xd9\xf0\
-\x3e\xbf\xda\xce\x2b\x7f\x65\xd7\x8f\x07\xd0\xd1\x8c\xfc\xdf\x8b\
-\xf3\x7c\x5a\x46\x2d\xdd\xfc\x17\x02\x53\x6a\x85\x86\x6f\xd1\xae\
-\xb1\xea\x9e\x2f\xb9\x1e\xcf\xc3\x9f\x39\x03\x11\x16\xe0\x04\x27\
-\x66\x85\x0b\x8a\x43\xce\xbc\x56\xe9\x7f\x90\xef\xf6\x4b\xd6\x18\
-\x40\xa3\xf7\x05\xe7\x3d\x80\xd6\xb6\x0f\x60\xac\x3e\x42\x46\xba\
-\x8b\x23\x53\x8c\x7e\x6b\x24\x4e\xc3\x3d\x7d\x9d\xfb\x9d\x43\x47\
-\x71\xfd\x8d\xff\xeb\x5c\x0a\x8e\x66\xe2\xbe\x1d\x13\xdf\x7e\x38\
-\x89\xac\x71\x6f\x34\xac\xc4\x22\x3e\x30\xa6\x56\xe8\xaf\x17\x43\
-\xbb\xf8\x31\x1c\x5c\x2a\xf0\x79\x34\x66\x72\x21\x75\xfc\x9d\xe0\
-\xd8\xcc\x70\xc1\xbe\xc7\xea\x21\xaa\xf3\x07\x97\x88\xae\x2f\x64\
-\x5d\x9b\x3e\xbc\xc8\xaf\x26\x6e\xf3\x87\x56\xeb\xe7\x8b\x7a\xbf\
-\x80\x3e\xeb\xff\xe1\xab\xba\xf9\x3f\x79\xb6\xe1\x3a\x73\xf4\x3a\
-\xbf\xef\x92\xfb\xcc\xdf\x56\x33\xae\xfd\x0d\x71\xae\x06\x7a\x39\
-\x56\xe5\xbe\x50\x98\x52\x2b\x78\xf8\x16\x1b\x86\xd7\x56\xbf\xef\
-\x47\xc8\x79\x5e\xda\xf7\x20\xba\x8e\x0b\x9c\x9c\x19\xa1\x57\x1c\
-\x32\xaa\xbb\x4a\x7b\x56\xc8\x1f\x40\x73\x56\x6e\x7c\xfd\x14\xd2\
-\xf3\x0b\x75\xaf\x19\x83\x86\x59\xf4\x7d\x97\x96\xec\x07\x64\x6f\
-\x39\x60\x92\x7e\x6b\x99\xd3\xe7\xf3\xab\x37\xba\xf9\x03\xd7\x99\
-\x9f\x5e\x66\xe4\x3f\x3d\xc3\xde\x29\xc6\x93\xf0\xb8\x91\x00\x34\
-\x34\xb2\x5e\x18\xa6\x0f\x57\x16\x46\xd1\x33\x8c\x4a\x1e\x36\xe4\
-\xa1\x81\x47\x95\x3f\x0b\x5d\x9b\x79\xc2\xc5\x05\x91\x7a\xfb\x1e\
-\x1d\x63\x54\x3d\xc7\x0b\xf1\x8f\x93\xef\xf8\x0e\x6b\x0c\x40\x62\
-\x62\x5e\xb5\x00\x24\x8e\xb5\xe6\x7c\x9f\xb9\x34\x80\xcf\x5d\xab\
-\x86\x9e\x07\xa4\x7b\xfe\x3c\xce\x74\x65\xbe\x3a\x87\x8b\xfb\xdf\
-\xe7\x01\x38\x98\x91\xff\x6f\xe3\x5c\x1d\x9d\x12\x08\xd7\x5f\x6f\
-\xc4\x1b\xc2\xb4\xa2\x91\x59\x7c\x8b\xec\x24\x1f\x86\x87\xa7\x95\
-\x3d\x8d\x34\x7b\x1c\xf5\x51\x9e\x11\x7a\xc1\x9c\x79\x9e\x9b\x53\
-\xcb\xe0\x38\x24\xb0\x32\xf7\x18\xa9\xe4\xff\x44\x56\x5e\x5c\xfb\
-\x3b\xaf\xb9\x43\x7d\x00\x11\xeb\x54\x6a\x42\x2c\x80\xf7\x07\xf0\
-\x79\xb6\x39\x3c\xef\x23\xe0\xd4\x98\x29\xaf\xf1\xd3\xf0\x23\xd7\
-\xb8\xfe\xc6\x9b\x66\xae\xf9\xa7\xbd\x2b\xd7\x0c\x0e\x23\xbc\x6e\
-\xcc\x13\x8d\x2c\x57\x2b\xd4\xf4\xe2\xcc\xec\x48\xf0\x71\x57\x71\
-\xf1\x57\x82\x8f\x95\xfd\xba\x30\xbe\x7f\xc6\xac\xf7\xce\x8e\x76\
-\x54\x2b\x4e\xce\xac\x67\x70\x1c\x72\x70\x4a\x04\xf3\x7a\xff\x52\
-\xe6\x56\x64\xd9\x77\x21\x80\x7c\xcf\xbf\xeb\xed\x3b\xe2\xfc\xe1\
-\xbe\x2f\x4a\xf2\x03\x58\x62\xab\x8c\xb1\x93\xf9\xf9\xe4\x2c\x7d\
-\x0a\x79\x6b\xcc\xa9\x3b\xfc\xce\x39\x0c\x1e\xc1\x55\xcb\xf1\x42\
-\x7e\x1f\x1a\x9a\x91\xfb\x78\xde\xf7\x77\xac\x6b\x3b\x37\xab\x01\
-\x5c\x5f\xd8\x98\x1d\xaf\x1b\x0a\xf3\xe9\xc5\xa1\x57\xeb\x41\xab\
-\x28\x77\xb0\xb3\x93\x31\xbc\xa4\x70\x72\xb0\x83\xb8\x08\x37\x18\
-\x99\x12\x00\xa7\x67\x45\x8a\x16\x8b\x4c\xee\xa3\x3a\x7b\xbc\x5b\
-\xfd\x41\x63\x8e\x47\xef\x9e\x40\xca\x3b\xe3\xc5\x3a\x27\x63\x75\
-\xbd\xc5\x5f\x7b\x93\x72\x9a\xd7\x6b\x7c\xfb\x8c\x6a\x06\xaf\x5e\
-\x03\x86\xe4\xfe\x2a\x5e\x42\xe6\x98\x49\xfc\xf2\x7e\xdb\x4f\x70\
-\xfd\x9d\x13\x66\x5e\xfb\x9b\xd1\x3d\x2e\x7f\x67\xc2\xf3\x68\x9e\
-\x68\xac\x1b\x16\xa8\x15\x1f\xcd\x8e\x82\x9d\x63\x23\x60\xf7\x2b\
-\xe1\x54\x13\x2e\x16\x37\x30\x4a\x2c\x92\xd4\x40\xb5\xef\x58\xa4\
-\xfe\xa0\xe5\xf7\xa0\x29\xf9\xbe\x5f\xea\x1b\xa7\x9a\xa4\x77\x8d\
-\x25\xf7\x16\x7f\x65\x0a\xe4\x5e\xfd\x4e\xfb\x7a\x4c\xe2\xa9\xcc\
-\x89\x33\xf8\xf7\x01\xd9\x5f\xa6\xff\xde\xc2\xfb\xe7\x55\x3e\x84\
-\xce\xb3\xbe\x1c\xb1\x5b\xee\x7d\xe8\x66\x66\xfe\xe3\xde\x38\x74\
-\x68\xec\x09\xd7\x17\x44\x57\x62\xa1\x98\x30\xa6\x56\x58\x56\x2c\
-\x52\x3a\x37\x0a\xf0\x9e\x44\xf2\x4c\x9f\x2b\x6b\x08\xaa\x18\xf9\
-\xce\x8f\x1b\xe2\x03\xa4\x67\x64\x82\xbc\xe4\x6e\x8d\xd5\x00\xac\
-\xaf\xc3\x9c\x00\xee\x9d\xe2\x19\x1f\x7a\xb7\x10\xd1\x84\x9c\x03\
-\x97\xe9\x79\x09\x21\x67\x90\xf1\xfe\x01\x7d\x73\x0b\x78\x8e\x89\
-\xcf\xde\x0d\xd5\xec\x9d\xa7\xb8\xfe\xce\xc7\x32\x00\x3b\x33\xf3\
-\x1f\x7b\x63\x43\xbf\xf6\x01\x84\xf7\x31\x3c\x10\x5d\x1d\xa6\xd4\
-\x8a\x85\x96\xad\x15\x73\x73\x54\x7d\xc7\xca\xd8\x1e\x76\xc1\x3d\
-\x68\xc1\xe9\x03\xf0\xcc\x03\xd0\x58\xf2\xee\x1f\xb6\xa1\x01\xe6\
-\xe8\x2b\xcc\xac\xfd\x47\x6f\xe8\xef\xf7\xf3\xfd\xae\x86\x8f\xe1\
-\xd4\x98\xfc\x07\x90\x6e\x01\x7d\x7e\xe9\xfd\x5e\xb3\x33\x42\x79\
-\xf2\x5f\x08\xa2\x8d\xac\x17\x96\xa7\x15\x98\x4f\x50\xf2\x7f\x30\
-\xd7\x03\xe7\xf2\x01\x68\x6f\x50\x9e\xeb\x17\xde\xa1\x61\x2b\x67\
-\x01\x4c\xdd\x57\x58\xdb\xdd\x3b\xbc\x6a\x0a\xc8\x7a\xce\xc7\xef\
-\xa7\x1a\x73\xfc\x16\xd7\xdf\xb9\x6d\x01\x6b\xbf\x8c\xa9\x71\xdd\
-\x34\xa4\x1e\x5c\x9f\xdf\x44\x07\x62\x8c\xa0\x11\x16\xe4\x5b\x18\
-\x18\x87\x7c\x30\xa1\x1e\xc3\x7d\xec\xe1\xc6\x79\x8e\x53\x59\x0f\
-\xf4\x9c\x75\x6e\xad\xda\xc6\xbb\x77\x0d\xde\x99\x29\x69\x80\x70\
-\x64\x8c\x7c\x45\x6f\xff\x89\x6a\xb4\x3c\x8f\x5f\xbe\x62\xe6\x42\
-\xee\xbf\x63\xfe\xb8\x9f\xb1\x9f\x70\xce\x9e\x9e\xd6\x88\x07\xff\
-\x85\x20\xc6\xc8\x7a\x61\x79\x71\x48\x46\xa2\xaa\xd6\x60\x83\xae\
-\x87\x9e\xf7\x00\x36\xb3\xce\x8d\xaf\x9f\xd2\xfb\x7f\x78\xcd\x65\
-\x12\x7f\xb2\xdd\x95\x29\x69\x80\xb6\xd8\x69\x38\x7d\x1d\x7d\x7b\
-\x9e\x72\xdd\x59\x58\xbd\xaf\x59\x11\xf7\xeb\x3c\x80\x23\x16\xc2\
-\x7d\x4f\x9c\xaf\xae\x4e\xf6\x70\xbd\xb8\x29\x3b\xe6\x33\x68\x62\
-\x64\x58\xb7\x6f\x71\x68\x72\x24\x38\xda\xd3\xbc\x1f\xd6\x14\x44\
-\xe9\xe4\xff\x3d\x08\x22\x73\xe1\xbf\xac\xb9\xc0\x8b\x15\xbc\xe3\
-\x00\x3a\x9f\xad\xf4\x7c\x10\x67\x3e\x60\xf4\x44\xe3\x70\x7f\xf8\
-\x58\xfd\xef\x55\x20\x31\x3c\xd6\xef\x89\xb0\xaf\xf0\x24\xaf\x02\
-\x1a\x58\x08\xff\x69\xdd\x7f\x1d\x3f\x67\x6e\xfe\x0b\x81\x29\xb5\
-\xc2\xc2\x7c\x8b\xd4\x38\xd5\xda\xff\x1e\xdf\x87\x9f\x7f\x1f\x46\
-\x73\xc6\x98\x6b\x77\xf1\xdf\x17\x9b\x34\x53\x50\xbf\x7c\x8b\xd7\
-\x80\xaf\x7e\x83\xac\x79\x4b\xc5\x8d\xf7\xb1\xc6\xff\xcb\x5f\xf5\
-\x8f\xf9\x79\xd6\x69\xd3\xef\x63\xd6\x1b\xda\xfc\x7e\x4b\xb9\xdb\
-\x17\xad\x13\xce\xd9\xb8\x70\x77\xb8\x3e\xaf\x19\xe1\x30\x1b\x9a\
-\x1a\x0f\x36\xa1\x15\x31\xb0\x71\x48\x38\x26\x72\x90\xfb\xbf\x13\
-\xd4\xe7\xfd\xf4\x01\xec\xc8\x9c\x28\xe1\xaa\x61\xc1\x1e\xc0\xbc\
-\xe7\xf7\xc2\x95\x36\xd7\x2b\x08\xf7\xf8\x32\xfa\x0f\x32\x6c\xcd\
-\x2f\x1a\xa0\xb8\xeb\xc3\x80\xf3\x53\xd8\xe3\x9c\xf7\x6b\x62\x8d\
-\x16\xb7\x3f\x76\x37\xf5\x1e\xb8\x58\x10\xff\x0b\x70\x16\x76\x6b\
-\xe2\xa3\xe0\xbf\x50\x98\x52\x2f\x2c\xd4\xb7\x28\x99\xdd\x98\xd6\
-\x4e\x29\xd7\xfe\xb9\x42\xbf\x00\x12\x0b\x36\x26\xf3\xe2\x37\xf6\
-\x5c\xd3\x77\x90\x91\x57\x20\x2c\xa7\x6d\x6b\xfd\xc2\xee\x3e\x81\
-\x9c\xed\x27\xe8\x3e\x9a\x20\xde\x93\x38\x3d\xfb\xdd\x23\x06\xef\
-\x93\xf2\xea\xe7\xa7\x5e\x9b\xc1\xdd\xd7\xf3\x59\xc1\x43\x68\x23\
-\xb3\x2c\xc3\x7b\x86\x21\x3f\x29\x80\xf0\x39\x96\x05\xcd\xc4\x83\
-\x0d\xfa\x16\x97\xe7\x46\x43\x72\xb4\x17\xc3\xfd\x4f\x64\x8a\xfb\
-\x40\x05\x9b\xb6\x38\x00\xe7\x13\xce\x2b\x73\xf5\xcf\xb0\x24\xe0\
-\x39\x3b\x3c\xcf\x8b\xf7\x83\x65\x8e\x7c\x85\xae\xb5\x78\x7f\x00\
-\xd6\x45\xe3\x7d\x64\x59\xb3\x17\x41\xce\xe6\x0f\x41\x5e\xfa\xad\
-\x38\xfd\x7c\x78\x9c\x1d\x56\xdf\x07\xcc\xd9\x76\x54\xdb\xdf\x9b\
-\x27\xb3\x3c\x5b\x82\x73\x77\x6c\xd7\x10\xb8\x3e\x37\x56\x3b\xe6\
-\xf1\x81\x95\xea\x85\x1e\xbe\xc5\xb6\x11\xf5\xa1\x71\xa8\xab\x7a\
-\x8f\x41\x7d\xcf\x70\xe0\x1e\x70\x9d\xb4\xab\xdf\x9f\xe7\x9c\x87\
-\x64\x1d\x13\x5a\x2b\x6f\xab\x1a\x60\x2a\x64\xad\xde\x21\xec\x99\
-\x2f\x5e\xab\xed\xef\x95\x9b\xf9\x7c\x2f\x97\xe1\xdd\x18\x30\xbd\
-\x77\x1d\xc2\xf1\xe6\x1a\x88\x35\x0c\x36\xaa\x15\xef\x8f\x6d\x00\
-\x9d\x63\xbc\x99\x78\x1f\xf1\x80\x20\x81\xe7\xf3\xf6\x26\x48\x21\
-\xc0\xb5\x60\x3f\xc1\x1d\x82\xdf\xe8\xf9\x43\x1f\x3f\xe8\x5d\xc6\
-\x7d\x17\x0d\xaf\x7e\xc1\x1a\x39\x41\x5b\xda\x17\x30\x59\xee\xf1\
-\xeb\xa7\x34\x97\x22\xe8\x59\xe3\x19\x22\x6e\xbd\xfd\xb1\xb0\x02\
-\xea\xca\x2c\xd3\xb6\xe3\xdc\x9b\x97\x51\x17\xae\xbd\xd6\xbc\x0a\
-\xaa\xeb\x81\x2e\x18\x53\x2b\x62\x8d\xac\x15\xba\xf5\xe2\xd8\xe4\
-\x46\xd0\x27\xce\x17\xec\x2b\xcf\x10\x22\x6f\x17\x6b\xab\xf3\x21\
-\x86\xfd\xdc\xba\xca\x14\xf7\x29\x7f\xae\x3c\x13\x00\x9a\xc0\xbe\
-\x4b\x31\xb5\xdd\xa0\x73\xcf\xb6\xdc\xe7\xfb\x70\xff\x89\xb9\x6f\
-\x93\x47\xdd\x19\xd3\x33\x40\x7e\xf1\xbe\xc4\x6b\x01\x35\xfd\xbc\
-\xce\x0c\xab\x73\x7f\xd8\x68\x5a\x17\xc0\x15\xf3\xe7\x57\x40\x17\
-\x99\xe5\xda\x87\x38\xff\x16\xc9\xeb\x11\xce\xc7\xa9\xa1\xb9\x20\
-\xd8\xac\x56\x10\x5c\x25\x98\x92\x1a\x0a\xee\xce\xaa\x3e\x42\x4f\
-\x65\x8a\x7b\x52\x42\x38\x9e\xa9\x3b\x41\x5f\x82\xf7\x99\x3e\x62\
-\xea\xe7\x8d\x9b\x85\xb9\x41\x61\x9b\x00\x98\x9f\x5d\x07\xde\x1b\
-\x11\x09\x25\x33\x63\xaa\xc4\x21\xdb\xb7\x4f\x85\x7c\x8e\x5c\x35\
-\xde\x95\x25\x64\x0f\x9a\x6a\x40\x8e\xdc\xba\xef\x11\x32\x15\xf7\
-\x4b\xee\x42\x46\xbf\x81\xc2\x9e\xed\xd0\x51\xba\xea\x09\x26\xca\
-\x2c\xdb\x4e\xe1\xbc\x5c\x59\x18\xa9\xc1\x7f\x21\xb0\x60\xad\x30\
-\x30\x0e\xd9\x3b\xa6\x21\xc4\x86\xb9\xab\xaf\xd5\x1f\x6a\xe9\x25\
-\xde\x92\x00\x7b\x38\xfe\x4f\x9d\xf3\x91\x41\x2e\x30\xb0\x43\x20\
-\x6c\x1a\x52\x1f\x2e\xcd\x69\xc2\x2b\xc6\x58\x7d\x70\xb5\xd6\x7c\
-\x38\xdf\x7e\x33\xea\xf9\xa9\xec\xa5\x9b\x6c\xe6\xcc\x90\xe8\x7d\
-\xca\x37\xed\xa7\x7d\x96\x85\xd5\x12\x8d\xa1\x67\x0f\xb5\xec\xf3\
-\x6f\x94\x59\xbe\x5d\xc4\x39\xba\x71\x40\x03\xb8\x36\x27\x5e\x89\
-\x38\xed\x78\xcd\x50\x58\xbe\x6f\x71\x8d\x60\x72\xcf\x50\xba\x5e\
-\x2b\x79\xfc\x77\x82\x0c\x8e\xdc\x5d\x36\xc1\x65\x75\xce\xa3\x66\
-\xe0\xef\x1f\x1c\xdf\x48\xef\xbc\xc5\xe2\x93\x7b\xb8\xe7\x2c\xc6\
-\xa8\xd3\x8b\x85\xef\x85\x0f\x1a\x6e\xbb\xf7\x89\xe8\x79\x47\xa0\
-\x50\x7f\x9f\x3e\xc7\x11\xe3\x68\x9d\xa2\x96\xbf\x7d\xdc\x42\xf3\
-\x7d\x9a\x86\x7d\xb0\xe0\xbd\xa1\x8d\xd4\xf8\x2f\x04\x71\x46\xd6\
-\x0b\xd3\x6b\xc5\x99\x29\x31\xd0\xae\x81\x97\xfa\x9a\xbf\x49\x99\
-\xb7\xd3\xb4\x34\xe5\x9e\x1f\x28\xfa\x06\x3a\x40\xbf\xb6\x81\xb0\
-\x6f\x6c\x23\x51\xe2\x90\x6b\xf3\x9b\xc3\xbc\x73\x27\xb5\xe6\xa9\
-\x32\x67\x2c\x10\x94\x0f\x60\x7e\x36\xeb\xad\x8d\x35\xdb\x17\x60\
-\xd6\xfc\xec\x1c\xe1\xdc\x1f\x35\x5e\xd7\x7d\x0c\xe7\x06\x3f\x04\
-\x57\x99\x75\x98\x92\xff\x8d\xe1\xda\xec\x04\x82\xf8\xea\x98\x23\
-\x26\x2c\xdb\xb7\x58\x3f\x20\x12\x02\x3c\x9d\x18\xde\xff\x9b\x20\
-\x93\xe3\x6e\x80\x12\x86\xf7\xc1\xde\x4e\x30\xa5\x57\x6d\x28\x9d\
-\xd1\x54\xf4\xbc\x05\x6a\xc0\x6b\x25\xa7\xb5\xce\x63\xbc\x3f\x4b\
-\xaf\xba\xb8\x01\x43\x20\x67\xef\xb9\x9a\x71\xbf\xa0\xfa\x9a\x7f\
-\xec\xa6\xa2\x76\x40\x8f\x67\x86\x7a\x9b\xa7\xbd\xff\x5a\x79\xde\
-\x57\xe0\x29\xb3\x1e\xa3\x77\x5b\x6d\x1b\xc2\xf0\x5f\x08\xcc\xac\
-\x15\x22\xfa\x16\x57\x09\xc6\x75\x0b\x55\xcf\xed\x5f\xc0\x3d\x79\
-\x96\x5c\x3e\xde\xcf\xf6\x04\x7f\xc6\xd7\xdd\x11\x26\xf5\xa8\x0d\
-\x97\x66\xc5\x1a\x35\x6f\x71\x65\x7e\x0b\x98\x5d\x7a\x4e\x7b\x9d\
-\xec\x9e\xb3\x7a\xad\x65\x8c\x2f\xab\x77\x1f\x0c\x6b\xe2\x7d\xc9\
-\xd7\xbc\x7b\xac\xb1\xfa\x4c\xab\x77\x68\xaf\x21\x7e\x00\xa5\x56\
-\xc6\x7d\xd5\xd9\xff\x77\x06\x11\xff\x7f\x56\x82\x1e\x1a\x60\x45\
-\x7a\xc1\xa1\x03\xe5\xb3\x9b\x43\x9f\x38\x7f\x86\xf7\x2f\x94\x1c\
-\xb7\xd7\x78\x4e\x78\x37\x6a\x39\xfe\x0c\xee\xfb\x67\x24\xf8\xc3\
-\x47\x53\x9a\x1a\x2d\x16\x41\x5f\x62\xe3\xc0\x48\xa2\x49\x21\xe4\
-\xb5\xfc\xa0\x5d\x63\x5f\x48\x79\xfb\x3d\xd1\xf3\xd7\x9a\xf5\x02\
-\x78\x57\x96\x35\xdf\x33\xc2\x55\x33\x88\xf5\x50\xaa\x18\x49\x48\
-\xac\x84\xfa\x28\xcf\xa3\xbd\xc5\x74\xbc\xce\x89\xbc\xbf\x81\x9b\
-\xcc\xfa\xec\x2a\xce\xe9\xad\x03\xc9\xfa\x3f\xab\x85\x00\x24\x18\
-\x59\x2f\x4c\xa3\x15\xe5\xb3\x9a\x43\x72\x63\xd5\xb9\xbd\x5f\x64\
-\x8a\xbb\x00\x34\xad\xb3\xb2\xbe\x8f\xfa\xfa\x1b\x07\x36\x10\x3d\
-\x0e\x41\xff\x63\xd3\xa0\x28\xc8\x6b\x15\x00\x51\xb5\x5c\x89\x1f\
-\x62\x57\xad\x46\x40\x46\xfe\xad\xf9\xcc\x65\x3a\xf7\xaf\x33\xc7\
-\x4f\x35\xe8\xbc\x0c\xf6\x1e\xc8\xc1\x7e\x75\xd6\x9c\x1f\x20\x71\
-\x91\xfc\xc0\x25\xc8\x50\xbf\x8b\x5b\x20\xef\x99\x3e\x6b\xf2\x4b\
-\x0f\xb4\x3f\xf3\xfb\xb0\x6b\xe4\x6d\x70\x92\x59\xa7\xd1\x35\x6d\
-\xf3\x80\x46\x02\xf9\x6f\x1b\x5a\x91\x1e\x1f\xa0\x1e\xeb\x27\x71\
-\xf4\x46\xa5\xfe\x7e\x87\x86\xde\x70\xe6\xd5\xa6\xa2\xc6\x21\xbb\
-\x47\x36\x86\xbe\xad\x83\xa0\x96\xb7\x93\x26\xdf\xb1\xc6\xe0\x06\
-\xc1\x1a\x82\x11\xca\x5c\x63\x2b\x82\xc4\xa4\x95\xbb\xde\x91\x6b\
-\xbb\x07\x04\x73\x5b\x9b\x3f\xd4\x3b\x1e\x50\x21\xaf\x00\xb2\x96\
-\x6f\x85\xdc\xcb\x0f\xad\x67\x0f\xff\xd6\x8f\xf4\xbc\x8e\xa1\x67\
-\x06\xa9\xbf\xbf\x74\x13\xad\xb7\xd0\xf2\x7a\x2f\x09\xf7\x97\x58\
-\x48\x0f\x2f\x7d\xed\x12\xdd\xff\xeb\x47\xd6\xff\x99\x89\xda\x31\
-\x8b\x41\x0b\x23\xc3\x34\x71\xc8\xb4\x5e\x61\xea\x77\x82\xb0\x71\
-\xbf\x3f\x53\xaf\x97\xdf\x2a\x08\xae\xcc\x16\x2f\x0e\x59\xd3\x2f\
-\x12\x5a\x47\x79\xa9\xd7\x10\x23\xee\x2b\xeb\x09\xdb\xe8\x3a\x47\
-\xd4\x7a\xc5\xce\x49\x59\x9f\x3e\x7e\xa9\x95\x0b\x57\xfe\x0a\x99\
-\xe3\x5e\x15\xe5\xec\x3c\xd6\xb8\x61\xfc\x8b\xbe\xb4\xc5\x71\xfe\
-\xfa\xf7\x54\xef\x32\xf5\xd8\xc7\xe3\x5c\xf3\x3f\xfa\x42\xd7\xeb\
-\xfe\x9e\x7f\x1f\xfa\xca\xac\xdf\xce\xe0\xdc\x7b\xbb\xa0\xa1\x6e\
-\xfe\x0b\x81\x29\xb5\x42\x0f\xbd\x38\x30\xa6\x09\xb8\x38\xaa\xea\
-\xf9\xf2\x58\x9e\x4b\x8a\x72\x0d\x86\xd1\x9d\x43\x45\x8b\x43\x56\
-\x17\x45\x41\xe3\x10\x37\x75\xce\xff\xa2\x5c\xe3\x5b\x0b\xfd\xe2\
-\x62\xa7\x2e\x6e\xdb\xe3\xe4\x67\xbf\xe9\xdc\xe7\x12\xc3\x17\xd0\
-\xe8\x37\x84\xbd\x47\xd1\xbf\xd6\xbb\x97\x8e\x21\x7c\xff\xec\x31\
-\xc8\x8f\xde\x80\xac\x55\xef\xd1\xbd\x38\xd1\x7a\x84\xd0\x35\x7f\
-\xb3\xae\x35\x1f\xf1\xa8\xe0\x3e\xb4\x92\xd9\x86\xed\xc3\x79\xf8\
-\x7a\x46\x24\x5c\x9b\xd1\xb2\x12\x33\xb9\x90\x68\x1c\x98\xd8\xb7\
-\xe8\xdc\xd8\x97\xe1\xdf\x76\x96\x67\xd2\x84\xa9\xe1\xeb\xdf\x26\
-\x58\x94\x58\x64\xcf\xc8\x68\x68\x1b\xe5\xad\xce\xfb\x7f\x10\xcc\
-\x22\xf0\x33\xe4\xcb\x8b\x1d\x33\xd3\xaf\xd3\x8e\xb3\x5f\xf0\x59\
-\x23\x33\xe7\x2e\xd1\x2b\x06\xe6\xb3\x8f\x88\x67\x8e\xf1\xec\xab\
-\xfc\xc4\x6d\x7a\xff\x86\x28\xbd\x88\xee\xbd\xa0\x77\xe5\x62\x4e\
-\x12\xfb\xed\x66\x2d\x5c\x25\xf8\xde\x30\x21\xe7\x77\x78\x9e\x19\
-\x3e\x48\xe0\x23\xb3\x1d\xdb\x82\xf3\x71\x46\xcf\x88\xaa\xfc\x17\
-\x0a\x2b\xd2\x8a\x7d\xa3\x9a\x32\x7e\xf7\x6f\x2c\x35\xfc\x4e\x4c\
-\x4d\x44\x4a\x8c\x1f\x5c\x35\x30\x16\xb9\x38\x3d\x0e\x06\xb7\x0f\
-\x61\xfa\x02\x82\xf2\x3c\xc0\x34\x02\x51\xeb\x43\xda\xac\xfe\x60\
-\x4e\xe6\x27\x3f\x3d\xe7\x73\x1f\xa6\xea\x0c\x91\x31\x91\x99\x49\
-\xcf\x1e\xe1\x59\x85\xac\xd7\xdf\xa6\xbd\xb3\xb2\xdf\xde\x0e\xd9\
-\x1b\xde\x87\x9c\xad\x07\x21\x67\xf7\x19\x05\xde\x39\x4c\x7b\xeb\
-\xd0\x31\x12\x6f\x67\x2d\x5a\x43\xeb\x1a\xb1\xae\x5e\xc8\x3d\x1e\
-\x86\xf4\x01\xd6\xd2\x9f\x5b\x1d\xbf\x59\x41\x2d\xbf\x3e\xb6\x14\
-\xe7\xe5\xb8\xce\x61\x84\xc7\xad\xb4\xa0\xa5\x78\x30\xa5\x56\xcc\
-\xac\xae\x15\xa3\x92\x6b\x33\x5c\x7c\x87\xe5\x79\xe0\xb9\x5c\xa8\
-\xed\xeb\x0c\x17\xa6\xc4\x1b\x14\x87\xec\x1a\x1e\x0d\xf5\x02\x5d\
-\xd5\xf7\x15\xd7\x11\x04\x18\xeb\x8b\xec\x71\xb1\xa2\x6e\xea\x85\
-\x7b\x77\x78\xf5\xd5\x22\x73\x5e\x54\xdf\xd9\xca\x90\x31\x70\xa8\
-\x90\x9e\x60\x97\x0a\xee\x41\x94\xcc\x36\x6d\x0e\xce\xcf\x41\x6d\
-\x48\x8c\x3b\xbd\x15\x3f\xcc\xe0\x03\xcb\xd5\x8b\x76\x51\xaa\xfd\
-\xbe\x5c\x96\xba\xbe\xa7\x78\x47\xe8\xfa\x7e\x0d\x0d\x8a\x33\xd6\
-\xf4\x6d\xa8\x9e\x5f\xf8\x8a\xa0\xad\xa9\xbe\x50\xf9\x5f\x7e\xcb\
-\xca\xfe\xe2\x97\x9f\xf8\xdc\x61\x83\x3a\x90\x39\xad\xd8\x28\x71\
-\x81\x25\x02\xef\x0f\xcc\xd9\x57\xca\x37\x3e\xc1\xde\xcc\x13\xe7\
-\x03\xd8\xcb\x6c\xd7\x5e\xc1\x39\x2a\x6f\x41\xe2\xdc\xe9\x49\x1c\
-\x68\x65\x18\x2c\x4c\x2b\xfc\x3d\x54\x7b\x6d\x9a\xf5\x7d\x8b\xf0\
-\xdf\x33\xe3\x03\xf5\xf6\x2d\x10\xe5\x33\x12\x20\x22\xc0\xf5\xa5\
-\xac\xb2\x17\xb0\xc9\xeb\x42\xb2\x1e\x82\x6f\xee\x03\x58\x9d\x5b\
-\xf1\xf2\x19\xaf\x9c\xda\x8d\x7f\x50\x1f\x1c\x7b\x69\x19\xb2\x5f\
-\x6e\x91\xc8\xca\xa6\xb9\x0f\x5a\xdb\xc4\x2f\xf7\xf0\x82\xe0\xbd\
-\xbc\x87\x10\x22\xb3\x7d\x2b\xa2\xb1\x6e\x74\x00\x5c\x9d\x96\xc4\
-\x0a\x6e\x5d\x30\x82\x5e\x98\xc0\xb7\xf0\x74\x71\x60\xf8\xaf\xd9\
-\xb7\x63\x35\xfe\xfb\xe4\x94\xba\x06\xf9\x17\x57\x66\x24\x42\xd3\
-\xda\x1e\xcc\x6b\xac\x32\xe7\x97\x2b\x7f\x08\xd1\x64\x2e\x9f\x14\
-\xd2\x77\x1b\xef\xa9\xa6\x75\xb2\x56\xc2\xff\xb4\xb4\x34\x76\x1f\
-\x7f\xf4\x44\x7a\xc6\x27\x57\xcb\x19\x5d\x36\x5f\x3f\xaf\x02\x12\
-\x65\x35\xc7\xb0\xb6\x0d\xe2\xc2\xbc\x08\xd7\x5b\xb3\x20\x49\x10\
-\x4c\xaa\x15\x7a\xfa\x16\xbe\x6e\x8e\x0c\x37\x6b\x69\x3c\x8b\xc1\
-\xf8\xef\x09\x75\xbd\x0c\x8e\x43\x76\x0e\x6d\x02\x0e\xf6\xaa\x3b\
-\x80\xcd\x3e\x9f\xf2\x2b\xa0\x3d\x67\x9f\x71\x2e\x2d\x20\xbc\xc1\
-\xbc\x3b\xed\x35\x60\x82\x5c\x9c\x18\xfb\x77\xd4\xbf\xdf\x7a\x10\
-\x72\x6f\xfe\x53\xe8\x7e\xc3\xe7\xc4\x5f\xca\xb3\xf2\x5a\x1e\x7d\
-\xac\x01\xcd\x77\xf9\xb8\xc0\xd5\xa9\xad\x39\x34\x80\x2f\x8c\xad\
-\x15\xe2\xf8\x16\xc8\x6f\x25\xff\x35\x6b\x7d\xf1\x8c\xef\xcf\x38\
-\xb6\x67\x68\x53\x83\xe3\x90\x7e\xad\x43\x98\xd7\xc1\xfd\x04\x8b\
-\x38\x0b\x9e\xf7\x00\xba\xd3\x73\x2a\x42\xf7\xe2\xbe\xf8\x99\xde\
-\x75\x8f\xb9\x7c\x53\xdf\xd3\xa9\x6b\xef\x31\x73\xde\x52\xea\xb3\
-\xe8\x59\x8b\x70\x8b\xac\xf7\xd9\x35\x90\xf7\x8c\xe1\x3e\xd4\x4b\
-\xec\x73\x51\x3e\xa5\x0d\xd1\x00\x75\xb4\xd6\x8e\x69\x96\xae\x17\
-\xec\x3a\x30\xa6\x93\xaa\xee\xef\x20\xcb\xf3\xc0\x1c\x3d\x64\x27\
-\xd4\x32\x38\x0e\x29\x7d\xb5\x05\x84\x12\x5d\x55\xbe\xd6\x64\x4b\
-\xfa\xd2\xb1\x7e\x25\xb7\x02\xf6\x61\x7f\x3a\xfd\xee\xc1\xfb\x1f\
-\x3d\x33\x88\x39\x03\x8c\x15\x32\x0a\x8b\x8c\xcf\xf7\xdc\x7c\x5a\
-\xcf\x98\xbd\x6c\x0b\xe4\x18\x56\x7b\x84\xf1\xfd\x89\xdc\x7b\xd0\
-\x59\x26\x19\xda\xff\xe1\x1c\x3d\x3e\x26\x51\x83\xff\x42\xd0\xda\
-\xc8\x7a\x21\x9e\x56\x9c\x1c\x97\x00\x8e\x0e\xaa\x7b\xfa\x34\xfb\
-\xb2\xc6\xa0\x1e\xe2\x7d\x88\xa7\xc7\x27\x18\x1c\x87\xac\xcc\x6b\
-\xa4\x5e\xe7\x17\x6e\x69\x5f\x7c\xce\x23\x08\xcd\xbf\x0f\x33\x08\
-\x1f\x1e\x18\x5c\xaf\xf3\xe5\xaf\xb4\x3e\x58\x7e\xb0\x9c\xd6\x1c\
-\x62\xbf\x62\xdc\xcb\xcf\x1c\x3f\x8d\xc6\xe2\x58\x57\x8b\x77\xf1\
-\xa4\xab\xdf\x67\x22\xcf\x53\xf4\xee\xc7\xb1\x51\xe3\xa9\xff\x9e\
-\x39\x75\x2e\xad\xf5\xc1\x3a\x7e\xcc\xd5\xe3\xb9\xdd\x3c\x71\xfa\
-\x18\xff\x80\xf5\xfa\x36\xbc\x97\xa7\xaf\x61\x0f\x6a\xd8\xd6\x3f\
-\x16\xae\x4e\x69\xab\x44\x9b\xea\x98\x2a\x26\xcc\xeb\x5b\x60\xbe\
-\x53\xc9\xcb\x37\x58\x9e\xc7\x71\x5a\xfb\xd7\x3a\x54\x94\x38\x24\
-\x25\x5a\x75\xb6\xf8\x98\xa5\x4e\x00\xec\x55\x95\xff\x10\x7a\xe6\
-\x55\xbc\xd8\x99\xfb\xed\xb3\xdf\x6d\xe8\xfc\x2f\xd6\xe9\xef\xcf\
-\xaf\x80\xac\xbc\xaf\xc0\x59\xa2\x3a\xab\xd1\xf9\xbe\x24\xb3\xb1\
-\x1a\xff\x85\xc0\xcc\x5a\xa1\x87\x5e\x6c\xec\xdb\x84\xe1\xe4\x8f\
-\xb2\xea\x67\x6d\x5a\x30\x3e\xc0\x89\xb1\x09\x06\xc7\x21\xc7\xc7\
-\xc6\xab\xef\x39\xc8\x2d\x74\x0e\xe0\xdd\x25\x6f\x12\x7c\xef\xe0\
-\xea\x06\x61\xa9\xb9\xd0\x7a\xc5\x0e\x90\xdf\xf9\xb7\x35\x72\xfe\
-\x31\xc6\x36\x64\xad\xef\x97\xf1\x35\x78\x49\xf4\xd6\x69\x78\xfe\
-\x04\xc6\x27\xd7\x83\xab\xaf\xb6\x23\x68\xab\xa7\x0e\x58\x89\x5e\
-\x28\x35\xa0\x61\x2d\x55\x5f\xdf\xfe\x2c\xcf\xe4\x10\x8e\x15\x24\
-\x86\x88\x12\x8b\x4c\xef\x51\x4f\xbd\x8f\xa8\xb7\x85\x7c\xef\xd8\
-\xa7\x7c\x90\x4c\xd1\x03\x96\xa9\x57\xc0\xda\x05\x78\xa5\x73\x18\
-\x9c\x7c\x25\x0e\xae\xce\x4a\x82\x83\x2b\x87\xc2\xaa\x7d\x9b\xe0\
-\xd5\xf2\xdb\x50\xf8\xed\x53\xcb\x3b\xff\x57\xf1\xe2\x79\xc6\xed\
-\x7f\x7f\x99\xf5\xe9\xe3\xe5\x79\x15\xd0\xd5\x8a\xcf\xe2\x9b\xcb\
-\xc6\xe1\xf7\x9e\x11\x1b\xac\xe4\xbf\x10\xb4\x35\xb2\x5e\x18\x4f\
-\x2b\x66\xf4\x88\x64\x38\x79\x95\xe5\x99\x34\x23\x78\xe1\xec\x60\
-\x0f\x47\xc7\x24\x18\x1c\x87\x94\x4f\x4d\x82\xe6\x75\x3c\x99\xd7\
-\x5b\x6b\xe6\xef\x3b\x51\x59\xeb\xf0\x1f\x86\xf3\xce\x8e\xf6\xd0\
-\x95\xc4\x29\x6b\x0a\x88\x0f\xa8\x25\xc7\x59\x3e\xbb\x1d\x1c\x58\
-\x35\x1c\xd6\xef\x5a\x0e\xf3\xce\x9c\x82\x51\x1f\x3f\x84\x82\x0a\
-\x13\xde\x33\x76\xef\x05\x64\x5d\x7e\x00\xed\xd7\xed\x87\xc6\x23\
-\xa6\x41\x50\xeb\xce\xe0\xe8\xee\xa1\x79\xae\x0a\xfd\xd9\xf9\x04\
-\xe9\x04\x81\x12\xbd\x75\x1a\xde\x4f\x02\xcd\x6b\x7b\xe9\xc1\x7f\
-\x0b\xd7\x0a\x2d\x7a\x71\x61\x62\x12\x78\xb9\xaa\x6a\x01\xd8\xce\
-\xff\xd3\xb3\x91\x39\xf1\xc1\xa2\xc4\x21\xbb\x87\x34\x67\xce\x01\
-\xe1\x59\x80\xd6\x26\xfe\x8e\x83\x94\x7b\x10\x5f\xc8\xd4\xfb\x94\
-\x13\x4d\x9a\x93\x5a\x1f\x2e\x4c\x4a\xd4\x3b\xc7\x59\x3e\xab\x1d\
-\x1c\x5f\x52\x00\x3b\x36\xcf\x80\xd5\xef\xaf\x83\x45\x47\xf7\xc1\
-\xcc\x92\x8b\x30\xee\xc6\x5d\x18\xfa\xd9\x3f\xa1\xdf\xd7\xbf\xf1\
-\xe6\x77\xd1\xd7\xbf\xc3\xd0\xcf\x7f\x80\xb1\x37\xbf\x85\x19\xa5\
-\x97\xe0\xf5\x13\x07\x88\xef\xb1\x11\xb6\x6f\x99\x05\xc7\x96\x15\
-\x41\xf9\x9c\xb6\xca\x1a\xab\x16\xb0\x67\x78\x13\x98\xdb\xa7\x1e\
-\xe4\x25\xd6\x82\x66\x75\x3c\xd4\xeb\xad\xd5\x81\x7e\xcd\x37\x04\
-\x7b\x09\x5e\x25\x48\x26\x90\x62\x82\xaa\x16\x8a\xcf\xca\x9b\x70\
-\xe1\xea\xe4\xf6\xba\xf1\x2a\x83\x76\x56\xaf\x17\x03\x92\x54\x67\
-\x81\x0e\xb3\x3c\x17\xdc\x0b\x78\x86\x75\x3c\xbb\x07\x37\x17\x25\
-\x0e\x19\xd8\x5a\xf5\x7a\x9f\xca\x14\xfd\x44\x8d\x69\x58\x73\x90\
-\x2a\x53\xdc\x59\xf2\x94\xe1\x04\xd6\x3f\xf7\x4b\x0a\x85\xf7\x87\
-\xc5\x9a\xac\x8e\xf3\xca\xcc\x36\x50\x36\xaf\x2b\x9c\x5f\xd0\x0b\
-\x4e\xbf\x91\xa5\x44\x26\xc5\xf9\x85\xa9\x74\xac\x7c\x56\x5b\x83\
-\xea\x2d\xca\xa7\x27\xc2\xae\xa1\x4d\x61\x4e\xef\x7a\x20\x6f\x51\
-\x8b\xd6\x60\x3a\xb3\x6b\x02\xea\xef\x5d\x82\x5d\x32\xc5\xfd\xd7\
-\x1d\x08\x3c\x6b\xb8\x06\xfc\x84\xcf\xe6\xe4\xa8\x24\x7e\x1a\x20\
-\x04\x16\xac\x15\x27\xc6\xb4\x64\xd6\x0d\x5c\x27\x9a\x72\xe5\x46\
-\xe2\xea\x78\xc1\x15\x11\xe2\x90\xd2\x49\x49\x50\xc7\x57\x75\x26\
-\x70\x9a\x91\xbe\xcb\x30\x82\x19\x04\x0f\x99\x39\x8f\x67\x9a\x5a\
-\x45\x78\xc3\x1b\x19\x0d\xe0\xd2\x94\x56\x36\x51\xc7\xc9\x07\xe5\
-\xd3\x12\x61\xcf\xb0\xa6\x30\xaf\x4f\x7d\xc8\x27\x7e\x42\xf3\x30\
-\x4f\x2e\x3f\x81\xe9\xbf\xb4\x93\x60\xa2\x52\x13\x3c\x6a\x10\xff\
-\xaf\xe1\x33\x58\x9f\x1b\x0b\x57\x27\x75\xa8\x8a\xc9\x6c\x68\x6f\
-\x1c\x98\xd2\xb7\x50\x6a\x40\x4e\x7c\x88\xb6\x5e\x20\x98\xab\xfb\
-\x27\x8e\x2f\x4c\x6b\x24\x4a\xde\xe2\xed\xdc\x18\xf5\xfb\x43\x1b\
-\x88\xf4\xfd\xe1\x1e\x06\xf6\x31\x3a\xa7\x9e\xcb\xab\xeb\xe7\x0a\
-\xc3\xda\xd5\x81\x43\xa3\xe2\xad\xa2\x36\xcb\x14\x67\x44\xd8\x34\
-\x81\xc3\x4f\xc0\xda\xed\xaf\x34\x34\xc1\xdd\x46\xf9\xff\x2e\x7e\
-\xe6\xa9\x5d\xa3\xaa\xf3\x5f\x08\xac\x50\x2b\x0e\x0e\x4f\x64\x6a\
-\xf5\xff\x24\x88\x60\x79\x36\x43\xf1\xd9\xd4\xf2\x72\x86\x92\x09\
-\x49\xa2\xc4\x1e\xbd\x9a\x04\xa9\xdf\x33\x60\x48\xed\x29\xe6\xf2\
-\xf0\x0e\x77\xd5\x3d\xa3\xb8\xbe\xa5\x36\x0d\x82\x0d\x85\x4d\xe0\
-\x8a\x95\xd5\x66\x99\xcb\xb7\xb8\x34\x35\x11\xb6\x0d\x8c\x81\x69\
-\x3d\x22\x20\xbd\x79\x20\xdd\x1b\x72\xb0\xb7\x63\xd3\x84\x67\xca\
-\xd8\x0d\x7b\x47\x8c\x91\x29\x7a\xb2\xba\xd8\x00\xff\x31\x37\x04\
-\x99\xb1\x21\x84\xc7\x1d\xb5\xa0\x83\x78\x30\xa5\x56\xe8\xd0\x0b\
-\x35\x3e\x6e\x65\x79\x36\x78\xfe\x9b\xde\x93\x30\x20\xa9\x8e\x20\
-\xdf\x82\x0b\xa7\xc7\xb6\x02\x7f\x77\xd5\x39\xe4\x51\x02\xbf\x2b\
-\x7f\x82\xf1\xca\x79\xa8\x9a\x9b\x4d\x43\x3d\xe9\x9e\xc6\xb9\x09\
-\xad\xac\xba\x36\xcb\x52\x7c\x8b\xb2\x29\x89\xb0\x75\x40\x0c\x4c\
-\xe9\x1e\x01\x7d\x62\x03\x21\x2a\xc8\x8d\x4b\x13\x70\xdd\xf8\x58\
-\xa6\xe8\xa5\x35\x52\xa9\xc9\xd6\xb6\x07\x89\xbe\x0d\x34\x0a\xf2\
-\x84\xab\x13\x3b\xf2\xc3\x24\x3e\xb0\x0e\xbd\xd8\x3f\x24\x91\xc9\
-\xcd\xa3\xbe\x37\x66\x79\x3e\xa8\xf3\x2f\xb0\x6e\xf8\x83\x21\x09\
-\xa2\xc4\x20\x6f\xa4\x35\x66\xe6\xcf\x63\x65\xcc\xae\xcd\x50\x83\
-\xba\xcb\x14\x77\x8a\x3f\x61\xe6\x9e\xaf\x9b\x13\x14\x26\x86\xc2\
-\xee\x41\x71\x36\x53\x9b\x65\xc9\x5a\x51\x3a\x39\x11\xb6\xf4\x8b\
-\x81\xc9\xdd\xc2\x89\x8f\x15\x08\x91\x81\x6e\xec\x77\x35\x28\xf2\
-\xad\xb7\x08\xf0\x0e\xe0\xbe\x56\xe0\x23\x60\x5c\xf3\x0c\x39\x50\
-\x3a\x8e\xf0\x6a\x62\x27\x16\x74\x34\x0c\x16\xae\x15\x59\xcd\x55\
-\x79\x80\x7d\x1c\xcf\x08\x7d\x03\x68\x53\xcf\x4f\xb4\x1c\x67\x72\
-\x03\x55\x6d\xf0\x09\x8e\xd7\xc4\x78\xa4\x98\xe0\x11\x33\xb7\x70\
-\xbe\xb5\xad\xef\x0b\x8b\xd2\x1b\xc1\xc5\x49\x6d\xcc\xb6\x7f\x6a\
-\x79\x5a\x61\x1e\xbd\xc0\xbd\xd3\x4d\x45\x31\x30\xa9\x6b\x38\xf4\
-\x6a\x1a\x40\xeb\xa7\xec\xec\xaa\xe9\xc1\x79\x2b\xf0\x01\x68\xdf\
-\xcb\xd5\xd9\xcd\xe1\xca\x84\x4e\xd5\xc0\xae\x09\xda\x60\x4c\xad\
-\x10\x5f\x2f\x8e\x8e\x48\x52\xdf\x0b\x48\xe4\xd8\x43\xa7\xfb\x24\
-\x6f\xa6\x47\x8b\x12\x87\x1c\x1f\xd5\x12\xbc\x5c\x54\x35\x08\xfd\
-\xd4\x72\x79\x85\x04\x67\x95\x7b\x55\x74\xbc\xb6\x8f\x2b\x8c\x6c\
-\x1f\x0e\x47\x46\xb4\xb4\xf9\xda\x2c\x6b\x8f\x43\x4a\x88\x26\x6c\
-\xe8\x1b\x0d\x13\xba\xd4\xa5\x79\x23\xe5\x77\xd8\xc1\xc2\xf9\xff\
-\x16\x8d\x71\x5b\x86\x13\xbe\x27\x6b\xa0\x93\x20\x98\x54\x2b\x44\
-\xf4\x2d\xfa\xb7\x54\x9d\x0d\x2e\xe7\xc8\xcb\x8d\x55\xec\xa1\x3b\
-\xc3\xa9\xd1\xad\x45\x89\x43\xe6\xf4\x68\xc8\xbc\xe6\xff\x29\x6b\
-\x03\xff\xa3\x9e\xcb\xeb\x19\x13\x04\xeb\xf2\x9a\xc2\x15\x5b\xab\
-\xcd\xaa\x21\x71\x08\xc6\x09\xca\xef\xb3\xc8\xc2\xf9\xdf\x13\xdf\
-\x67\x93\x10\x6f\x16\xfe\x0b\x85\x05\xeb\x85\x16\x9d\x38\x37\xb6\
-\x1d\xf8\xbb\x3b\x6b\x3b\x17\x60\xaf\xcc\xd9\x43\xd7\x86\x81\xa2\
-\xc4\x22\x57\x08\x92\x22\x7c\xab\xf8\x8b\xd1\xc1\x9e\x30\xb5\x6b\
-\x24\x9c\x1d\xdb\xda\xe2\xf7\x4f\x25\xdf\xa2\x12\xe7\x27\xb6\x84\
-\x0f\x47\xc4\xc1\xd6\x7e\x4d\x60\x59\x4e\x23\x98\xd3\xab\x3e\x34\
-\xa8\x3c\x67\x22\xb7\x70\xfe\x63\xbd\xc3\x1f\x18\x5f\x9e\x1c\x4e\
-\xe6\xe5\xf8\xce\x4a\x24\xeb\x86\x0d\x69\xc5\x6b\x3d\x54\x67\xf6\
-\xbf\x27\xf0\x65\x79\x4e\xf5\x64\xca\xfb\x41\x66\x77\x6f\x24\x4a\
-\xfc\x71\x70\x68\x4b\x08\xf6\x72\x81\xbc\xf8\xda\xb0\xb3\x7f\x82\
-\xed\xd5\x5a\x58\xa1\x6f\x51\x3e\xa5\x35\x9c\x18\x9b\x08\x7b\x06\
-\x37\x87\xf5\x05\x31\xb0\x28\xa3\x21\x4c\x4d\xa9\x07\xc3\xdb\x87\
-\x41\x5e\x8b\x10\xe8\x1e\x1d\x00\xad\x22\x7c\xa0\x41\x90\x3b\x04\
-\x79\x3a\x83\x93\x03\x67\x5d\x11\x73\xbf\xa4\x9f\x15\xe4\x00\x4e\
-\xd2\x79\x9d\x12\xad\xc6\x7f\x21\xb0\x7e\xad\xb8\x42\x10\x1b\xaa\
-\xba\xab\x67\x07\xc7\x73\x1a\xc0\xf8\xe7\x3b\xfb\xb5\x10\x25\x0e\
-\xb9\x22\x4a\x8e\xd3\xb6\x6a\xb3\xc4\xc4\x85\x09\xad\xe1\xf0\x88\
-\x16\xb4\xcf\xc5\x8a\x9c\x68\x98\x97\xda\x00\x26\x74\x8e\x80\x41\
-\xad\xeb\x40\x46\x6c\x2d\xe8\xd4\xc0\x9f\xd6\x79\x46\xf8\xbb\xa9\
-\xf7\x88\x14\x8a\x9f\x95\x75\x84\xd7\x94\xe7\x90\xb0\xff\x33\xf6\
-\xd8\xaf\x63\x25\xfb\x80\xb8\x7f\x09\x1d\xeb\x07\xc2\x95\x57\xba\
-\x10\x74\xae\x8e\xf1\x62\xc2\x98\x5a\xa1\xbf\x5e\x7c\x30\xb0\x95\
-\x7a\x9d\x68\xa6\xb6\xfd\x80\xba\xbe\x6e\x70\x76\x74\x5b\xab\xc8\
-\x71\xda\x8a\x56\x5c\x9e\xd4\x16\x8e\x8f\x6a\x05\x7b\x06\xc5\xc1\
-\xfa\xfc\xa6\xb0\x38\xa3\x31\x4c\x4b\x89\x84\x91\xed\xeb\x42\x41\
-\x62\x28\xcd\x99\xe0\x1e\x49\x74\xb0\x07\x04\x7b\xbb\x00\xf6\x72\
-\xd0\x83\xcb\x58\xff\xf7\xa3\xb2\x06\x10\xcf\x48\x1f\x20\xd8\x40\
-\xb0\x90\x60\x82\x32\x9e\xc7\x3d\xd9\x38\x25\xbf\x6d\xa1\x0e\xa8\
-\x36\xe6\xbf\x71\xee\x97\x8c\xee\xa4\xd4\x00\xbe\x30\xb3\x56\x88\
-\xec\x5b\x4c\x4a\x8e\x62\xe6\xc1\xbf\x64\xd5\x7b\x05\xa3\x61\xef\
-\xc4\x4f\xa8\x5e\x46\x06\x10\xbf\xc1\x3a\x72\x9c\x96\x58\x9b\x55\
-\x3a\xa1\x2d\x1c\x1b\xd9\x12\xb6\xf5\x6b\x0e\x4b\xb3\xa2\x61\x6e\
-\xaf\x86\x30\xa9\x73\x7d\x18\xd6\xb6\x2e\xe4\x25\x84\x42\xd7\x46\
-\x01\xf4\x7c\x6a\xfd\x00\x77\x08\xf0\x70\xe6\xda\x73\xd7\x85\x3f\
-\x94\xe7\x83\xbf\x52\xe6\x77\x71\x7d\xde\xac\x3c\x2b\x8c\xf5\xbd\
-\x03\x65\x8a\x7b\x5f\x9b\x2a\x79\xe0\x28\xab\x99\x46\xcf\x02\x2c\
-\xea\xd5\x4c\x20\xff\xbb\x58\x97\x5e\xe8\xd0\x83\x72\x82\x96\x75\
-\xfd\x98\xb9\x73\x5a\xc6\xde\xc3\xb7\x91\xd2\xe7\x83\x09\x1d\xa3\
-\xac\x22\xc7\x69\x6c\xbd\x28\x79\xa5\x2d\xec\x1f\xd2\x12\xb6\x16\
-\x36\x87\xe5\x59\x4d\xe0\xb5\x9e\x0d\x61\x7c\xa7\xfa\x30\x30\x29\
-\x0c\xd2\x9b\x05\x43\xa7\xa8\x00\xe2\x67\x7b\x43\x3d\xea\x67\x3b\
-\x11\x2e\xcb\xf4\x5d\x9b\x7f\x50\x5b\x9b\x0f\x29\xb9\xfc\x86\xb2\
-\x96\x15\xe3\xb3\xde\xca\xba\xad\x88\x1a\x76\x96\xc7\x50\xc3\x33\
-\x91\xd0\x29\x32\x08\xae\x8c\xeb\xca\x13\x5d\x14\xb0\x31\xad\x38\
-\x3c\xa4\x0d\xf8\xb9\x39\xa9\x9f\x11\x66\xcb\x07\x16\xe0\x38\xd6\
-\x4e\x6d\xca\x4b\xb0\xbe\xfd\x10\x91\x7c\x0b\xcc\x9b\x46\x05\x7a\
-\x30\x77\xab\x0a\x05\xe6\xc7\xbe\x26\xb8\x42\x70\x94\x60\x9b\x4c\
-\x71\x37\xe5\x54\x82\x21\x32\x45\x2f\x8f\x76\x4a\xbd\xf5\x97\x28\
-\x6a\x54\x0b\x66\x6a\x01\x4f\x0d\xeb\x28\x40\x03\xba\x0a\xd3\x0b\
-\x2b\xf1\x2d\x36\xe5\x26\x80\x77\x65\x8d\x0e\xee\x09\x2c\x20\xe8\
-\xa1\xac\xe7\x18\x4d\x50\xc2\xcc\xe3\x8c\xa6\xa1\x66\xcd\x5b\x98\
-\xcb\xb7\x98\x94\x1c\xa9\xce\xe5\xdf\x95\x39\xb0\xeb\xca\x7c\x32\
-\xe6\x50\x57\x12\xcc\x26\x18\x41\x90\x4d\xd0\x51\xa6\xb8\x67\xbd\
-\x96\xcc\x42\xee\x46\x90\xac\x8a\x9d\xa2\xe7\x01\x3b\x35\x86\x2b\
-\x63\xbb\x69\xc7\xb8\x6e\x46\xd2\x08\xcb\xf1\x2d\x0e\x0d\x6e\x03\
-\xcd\x43\x7d\x38\xd7\x2f\x0f\x67\x47\x98\xd8\xa9\x01\x94\xdb\xe8\
-\x9e\x88\x36\x5c\x1e\xdf\x81\x7c\x7e\x07\xa6\x6e\xb2\xbf\xc4\x67\
-\x9b\x30\x7a\x2f\x60\x6c\x88\x8f\x6e\xfe\x0b\xc1\x38\x63\xeb\x85\
-\x71\xb5\x62\xa3\x3c\x01\xb2\x9b\xd5\x86\x36\xe1\xfe\x10\x4b\xf4\
-\x20\x35\x3a\x04\x66\x77\x8b\x86\x8f\x46\x75\xb0\xca\x1c\xa7\x18\
-\x5a\x71\x60\x48\x92\x7a\xff\x0c\xc9\x6c\xc3\xf0\x3c\xd0\xcf\x18\
-\xcb\x7d\xd0\xb7\x1d\x5c\x19\x93\x52\x1d\x63\xd9\x60\x4d\x5a\x61\
-\x5d\x71\x88\xa5\xee\x9f\xe2\x79\x31\xe5\xb9\xd8\xa7\xca\xf8\x5c\
-\x32\xdb\x30\xcc\xa7\x42\x5e\x6c\x38\x3b\xff\x85\xc0\xd8\x5a\x61\
-\x03\xbe\x85\x35\xef\x9f\x66\x35\x0b\x55\x3f\xcb\xbc\x57\x99\x87\
-\x9f\xa4\x8c\x07\x7a\xda\xd8\x1e\x79\x4d\xb1\x58\x26\xb6\x3d\x37\
-\x8c\xcc\xcf\xd1\xdd\x15\x18\xa3\x0b\x29\x96\xaf\x17\x92\x6f\x21\
-\xaa\x6f\x71\x7e\x4c\x07\xe8\xd1\xb8\x16\xdf\x5c\x3f\xd6\x4e\x7f\
-\xa3\xcc\xf5\x1f\x91\x29\x7a\xe9\x30\x7a\xd1\x4f\x43\x2f\xa4\x3b\
-\x7b\xcc\x6b\xf4\xac\xcb\xe4\x0e\xd1\x50\x4e\xb8\xcf\xe0\x8a\x10\
-\x18\x5b\x2f\x4c\xe6\x5b\x74\x95\x7c\x0b\x1d\x5a\xf1\xe1\xc0\xd6\
-\xf0\x5a\xf7\x68\x18\xd1\xa6\x1e\xe4\xc7\xd5\x81\x1e\x8d\x6a\x41\
-\xab\xba\x7e\xd0\x20\xd0\x03\x02\x3d\x9c\x99\x1e\x2b\x42\xa1\xa9\
-\x17\x5b\x35\xf4\xa2\x87\xa4\x17\x46\x33\x3c\xb3\x04\x61\x3e\xee\
-\x70\x69\x24\x72\xbf\x87\x00\x58\xa0\x56\x8c\xb1\x85\x38\xc4\xba\
-\x7d\x8b\x0b\x63\x3a\xc1\xd1\xa1\x6d\x61\x5b\x41\x0b\x58\x9a\xd6\
-\x8c\xea\x05\xee\x9d\xf4\x4f\xac\x0b\xbd\xa2\x83\xa1\x7d\xbd\x00\
-\xba\xd7\x82\xfd\x0e\x9c\x1c\x0c\xaa\xf3\xbb\xad\xac\xf1\xc3\xfe\
-\x9d\x78\xdf\xc9\x0c\x65\x8d\x5f\xba\x72\xef\x36\x52\xd2\x0b\x9d\
-\x86\x7b\x39\x8f\xf0\xb9\xae\xe8\x9d\x08\xe5\xa3\x7a\x12\xf4\xe0\
-\x07\x3d\xb4\x42\xf2\x2d\x24\xdf\x42\x13\x67\x46\xb6\x87\xf7\xfb\
-\xb7\x82\x8d\xb9\xf1\xf0\x66\x9f\xa6\x30\xbd\x4b\x23\xea\x5f\xe4\
-\x69\xf8\x17\x01\xfa\xfb\x17\x8f\x95\xfe\x45\xb9\x9a\x7f\x31\x59\
-\x59\x07\x23\x99\x4c\x36\x1d\x9f\x53\xab\xb0\x00\x25\xff\x85\xc0\
-\x18\x5a\x21\xf9\x16\xda\xf8\x7e\x79\x6c\x17\xd8\xdd\xb7\x35\x4c\
-\x4b\x6e\x0c\xf9\xcd\xc3\xa0\x5d\xbd\x40\x68\x1a\xe2\x03\x0d\x03\
-\xbd\xa0\xbe\xbf\x07\x44\xf8\x79\x40\x74\x2d\x2f\x68\x19\xe6\x07\
-\x9d\xa3\x6a\xc1\x80\x16\x11\xf0\x66\x6a\x73\xf8\x68\x44\x27\xf3\
-\x68\xc5\x2b\xe2\xc6\x21\x2a\xbd\x90\x1b\xac\x17\xdf\x11\x04\x48\
-\xf4\xa7\xe7\x96\x51\x23\x61\x63\x46\x6b\x28\x1f\xd9\x8b\xa0\x27\
-\x37\x46\x19\x02\x0b\xf1\x2d\xac\x2c\xc7\x79\x70\x40\x7b\x28\x88\
-\xab\x0b\xb5\xbd\x39\x7b\xd4\xf2\x02\xde\x77\x58\x8f\x68\x44\x3e\
-\xf9\x5b\x7b\x8a\xda\xd4\x88\xbc\x05\x9b\x5e\x60\x0f\x1c\xe5\x33\
-\x99\x20\xd1\x9f\xda\x7c\x7c\x1e\x2d\xeb\x04\x28\xf9\x2f\x14\xc6\
-\xd0\x8b\x9a\x1d\x87\x94\x8d\xee\x02\x93\x3b\x34\x86\x60\x4f\xd7\
-\xaa\x1c\x76\x76\x86\x96\x2d\x5b\xc2\x90\x21\x43\x60\xda\xb4\x69\
-\xb0\x74\xe9\x52\xd8\xbc\x79\x73\x15\xac\x5d\xbb\x16\x16\x2e\x5c\
-\x08\x93\x26\x4d\x82\x81\x03\x07\x42\x9b\x36\x6d\x20\x20\x20\xa0\
-\x9a\x1e\xe0\xf9\x1c\xd4\x95\x13\x43\x3b\xd4\xa8\x38\x04\x35\x40\
-\xc6\x7d\x27\x4c\x4d\x34\x3c\xf7\x42\xef\x98\xd8\x90\xde\x06\xca\
-\x47\xa4\x2a\xd1\xab\x2a\x46\x8a\x01\xc9\xb7\xd0\x86\xb2\x51\x5d\
-\x61\x70\x62\x7d\x70\x75\x74\x50\xf1\x34\x2c\x2c\x8c\x72\xf9\xf2\
-\xe5\xcb\xf0\xe7\x9f\x7f\x82\xbe\xf6\xc3\x0f\x3f\xc0\x87\x1f\x7e\
-\x08\xe3\xc7\x8f\x87\xfa\xf5\xeb\xab\xfe\x3e\x9e\xb7\x4d\x8e\xac\
-\x05\xc7\x06\x77\xac\x11\x39\x4e\xac\xf3\x54\x7e\xf6\x9b\x12\xf5\
-\x55\x86\x7d\xa8\x21\xb1\x76\x80\x1a\xff\x85\xc0\x18\x5a\x51\xb3\
-\x7c\x8b\x19\x9d\x9b\x80\x9b\x93\x83\xf2\x4e\x3f\x3b\x48\x49\x49\
-\x81\x13\x27\x4e\xc0\x8b\x17\x2f\x40\x6c\x7b\xf9\xf2\x25\x94\x97\
-\x97\xc3\x88\x11\x23\xc0\xc5\xc5\x45\xa5\x03\xf2\xd8\x30\xb8\x38\
-\xba\xab\x4d\xe7\x38\x4f\x0c\x6b\xcf\xf0\xff\x3f\x12\xed\x55\xe6\
-\x23\x53\xf6\xbf\x5e\x97\x46\x7c\x80\xe1\xbd\x95\x48\xd5\x53\x0f\
-\xcc\xa1\x17\x66\xd4\x8a\x51\xfa\xe7\x38\x0f\xf5\xef\x08\xf5\xfd\
-\x3c\x55\xeb\x31\xf2\xfe\xc6\x8d\x1b\x60\x2a\xfb\xdb\xdf\xfe\x06\
-\xe3\xc6\x8d\x03\x27\x27\xc5\x59\x68\x1f\x57\x27\x58\x9f\x95\x68\
-\xb3\xfb\xa7\xe5\x04\x6a\xfd\xfc\xdc\x25\xea\xab\x6c\x2e\x3e\x93\
-\xf8\x50\x7f\x35\xfe\x0b\x44\x8d\xd6\x0a\xe1\xbe\xc5\xac\x2e\xcd\
-\xc0\xd1\x5e\x31\x17\x23\x22\x22\xe0\xd8\xb1\x63\x60\x2e\xfb\xfc\
-\xf3\xcf\x21\x29\x29\x49\xe5\x7f\x60\x1c\x62\xab\xfb\xa7\x98\x4b\
-\x55\xf2\xbf\x81\x44\xfb\x2a\x3e\x00\xf6\xa9\x87\xd7\xbb\xb6\x20\
-\x7c\xee\xa3\x86\xde\x46\x80\xb5\x68\x85\xf8\x7a\x71\x99\xa0\x67\
-\x43\x55\x5d\x3d\x8c\x1c\x39\x12\x7e\xfd\xf5\x57\x30\xb7\x3d\x7f\
-\xfe\x1c\x16\x2d\x5a\x04\x0e\x0e\x8a\x38\x24\x36\xc4\x17\x2e\x8d\
-\x4a\xb1\xb9\xda\xac\xc6\x41\x5e\xcc\xb3\x4f\x94\x68\x5f\xc5\xf0\
-\xbe\x4a\xa8\xe5\xe1\x06\xe7\x07\x91\x79\x3f\xac\x0f\x7f\x18\x55\
-\x2b\x6c\xc7\xb7\x28\x1d\xd1\x9d\xf2\x8a\x9e\xbf\xf0\xf0\x80\xfd\
-\xfb\xf7\x83\xa5\xd9\x99\x33\x67\xc0\xcf\x4f\xd1\x1f\x2d\xd4\xcb\
-\x0d\x4a\x86\x77\xb5\xa9\x33\x22\x09\xb5\x55\xbd\xdf\x92\x25\xca\
-\x57\x31\x7b\x65\x6d\x25\x0c\x8a\x6f\x48\x78\x9d\xa6\x86\x3e\xe2\
-\xa1\x86\xfa\x16\x17\x86\xf5\x80\x48\x7f\x4f\x55\x5e\xff\xce\x9d\
-\x3b\x60\xa9\xf6\xed\xb7\xdf\x42\xbd\x7a\xf5\xe8\x7b\xf5\x73\x73\
-\x86\x93\x43\x3a\xdb\x4c\x1d\x67\xfb\x7a\xaa\x7b\x7b\xd2\x25\xca\
-\x57\xb3\x96\x32\xbc\x0f\x97\xc4\xa5\x7b\xe5\x5d\xa0\x7c\x68\x9a\
-\x76\x0c\xe3\x82\x31\xf4\xc2\x5a\xb4\xa2\xba\x5e\x5c\x1a\xd1\x13\
-\x1a\x07\x2a\x6a\x4f\xa2\xa2\xa2\xe0\xd1\xa3\x47\x60\xe9\xf6\xf7\
-\xbf\xff\x1d\x9a\x34\x69\xa2\xd2\x80\xf3\xc3\xbb\xd9\x44\x6d\x56\
-\xf7\x86\xaa\xfb\x60\xfb\x4a\x74\x67\x35\xec\xd1\x08\x6d\xeb\x06\
-\xc3\xe5\xa1\xe9\x1a\x48\xd3\x0a\xcb\xd1\x0a\xcb\xd2\x8b\x36\x75\
-\x83\x54\x79\x3e\xcc\xb9\x5b\x8b\xfd\xfb\xdf\xff\x86\xa6\x4d\x9b\
-\xd2\xf7\x5e\xc7\xdb\x1d\x2e\x92\xf8\xc5\xda\x6b\xb3\xd2\x63\xea\
-\x30\xfc\x1f\x21\x51\x9d\xd5\x6a\x31\x35\x41\x6f\xa5\x24\xc1\xe5\
-\x21\xe9\xd5\x31\x94\x0f\x0c\xd0\x0a\x53\xe8\x85\x89\xb4\x62\x58\
-\xa2\xe2\x1e\x50\x7f\x7f\x7f\xb8\x7b\xf7\x2e\x58\x9b\xa1\x1f\xc0\
-\xc4\x02\xf1\xa1\x7e\x16\xb5\x7f\xaa\x8f\x56\xa4\x55\xf2\x7f\xb8\
-\x44\x75\x4e\xc3\xfa\x68\xa8\xed\xe5\x0e\xe7\x06\xf4\x21\x9c\xcf\
-\x50\x43\xba\x70\x18\x5b\x2f\x2c\x34\x0e\x79\x27\xb3\x3d\xad\xad\
-\xc1\x9c\xfa\xd9\xb3\x67\xc1\x5a\x0d\xf3\x01\x4c\x4e\x70\x58\xcb\
-\x06\x56\x5d\x9b\xd5\xbb\x71\x6d\x86\xff\x43\x24\x9a\x73\x1a\xde\
-\x91\x72\x07\x9f\x93\x3c\xa6\x3e\x5c\x1e\x9c\x51\x89\x21\x42\x61\
-\x61\x5a\x31\xd4\x34\x5a\x71\x69\x58\x6f\x12\x37\x2b\xea\xeb\x8a\
-\x8b\x8b\xc1\xda\x0d\xf7\x05\xec\xed\xed\xa9\x9e\x6d\xce\x6a\x63\
-\xb5\x75\x9c\x3d\x1b\xa9\xf6\x5e\x07\x4a\x34\xd7\x6a\xd8\x7b\xe5\
-\x29\xd6\x83\xac\xed\xd5\x9e\x70\x3f\x53\x03\x19\xba\x61\x6c\xad\
-\xb0\x60\xdf\xa2\xa0\x99\xa2\xce\x1e\xe3\xe7\xa7\x4f\x9f\x82\x2d\
-\x18\x9e\x2d\xc2\xcf\x14\xe0\xee\x02\x97\x86\xf7\xb4\xca\xda\xac\
-\x94\x06\x21\xda\xee\x81\x97\x8c\xe5\x6c\x40\x1d\x2f\x0f\x38\xd7\
-\x3f\x8d\x45\x03\xf8\x22\xc3\x32\xf4\xc2\x44\xbe\xc5\xc1\xc2\x6e\
-\xf4\xbc\x2e\xae\x97\x58\x6b\x6f\x2b\xf6\xec\xd9\x33\x48\x48\x50\
-\x9c\xa1\xe9\x1f\x1f\x69\x95\xb5\x59\xdd\xa2\x42\x74\xdd\x01\x2d\
-\x59\xa5\x39\xc9\x94\x77\x61\xf6\x6e\x10\x0e\x97\x07\x65\x69\x20\
-\x93\x1d\x83\x0d\x85\x75\x6b\x45\x6c\xb0\xbf\xaa\xb6\xcf\xd6\xec\
-\xf6\xed\xdb\x34\x9f\x81\x7b\xc4\x67\x06\xa6\x58\x5d\x6d\xd6\xbb\
-\x39\x6d\xc1\xa5\xf2\x8c\xe5\x44\x89\xe2\x3a\x0d\xef\x73\xfa\x8d\
-\xc6\xb1\x9d\x5a\xb2\x68\x80\x10\x18\x43\x2f\x2c\x2b\x0e\x39\x5a\
-\xd8\x83\xd6\xd0\xe3\xd9\xba\x7f\xfe\xf3\x9f\x60\x8b\xd6\xbf\x7f\
-\x7f\xca\x9f\xac\x98\x70\xab\xac\xcd\x5a\xd0\x2d\x8e\xb9\xcf\xf0\
-\x19\x41\x57\x89\xe2\x3a\x0d\xf7\x4a\xc1\xcd\xd1\x11\xf6\x66\x75\
-\x87\xcb\x03\xb3\x35\x90\x55\x89\x41\x62\xc1\x4c\x5a\x61\xa0\x5e\
-\xb4\xab\x1b\x4c\xb9\x81\xe7\x6b\x6d\xd5\x70\x1f\x13\x63\x1b\x3c\
-\x4b\x57\x32\xb8\x97\x55\xd6\x66\x0d\x8c\x57\xdd\x6d\x88\x3d\x45\
-\xa5\xbb\x47\x75\xdb\x3e\x7c\x5e\x8d\x03\x7c\xa1\xa4\x5f\x06\x8b\
-\x06\xf0\x85\x31\xb4\xc2\x32\x7c\x8b\xf3\x03\xfb\xd0\xb8\x1f\xd7\
-\xff\xbf\xfc\xe5\x2f\x60\xcb\x96\x9e\x9e\x4e\xf9\x33\xa5\x5d\x33\
-\xab\x3c\x23\x72\x69\x78\x2f\x7a\xde\x55\xa9\x01\xbb\x25\x7a\xeb\
-\x34\xec\x15\x54\x81\xcf\x2b\x35\x2a\x02\x2e\x0f\xc8\xa9\x0a\xbd\
-\xf5\xc0\x1c\x7a\x61\x1c\xad\x18\xd5\x22\x86\xce\xa7\x3e\x7d\xfa\
-\x80\xad\xdb\xbe\x7d\xfb\xe8\x67\xad\xe7\xeb\x69\xb5\x75\x9c\xfb\
-\x0a\x92\xd5\xfb\x2d\x65\x49\x14\xd7\x69\x78\x77\xd0\xaf\xf8\xbc\
-\x26\x27\xc5\x57\xd7\x00\xbe\x18\x98\x63\xfd\x5a\xc1\xa2\x17\xe1\
-\x3e\x8a\xf3\x3d\xbb\x76\xed\xb2\x79\xfe\xff\xfe\xfb\xef\xe0\xe5\
-\xe5\x45\x7d\x9d\x92\x41\xa9\x56\x7b\x46\xe4\xd5\x76\x4d\x19\xfe\
-\x3f\x94\x49\xf7\x98\xf1\xb1\x02\x82\x97\x98\xff\x5d\xd7\x23\x99\
-\xf0\x59\xae\x81\x1c\xf1\x61\x05\x5a\x71\x71\x60\xa6\xaa\xd6\x0f\
-\xeb\xe6\x6b\x82\xf5\xea\xd5\x8b\x72\x67\x76\xc7\x78\xab\xaa\xcd\
-\x52\xd7\x8b\x4b\xc3\x52\x21\xca\x5f\xd5\x13\x60\xb2\x44\x6f\x5e\
-\xb6\x0c\x9f\x97\x8f\x8b\x33\xec\xcd\xec\x09\x97\xfa\xcb\x59\x71\
-\x99\x0d\x46\xd7\x0a\xf3\xe8\xc5\xbc\x8e\x89\x74\x0e\x25\x27\x27\
-\x43\x4d\xb1\xc5\x8b\x17\xd3\xcf\xdc\x36\x2c\x58\xcf\x3d\x54\xcb\
-\x38\x23\xb2\xbc\xa7\xea\xae\xf3\x7f\xcb\x14\xbd\x70\x24\xd3\x6e\
-\x78\x7f\xd0\x31\x45\x6d\x90\x27\x1c\xcb\x4d\x27\x7c\xcf\x55\x83\
-\x5c\x2f\x68\xd7\x0a\xcb\xf6\x2d\xda\x86\x29\xea\x4a\xb0\x2f\xb7\
-\x18\xf6\xe3\x8f\x3f\xc2\xba\x75\xeb\xa0\xb0\xb0\x10\xe2\xe2\xe2\
-\xe8\xd9\xc1\xc6\x8d\x1b\x53\x7d\x99\x3e\x7d\x3a\x94\x95\x95\xd1\
-\x5e\x9e\xe6\x34\x7c\x0f\xb4\x1e\xd0\xcd\xc5\xea\xeb\x38\xe3\x43\
-\xfc\x25\x1f\x40\x98\x79\x10\xdc\xa2\x35\xae\x81\xfe\x70\xae\x30\
-\x1b\x2e\xf5\xcb\xe5\x46\x7f\x6d\x10\x41\x2b\xfa\x9b\x57\x2b\x82\
-\x3d\xdc\xe9\xfc\x39\x7f\xfe\xbc\x41\x9c\xfa\xee\xbb\xef\x60\xd0\
-\xa0\x41\xaa\x9e\x9c\xda\x10\x1d\x1d\x0d\x07\x0e\x1c\x30\x1b\xff\
-\xb1\xaf\x38\xbe\x0f\xdc\xf3\xb0\xf6\x3a\xce\xb7\x52\x5a\x31\xcf\
-\xf5\x9e\x4c\xd1\x0b\x47\x32\xdd\x86\x77\xa9\x3d\xc0\xe7\xd6\xbe\
-\x4e\x6d\xb8\xd0\x97\x70\xb3\x5f\x9e\x1a\x72\xf5\x87\x95\x69\x85\
-\x8b\xb2\x6f\x9e\x21\x35\x3f\x98\x37\xc4\xbe\x60\xb4\xd6\xc2\xc9\
-\x11\x32\x1a\xd5\x83\x37\xbb\xb4\x81\x83\xf2\x5e\x70\xa1\x5f\x26\
-\x9c\x2a\x4c\x83\x77\xfa\x74\x86\xf1\x2d\x63\xa1\xbe\xaf\xea\x2e\
-\x1b\xba\xdf\xf0\xdf\xff\xfe\xd7\x2c\x1a\xe0\xe3\xe3\x43\xdf\xc3\
-\xc9\xa2\xde\x56\x7d\x46\xe4\xe2\x90\x3e\x10\xea\xe5\xce\x3c\xd3\
-\x5e\x12\xb5\x79\x5b\x8c\x4c\xd9\x3b\xb4\x6b\x44\x5d\x28\xeb\x4b\
-\x38\x5a\x94\x57\x89\x7e\x7c\x61\x0c\xad\x30\x8d\x5e\x5c\x28\xca\
-\x52\xf8\xc1\x01\x01\x06\x9f\xad\xc1\xba\xb4\xbc\x98\x28\x38\x59\
-\xd0\x47\x67\xcc\x81\xda\x10\xe4\xee\xa6\x3a\x67\x64\x8e\xbc\x63\
-\x8b\x16\x2d\xe8\xeb\xbf\xd9\xb5\xb5\xc5\xd7\x66\xe9\xc2\xc8\xc4\
-\x68\x86\xff\xef\x49\xb4\x16\x64\xd8\x4b\x95\xde\x25\xd8\x27\xaa\
-\x3e\x5c\x2c\xca\x27\xdc\x67\x90\x27\x0c\xc6\xd6\x0b\x23\x68\xc5\
-\xe6\x5e\x5d\xe8\xbc\xe9\xd0\xa1\x83\x5e\x1c\x5a\xbf\x7e\x3d\xfd\
-\x7d\xac\x4b\x5f\xda\xb5\x9d\xa0\x1c\x27\xfa\x04\xb1\xb5\x14\x77\
-\x7c\x75\xea\xd4\xc9\x28\x77\x86\x68\xb3\x9e\x3d\x7b\x2a\xce\x3a\
-\xb4\x68\x62\xf0\xfe\xa9\xb9\xeb\xbe\xf7\xe4\x74\x51\xcf\x03\x3a\
-\x4a\xb4\x16\x64\xed\x99\xda\x80\xec\x86\x0d\xe0\x62\x5f\x75\x0d\
-\x10\x02\x0b\xd2\x0a\x9e\x71\xc8\xa2\xce\x6d\xe9\xbc\xc1\x9a\x38\
-\xa1\xf6\xe9\xa7\x9f\xd2\xbb\xfd\x70\xef\xf0\xed\xee\x1d\xf5\x8a\
-\x3d\x3e\x2a\xcc\x80\x30\x6f\x45\xed\xc1\xea\xd5\xab\x4d\xca\xff\
-\xa2\xa2\x22\xfa\xba\xe8\xb3\xd8\x42\xdd\x77\x84\xaf\x6a\x2f\xb0\
-\xa3\x44\x69\xc1\x96\x42\xf0\x07\x3e\xbf\xb4\xa8\x48\x28\x2b\x24\
-\x7c\xee\x5b\xa0\x44\xbe\x76\x18\x5b\x2b\x8a\x8c\xa7\x15\x33\xdb\
-\xb4\xa4\x73\xa6\xa0\xa0\x40\x30\x7f\xba\x75\xeb\xa6\x38\x2f\x10\
-\xdf\xd4\xa0\x38\x64\x4b\x6a\x17\x1a\x3b\x04\x05\x05\xd1\xda\x1c\
-\x53\x19\xde\x29\x88\xef\xbf\x47\x64\x5d\x9b\xa8\xe3\x94\xc7\xa8\
-\xce\x05\xcc\x94\xe8\xac\x97\xf5\x90\x29\xcf\x0b\xa6\x44\x84\x43\
-\x69\x15\x0d\xe0\x8b\x7c\xf3\xeb\x85\x00\xdf\x62\x5c\x8b\x38\x3a\
-\x67\xf0\x6e\x5e\xa1\x67\x69\xf1\xf7\x70\xef\xa0\xa4\x6f\x8e\xc1\
-\xfb\xa7\x6d\x6a\x2b\xf6\x20\x8f\x1e\x3d\x6a\x32\xfe\xe3\x5e\x24\
-\xbe\x66\xc7\xba\xb5\x2d\xbc\x8e\x93\x9f\x5e\xcc\xeb\x94\xc8\xf0\
-\xff\x88\x44\x65\xbd\x0d\x7d\xa7\xff\xd1\x98\xb8\x4e\x1d\x28\xc9\
-\x27\xdc\x2b\x2c\x24\x28\xa8\x8e\xbe\x62\xc0\xbc\x5a\x31\x26\xa1\
-\x39\x9d\x33\x63\xc7\x8e\x15\xc4\x9d\x89\x13\x27\xd2\xdf\x1b\x9d\
-\x10\x2b\x4a\xde\x62\x56\x5b\x85\x1f\x82\xfb\x87\xa6\xb2\x39\x73\
-\xe6\x28\x72\x0f\xc8\x7f\xb3\xd4\x71\x8a\xab\x17\xef\x67\xa7\x30\
-\xfc\x7f\x24\xd1\xd8\x20\x6b\x25\x53\xdc\xb3\x0a\x71\xc4\x27\x3d\
-\x91\x93\xa3\xd4\x00\x21\x30\x86\x5e\x88\xaf\x15\x33\xdb\x28\xf6\
-\x8e\xfb\xf5\xeb\xa7\x57\xee\x7c\x4f\x7a\x2f\x51\x62\x11\xac\xc3\
-\xc2\xbf\x17\x19\x19\x69\x32\xfe\x2f\x58\xb0\x80\xbe\x66\x97\x88\
-\x30\x9b\xa8\xfb\x2e\x1d\x90\x01\x0e\x76\x76\xf8\x99\x9e\x13\x38\
-\x4b\x34\x36\xf8\xbc\xd0\xdf\x70\x7e\xd4\xf5\xf2\x82\xf7\xfb\xa4\
-\xc3\xa5\x82\xbe\x04\x85\x0a\x14\x8a\x09\x33\x68\x85\x52\x2f\x56\
-\x75\x4b\x56\xdd\xdf\xcb\xd7\xb0\x76\x0f\xf3\x7e\x98\xf3\xbf\x28\
-\x62\x8e\x13\x7b\x34\xb8\xb9\xb9\x99\x8c\xff\x6f\xbe\xf9\xa6\xe2\
-\xb3\xd7\xab\x6b\xb1\xb5\x59\x87\xf2\x52\x05\x69\x44\x88\xa7\xbb\
-\x74\x47\xa8\x78\x56\x47\xa6\xec\x21\xe6\xeb\xe2\x02\x1b\xba\x75\
-\x57\x6a\x00\x5f\x18\x43\x2b\xc4\xd5\x8b\x83\x59\x19\x74\xbe\x34\
-\x6b\xd6\x8c\x37\x6f\x7e\xfb\xed\x37\xfa\x3b\xb8\x7f\x2f\x66\x8e\
-\x33\xcc\x4b\xb1\x0f\xf0\xf8\xf1\x63\x93\xf0\x7f\xfe\xfc\xf9\xf4\
-\xf5\x72\x1a\x47\x59\x64\x6d\xd6\xb8\xc4\x58\x45\x8d\x22\x59\xd3\
-\xdb\xd4\x09\x81\x0f\xb3\x7b\xe9\x3c\x23\x12\x13\xa8\xba\x23\x30\
-\x49\xa2\xaf\x28\xe6\x49\x70\x02\x9f\xa9\xb3\x83\x03\xcc\x4a\x6a\
-\x23\x50\x03\xcc\xad\x17\xda\xb5\x02\x73\x9c\x42\xeb\x7f\x18\xfe\
-\xfb\xbb\xba\x8a\x1a\x8b\xa0\x9e\xe0\x99\xdc\x3f\xfe\xf8\xc3\x24\
-\xfc\x1f\x37\x6e\x1c\xfd\x1c\x93\x5b\x25\x18\xbd\x8e\x53\xe8\x19\
-\x91\xd2\x7e\x59\xd4\xbf\xc2\x5a\x6a\x6f\x6f\x6f\x55\x8d\xc5\x9a\
-\x1e\xda\xf7\x59\x13\x43\x6a\x31\xfc\xef\x26\x51\x57\x34\xc3\x33\
-\x43\x6b\x99\x9a\xd5\xb4\xc8\x06\x70\x3e\xb7\x10\x2e\xe6\x17\x71\
-\xe2\x12\x83\x82\x22\x8b\xd7\x0a\xf4\xbb\xf1\x73\x09\xb9\xdf\x0b\
-\xef\xd4\xc0\x75\xa9\x8c\xd7\x1e\x89\xee\x38\xe4\x42\x61\x2e\xad\
-\x23\xa8\x55\xab\x96\xc9\xfc\xff\xbc\xbc\x3c\x45\xdd\x41\x4a\x67\
-\x8b\xab\xe3\x7c\x3f\x53\x51\x9b\xd4\xb6\x6d\x5b\xf8\xf9\xe7\x9f\
-\x61\xd4\xa8\x51\xf4\xff\xc7\xb3\xeb\x5b\x7a\x77\xe1\xe4\x7f\xab\
-\x50\x15\xff\x53\x24\xda\x8a\x6e\x83\x08\x7e\xc7\xe7\xdb\xd8\x3f\
-\x00\xf6\xa7\x65\x6a\xd5\x00\xbe\x30\x99\x56\x70\xe8\x45\x94\xaf\
-\xe2\x5e\x6f\x21\x77\x7a\xb7\x6f\xdf\x9e\xfe\xce\x96\x1e\xdd\x45\
-\x89\x43\xde\xed\xd5\x83\xfe\xbd\xd6\xad\x5b\x9b\x8c\xff\x78\x06\
-\x09\x5f\x73\x5f\x46\x6f\x8b\xab\xcd\x9a\xde\x46\x91\x5f\x45\x1f\
-\x85\xb1\x99\x33\x67\x2a\xee\x5f\x27\x3e\xc1\xd9\xc2\x2c\x56\xdf\
-\x22\x26\xc0\x5f\xf2\xff\x8d\x6b\xf1\x04\xf7\xf1\x19\x7b\x3b\xbb\
-\xc0\xa2\xf6\xc9\x70\x31\xaf\x5f\x75\xe4\x6b\xa2\x48\x34\x54\x6a\
-\x85\x38\x7a\x91\xdf\x58\xc1\x83\xc9\x93\x27\x0b\xce\x9d\xe7\x36\
-\x6a\x24\x4a\x1c\xd2\xaf\x89\xa2\xff\xd8\xeb\xaf\xbf\x6e\x12\xee\
-\x3f\x78\xf0\x80\xbe\x9e\x97\xb3\xb3\x45\xd6\x66\xc5\x07\x2b\xee\
-\x5d\x3d\x76\xec\x58\x95\xbc\x2b\x53\xb3\xdc\xa3\x7e\x38\xab\x6f\
-\x11\xee\xad\xaa\x01\x6c\x2c\x51\xd5\x68\xe6\x47\x70\x5c\x15\x0f\
-\xd4\x6f\x00\x67\xb2\x0b\xd8\x75\x80\x0f\xf2\x8d\xa7\x17\x7c\x7c\
-\x8b\xad\xdd\x15\x73\x2a\x29\x29\x89\x37\x7f\xf0\x6e\x4d\xdc\x03\
-\xc0\x9c\xc8\xbe\xb4\x74\x83\xe2\x0f\xac\xb1\x08\x74\x53\x9c\x05\
-\xc2\xfb\xfa\x4c\x61\xd8\x9f\x80\xd6\xfe\x84\xd5\xb1\xb8\x3a\xce\
-\xe3\xb9\x8a\x7d\x3c\x8c\xfb\x9f\x3c\x79\x52\xe5\x7d\xdf\xbb\x77\
-\x8f\xf6\x69\x72\x20\x71\x40\x49\x61\x4e\x35\xdd\x08\x70\x73\x65\
-\xf8\x1f\x2a\xd1\xd4\xa8\x66\x27\x53\xdc\x35\x4a\x6b\x86\xeb\x78\
-\x7a\xc1\xc6\xae\xbd\x08\x9f\xfb\xeb\x40\x3f\xc3\x21\xb2\x56\x94\
-\xe6\xf5\x05\x27\x32\xa7\x30\xf7\x86\xeb\xa2\xd0\xfa\xb9\x18\x12\
-\x0b\x9d\xcf\xcd\xd7\x3b\x6f\x31\x2a\x4e\x51\x83\x88\xf5\xc4\xa6\
-\xb2\x38\xe5\x6b\x2e\x4d\xee\x64\x71\x75\x9c\xe3\x12\x14\xef\x6d\
-\xe8\xd0\xa1\xac\xef\x3d\x2d\x2d\x8d\x8e\x4f\x6c\x19\x5f\xc5\xb7\
-\x38\x5b\x90\x4d\x73\x28\x64\xec\xa9\x4c\x71\xff\x8d\x64\xc6\xb7\
-\xa6\x32\xe5\x7d\xa3\xa8\xd9\x03\x62\x9a\xc1\xb9\xec\xbe\x70\x31\
-\xb7\x3f\x3f\x58\x88\x56\xb4\x0d\xad\x23\xf8\xbe\x4f\xac\xd5\x67\
-\xea\x80\x5a\x86\x84\xc0\x19\x79\xae\xe0\xd8\x63\x75\x97\x6e\x74\
-\x2d\xc3\x3c\xf7\x9d\x3b\x77\x4c\xc2\xfd\x0b\x17\x2e\xd0\xf7\xec\
-\x49\x5e\xf3\xa2\x05\xd6\x66\x85\x7a\x2a\xfa\x28\xdc\xb8\x71\x43\
-\xab\xef\xd2\x2a\x24\xb8\x8a\x6e\x6c\xee\xd5\x8d\x59\xfb\x3f\x93\
-\x68\x69\x52\xc3\x5a\xab\xb7\x08\x5e\x30\xbe\xc0\x8a\x8e\x29\x84\
-\xdf\x03\x38\xd0\x5f\x3f\x18\xd1\xb7\xd8\x9a\x92\x4a\xe7\x4e\xfd\
-\xfa\xf5\x05\xf5\xe6\xfa\xfe\xfb\xef\x69\x6f\x2f\xfc\xdd\x30\xf2\
-\xb9\x97\x75\xea\xc2\x23\x6f\xa1\xe0\xfe\xa2\x0e\x1d\x69\xfc\x80\
-\xbf\xbb\x6a\xd5\x2a\x93\xad\xfd\x19\x19\x8a\x9a\x87\x82\xe8\x68\
-\x8b\xab\xcd\x5a\xd3\x4d\x71\x8e\x17\xfd\x13\x2e\x2b\x2d\x2d\x55\
-\x3c\x6f\x2f\xaf\x2a\xba\x31\x2d\x49\x55\xff\xbf\x53\xa2\xa4\x59\
-\xac\x1d\xc1\xe7\x4c\x5e\x20\xa5\x6e\x7d\x38\x92\x96\x07\x17\xe5\
-\x03\xaa\x23\x57\x08\x4c\xa3\x15\x7e\x2e\x8a\xd8\xf1\xdc\xb9\x73\
-\x82\xf8\xf4\xaf\x7f\xfd\x0b\xba\x77\xef\xae\xea\xe9\x13\x17\x54\
-\x0b\x16\xb6\xeb\x08\xa7\xb2\xf3\x58\x75\x60\x73\x4a\x4f\x68\x5f\
-\xbb\x8e\xea\xe7\xe7\xcd\x9b\x67\x32\xee\x7f\xf6\xd9\x67\xaa\xbb\
-\xc0\xa9\xbf\x62\xec\x5a\x0b\x81\x7a\xd1\x25\xbc\x2e\x7d\x26\xd8\
-\x57\x81\xcb\xd0\x4f\x52\xd5\x5f\xa9\xf9\x16\xdd\xeb\x45\x30\xcf\
-\x74\x82\x44\x45\xb3\x19\xc6\x5d\x33\x64\xca\x73\x84\x5e\x4e\xce\
-\x30\x3e\xae\x15\x9c\xcf\x26\x9c\x93\x0f\xd4\xc0\x00\x7e\x30\xb6\
-\x56\x28\xf5\x62\x64\x6c\xbc\xa2\x1e\xbe\x4b\x17\xc1\xbc\xc2\xde\
-\x1d\x7b\xf7\xee\x85\x86\x0d\x1b\xaa\x78\xed\x60\x67\x0f\x4d\xfc\
-\x03\x21\x25\xbc\x1e\x74\x8f\xa8\x07\xad\x43\x6b\xd3\x3a\x4a\x66\
-\x3c\x38\x38\x98\xde\xc5\x61\x8e\x9e\x1f\x9d\xeb\x86\x8b\xb6\x7f\
-\x2a\x96\x5e\x1c\xcf\xce\xa2\xb1\x10\xf6\x51\xd3\x56\x03\x89\xf7\
-\x32\xe3\x67\xa8\x4d\xe2\x04\x46\x37\xb0\x0e\xc3\xa7\xf2\xd9\x36\
-\x94\x68\x68\x76\xab\x4f\x70\x92\x99\xeb\xb5\x3d\xbc\x60\x41\xeb\
-\x64\x28\xab\xa6\x01\x7c\x31\xc0\x08\x7a\x51\x55\x03\x4a\x72\x8a\
-\x54\xb5\x40\x25\x25\x25\x7a\xf1\xeb\xcf\x3f\xff\x84\xdd\xbb\x77\
-\xd3\x7e\x02\x58\x53\x28\xd3\xe8\xfb\x89\x39\xc6\xe6\xcd\x9b\xc3\
-\xb2\x65\xcb\x4c\x56\xe7\xcb\xd8\xd9\xb3\x67\x55\xba\x74\x26\x27\
-\xcf\xe2\x6a\xb3\xc6\xc4\xc7\x6b\xcd\xfb\x31\xb6\x7d\xfb\x76\xfa\
-\x73\xb1\x41\x81\x2a\xfe\xbf\xd9\xa9\x23\xf3\x8c\xff\x22\x51\xcf\
-\xa2\x2c\x8d\xe0\x2b\x66\xfe\x37\xf5\x0f\x82\xf5\xc9\xa9\x70\x31\
-\x67\x90\x12\x03\xb5\xc3\xd8\x7a\xa1\xa1\x09\x23\x63\x15\xf9\xbc\
-\xd8\xd8\x58\x78\xf6\xec\x99\x41\x7c\x7b\xfe\xfc\x39\xbd\x6f\x13\
-\xb5\x04\x63\x8a\xeb\xd7\xaf\x9b\xed\x7e\x11\xf4\x4f\xe2\x95\xfc\
-\x4a\x8b\x8c\xb2\xb8\xda\xac\x32\xd4\x4b\xe5\x1e\x28\xf6\x56\xd0\
-\x66\xa8\x0f\xf8\x73\x45\x31\x31\x2a\xed\xc0\x73\xaa\xca\x39\x36\
-\x49\xa2\x9c\xc5\x19\xf6\x63\x1b\x49\xf0\x4f\x46\x07\x5a\x07\xd7\
-\x81\x75\x55\x74\x80\x2f\x8c\xab\x15\xa5\x39\xfd\x21\xd0\x4d\x71\
-\x86\xec\xad\xb7\xde\xb2\x99\xfb\x3e\x96\x2c\x59\x42\x3f\x93\x2b\
-\xf1\x6f\x2e\xe4\x15\x99\xa0\x36\x4b\x98\x0e\x2c\xee\xd0\x51\x55\
-\xef\xab\xcd\x7e\xfd\xf5\x57\x5a\x7b\x8d\x3f\x7b\x20\x23\x83\x72\
-\x7f\x53\x65\xee\xe5\x27\x99\xe2\xbc\x8a\x64\x96\x69\xf8\xdd\x2c\
-\x20\xf8\x85\xd1\x81\xf8\xc0\x10\x58\xd9\xbe\x07\x5c\xcc\x1e\x54\
-\x15\x39\x62\x40\x3f\xdf\x62\x43\xe7\x54\xea\xa7\x63\x7d\x0f\xe6\
-\xcb\xac\xdd\x6e\xde\xbc\x49\xf7\x17\xf1\x33\xcd\x6b\xd3\xc1\xac\
-\xb5\x16\x5c\xbe\x45\xb3\xc0\x40\x3a\x1f\x30\x87\xa2\xcd\x50\x93\
-\x99\xbd\x16\x46\x3b\x92\xc3\xea\x32\xfc\x5f\x24\x51\xcc\x2a\xcc\
-\x5f\xa9\x03\x3f\x31\x3a\xd0\xc4\x2f\x08\x5e\x6f\xdd\x05\x4a\xb3\
-\x90\xff\x83\x75\xc0\xf8\x5a\x91\x5e\xbf\x11\x7d\x5f\x8d\x1a\x35\
-\x32\x5b\x7f\x7e\x31\x0c\xd7\x4b\x66\x7f\x12\x6b\x1c\x2c\xb1\x36\
-\xeb\x83\x3e\x8a\xfd\xc8\x90\x90\x10\x78\xfa\xf4\x29\xe7\x67\xc1\
-\x7b\xd9\x31\x37\x88\x3a\xf6\x76\xe7\xae\x94\xfb\xef\xf4\xe8\x45\
-\xff\x7f\x65\x1d\x5a\xb0\x44\x2d\xab\x32\x2f\xe5\x5e\xc1\x8f\x8c\
-\x0e\xd4\x72\xf3\x80\x61\x4d\x5a\xc0\x91\xde\x05\x3c\x74\x80\x2f\
-\x84\xeb\xc5\x85\xec\x81\x50\xd7\x53\x71\xee\xb4\x77\xef\xde\x06\
-\xe7\x02\xcc\x15\xf3\xe7\xe7\x2b\xce\x37\x63\x6e\xfc\x82\xbc\x9f\
-\x45\xd4\x5a\x68\x6a\xc5\xa0\x26\xcd\x74\x9e\xbf\xc0\xbb\x95\xa2\
-\xa2\xa2\x14\x7b\x17\x61\xe1\x54\x37\xca\x08\x62\x03\x55\x71\xff\
-\x52\x89\x4e\x56\x6b\xee\x04\xe3\x08\xee\x32\x3a\x80\xe7\x3c\x53\
-\xc2\x22\x61\x5d\xa7\x3e\x50\x96\x35\x84\x03\x83\xa1\x4c\x34\x8d\
-\xa8\xae\x15\xc7\xfa\xe0\xd9\x60\xc5\x5d\x5e\x03\x07\x0e\x34\xfb\
-\x9d\x7d\x42\x6d\xf4\xe8\xd1\xca\x3b\xbe\xec\x61\x47\x8f\x74\xa3\
-\xef\x9f\xea\xab\x15\x4c\xde\xef\xca\x95\x2b\xac\x9f\xe3\xf4\xe9\
-\xd3\xd4\x37\xc0\x9f\xc1\xb3\x9a\x4c\xfe\x62\x6e\x9b\x76\x0c\xf7\
-\x31\xaf\xe4\x2d\xd1\xc8\xea\x0d\xcf\x14\xe0\xb9\xed\xc3\x32\x45\
-\x0f\x37\xfa\xfd\xe2\x3a\x3c\x38\x3a\x01\xf6\x74\x97\x6b\xd1\x02\
-\x5d\x50\x68\x85\x50\xbd\xd8\x91\x92\x4d\xcf\x06\xe0\xfb\x18\x3e\
-\x7c\x38\xcd\xe9\x5b\x83\xcd\x9a\x35\x8b\xbe\x67\xac\xf3\x59\x8e\
-\xb5\x98\x26\xd8\x3f\xd5\x47\x2b\x3e\xec\x93\x03\x76\x32\xea\xbf\
-\xd3\xf7\x8c\x77\x30\xa2\x9f\x8f\xb5\xbf\x1b\x37\x6e\xa4\xf7\xa2\
-\x30\xf3\xa0\x65\x70\x08\x9c\x97\x17\x52\xcd\x38\x9e\x99\xa7\x3a\
-\x33\x45\x30\x58\xa2\x8e\xcd\x59\x38\xc1\x62\xf5\x3d\x03\x44\x8c\
-\x5f\x10\x8c\x8f\x6d\x03\x87\x53\xfb\x12\x4e\x0f\x35\x40\x0f\x74\
-\x68\x85\x9a\x6f\xb1\x21\xb9\x37\xf5\x47\xf0\xf5\xe5\x72\x39\xed\
-\xff\x63\xc9\x3e\xbf\x3a\xf7\xe7\x26\x75\x34\xe9\xfe\xa9\x50\xbd\
-\xd8\xdb\x2b\x13\x5a\x05\x87\x6a\xbd\x2b\xd5\xd3\xc9\x19\xa6\xb7\
-\x6c\x53\x45\x37\x3a\xd6\x51\xe5\xfc\x2e\x29\xd7\x0d\xc9\x6c\xd3\
-\xb0\xf7\x10\xde\x4b\xb0\x83\xe0\x67\x66\x4e\xe0\xdc\x6e\x1e\x10\
-\x0c\x23\x9b\xb4\x84\xed\x5d\xb3\xa1\x2c\x73\x28\x37\xb2\xd4\xa1\
-\x9f\x26\x6c\xed\x92\x01\x2e\x0e\x8a\xda\xa0\x84\x84\x04\x78\xf8\
-\xf0\xa1\xc5\x71\x1f\xfb\xe4\x64\x66\x66\xaa\x9e\xcf\xac\xc4\xf6\
-\x26\xdf\x3f\xd5\x57\x2f\xb6\x93\xf8\x64\x50\x4c\x73\x48\xac\x15\
-\x02\x0d\x7d\xfd\xa1\x69\x40\x10\xa4\x47\x36\x84\xb7\x3a\x74\x81\
-\x52\x8d\xbc\xc5\xe4\x84\x24\xf5\xfd\xbe\x70\x89\x22\x35\xc6\xdc\
-\x08\x0a\x08\x8e\xca\x14\x67\x3c\x55\x6b\x44\xa8\xbb\x17\x64\xd7\
-\x6f\x02\xcb\xda\xf6\x84\xb3\xe9\x83\xb4\xeb\x81\x2e\x70\x68\xc5\
-\xbe\x1e\x79\xe0\xeb\xac\x38\x23\xe0\x4b\xe2\x50\xbc\xf3\xd7\x52\
-\xac\xa2\xa2\x82\xd6\x2c\xe1\x7b\x73\xb2\x77\x80\x15\x1d\xba\x9b\
-\x6d\xff\xd4\x98\x5a\xb1\xb6\x73\x4f\x70\xb6\x77\x60\xbe\x77\xb9\
-\x44\x89\x1a\xbd\x77\x80\xdf\xff\x36\x82\x1f\xd4\xb5\x00\xe7\x7f\
-\x33\xff\x60\xe8\xd7\x30\x0e\x96\xb4\xe9\x01\x27\x7b\x0f\x20\xbc\
-\x1e\xa6\x06\xfd\xb5\xe1\x1c\xd1\x96\xb8\xc0\x10\xd5\x6b\xe1\x59\
-\x3a\x73\xfa\x02\x58\x6f\x8c\x7d\xbc\xdd\x94\xb1\xb0\xbf\xab\x1b\
-\x7c\xd8\x2b\xcf\xec\xfb\xa7\xc6\xf0\x2d\x76\x74\xcf\xa0\xe7\x49\
-\x94\xcf\x7e\xb5\x44\x01\xc9\x94\x66\x2f\x53\xf4\x7b\x5b\x48\x70\
-\x5b\x3d\x77\xc8\xf8\xc2\x0d\x7c\x02\x20\x87\xf8\x07\x93\x9b\xb7\
-\x83\x65\x6d\x7a\xc2\x9e\x6e\x79\x70\x3e\x8d\xac\xeb\x19\xc3\x2a\
-\x91\xc9\x06\x76\x1d\x98\x1c\xd7\x4e\x95\x13\x70\x75\x75\xa5\xbd\
-\xb4\x7f\xf9\xe5\x17\x93\x72\xff\xe2\xc5\x8b\xf4\xee\x70\x99\xf2\
-\xee\xf1\x76\x21\x75\xe1\x5c\xe6\x40\xa3\xee\x89\x98\x44\x2f\x58\
-\x74\xe0\x83\x5e\x39\x10\xec\xee\xc1\x7c\xa7\x07\x95\xdf\xb9\x64\
-\x92\xb1\x19\xee\x05\xa5\x2a\xf3\x87\x97\x09\x9e\xb0\xe5\x95\xf0\
-\x1c\x4c\xa0\xab\x3b\x14\x35\x68\x0e\xe7\x34\xb5\x80\x07\x8e\xf7\
-\xee\x0f\x09\x81\xa1\x4c\xfd\x09\x04\x06\x06\xc2\xe2\xc5\x8b\xe1\
-\x7f\xff\xfb\x9f\x51\xf3\x7b\x47\x8e\x1c\x81\xe4\xe4\x64\xd5\xe7\
-\xc0\x73\xcb\x6b\x3a\xf6\xd6\x7b\x4f\xc4\xd2\xb5\x62\x7b\x4a\x06\
-\x04\xb8\xba\xa9\xe7\xfb\x5c\xa5\x29\x2e\x99\x00\xc3\xf9\x82\xf7\
-\x1a\x4e\x27\xd8\x42\x70\x9e\xe0\x01\xc1\x33\x86\x43\x8d\x7c\x02\
-\x61\x5f\xf7\x42\xc2\xeb\xe1\x1c\xe0\xd6\x81\xb5\x1d\xd2\x20\xcc\
-\xc3\xbb\x32\x5f\xed\xe9\x09\x23\x47\x8e\xa4\x75\xb7\x62\xd9\xd7\
-\x5f\x7f\x4d\xcf\x0c\x36\x68\xd0\x40\xf5\x3a\x98\x8f\x1c\xd0\x28\
-\x0e\x2e\x64\x0c\xd1\x9a\xb7\x10\x6d\x4f\x24\x5b\x6c\xbd\x18\xa4\
-\x53\x2f\xd6\x74\xea\x05\x5e\xce\xaa\x73\xbd\x25\xca\xb8\x4f\x32\
-\xc9\xc4\xb2\x44\x82\x0a\x9c\x5f\x3e\xce\xae\xb0\xa2\x4d\x2a\x94\
-\xa5\x0f\xd7\x0e\x0e\x8d\x58\xd3\x3e\x0d\x22\xbd\xfd\x54\xfe\x00\
-\xa2\x6e\xdd\xba\xf4\x6e\x51\xec\x2d\xfe\xd7\xbf\xfe\x95\x77\x4c\
-\x8f\xe7\x06\x0f\x1d\x3a\x04\x13\x26\x4c\x50\xd5\xbd\x31\xc0\x1c\
-\xe4\x98\xa6\xad\xa0\x24\x63\xb0\xe8\x39\x4e\x63\xec\x9f\xea\x03\
-\xfc\xdd\xd1\xcd\x5a\x32\xf7\xf9\x31\x3e\xbf\x8b\x34\x5d\x25\x33\
-\x82\x61\x3f\xe3\x93\x4c\xae\x60\x64\x4c\x12\x94\xa6\x8f\x20\x5c\
-\xd7\xc4\x70\x5e\x38\xd4\xbd\x08\xd2\x23\xa2\xc1\xdb\xd9\xb5\x5a\
-\xcc\x81\x3d\x01\x70\xff\x10\xf3\x86\x45\x45\x45\xd4\x4f\x40\x60\
-\x9d\x6e\x6a\x6a\x2a\x3d\x6f\xe0\xa8\xec\x41\xa0\x0e\xac\x43\x6c\
-\x13\x5c\x17\x56\xb5\xeb\x5d\xdd\x07\x11\x90\xb7\x30\x4c\x2b\x4c\
-\xe3\x5b\xec\xef\x99\x07\x6d\x42\xc2\x98\xcf\xfe\x52\xa6\x38\xd7\
-\xe3\x20\x4d\x53\xc9\x8c\x9c\x43\x5c\xa0\x9c\x6f\xd0\x29\xb4\x3e\
-\x9c\xea\x45\xe6\x64\xda\x88\x4a\xa4\x0b\xc5\x70\xd8\x97\x52\x08\
-\x43\xa3\x5b\xd2\xfd\x08\x6f\x27\x17\x9a\xa7\x93\xe9\x00\xe6\x25\
-\xfc\x5c\xdc\x68\xad\x53\x61\x54\x73\xd8\xdd\x35\x8f\x57\x1c\xc2\
-\x0b\x99\xa6\xd4\x0b\x61\x3a\x70\x2e\x63\x10\x8c\x6d\x96\xa4\xea\
-\xc1\x22\x53\xdc\x41\xdd\x47\x9a\x9a\x92\x99\xd0\xd2\x09\xfe\x8b\
-\xf3\x2f\xc2\xd3\x17\x76\x75\x29\x20\xdc\x1f\xa9\x81\x11\xfc\xc0\
-\xa2\x09\x25\x69\xc3\x88\x26\xf4\x25\xb1\x42\x3a\x89\x35\x7a\xc3\
-\xbc\x16\x5d\xe1\xb5\x84\x2e\xb0\xb2\x6d\x6f\xd8\xd2\x29\x0b\x8e\
-\xf4\xec\xcf\xdb\xcf\xe0\xce\x55\x0c\x37\xb2\x5e\x88\xab\x15\xe7\
-\x49\x1c\x33\xa3\x45\x07\x08\x71\xf7\x54\xd7\xc1\x0f\x08\x42\xa4\
-\xe9\x28\x99\x19\x0c\xfb\xc7\x7d\xc1\xe4\x04\x76\x75\x66\xd3\x00\
-\xbe\xd0\x5f\x2b\x74\xf9\x16\x82\x61\x61\x5a\xb1\xbf\x47\x01\xf1\
-\x8d\x5a\x40\x80\xab\xbb\x3a\xef\xbf\x50\xee\xdd\x48\x26\x99\x39\
-\x0d\x7b\x95\x60\x9d\x21\x74\xad\xdd\x00\xca\xfa\x8c\xd2\xc0\x48\
-\x6e\xa4\x8d\xb4\x30\xbd\xb0\x0c\xad\x28\x49\x1f\x02\xeb\x3a\xa4\
-\xc1\xf0\x98\x96\xd0\x3c\x20\xa4\x4a\x9e\x54\xa6\xe8\x1b\x5d\x24\
-\x93\xf6\xf5\x25\xb3\x1c\xc3\xda\x72\xf0\x22\x71\xfb\x05\xc2\xf9\
-\xd2\x6a\x1a\x20\x04\xd6\xa2\x15\xe2\xe9\xc5\xe2\xa4\x1e\x30\xb8\
-\x71\x0b\x48\x0d\x6f\x04\xb1\xfe\xc1\xaa\xb3\xd4\x6a\xc0\x1e\xd1\
-\xef\x13\x74\x95\xa6\x9a\x64\x16\x6a\xb4\x37\xc9\xbe\xae\xfd\xa1\
-\xb4\xf7\x68\x16\x8c\xaa\x44\x9f\xea\x10\x55\x2b\x4c\xa1\x17\x22\
-\x69\xc5\xdc\x16\x5d\x34\xd7\x77\x26\x97\xff\xa5\x4c\x71\x97\xbc\
-\x5c\x26\xf5\xea\x93\xcc\xf2\xed\x22\xce\xdd\x65\x49\x69\x1c\xfc\
-\x17\x82\x51\x5a\xf5\xc2\x56\x7c\x0b\x5c\xf7\x1d\xed\xec\x19\xce\
-\xbf\x4b\x30\x82\xa0\x33\x41\x90\x34\x9d\x24\xb3\x32\xdb\x84\xf3\
-\x78\x7c\x93\x0e\x50\x9a\x3a\x86\x03\xa3\x45\xd0\x06\xdb\xf0\x2d\
-\x56\xb5\xed\xa3\x7e\x3e\x6f\x89\x34\x7d\x24\xb3\x72\x9b\x8c\x73\
-\x39\x33\xbc\x99\x16\xfe\x0b\x84\xb1\xb5\xc2\x4c\xbe\xc5\xea\x76\
-\xe9\x18\xe3\xbf\x54\x72\x7f\xbd\x34\x75\x24\xb3\x01\xeb\x85\xf3\
-\x39\xc1\xbf\x0e\x94\xf6\x1a\x5b\x1d\xa9\xea\x18\x63\x04\x58\x87\
-\x6f\xb1\x34\xa9\xb7\xea\x2e\x53\xa5\xcf\x2f\xe5\xf1\x25\xb3\x05\
-\x8b\xc0\x39\x1d\xe0\xe2\xce\xce\x7f\x21\x30\xba\x56\x8c\x31\x8b\
-\x56\x2c\x6a\xd9\x93\xf6\x5c\x50\x72\x7f\xa3\x4c\xea\xc7\x25\x99\
-\xed\x18\xae\x63\xbf\xe2\xdc\x3e\xde\x6d\x38\x94\xf6\x1c\xa7\x40\
-\x2f\x2e\x8c\x15\x0f\xc6\xd6\x0b\x11\xb4\x61\x46\xf3\x2e\xb4\x5e\
-\x59\xc9\xfd\x0d\x12\xf7\x25\xb3\x41\xfb\x04\xe7\xf7\xfa\xd6\xf2\
-\x4a\xfe\x0b\x85\xb1\xf5\xc2\x0c\xbe\xc5\xa0\x86\x2d\xd5\xf7\xf6\
-\x16\x4a\xd3\x44\x32\x1b\xb5\x3d\x38\xc7\x67\x34\xeb\x06\xa5\x3d\
-\x5e\x21\x7c\xe6\x83\x71\x96\xab\x15\x06\xea\xc5\xb9\x9e\xa3\x20\
-\x35\x2c\x9a\xe1\x3d\xf6\x50\x18\x21\x4d\x11\xc9\x6c\xd8\xe6\xe1\
-\x5c\xef\x5b\x3f\x51\xc1\x7f\x21\x30\xb6\x56\x98\xd8\xb7\x38\xd2\
-\x6d\x08\xc4\xfb\xd7\x66\xb8\x8f\x71\x51\x9a\x34\x3d\x24\xb3\x71\
-\xcb\xc3\xf9\xde\x2e\xa8\x3e\xe1\xf4\x78\x01\x30\x86\x56\x98\xcf\
-\xb7\xd8\xd4\x36\x17\x82\x5c\x55\x67\xf4\xfe\x4a\x90\x20\x4d\x0d\
-\xc9\x6a\x80\xc5\xe2\x9c\x0f\x73\xf7\x85\xd2\xee\x13\x08\xc6\xeb\
-\x46\x0f\x7d\x60\x61\xbe\x85\x9a\x3e\xcc\x8a\x4d\xc1\x7e\x63\xcc\
-\xde\x7e\xb9\x4c\xba\x6b\x53\xb2\x9a\x63\xd8\x77\xea\x39\xe6\xb9\
-\xcf\x76\x1b\x07\x17\x88\x06\xa8\xa3\x54\x27\x8c\xa1\x17\xa6\xf1\
-\x2d\x70\xcf\xa3\x53\x70\x95\xfe\x63\xeb\x08\x9c\xa4\x29\x21\x59\
-\x0d\xb3\x7b\x38\xff\xb7\xb5\xed\x0f\x17\x52\x26\x2a\x31\x81\x1d\
-\xdd\xb9\x61\x1e\xad\xd0\x4f\x2f\x56\x27\xe5\x40\xa8\x9b\xaa\xaf\
-\xe9\xff\x94\x71\x90\x64\x92\xd5\x44\x3b\x8e\x3c\x98\xdf\xbc\x8f\
-\x1a\xff\x85\x40\xb8\x56\x98\x4b\x2f\xce\xa4\x8c\x86\xbc\x88\x78\
-\xd5\xbd\x9c\x04\x37\x09\x22\xa5\x29\x20\x59\x0d\x36\xbc\x5f\x1e\
-\x86\x46\xb5\x83\x0b\xdd\x26\xa9\x61\x62\x25\x52\xc4\x84\x79\x7c\
-\x8b\x95\x2d\xb3\x21\xdc\xc3\x4f\x7d\x6f\x6f\x81\xe4\xef\x4b\x26\
-\x99\x6c\x18\x72\xa2\x7b\x48\xb4\x06\xff\x85\xc2\x32\xb4\x42\x53\
-\x2f\x0e\x74\x1a\x06\x3d\x42\xa3\xd5\xfb\x93\xfe\x85\xa0\x95\xf4\
-\xb5\x4b\x26\x19\xb5\x76\xc8\x8b\x46\x5e\xc1\x70\xa1\xeb\xe4\xaa\
-\xe8\x36\xd9\x40\x4d\xd0\xa1\x15\x46\xd4\x8b\xb3\xdd\x5e\x81\x71\
-\x8d\x3a\x81\x9b\x83\xaa\x37\xcf\xef\x04\xf3\x65\xd2\x1d\x3b\x92\
-\x49\xa6\x6e\xbe\xc8\x0f\x57\xc2\x93\x12\x4d\xfe\x0b\x85\x51\xb4\
-\x42\xb8\x6f\xb1\x32\x51\x0e\xf5\x3c\x02\xd4\x73\xfb\x98\xe3\xa8\
-\x27\x7d\xd5\x92\x49\xc6\x6a\xb4\x17\xd8\x07\xed\x46\xc0\x85\x2e\
-\xaf\x2a\xd0\x55\x1d\x93\xc5\x87\x11\x7c\x8b\xb5\x2d\x0b\xa0\x6d\
-\x60\x7d\x75\xde\x7f\x2b\x53\x9c\x73\x96\x4c\x32\xc9\xb8\xad\x0c\
-\xf9\xb2\x34\x4e\x5e\xc9\x7f\x21\xe8\x6a\x0a\xbd\xe0\xe6\xfd\xaa\
-\x16\xb9\x90\xe0\x57\x57\x9d\xf7\x8f\x09\xa6\x4a\xf9\x3d\xc9\x24\
-\xe3\x65\xb4\x17\xd8\x2b\x0d\xba\x10\x3e\x4f\xd1\x82\x57\x0d\x87\
-\x88\x5a\xb1\xba\x45\x3e\x59\xef\x23\xd5\x79\xff\xb3\x4c\xd1\x9b\
-\xcb\x4f\xfa\x4a\x25\x93\x8c\xb7\x4d\x42\xfe\x64\xd4\x8e\x83\x0b\
-\x9d\xa7\xf0\x87\xb1\xb5\x82\x45\x2f\xce\x74\x1e\x0f\xc5\xcd\xfa\
-\x40\x33\x9f\xda\x12\xef\x25\x93\x4c\x1c\xeb\x89\x3c\x8a\xf7\xad\
-\x4b\x78\x3d\x55\x07\xa6\xe8\x0f\x03\xf4\x62\x5b\xd2\x20\xc8\x0a\
-\x8b\x07\x0f\x47\x17\x75\xde\xff\x1f\xc1\x6b\x04\xde\xd2\x57\x28\
-\x99\x64\x7a\x1b\xed\x05\xe6\xef\xec\x01\x17\x92\xa7\xf2\x43\x67\
-\xbe\xd0\x5f\x2b\x8e\x74\x18\x0b\x53\xa2\x7b\x40\xac\x6f\x98\x66\
-\xbf\x7d\x3c\xa7\xd3\x5f\x26\xed\xe5\x49\x26\x99\x18\x86\xbd\xad\
-\x7e\x41\x6e\x1d\x69\x3f\x1e\x4a\x92\xa7\xb1\xe2\x42\x15\x4c\x35\
-\x8a\x56\x1c\xed\x30\x0e\x66\x46\xa7\x42\xdb\x80\x48\x70\xb4\x73\
-\xd0\xf4\xf1\x37\x13\xc4\x4b\x5f\x97\x64\x92\x89\x6e\x1f\x23\xcf\
-\xd6\xc6\xf7\x83\x92\x4e\xd3\xb8\x91\xcc\x1f\x7c\xb4\xa2\x84\x60\
-\x6b\xe2\x20\x18\x1d\xd5\x19\x12\xfd\x22\xd4\x7b\xee\x21\xfe\x24\
-\x38\x45\x30\x44\x26\xdd\xa9\x23\x99\x64\xc6\x34\xda\x0b\x6c\x5a\
-\xa3\x54\xc2\xf3\xe9\x3c\x31\x4d\xb0\x56\x9c\x27\xd8\xde\x6a\x18\
-\x4c\x69\xd4\x13\x3a\x07\x45\x83\xaf\x93\xbb\xa6\x6f\xff\x94\xe0\
-\xa4\x92\xf3\x52\x3e\x4f\x32\xc9\x4c\x63\x98\x47\x83\x82\xb0\xd6\
-\x50\xd2\x71\x06\xc1\xf4\xaa\xe8\x24\x1c\x67\x3b\x4e\x85\x9d\xad\
-\x46\x40\x71\x93\x4c\x28\xa8\xdb\x1a\x12\x7c\xc3\x35\xf3\x77\x0c\
-\x1e\xc9\x14\xbd\xf5\xfb\x4a\x9c\x97\x4c\x32\xb3\x18\xde\x5b\x09\
-\xcd\x7d\xea\xc2\x47\x1d\xa6\x2a\x35\x40\x3b\x4e\xb5\x7f\x15\x3e\
-\x48\x1a\x0b\x6b\xe3\xfa\xc3\x82\x26\xd9\xf0\x4a\x54\x0a\xd1\x8f\
-\x24\x68\x1f\xd0\x10\xc2\xdd\x03\x34\xe3\x77\x75\x7c\x47\xb0\x9f\
-\x60\x34\x41\x03\xe9\xd1\x4b\x26\x99\xd9\x0d\xcf\x01\xfc\x17\xf9\
-\x89\x77\x5c\xa2\x5f\x1e\xea\xea\xcb\x0a\x2f\x47\x57\xcd\x38\x9d\
-\x0b\x2f\x95\x6b\x3b\xfa\xf3\x78\xde\x16\x7b\x6a\x86\x48\x8f\x5a\
-\x32\xc9\x2c\xd2\x12\x65\x8a\xbd\xb5\x27\x3c\xb8\xcd\xdc\x73\xff\
-\x77\x82\x1b\x04\x47\x65\x8a\xbb\xf1\x66\x13\xe4\x12\xc4\x11\xb8\
-\x49\x8f\x54\x32\xc9\xac\xce\xb0\x2f\x60\x2d\x99\xa2\x37\x0e\x1b\
-\x02\x64\x52\x6d\xbd\x64\x92\x49\x26\x99\xcd\x1a\xb0\xd9\x23\x59\
-\x31\xeb\xbf\xc3\x7c\xf2\x1b\xc5\xf0\x88\xfe\x5f\x16\x2b\xc3\xbf\
-\x68\x87\xf1\xa0\xcc\x81\x65\xf8\x89\xfa\x0b\x17\xb3\xff\x75\x95\
-\xf9\x54\x1b\x7e\x5e\xe5\x8d\xdb\xb1\xbc\xeb\x2a\x96\xac\x39\xae\
-\xf1\xc9\x7d\xb4\xfe\xf9\xea\x9f\xe0\xb1\x8e\x47\x37\x5f\x73\xbc\
-\xea\x1b\x78\x59\xed\xd1\x47\x68\x7d\x79\xb2\x3e\x6b\x7f\x79\x8d\
-\x37\x58\xa6\xe3\xbb\x65\xf9\xee\x8b\xb5\xbe\x7c\xd5\x0f\xf0\x84\
-\x65\xdc\x87\xfb\xe1\x57\xfb\x00\x2c\x6f\xaf\xca\x07\x60\x9b\x9b\
-\x76\xda\x9e\x5e\xd5\x0f\xf8\x9c\x75\xbc\x58\xcb\xd3\xab\xfa\x01\
-\x1f\xb1\x8e\x47\x68\x7d\xfb\xea\x0f\x60\xbe\x8e\x71\x0e\x0f\x4c\
-\xfb\xdb\xaf\x7c\x40\x4f\xd8\xc7\xed\xb4\x7f\xbc\xca\xf1\x47\x3a\
-\xd8\x5f\xc6\x31\x5e\xac\xf5\xe3\x55\x8e\x73\xa9\x4b\xb2\xb6\x6f\
-\xaf\xf2\x01\xeb\x1a\x57\x3d\x9e\xf9\xec\x0f\xf8\x89\x9a\x47\xcb\
-\x36\xce\x3c\x9e\x08\x8e\x2f\x80\x79\x3c\xf3\x38\xc6\x95\x8f\xc7\
-\xee\x25\xc7\xb8\xf2\x6d\xb9\x3c\xe7\xf8\x02\x95\xe3\x11\x5c\xe3\
-\xcc\xd3\x7c\xc2\xfe\x05\x32\x2f\x0b\x1c\xe3\xcf\x99\x3f\xa6\x7d\
-\xdc\x87\x65\x1a\xa9\x3f\xbe\x08\x96\x69\xa4\xfe\xf8\x92\x75\x8c\
-\x17\x73\x8d\x3f\x62\xfe\xfb\x11\xfb\x04\x2a\x63\xde\xab\xd6\x71\
-\x07\xce\xf1\xf9\xcc\x77\xc1\x31\xae\x9a\x0b\x5a\xc7\x23\xd8\x68\
-\x90\x5c\xf9\xf8\x23\xd8\x68\xa0\x36\x9e\xcc\x35\xfe\x5c\xf5\x52\
-\x32\xbd\xc6\x9f\x30\x8f\xef\xa5\x7e\xe3\x8f\x99\xc7\xfb\x5c\xbf\
-\xf1\x47\xbc\xc6\x1d\x58\x55\x2a\x59\xfd\xeb\x7b\x6c\xe0\xf8\x23\
-\xf6\x71\x2d\x5f\x7f\xd5\xf1\x32\xf6\x71\x99\x96\xf1\x62\xf5\xf1\
-\xf9\x3a\xc6\xd9\x05\xf2\x25\x33\xfe\xd2\xc0\xf1\xe7\x3a\xc6\x9f\
-\xb0\x0b\xfc\x73\x66\xfc\xb1\xd6\x71\x07\xd6\x45\x42\x7d\xbc\x8c\
-\x7d\xfc\x09\x33\x3e\x9f\x7d\x01\x52\x8d\xcb\xb4\x8e\xdb\x91\xd7\
-\x71\xd4\x32\x8e\x5b\x0c\x8e\x6c\xfa\xa9\xf6\xb1\x59\xc7\xd5\x3e\
-\xb6\x37\x9b\x7e\x0b\x18\xf7\xd1\x31\x1e\xc1\xb6\xfe\xa8\x8f\xcf\
-\x17\x38\x1e\x51\x75\x3c\xb9\x8c\x93\x7e\xbc\xc6\x8b\x1f\xb1\x4c\
-\x5f\x01\xe3\xd5\xa6\x90\x86\x6f\xa1\x39\x05\xed\xaa\x8e\xdb\x69\
-\xfe\xbe\xc6\xb8\xc3\x4b\xb6\xe5\xb1\x72\xdc\xe5\x11\xdb\xf2\xfb\
-\x48\xfb\xe3\x57\x1b\x7f\x8d\xd5\xbd\x50\x8d\xdb\x3d\xd2\x3e\xee\
-\x50\xc6\xea\xde\x3c\xe2\x9c\x1d\x8a\xd5\x45\x35\x1e\xa6\x75\x75\
-\x94\xc9\xda\xb0\xaf\xde\xaa\xf1\xc7\xec\xde\xc3\x23\xce\xb7\xef\
-\x52\x65\x9c\xbe\xfd\xe4\xf9\xd5\xbc\x2b\x66\xdc\x65\xbe\x26\xc9\
-\x93\xab\x8c\xfb\xd0\x07\xfa\xa8\x9a\xf7\xf7\x48\x8d\x3c\xc9\xea\
-\x33\xc0\xae\xaa\x73\x15\x4e\x3f\xf0\xf3\x6a\xce\xcf\xa3\xca\xc7\
-\xe3\x50\xc5\x95\x74\xa9\x36\xee\x52\xc5\x15\x8d\xa8\x36\xee\x53\
-\xe5\xeb\x2e\x66\xfd\xfd\x27\x9a\xce\xaf\xc6\xeb\xbf\xd4\x74\xbe\
-\xd5\xde\xbf\x83\xba\x2f\x1c\xa1\xe1\x7b\x7b\x6b\xcc\xe7\x62\x8d\
-\x71\x1f\xe5\xf8\x13\x0e\xdf\xdd\x45\xf9\x96\x9e\x68\xc4\x0e\x8f\
-\xd5\xbe\x9f\xe2\x4a\x67\xb4\x98\x6b\x5c\xc6\xf1\xfb\xf8\xfd\x27\
-\xab\x7d\xfe\x62\x96\x71\x75\x1f\xc8\x41\x23\xf6\xc0\xf9\x15\xa1\
-\xfe\xfd\x44\x54\x1f\xaf\xea\x62\x6a\xc4\x2e\x8f\xf1\x0b\x78\x54\
-\x6d\x7e\x56\x1d\xaf\xce\x2f\xd5\xf8\x4c\xf2\x9e\x9e\x54\x27\xc0\
-\x13\x35\x7a\x3b\x3c\xaa\x3e\xae\x9a\x71\x1d\xaa\x5d\xef\x6e\x57\
-\x65\x3c\x9c\x3d\x7e\xe2\x3d\xee\xc3\x3e\xae\x9a\x50\x3e\xf3\x59\
-\x09\xac\x1a\x77\x29\xd3\xea\xfd\x57\xd3\x9f\x08\x8d\xe0\xab\xaa\
-\x00\x38\x54\x8f\x3d\x1f\xb3\xc7\xfe\x3a\x22\x77\x96\x75\xbd\x58\
-\x7b\xe2\xc3\x4e\x47\x62\x44\x06\x82\x32\x17\x65\x7a\xa4\x1e\xd4\
-\xff\x04\x47\xf0\xeb\xa3\x2b\x38\x8e\xd0\x1e\x5c\xab\xfe\x80\xae\
-\xf1\x27\x06\x8e\x3f\xd7\x73\xdc\x05\xb4\x47\xd7\x7c\xc7\xc1\xd0\
-\xf1\xf9\x3a\xc6\xcb\x0c\x1c\x7f\x64\xe0\xf8\x63\x1d\xe3\x4f\xf4\
-\x1b\x77\xd0\x91\xdd\xb1\x03\x1d\x5f\x80\x8e\xec\x91\xce\xf1\x62\
-\x1d\x5f\x40\xb2\x8e\x07\x9c\xac\xe3\x01\x46\xf0\x1d\x7f\xac\x83\
-\x81\x4f\x74\x8c\x3f\xd7\x31\xfe\x52\xc7\x17\xa4\x2b\xfd\xc6\xf1\
-\x80\x5c\x74\xa4\xff\x5c\x74\x48\x8c\x8b\x8e\xf4\xa3\x03\x68\x7f\
-\x00\x0e\x3a\xd2\x9b\x0e\x3a\xd2\xa3\x0e\xda\xd3\xab\xea\xe3\x65\
-\x3a\xc6\x1f\xe9\x18\x7f\xac\x63\xfc\x89\x8e\xf1\x97\x32\x1d\xab\
-\x90\xae\xf1\x32\x1d\xe3\xba\xf2\xd3\xba\xf2\xdb\x2f\x75\x8c\x83\
-\xae\xf1\x32\x99\xf6\x0d\x80\xc7\x3a\xc6\x9f\x6b\xcf\xcf\x73\x25\
-\x8f\xb4\xbd\x81\x62\xee\xdd\x19\x96\xf1\x97\xba\xf6\x8e\xca\xb4\
-\xbb\x01\xd5\x5e\xc0\x41\xc7\x06\x4d\xb5\xf1\xc7\xda\xf6\x47\xaa\
-\xff\x81\xea\x3b\x48\x2f\xb5\xec\xbf\x54\xff\x03\xc9\x3a\x76\xa8\
-\x58\x37\xce\xb4\x6d\x50\x55\xfd\x04\x2e\x3a\x76\xc8\x7c\x58\xc6\
-\x9f\x6b\xdf\x40\x53\xff\x80\x6c\x2f\xaf\x3e\x1e\xa1\x7d\x9c\xf5\
-\xd7\xd5\xc6\x1d\x0c\x1c\x77\xd1\x31\xee\xc3\xbe\x01\xa9\xed\xcb\
-\xa9\x32\x5e\xac\x63\x1c\xb4\x8f\xdb\xe9\x18\x77\xd0\x31\xee\x02\
-\xdc\x1b\xa8\x9c\x4f\x5f\x6d\x3c\x59\xc7\x78\xb1\xf6\x71\xae\xb7\
-\xcf\x8c\x3b\xe8\x18\xf7\xe1\x1a\x2f\xd3\xfe\xf6\xaa\x05\xa7\xec\
-\xe3\x9c\x6f\x4f\x39\xee\xa2\x63\x3c\x42\xc7\x78\xb1\xf6\x71\xce\
-\x4f\xaf\x24\xb0\x8f\x8e\xf1\x62\xed\xe3\x5a\xfe\x3c\x1d\x4f\xd6\
-\x3e\xae\xed\xd7\x51\x40\x8a\xb5\x8d\x3f\x97\x81\x30\xfb\x7f\xdf\
-\x39\x99\x66\
-"
+from gns3_webclient_pack.qt import QtCore
 
-qt_resource_name = b"\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0a\
-\x0c\xf7\x16\x47\
-\x00\x63\
-\x00\x6f\x00\x6e\x00\x66\x00\x69\x00\x67\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0c\x07\x55\xc7\
-\x00\x71\
-\x00\x75\x00\x69\x00\x74\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0a\
-\x05\x78\x42\xa7\
-\x00\x72\
-\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x08\
-\x0c\x33\x57\x07\
-\x00\x68\
-\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x73\x00\x76\x00\x67\
-\x00\x0d\
-\x09\x8f\x7a\x87\
-\x00\x67\
-\x00\x6e\x00\x73\x00\x33\x00\x5f\x00\x6c\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x0c\xb3\xaf\xff\
-\x00\x67\
-\x00\x6e\x00\x73\x00\x33\x00\x5f\x00\x77\x00\x65\x00\x62\x00\x63\x00\x6c\x00\x69\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x69\x00\x63\
-\x00\x6f\
-"
+import logging
+log = logging.getLogger(__name__)
 
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x12\x00\x02\x00\x00\x00\x04\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xc9\
-\x00\x00\x00\xa2\x00\x01\x00\x00\x00\x01\x00\x00\x4b\xbe\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x13\
-\x00\x00\x00\x3c\x00\x01\x00\x00\x00\x01\x00\x00\x16\x5b\
-\x00\x00\x00\x6c\x00\x01\x00\x00\x00\x01\x00\x00\x24\xfa\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-"
+RESOURCE_FILE = "ui/resources.rcc"
 
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x12\x00\x02\x00\x00\x00\x04\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x82\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xc9\
-\x00\x00\x01\x6d\x15\x9b\x56\x34\
-\x00\x00\x00\xa2\x00\x01\x00\x00\x00\x01\x00\x00\x4b\xbe\
-\x00\x00\x01\x72\x3c\xa2\x51\x64\
-\x00\x00\x00\x52\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x13\
-\x00\x00\x01\x6d\x15\x9b\x56\x30\
-\x00\x00\x00\x3c\x00\x01\x00\x00\x00\x01\x00\x00\x16\x5b\
-\x00\x00\x01\x6d\x15\x9b\x56\x30\
-\x00\x00\x00\x6c\x00\x01\x00\x00\x00\x01\x00\x00\x24\xfa\
-\x00\x00\x01\x6d\x15\x9b\x56\x30\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x6d\x15\x9b\x56\x30\
-"
+_resource_path = None
 
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
 
 def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    """
+    Registers the resources, only done once.
+
+    :returns: boolean indicating if the resources are registered
+    """
+
+    global _resource_path
+    if _resource_path is not None:
+        return True
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.path.basename(RESOURCE_FILE))
+    if not os.path.isfile(path):
+        # frozen package, the file is shipped next to the executable
+        from gns3_webclient_pack.utils.get_resource import get_resource
+        path = get_resource(RESOURCE_FILE)
+    if path is None or not QtCore.QResource.registerResource(path):
+        # the icons and images of the user interfaces are missing
+        log.error("Could not register the Qt resources from '{}', the file may be missing from the package".format(path or RESOURCE_FILE))
+        return False
+    _resource_path = path
+    return True
+
 
 def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+    """
+    Unregisters the resources.
+    """
+
+    global _resource_path
+    if _resource_path is not None:
+        QtCore.QResource.unregisterResource(_resource_path)
+        _resource_path = None
+
 
 qInitResources()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Atomic file writes: readers see either the previous or the new content.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+
+# attempts to replace a file while it is open by a reader (Windows only)
+REPLACE_ATTEMPTS = 10
+
+
+def _replace(source, destination):
+
+    for attempt in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(source, destination)
+            return
+        except PermissionError:
+            # on Windows the file cannot be replaced while a reader has it open
+            if not sys.platform.startswith("win") or attempt == REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(0.01 * (attempt + 1))
+
+
+def atomic_write(path, data):
+    """
+    Write data to a unique temporary file in the same directory and move it
+    in place. The temporary file is removed if anything fails. The file is
+    created readable by the user only.
+
+    :param path: file path
+    :param data: content (bytes)
+
+    :raises OSError: if the file cannot be written
+    """
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".{}.".format(os.path.basename(path)), suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        _replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path, data, **kwargs):
+    """
+    Write data as JSON with atomic_write().
+
+    :param path: file path
+    :param data: JSON serializable data
+    :param kwargs: json.dumps() options
+
+    :raises OSError: if the file cannot be written
+    :raises TypeError, ValueError: if the data cannot be serialized
+    """
+
+    atomic_write(path, json.dumps(data, **kwargs).encode("utf-8"))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Background check of the availability of console commands.
+"""
+
+import concurrent.futures
+
+from gns3_webclient_pack.qt import QtCore
+from gns3_webclient_pack.utils.executables import ExecutableCache, command_program
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class CommandProbe(QtCore.QObject):
+    """
+    Resolves the executables of commands in a thread pool, off the GUI thread.
+    """
+
+    # emitted in the thread of the probe object with the command line and the
+    # path of its executable ("" if it is missing, None if it cannot be told)
+    command_probed_signal = QtCore.Signal(str, object)
+
+    MAX_WORKERS = 4
+
+    # pool shared by all the probes
+    _executor = None
+
+    @classmethod
+    def _pool(cls):
+
+        if cls._executor is None:
+            cls._executor = concurrent.futures.ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="command-probe")
+        return cls._executor
+
+    def probe(self, commands):
+        """
+        Probe commands, command_probed_signal is emitted for each of them.
+
+        :param commands: command lines
+        """
+
+        executable_cache = ExecutableCache.instance()
+        for command in set(commands):
+            self._pool().submit(self._probe, executable_cache, command)
+
+    def _probe(self, executable_cache, command):
+
+        program = command_program(command)
+        executable = None
+        if program is not None:
+            try:
+                executable = executable_cache.resolve(program) or ""
+            except OSError as e:
+                log.debug("Cannot probe command {}: {}".format(command, e))
+        try:
+            self.command_probed_signal.emit(command, executable)
+        except RuntimeError:
+            # the probe has been deleted with its dialog
+            pass
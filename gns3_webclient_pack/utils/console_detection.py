@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Detection of the console clients used by the default settings.
+
+Probing the desktop session, the Linux distribution and the PATH is only done
+when the default commands are needed. The results are cached on disk, keyed by
+what they depend on (PATH, desktop session and os-release files), so they are
+computed once per environment.
+"""
+
+import os
+import sys
+import json
+
+from gns3_webclient_pack.version import __version__
+from gns3_webclient_pack.utils.atomic_write import atomic_write_json
+
+import logging
+log = logging.getLogger(__name__)
+
+CACHE_FILENAME = "console_detection.json"
+
+OS_RELEASE_FILES = ("/etc/os-release", "/usr/lib/os-release")
+
+# terminal of the desktop sessions (XDG_CURRENT_DESKTOP)
+DESKTOP_TERMINALS = (
+    (("gnome", "unity", "cinnamon"), "Gnome Terminal"),
+    (("kde",), "KDE Konsole"),
+    (("mate",), "Mate Terminal"),
+    (("xfce",), "Xfce4 Terminal"),
+    (("lxde", "lxqt"), "LXTerminal"),
+)
+
+# distributions shipping gnome-terminal by default
+GNOME_TERMINAL_DISTRIBUTIONS = ("Debian", "Ubuntu", "Linux Mint")
+
+X_TERMINAL_EMULATOR = "x-terminal-emulator"
+
+
+def detection_key():
+    """
+    Returns what the detection results depend on.
+    """
+
+    os_release = None
+    if sys.platform.startswith("linux"):
+        for path in OS_RELEASE_FILES:
+            try:
+                os_release = [path, os.stat(path).st_mtime_ns]
+                break
+            except OSError:
+                pass
+    return [__version__, sys.platform, os.environ.get("PATH", ""), os.environ.get("XDG_CURRENT_DESKTOP", ""), os_release]
+
+
+def _linux_terminal():
+    """
+    Returns the name of the pre-configured terminal of the Linux desktop,
+    "x-terminal-emulator" or None if no terminal was found.
+    """
+
+    current_desktop = os.environ.get("XDG_CURRENT_DESKTOP", "").lower()
+    if current_desktop:
+        for desktops, terminal in DESKTOP_TERMINALS:
+            if any(desktop in current_desktop for desktop in desktops):
+                return terminal
+
+    import distro
+    if distro.name() in GNOME_TERMINAL_DISTRIBUTIONS:
+        return "Gnome Terminal"
+
+    import shutil
+    if shutil.which(X_TERMINAL_EMULATOR):
+        return X_TERMINAL_EMULATOR
+    return None
+
+
+def _detect():
+
+    results = {}
+    if sys.platform.startswith("win"):
+        import shutil
+        results["solar_putty"] = shutil.which("Solar-PuTTY.exe") is not None
+    elif sys.platform.startswith("linux"):
+        results["terminal"] = _linux_terminal()
+    return results
+
+
+def _load_cache(cache_path, key):
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get("key") == key and isinstance(data.get("results"), dict):
+            return data["results"]
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_cache(cache_path, key, results):
+
+    try:
+        atomic_write_json(cache_path, {"key": key, "results": results})
+    except (OSError, TypeError, ValueError) as e:
+        log.debug("Cannot write the console detection cache '{}': {}".format(cache_path, e))
+
+
+def detect_console_clients(cache_path=None):
+    """
+    Returns the console clients detected on this system.
+
+    :param cache_path: file caching the results between processes
+
+    :returns: dict with "solar_putty" (Windows) or "terminal" (Linux)
+    """
+
+    key = None
+    if cache_path:
+        key = detection_key()
+        results = _load_cache(cache_path, key)
+        if results is not None:
+            return results
+
+    results = _detect()
+    log.debug("Console clients detected: {}".format(results))
+    if cache_path:
+        _save_cache(cache_path, key, results)
+    return results
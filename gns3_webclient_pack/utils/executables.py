@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Resolution of the executables of console commands.
+
+Resolved executables are cached, in memory and in a file shared by the
+launcher processes: an entry stays valid while PATH is the same and a stat
+of the executable (or of the PATH directories when it was not found) shows
+no change, which is much cheaper than walking PATH again.
+"""
+
+import os
+import sys
+import json
+import shlex
+import shutil
+import threading
+
+from gns3_webclient_pack.utils.atomic_write import atomic_write_json
+
+import logging
+log = logging.getLogger(__name__)
+
+CACHE_FILENAME = "executables.json"
+
+# entries kept in the cache file, the oldest are dropped first
+MAX_ENTRIES = 256
+
+
+def command_program(command_line):
+    """
+    Returns the program started by a command line or template.
+
+    :param command_line: command line
+
+    :returns: program or None if it cannot be found
+    """
+
+    try:
+        if sys.platform.startswith("win"):
+            args = shlex.split(command_line, posix=False)
+            program = args[0].strip('"') if args else None
+        else:
+            args = shlex.split(command_line)
+            program = args[0] if args else None
+    except ValueError:
+        return None
+    if not program or "{" in program:
+        # the program depends on the launch
+        return None
+    return program
+
+
+class ExecutableCache:
+    """
+    Cache of the resolved executables.
+
+    :param cache_path: file persisting the cache between processes
+    """
+
+    def __init__(self, cache_path=None):
+
+        self._cache_path = cache_path
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def _loadEntries(self):
+
+        if self._entries is not None:
+            return self._entries
+        entries = {}
+        if self._cache_path:
+            try:
+                with open(self._cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    entries = {key: entry for key, entry in data.items() if isinstance(entry, list) and len(entry) == 2}
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                log.debug("Cannot read the executable cache '{}': {}".format(self._cache_path, e))
+        self._entries = entries
+        return entries
+
+    def _saveEntries(self):
+
+        if not self._cache_path:
+            return
+        entries = self._entries
+        if len(entries) > MAX_ENTRIES:
+            for key in list(entries)[:len(entries) - MAX_ENTRIES]:
+                del entries[key]
+        try:
+            atomic_write_json(self._cache_path, entries)
+        except (OSError, TypeError, ValueError) as e:
+            log.debug("Cannot write the executable cache '{}': {}".format(self._cache_path, e))
+
+    @staticmethod
+    def _searchDirectories(program, path):
+
+        if os.path.dirname(program):
+            return [os.path.dirname(os.path.abspath(program))]
+        return [directory for directory in path.split(os.pathsep) if directory]
+
+    @staticmethod
+    def _stat(path):
+
+        try:
+            stat = os.stat(path)
+            return [stat.st_ino, stat.st_mtime_ns]
+        except OSError:
+            return None
+
+    def _fingerprint(self, program, path, executable):
+        """
+        Returns what must not change for a resolution to stay valid:
+        the executable if it was found, the searched directories otherwise.
+        """
+
+        if executable:
+            return [self._stat(executable)]
+        return [self._stat(directory) for directory in self._searchDirectories(program, path)]
+
+    @staticmethod
+    def _resolve(program, path):
+
+        if os.path.dirname(program):
+            if os.path.isfile(program) and os.access(program, os.X_OK):
+                return os.path.abspath(program)
+            return None
+        return shutil.which(program, path=path)
+
+    def resolve(self, program):
+        """
+        Returns the absolute path of the executable of a program.
+
+        :param program: program name or path
+
+        :returns: executable path or None if it cannot be found
+        """
+
+        path = os.environ.get("PATH", os.defpath)
+        key = "{}\0{}".format(program, path)
+        if os.path.dirname(program) and not os.path.isabs(program):
+            # a relative path is resolved from the current directory
+            key = "{}\0{}".format(key, os.getcwd())
+        with self._lock:
+            entry = self._loadEntries().get(key)
+        if entry is not None and self._fingerprint(program, path, entry[0]) == entry[1]:
+            return entry[0]
+
+        executable = self._resolve(program, path)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = [executable, self._fingerprint(program, path, executable)]
+            self._saveEntries()
+        log.debug("Executable of {}: {}".format(program, executable))
+        return executable
+
+    @staticmethod
+    def instance():
+        """
+        Singleton to return only one instance of ExecutableCache.
+
+        :returns: instance of ExecutableCache
+        """
+
+        if not hasattr(ExecutableCache, "_instance") or ExecutableCache._instance is None:
+            from gns3_webclient_pack.local_config import LocalConfig
+            ExecutableCache._instance = ExecutableCache(os.path.join(LocalConfig.instance().configDirectory(), CACHE_FILENAME))
+        return ExecutableCache._instance
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Advisory inter-process file lock (fcntl on POSIX, msvcrt on Windows).
+"""
+
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class FileLockTimeout(OSError):
+    """
+    Raised when a lock cannot be acquired in time.
+    """
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a lock file, only processes using
+    the same lock file are synchronized.
+
+    :param path: lock file path
+    :param timeout: seconds to wait for the lock
+    """
+
+    # delay between two attempts to acquire the lock
+    POLL_INTERVAL = 0.01
+
+    def __init__(self, path, timeout=10):
+
+        self._path = path
+        self._timeout = timeout
+        self._fd = None
+
+    def path(self):
+        """
+        Returns the lock file path.
+        """
+
+        return self._path
+
+    def isLocked(self):
+        """
+        Returns whether the lock is held by this object.
+        """
+
+        return self._fd is not None
+
+    def _tryLock(self, fd):
+
+        try:
+            if fcntl is None:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            return False
+        return True
+
+    def acquire(self):
+        """
+        Acquire the lock.
+        """
+
+        if self._fd is not None:
+            raise RuntimeError("Lock {} is already acquired".format(self._path))
+
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = time.monotonic() + self._timeout
+        while not self._tryLock(fd):
+            if time.monotonic() >= deadline:
+                os.close(fd)
+                raise FileLockTimeout("Timeout after {} seconds waiting for lock {}".format(self._timeout, self._path))
+            time.sleep(self.POLL_INTERVAL)
+        self._fd = fd
+
+    def release(self):
+        """
+        Release the lock.
+        """
+
+        if self._fd is None:
+            return
+        try:
+            if fcntl is None:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except OSError as e:
+            log.debug("Could not unlock {}: {}".format(self._path, e))
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+
+        self.release()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Discovery of the gnome-terminal environment (GNOME_TERMINAL_SERVICE and
+GNOME_TERMINAL_SCREEN) needed to open a new tab in an existing window.
+
+The values are taken from a telnet process started by gnome-terminal-server and
+cached, keyed by the server and telnet processes (pid and create time), so
+following launches only have to check these two processes are still alive.
+"""
+
+import os
+import json
+
+import psutil
+
+from gns3_webclient_pack.utils.atomic_write import atomic_write_json
+
+import logging
+log = logging.getLogger(__name__)
+
+ENV_VARIABLES = ("GNOME_TERMINAL_SERVICE", "GNOME_TERMINAL_SCREEN")
+CACHE_FILENAME = "gnome_terminal_env.json"
+
+# cache shared by launches made from the same process (batch and resident service)
+_cache = {}
+
+
+def _process_key(proc):
+
+    return [proc.pid, proc.create_time()]
+
+
+def _is_alive(key, name):
+    """
+    Returns whether a process identified by its pid and create time is still running.
+    """
+
+    try:
+        pid, create_time = key
+        proc = psutil.Process(pid)
+        return proc.create_time() == create_time and proc.name() == name
+    except (psutil.Error, TypeError, ValueError):
+        return False
+
+
+def _load_cache(cache_path):
+
+    if _cache or not cache_path:
+        return _cache
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            _cache.update(data)
+    except (OSError, ValueError):
+        pass
+    return _cache
+
+
+def _save_cache(cache_path, data):
+
+    _cache.clear()
+    _cache.update(data)
+    if not cache_path:
+        return
+    try:
+        atomic_write_json(cache_path, data)
+    except (OSError, TypeError, ValueError) as e:
+        log.debug("Cannot write the gnome-terminal cache '{}': {}".format(cache_path, e))
+
+
+def _cached_env(cache):
+
+    try:
+        env = {name: cache["env"][name] for name in ENV_VARIABLES}
+    except (KeyError, TypeError):
+        return None
+    if _is_alive(cache.get("server"), "gnome-terminal-server") and _is_alive(cache.get("telnet"), "telnet"):
+        return env
+    return None
+
+
+def find_gnome_terminal_server(server_key=None):
+    """
+    Returns the gnome-terminal-server process of the current user.
+
+    :param server_key: [pid, create time] of a previously found server, checked first
+
+    :returns: psutil.Process instance or None
+    """
+
+    if server_key and _is_alive(server_key, "gnome-terminal-server"):
+        return psutil.Process(server_key[0])
+
+    uid = os.getuid()
+    # only fetch the name and owner of each process, the children are inspected later
+    for proc in psutil.process_iter(attrs=["name", "uids"]):
+        uids = proc.info["uids"]
+        if proc.info["name"] == "gnome-terminal-server" and uids and uids.real == uid:
+            return proc
+    return None
+
+
+def _telnet_env(server):
+    """
+    Returns the gnome-terminal environment of the most recent
+    telnet process started by gnome-terminal-server.
+    """
+
+    try:
+        children = server.children()
+    except psutil.Error:
+        return None, None
+
+    telnets = []
+    for child in children:
+        try:
+            if child.name() == "telnet":
+                telnets.append((child.create_time(), child))
+        except psutil.Error:
+            pass
+    telnets.sort(key=lambda item: item[0], reverse=True)
+
+    for _, proc in telnets:
+        try:
+            env = proc.environ()
+            if all(name in env for name in ENV_VARIABLES):
+                return {name: env[name] for name in ENV_VARIABLES}, proc
+        except psutil.Error:
+            pass
+    return None, None
+
+
+def gnome_terminal_env(cache_path=None):
+    """
+    Returns the gnome-terminal environment variables to open a new tab.
+
+    :param cache_path: file to persist the discovered values between launcher processes
+
+    :returns: dict with the environment variables (empty if not found)
+    """
+
+    cache = _load_cache(cache_path)
+    env = _cached_env(cache)
+    if env is not None:
+        log.debug("Using cached gnome-terminal environment")
+        return env
+
+    server = find_gnome_terminal_server(cache.get("server"))
+    if server is None:
+        return {}
+
+    env, proc = _telnet_env(server)
+    if env is None:
+        return {}
+    try:
+        _save_cache(cache_path, {"server": _process_key(server), "telnet": _process_key(proc), "env": env})
+    except psutil.Error:
+        pass
+    return env
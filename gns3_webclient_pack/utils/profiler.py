@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Opt-in profiling of the entry points.
+
+Profiling is requested with the --profile (cProfile) and --profile-memory (tracemalloc)
+command line flags or with the GNS3_WEBCLIENT_PROFILE environment variable
+("cpu", "memory" or "cpu,memory"). Reports are written to the config directory.
+"""
+
+import os
+import sys
+import time
+import functools
+
+import logging
+log = logging.getLogger(__name__)
+
+PROFILE_ENV_VARIABLE = "GNS3_WEBCLIENT_PROFILE"
+PROFILE_FLAGS = {
+    "--profile": "cpu",
+    "--profile-memory": "memory"
+}
+
+# number of frames kept for each memory allocation
+MEMORY_FRAMES = 10
+
+# number of entries in the text reports
+REPORT_LIMIT = 40
+
+
+def requested_modes(argv=None):
+    """
+    Returns the profiling modes requested on the command line or in the environment.
+    The profiling flags are removed from the command line arguments.
+
+    :param argv: command line arguments (sys.argv by default)
+
+    :returns: set of modes ("cpu" and/or "memory")
+    """
+
+    if argv is None:
+        argv = sys.argv
+
+    modes = set()
+    for value in os.environ.get(PROFILE_ENV_VARIABLE, "").lower().split(","):
+        value = value.strip()
+        if value in ("1", "true", "yes", "cpu"):
+            modes.add("cpu")
+        elif value == "memory":
+            modes.add("memory")
+        elif value == "all":
+            modes.update(("cpu", "memory"))
+
+    for flag, mode in PROFILE_FLAGS.items():
+        while flag in argv:
+            argv.remove(flag)
+            modes.add(mode)
+    return modes
+
+
+def report_path(name, extension):
+    """
+    Returns the path of a new report in the config directory.
+
+    :param name: name of the profiled program
+    :param extension: file extension of the report
+    """
+
+    from gns3_webclient_pack.local_config import LocalConfig, config_directory
+    filename = "{}-{}-{}{}".format(name, time.strftime("%Y%m%d-%H%M%S"), os.getpid(), extension)
+    # the config is not loaded (and possibly written) at exit just to get its directory
+    local_config = getattr(LocalConfig, "_instance", None)
+    directory = local_config.configDirectory() if local_config is not None else config_directory()
+    return os.path.join(directory, filename)
+
+
+def _write_cpu_reports(profile, name):
+
+    import io
+    import pstats
+
+    path = report_path(name, ".prof")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    profile.dump_stats(path)
+
+    # readable summary next to the binary profile
+    summary = io.StringIO()
+    stats = pstats.Stats(profile, stream=summary)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(REPORT_LIMIT)
+    with open(os.path.splitext(path)[0] + "-cpu.txt", "w", encoding="utf-8") as f:
+        f.write(summary.getvalue())
+    log.info("CPU profile written to {}".format(path))
+
+
+def _write_memory_report(start_snapshot, end_snapshot, peak, name):
+
+    path = report_path(name, "-memory.txt")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lines = ["Peak traced memory: {:.1f} KiB".format(peak / 1024), ""]
+
+    lines.append("Top {} allocations at exit:".format(REPORT_LIMIT))
+    for stat in end_snapshot.statistics("lineno")[:REPORT_LIMIT]:
+        lines.append("    {}".format(stat))
+
+    lines.extend(["", "Top {} growths since start:".format(REPORT_LIMIT)])
+    for stat in end_snapshot.compare_to(start_snapshot, "lineno")[:REPORT_LIMIT]:
+        lines.append("    {}".format(stat))
+
+    lines.extend(["", "Largest allocation traceback:"])
+    largest = end_snapshot.statistics("traceback")
+    if largest:
+        lines.extend("    {}".format(line) for line in largest[0].traceback.format())
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    log.info("Memory allocation report written to {}".format(path))
+
+
+def run_profiled(func, name, modes, *args, **kwargs):
+    """
+    Runs a function with profiling and writes the reports when it returns or exits.
+
+    :param func: function to run
+    :param name: name of the profiled program, used in the report file names
+    :param modes: profiling modes ("cpu" and/or "memory")
+    """
+
+    profile = None
+    start_snapshot = None
+    if "memory" in modes:
+        import tracemalloc
+        tracemalloc.start(MEMORY_FRAMES)
+        start_snapshot = tracemalloc.take_snapshot()
+    if "cpu" in modes:
+        import cProfile
+        profile = cProfile.Profile()
+        profile.enable()
+
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # also reached with SystemExit which ends most runs
+        try:
+            if profile is not None:
+                profile.disable()
+                _write_cpu_reports(profile, name)
+            if start_snapshot is not None:
+                end_snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                _write_memory_report(start_snapshot, end_snapshot, peak, name)
+        except OSError as e:
+            log.warning("Cannot write the profiling reports: {}".format(e))
+
+
+def profiled(name):
+    """
+    Decorator profiling an entry point when requested on the command line or in the environment.
+
+    :param name: name of the profiled program, used in the report file names
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            modes = requested_modes()
+            if not modes:
+                return func(*args, **kwargs)
+            return run_profiled(func, name, modes, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -6,8 +6,11 @@ Script to build all the PyQt user interfaces and resources for this project.
 
 import os
 import sys
+import ast
 import stat
+import struct
 import shutil
+import tempfile
 import subprocess
 import argparse
 
@@ -31,12 +34,17 @@ if sys.platform.startswith('win'):
         PATH = os.path.join(PATH, "bin")
     PYUIC = os.path.join(PATH, "pyuic5")
     PYRCC = os.path.join(PATH, "pyrcc5")
+    RCC = shutil.which("rcc")
 
     if not os.path.exists(PYUIC):
         PYUIC = "pyuic5.exe"
 else:
     PYUIC = shutil.which("pyuic5")
     PYRCC = shutil.which("pyrcc5")
+    RCC = shutil.which("rcc") or shutil.which("rcc-qt5")
+
+# format version of the binary resource files (supported since Qt 5.8)
+RCC_FORMAT_VERSION = 2
 
 
 def build_ui(path):
@@ -63,25 +71,65 @@ def build_ui(path):
                     subprocess.call(command)
 
 
+def _call(command):
+
+    if sys.platform.startswith('win'):
+        for i, arg in enumerate(command):
+            command[i] = '"' + arg.replace('"', '"""') + '"'
+        command = ' '.join(command)
+    return subprocess.call(command)
+
+
+def pack_resources(source, target):
+    """
+    Builds a binary resource file with pyrcc5 when rcc is not available:
+    the tree, names and data of the generated Python module are written
+    after the header of the rcc binary format.
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        module = os.path.join(tmp_dir, "resources_rc.py")
+        if _call([PYRCC, "-compress", "9", "-o", module, source]) != 0:
+            raise SystemExit("Could not build resources {}".format(source))
+        with open(module, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+
+    blobs = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
+            if node.targets[0].id in ("qt_resource_struct_v2", "qt_resource_name", "qt_resource_data"):
+                blobs[node.targets[0].id] = ast.literal_eval(node.value)
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(blobs["qt_resource_struct_v2"])
+    names_offset = data_offset + len(blobs["qt_resource_data"])
+    with open(target, "wb") as f:
+        f.write(b"qres" + struct.pack(">IIII", RCC_FORMAT_VERSION, tree_offset, data_offset, names_offset))
+        f.write(blobs["qt_resource_struct_v2"])
+        f.write(blobs["qt_resource_data"])
+        f.write(blobs["qt_resource_name"])
+
+
 def build_resources(path, target):
     for file in os.listdir(path):
         source = os.path.join(path, file)
         if source.endswith(".qrc"):
-            target = os.path.join(target, file.replace(".qrc", "_rc.py"))
+            # resources are loaded from a binary file mapped in memory by Qt
+            # instead of being unmarshalled from a Python module
+            target = os.path.join(target, file.replace(".qrc", ".rcc"))
             if not os.access(
                 target, os.F_OK) or (
                 os.stat(source)[
                     stat.ST_MTIME] > os.stat(target)[
                     stat.ST_MTIME]) or args.force or args.resources:
-                command = [PYRCC, "-compress", "9", "-o", target, source]
                 print("Building resources {}".format(source))
                 if args.force and os.access(target, os.F_OK):
                     os.remove(target)
-                if sys.platform.startswith('win'):
-                    for i, arg in enumerate(command):
-                        command[i] = '"' + arg.replace('"', '"""') + '"'
-                    command = ' '.join(command)
-                subprocess.call(command)
+                if RCC:
+                    _call([RCC, "-binary", "-compress", "9", "-format-version", str(RCC_FORMAT_VERSION), "-o", target, source])
+                else:
+                    pack_resources(source, target)
 
 
 def recursive(function, path):
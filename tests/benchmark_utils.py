@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Helpers shared by the benchmarks: timing statistics and JSON reports
+which can be compared across commits.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+import subprocess
+
+from gns3_webclient_pack.version import __version__
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def stats(durations):
+    """
+    Returns the statistics of durations, in microseconds.
+
+    :param durations: durations in seconds
+    """
+
+    durations = [d * 1000000 for d in durations]
+    return {
+        "runs": len(durations),
+        "min_us": round(min(durations), 1),
+        "median_us": round(statistics.median(durations), 1),
+        "mean_us": round(statistics.mean(durations), 1),
+        "max_us": round(max(durations), 1),
+    }
+
+
+def timeit(func, repeat):
+    """
+    Calls a function several times and returns the statistics of its durations.
+
+    :param func: function to time
+    :param repeat: number of calls
+    """
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return stats(durations)
+
+
+def commit():
+    """
+    Returns the commit of the benchmarked code or None if it is unknown.
+    """
+
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def write_report(results, output_variable, default_output, key="benchmarks"):
+    """
+    Writes benchmark results as JSON with what they have been measured on.
+
+    :param results: benchmark results
+    :param output_variable: environment variable giving the report file
+    :param default_output: report file when the variable is not set
+    :param key: key of the results in the report
+    """
+
+    report = {
+        "version": __version__,
+        "commit": commit(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "timestamp": time.time(),
+        key: results,
+    }
+    output = os.environ.get(output_variable) or str(default_output)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, sort_keys=True)
@@ -9,13 +9,30 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 
 @pytest.fixture
-def local_config():
+def local_config(tmp_path):
 
+    from unittest.mock import patch
     from gns3_webclient_pack.local_config import LocalConfig
+    from gns3_webclient_pack.utils.executables import ExecutableCache
     (fd, config_path) = tempfile.mkstemp()
     os.close(fd)
     LocalConfig._instance = LocalConfig(config_file=config_path)
-    return LocalConfig.instance()
+    ExecutableCache._instance = None
+    # keep the files written next to the config (logs, caches, launch markers...) out of the user directory
+    with patch.object(LocalConfig, "configDirectory", return_value=str(tmp_path / "config")):
+        yield LocalConfig.instance()
+
+
+@pytest.fixture(autouse=True)
+def console_executables():
+    """
+    The console programs used by the tests are not installed: they
+    are spawned (with a mocked Popen) without being resolved.
+    """
+
+    from unittest.mock import patch
+    with patch("gns3_webclient_pack.launcher.Command.resolve_executable", side_effect=lambda program: program) as resolve_executable:
+        yield resolve_executable
 
 
 def pytest_configure(config):
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack.utils.atomic_write import atomic_write_json
+
+
+def test_atomic_write_json(tmp_path):
+
+    path = str(tmp_path / "cache" / "data.json")
+    atomic_write_json(path, {"a": 1})
+    atomic_write_json(path, {"a": 2})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 2}
+    assert os.listdir(str(tmp_path / "cache")) == ["data.json"]
+
+
+def test_atomic_write_json_failure(tmp_path):
+
+    path = str(tmp_path / "data.json")
+    atomic_write_json(path, {"a": 1})
+
+    with pytest.raises(TypeError):
+        atomic_write_json(path, {"a": object()})
+    with patch("os.replace", side_effect=PermissionError("busy")), pytest.raises(PermissionError):
+        atomic_write_json(path, {"a": 2})
+
+    # the previous content is kept and no temporary file is left behind
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 1}
+    assert os.listdir(str(tmp_path)) == ["data.json"]
+
+
+def test_atomic_write_json_replace_retried_on_windows(tmp_path):
+
+    path = str(tmp_path / "data.json")
+    replace = os.replace
+    errors = [PermissionError("open by a reader")] * 2
+
+    def busy_replace(source, destination):
+        if errors:
+            raise errors.pop()
+        replace(source, destination)
+
+    with patch("os.replace", side_effect=busy_replace), patch("sys.platform", new="win32"), patch("time.sleep"):
+        atomic_write_json(path, {"a": 1})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 1}
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import threading
+import pytest
+from unittest.mock import patch
+from gns3_webclient_pack.batch_launcher import batch_launch, read_urls
+from gns3_webclient_pack.launcher import main, LauncherError
+
+
+def test_read_urls(tmp_path):
+
+    path = tmp_path / "urls.txt"
+    path.write_text("# lab 1\ngns3+telnet://localhost:5000\n\n  gns3+vnc://localhost:5900  \n")
+    assert read_urls(str(path)) == ["gns3+telnet://localhost:5000", "gns3+vnc://localhost:5900"]
+
+
+def test_read_urls_missing_file(tmp_path):
+
+    with pytest.raises(LauncherError):
+        read_urls(str(tmp_path / "missing.txt"))
+
+
+def test_batch_launch_reports_each_url():
+
+    def launch(url):
+        if "fail" in url:
+            raise LauncherError("Dummy")
+
+    urls = ["gns3+telnet://localhost:{}".format(port) for port in range(5000, 5005)] + ["gns3+telnet://fail:5000"]
+    results = batch_launch(urls, launch, concurrency=2, pace=0)
+    assert [url for url, _ in results] == urls
+    assert [error for _, error in results] == [None] * 5 + ["Dummy"]
+
+
+def test_batch_launch_unexpected_error():
+
+    def launch(url):
+        if "fail" in url:
+            raise KeyError("dummy")
+
+    urls = ["gns3+telnet://fail:5000", "gns3+telnet://localhost:5000"]
+    results = batch_launch(urls, launch, concurrency=2, pace=0)
+    assert results == [("gns3+telnet://fail:5000", "Unexpected error: 'dummy'"), ("gns3+telnet://localhost:5000", None)]
+
+
+def test_batch_launch_negative_pace():
+
+    urls = ["gns3+telnet://localhost:5000", "gns3+telnet://localhost:5001"]
+    assert batch_launch(urls, lambda url: None, concurrency=1, pace=-1) == [(url, None) for url in urls]
+
+
+def test_batch_launch_concurrency():
+
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def launch(url):
+        with lock:
+            running.append(url)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(url)
+
+    urls = ["gns3+telnet://localhost:{}".format(port) for port in range(5000, 5020)]
+    batch_launch(urls, launch, concurrency=3, pace=0)
+    assert max(peak) <= 3
+
+
+def test_main_batch(local_config):
+
+    local_config.loadSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    argv = ["gns3-webclient-launcher", "gns3+telnet://localhost:6000", "gns3+telnet://localhost:6001", "--pace", "0"]
+    with patch('subprocess.Popen') as proc, \
+            patch('os.environ', new={}), \
+            patch('sys.platform', new="linux"), \
+            patch('sys.argv', new=argv), \
+            patch('gns3_webclient_pack.launcher.configure_logging'):
+        main()
+        assert sorted(call[0][0] for call in proc.call_args_list) == [["telnet", "localhost", "6000"], ["telnet", "localhost", "6001"]]
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import shlex
+import pytest
+from gns3_webclient_pack.command_template import compile_template, CommandTemplate
+from gns3_webclient_pack.launcher_error import LauncherError
+
+
+def test_compile_template_is_cached():
+
+    assert compile_template("telnet {host} {port}") is compile_template("telnet {host} {port}")
+
+
+def test_render():
+
+    template = CommandTemplate('xterm -T "{name}" -e "telnet {host} {port}"')
+    assert template.placeholders() == {"name", "host", "port"}
+    assert template.render({"name": "R1", "host": "localhost", "port": "5000"}) == 'xterm -T "R1" -e "telnet localhost 5000"'
+
+
+def test_render_with_literal_braces():
+
+    template = CommandTemplate("osascript -e 'display dialog \"VNC\" buttons {\"OK\"}' -e 'open location \"vnc://{host}:{port}\"' {{literal}}")
+    assert template.placeholders() == {"host", "port"}
+    assert template.render({"host": "localhost", "port": "5900"}) == "osascript -e 'display dialog \"VNC\" buttons {\"OK\"}' -e 'open location \"vnc://localhost:5900\"' {literal}"
+
+
+def test_unknown_placeholder():
+
+    with pytest.raises(LauncherError):
+        CommandTemplate("telnet {host} {prot}")
+
+
+def test_missing_value():
+
+    with pytest.raises(LauncherError):
+        CommandTemplate("telnet {host} {node_id}").render({"host": "localhost"})
+
+
+@pytest.mark.parametrize("name", ["R1", "R 1", 'R"1', "R'1'", "R\\1", ""])
+def test_render_args_matches_split(name):
+
+    template = CommandTemplate('xterm -T "{name}" -e "telnet {host} {port}" {name}')
+    values = {"name": name, "host": "localhost", "port": "5000"}
+    assert template.renderArgs(values) == shlex.split(template.render(values))
+
+
+def test_render_args_invalid_command():
+
+    with pytest.raises(LauncherError):
+        CommandTemplate('xterm -T "{name}').renderArgs({"name": "R1"})
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Startup benchmark of the config application: time from the start of the
+interpreter running main() until the main window is shown.
+
+Results are written as JSON to the file given by the GNS3_WEBCLIENT_STARTUP_BENCHMARK_OUTPUT
+environment variable (config_startup_benchmark.json in the pytest temporary directory by default)
+so runs can be compared across commits.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+from benchmark_utils import ROOT, stats, write_report
+
+REPEAT = 5
+
+# modules only imported when the user opens what needs them
+DEFERRED_MODULES = (
+    "gns3_webclient_pack.dialogs.about_dialog",
+    "gns3_webclient_pack.dialogs.command_dialog",
+    "gns3_webclient_pack.ui.about_dialog_ui",
+    "gns3_webclient_pack.ui.command_dialog_ui",
+    "gns3_webclient_pack.utils.install_mime_types",
+)
+
+# runs main() and quits as soon as the main window is shown
+STARTUP_WORKER = """
+import sys
+import json
+import time
+
+start = time.perf_counter()
+from gns3_webclient_pack.qt import QtCore, QtWidgets
+
+show = QtWidgets.QMainWindow.show
+
+
+def shown(window):
+    show(window)
+    print(json.dumps({
+        "duration": time.perf_counter() - start,
+        "modules": sorted(name for name in sys.modules if name.startswith("gns3_webclient_pack")),
+    }))
+    QtCore.QTimer.singleShot(0, QtWidgets.QApplication.instance().quit)
+
+
+QtWidgets.QMainWindow.show = shown
+from gns3_webclient_pack.main import main
+sys.argv = ["gns3-webclient-config"]
+main()
+"""
+
+
+def _startup(home):
+
+    env = dict(os.environ, HOME=home, APPDATA=home, QT_QPA_PLATFORM="offscreen")
+    output = subprocess.run([sys.executable, "-c", STARTUP_WORKER],
+                            cwd=ROOT,
+                            env=env,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True,
+                            timeout=60,
+                            check=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_config_startup_benchmark(tmp_path):
+
+    home = str(tmp_path / "home")
+    os.makedirs(home)
+
+    # the first run creates the config file and the bytecode caches
+    first_run = _startup(home)
+    runs = [_startup(home) for _ in range(REPEAT)]
+
+    for run in [first_run] + runs:
+        assert not set(DEFERRED_MODULES) & set(run["modules"])
+
+    first_window = stats([run["duration"] for run in runs])
+    first_window["first_run_us"] = round(first_run["duration"] * 1000000, 1)
+    first_window["modules"] = len(runs[-1]["modules"])
+    write_report({"first_window": first_window},
+                 "GNS3_WEBCLIENT_STARTUP_BENCHMARK_OUTPUT",
+                 tmp_path / "config_startup_benchmark.json")
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import subprocess
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack import settings
+from gns3_webclient_pack.utils import console_detection
+from gns3_webclient_pack.utils.console_detection import detect_console_clients, detection_key, CACHE_FILENAME
+
+
+@pytest.mark.parametrize("desktop, terminal", (
+    ("GNOME", "Gnome Terminal"),
+    ("ubuntu:GNOME", "Gnome Terminal"),
+    ("KDE", "KDE Konsole"),
+    ("XFCE", "Xfce4 Terminal"),
+    ("LXQt", "LXTerminal"),
+))
+def test_desktop_terminal(monkeypatch, desktop, terminal):
+
+    monkeypatch.setenv("XDG_CURRENT_DESKTOP", desktop)
+    with patch("sys.platform", new="linux"):
+        assert detect_console_clients() == {"terminal": terminal}
+
+
+def test_distribution_terminal(monkeypatch):
+
+    monkeypatch.delenv("XDG_CURRENT_DESKTOP", raising=False)
+    with patch("sys.platform", new="linux"), \
+            patch("distro.name", return_value="Debian"):
+        assert detect_console_clients() == {"terminal": "Gnome Terminal"}
+    with patch("sys.platform", new="linux"), \
+            patch("distro.name", return_value="Fedora"), \
+            patch("shutil.which", return_value=None):
+        assert detect_console_clients() == {"terminal": None}
+
+
+def test_detection_cache(monkeypatch, tmp_path):
+
+    cache_path = str(tmp_path / CACHE_FILENAME)
+    monkeypatch.setenv("XDG_CURRENT_DESKTOP", "KDE")
+    with patch("sys.platform", new="linux"):
+        assert detect_console_clients(cache_path) == {"terminal": "KDE Konsole"}
+        with patch.object(console_detection, "_detect") as detect:
+            assert detect_console_clients(cache_path) == {"terminal": "KDE Konsole"}
+        assert not detect.called
+
+        # the desktop session and the PATH are part of the key
+        key = detection_key()
+        monkeypatch.setenv("XDG_CURRENT_DESKTOP", "MATE")
+        assert detection_key() != key
+        assert detect_console_clients(cache_path) == {"terminal": "Mate Terminal"}
+        monkeypatch.setenv("PATH", os.environ.get("PATH", "") + os.pathsep + str(tmp_path))
+        with patch.object(console_detection, "_detect", return_value={"terminal": None}) as detect:
+            assert detect_console_clients(cache_path) == {"terminal": None}
+        assert detect.called
+
+
+def test_settings_are_detected_on_first_access(monkeypatch):
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("the Linux Telnet commands are only defined on Linux")
+    # reset the detected settings
+    for name in ("DEFAULT_TELNET_COMMAND", "COMMANDS_SETTINGS"):
+        if name in vars(settings):
+            monkeypatch.delattr(settings, name)
+
+    with patch("sys.platform", new="linux"), \
+            patch("gns3_webclient_pack.utils.console_detection.detect_console_clients", return_value={"terminal": "KDE Konsole"}) as detect:
+        assert settings.COMMANDS_SETTINGS["telnet_command"] == settings.PRECONFIGURED_TELNET_COMMANDS["KDE Konsole"]
+        assert settings.DEFAULT_TELNET_COMMAND == settings.COMMANDS_SETTINGS["telnet_command"]
+    assert detect.call_count == 1
+
+
+def test_settings_import_does_not_probe():
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    subprocess.run([sys.executable, "-c", "import sys, gns3_webclient_pack.settings; assert 'distro' not in sys.modules"],
+                   cwd=root,
+                   check=True)
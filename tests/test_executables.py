@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack.utils.executables import ExecutableCache, command_program
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX executables")
+
+
+def _executable(directory, name):
+
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+def test_command_program():
+
+    assert command_program('xterm -T "{name}" -e "telnet {host} {port}"') == "xterm"
+    assert command_program(r"/Applications/Chicken\ of\ the\ VNC.app/Contents/MacOS/Chicken\ of\ the\ VNC {host}:{port}") == "/Applications/Chicken of the VNC.app/Contents/MacOS/Chicken of the VNC"
+    assert command_program('{program} {host}') is None
+    assert command_program('xterm -e "telnet') is None
+    assert command_program("") is None
+
+
+def test_resolve(monkeypatch, tmp_path):
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    cache = ExecutableCache()
+    assert cache.resolve("my-telnet") is None
+
+    # the directory has changed: the missing program is searched again
+    executable = _executable(tmp_path, "my-telnet")
+    assert cache.resolve("my-telnet") == executable
+    assert cache.resolve(executable) == executable
+
+    with patch("shutil.which") as which:
+        assert cache.resolve("my-telnet") == executable
+    assert not which.called
+
+    os.remove(executable)
+    assert cache.resolve("my-telnet") is None
+
+
+def test_resolve_path_change(monkeypatch, tmp_path):
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _executable(first, "my-telnet")
+    executable = _executable(second, "my-telnet")
+
+    cache = ExecutableCache()
+    monkeypatch.setenv("PATH", str(first))
+    assert cache.resolve("my-telnet") == str(first / "my-telnet")
+    monkeypatch.setenv("PATH", str(second))
+    assert cache.resolve("my-telnet") == executable
+
+
+def test_resolve_relative_path(monkeypatch, tmp_path):
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for directory in (first, second):
+        (directory / "bin").mkdir(parents=True)
+    first_executable = _executable(first / "bin", "my-telnet")
+    second_executable = _executable(second / "bin", "my-telnet")
+
+    cache = ExecutableCache()
+    monkeypatch.chdir(first)
+    assert cache.resolve(os.path.join("bin", "my-telnet")) == first_executable
+    monkeypatch.chdir(second)
+    assert cache.resolve(os.path.join("bin", "my-telnet")) == second_executable
+
+
+def test_command_dialog_probe(qtbot, local_config, monkeypatch, tmp_path):
+
+    from gns3_webclient_pack.qt import QtCore
+    from gns3_webclient_pack.dialogs.command_dialog import CommandDialog
+
+    monkeypatch.setenv("PATH", str(tmp_path))
+    installed = _executable(tmp_path, "installed-telnet")
+    local_config.saveSectionSettings("CustomCommands", {"telnet": {"Installed": "installed-telnet {host} {port}",
+                                                                   "Missing": "missing-telnet {host} {port}"}})
+    dialog = CommandDialog(None, console_type="telnet")
+    qtbot.addWidget(dialog)
+
+    combo = dialog.uiCommandComboBox
+
+    def probed():
+        for name, tooltip in (("Installed", "Installed: {}".format(installed)), ("Missing", "Not installed: the program cannot be found")):
+            assert combo.itemData(combo.findText(name), QtCore.Qt.ToolTipRole) == tooltip
+
+    qtbot.waitUntil(probed, timeout=5000)
+    assert combo.itemData(combo.findText("Missing"), QtCore.Qt.ForegroundRole) is not None
+    assert combo.itemData(combo.findText("Installed"), QtCore.Qt.ForegroundRole) is None
+
+
+def test_persistent_cache(monkeypatch, tmp_path):
+
+    cache_path = str(tmp_path / "cache" / "executables.json")
+    monkeypatch.setenv("PATH", str(tmp_path))
+    executable = _executable(tmp_path, "my-telnet")
+    assert ExecutableCache(cache_path).resolve("my-telnet") == executable
+
+    # another launcher process does not walk PATH again
+    with patch("shutil.which") as which:
+        assert ExecutableCache(cache_path).resolve("my-telnet") == executable
+    assert not which.called
+
+    # the executable has been replaced (new inode)
+    os.remove(executable)
+    _executable(tmp_path, "my-telnet")
+    with patch("shutil.which", return_value=executable) as which:
+        assert ExecutableCache(cache_path).resolve("my-telnet") == executable
+    assert which.called
+
+
+def test_launch_resolves_executable(local_config, console_executables, monkeypatch, tmp_path):
+
+    from gns3_webclient_pack.launcher import Command
+    from gns3_webclient_pack.launcher_error import LauncherError
+
+    console_executables.side_effect = lambda program: ExecutableCache.instance().resolve(program)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    executable = _executable(tmp_path, "my-telnet")
+    command = Command(host="localhost", port=6000, path="", params={}, url="gns3+telnet://localhost:6000")
+    with patch("subprocess.Popen") as proc, \
+            patch("sys.platform", new="linux"):
+        command.launch("my-telnet {host} {port}")
+        assert proc.call_args[0][0] == [executable, "localhost", "6000"]
+
+        proc.reset_mock()
+        with pytest.raises(LauncherError, match="'missing-telnet' cannot be found"):
+            command.launch("missing-telnet {host} {port}")
+        assert not proc.called
+    assert os.path.exists(os.path.join(local_config.configDirectory(), "executables.json"))
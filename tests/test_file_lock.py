@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+import threading
+import pytest
+
+from gns3_webclient_pack.utils.file_lock import FileLock, FileLockTimeout
+
+
+def test_file_lock(tmp_path):
+
+    path = str(tmp_path / "test.lock")
+    with FileLock(path) as lock:
+        assert lock.isLocked()
+        with pytest.raises(FileLockTimeout):
+            FileLock(path, timeout=0.05).acquire()
+    assert not lock.isLocked()
+    with FileLock(path, timeout=0.05):
+        pass
+
+
+def test_file_lock_serializes(tmp_path):
+
+    path = str(tmp_path / "test.lock")
+    counter = {"value": 0}
+
+    def increment():
+        for _ in range(50):
+            with FileLock(path):
+                value = counter["value"]
+                # let the other threads run while the lock is held
+                time.sleep(0.0001)
+                counter["value"] = value + 1
+
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter["value"] == 200
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import json
+import psutil
+import pytest
+from unittest.mock import patch, MagicMock
+
+from gns3_webclient_pack.utils import gnome_terminal
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="gnome-terminal only runs on Linux")
+
+ENV = {"GNOME_TERMINAL_SERVICE": ":1.42", "GNOME_TERMINAL_SCREEN": "/org/gnome/Terminal/screen/1234"}
+
+
+class FakeProcess:
+
+    def __init__(self, pid, name, create_time, environ=None, children=None):
+
+        self.pid = pid
+        self._name = name
+        self._create_time = create_time
+        self._environ = environ or {}
+        self._children = children or []
+        self.info = {"name": name, "uids": MagicMock(real=os.getuid())}
+
+    def name(self):
+        return self._name
+
+    def create_time(self):
+        return self._create_time
+
+    def environ(self):
+        return self._environ
+
+    def children(self):
+        return self._children
+
+
+@pytest.fixture
+def processes():
+
+    telnet_old = FakeProcess(11, "telnet", 100.0, environ={"GNOME_TERMINAL_SERVICE": ":1.1", "GNOME_TERMINAL_SCREEN": "/old"})
+    telnet = FakeProcess(12, "telnet", 200.0, environ=dict(ENV, HOME="/home/user"))
+    bash = FakeProcess(13, "bash", 300.0)
+    server = FakeProcess(10, "gnome-terminal-server", 50.0, children=[telnet_old, telnet, bash])
+    table = {p.pid: p for p in (FakeProcess(1, "init", 1.0), server, telnet_old, telnet, bash)}
+
+    def process(pid):
+        if pid not in table:
+            raise psutil.NoSuchProcess(pid)
+        return table[pid]
+
+    process_iter = MagicMock(side_effect=lambda attrs=None: iter(list(table.values())))
+    gnome_terminal._cache.clear()
+    with patch("gns3_webclient_pack.utils.gnome_terminal.psutil.Process", side_effect=process), \
+            patch("gns3_webclient_pack.utils.gnome_terminal.psutil.process_iter", new=process_iter):
+        yield table, process_iter
+    gnome_terminal._cache.clear()
+
+
+def test_gnome_terminal_env(processes, tmp_path):
+
+    cache_path = str(tmp_path / gnome_terminal.CACHE_FILENAME)
+    assert gnome_terminal.gnome_terminal_env(cache_path) == ENV
+    with open(cache_path) as f:
+        assert json.load(f) == {"server": [10, 50.0], "telnet": [12, 200.0], "env": ENV}
+
+
+def test_gnome_terminal_env_no_server(processes, tmp_path):
+
+    table, _ = processes
+    del table[10]
+    assert gnome_terminal.gnome_terminal_env(str(tmp_path / "cache.json")) == {}
+    assert not os.path.exists(str(tmp_path / "cache.json"))
+
+
+def test_gnome_terminal_env_cached(processes, tmp_path):
+
+    _, process_iter = processes
+    cache_path = str(tmp_path / gnome_terminal.CACHE_FILENAME)
+    gnome_terminal.gnome_terminal_env(cache_path)
+    assert process_iter.call_count == 1
+
+    # same process and another launcher process reading the cache file
+    assert gnome_terminal.gnome_terminal_env(cache_path) == ENV
+    gnome_terminal._cache.clear()
+    assert gnome_terminal.gnome_terminal_env(cache_path) == ENV
+    assert process_iter.call_count == 1
+
+
+def test_gnome_terminal_env_telnet_exited(processes, tmp_path):
+
+    table, process_iter = processes
+    cache_path = str(tmp_path / gnome_terminal.CACHE_FILENAME)
+    gnome_terminal.gnome_terminal_env(cache_path)
+
+    # the server is still known: only its children are inspected again
+    del table[12]
+    table[10]._children = [table[11]]
+    assert gnome_terminal.gnome_terminal_env(cache_path) == {"GNOME_TERMINAL_SERVICE": ":1.1", "GNOME_TERMINAL_SCREEN": "/old"}
+    assert process_iter.call_count == 1
+
+
+def test_gnome_terminal_env_server_restarted(processes, tmp_path):
+
+    table, process_iter = processes
+    cache_path = str(tmp_path / gnome_terminal.CACHE_FILENAME)
+    gnome_terminal.gnome_terminal_env(cache_path)
+
+    # same pid reused by another process
+    table[10]._create_time = 500.0
+    table[12]._create_time = 600.0
+    assert gnome_terminal.gnome_terminal_env(cache_path) == ENV
+    assert process_iter.call_count == 2
+    with open(cache_path) as f:
+        assert json.load(f)["server"] == [10, 500.0]
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import time
+import threading
+from unittest.mock import patch, MagicMock
+
+from gns3_webclient_pack.launch_coalescing import normalize_url, marker_path, claim_launch
+from gns3_webclient_pack.launcher import main
+from gns3_webclient_pack.launcher_service import launcher_command
+
+URL = "gns3+telnet://localhost:6000?name=R1&node_id=1234"
+
+
+def test_normalize_url():
+
+    assert normalize_url(URL) == normalize_url("GNS3+TELNET://LocalHost:6000/?node_id=1234&name=R1")
+    assert normalize_url("gns3+telnet://0.0.0.0:6000") == normalize_url("gns3+telnet://localhost:6000")
+    assert normalize_url(URL) != normalize_url("gns3+telnet://localhost:6001?name=R1&node_id=1234")
+    assert normalize_url(URL) != normalize_url("gns3+vnc://localhost:6000?name=R1&node_id=1234")
+
+
+def test_claim_launch(tmp_path):
+
+    directory = str(tmp_path)
+    assert claim_launch(URL, 2, directory)
+    assert not claim_launch(URL, 2, directory)
+    assert not claim_launch("gns3+telnet://localhost:6000?node_id=1234&name=R1", 2, directory)
+    assert claim_launch("gns3+telnet://localhost:6001", 2, directory)
+
+
+def test_claim_launch_expired(tmp_path):
+
+    directory = str(tmp_path)
+    assert claim_launch(URL, 2, directory)
+    path = marker_path(URL, directory)
+    os.utime(path, (time.time() - 10, time.time() - 10))
+    assert claim_launch(URL, 2, directory)
+    assert not claim_launch(URL, 2, directory)
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def _concurrent_claims(directory, claimers=8):
+
+    barrier = threading.Barrier(claimers)
+    results = []
+
+    def claim():
+        barrier.wait()
+        results.append(claim_launch(URL, 2, directory))
+
+    threads = [threading.Thread(target=claim) for _ in range(claimers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_claim_launch_concurrent(tmp_path):
+
+    for attempt in range(20):
+        directory = str(tmp_path / str(attempt))
+        assert _concurrent_claims(directory).count(True) == 1
+
+        # racing for an expired marker
+        path = marker_path(URL, directory)
+        os.utime(path, (time.time() - 10, time.time() - 10))
+        assert _concurrent_claims(directory).count(True) == 1
+        assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def test_claim_launch_stale_lock(tmp_path):
+
+    directory = str(tmp_path)
+    assert claim_launch(URL, 2, directory)
+    path = marker_path(URL, directory)
+    os.utime(path, (time.time() - 10, time.time() - 10))
+
+    # lock left by a launcher stopped while replacing the expired marker
+    with open(path + ".lock", "w"):
+        pass
+    assert not claim_launch(URL, 2, directory)
+    os.utime(path + ".lock", (time.time() - 10, time.time() - 10))
+    assert claim_launch(URL, 2, directory)
+    assert not claim_launch(URL, 2, directory)
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+
+
+def test_claim_launch_disabled(tmp_path):
+
+    assert claim_launch(URL, 0, str(tmp_path))
+    assert claim_launch(URL, 0, str(tmp_path))
+    assert not os.path.exists(os.path.dirname(marker_path(URL, str(tmp_path))))
+
+
+def test_claim_launch_cannot_write_markers(tmp_path):
+
+    with patch("os.makedirs", side_effect=PermissionError("denied")):
+        assert claim_launch(URL, 2, str(tmp_path))
+
+
+def test_main_drops_duplicate(local_config):
+
+    local_config.saveSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.platform', new="linux"), \
+            patch('sys.argv', new=["gns3-webclient-launcher", URL]), \
+            patch('gns3_webclient_pack.launcher.configure_logging'):
+        main()
+        main()
+        assert proc.call_count == 1
+
+
+def test_main_batch_drops_duplicate(local_config):
+
+    local_config.saveSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    argv = ["gns3-webclient-launcher", URL, URL, "gns3+telnet://localhost:6001", "--pace", "0"]
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.platform', new="linux"), \
+            patch('sys.argv', new=argv), \
+            patch('gns3_webclient_pack.launcher.configure_logging'):
+        main()
+        assert proc.call_count == 2
+
+
+def test_main_batch_pcap_launched(local_config):
+
+    pcap_url = "gns3+pcap://localhost:3080?project_id=1234&link_id=5678"
+    argv = ["gns3-webclient-launcher", pcap_url, "gns3+telnet://localhost:6001", "--pace", "0"]
+    local_config.saveSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.platform', new="linux"), \
+            patch('sys.argv', new=argv), \
+            patch('gns3_webclient_pack.launcher.configure_logging'):
+        main()
+    spawned = [call[0][0] for call in proc.call_args_list if pcap_url in call[0][0]]
+    assert len(spawned) == 1
+
+    # the capture launcher process, within the coalescing window of the batch
+    child_argv = ["gns3-webclient-launcher"] + spawned[0][len(launcher_command()):]
+    with patch('sys.argv', new=child_argv), \
+            patch('gns3_webclient_pack.launcher.configure_logging'), \
+            patch('gns3_webclient_pack.launcher.application', return_value=MagicMock()), \
+            patch('gns3_webclient_pack.launcher.launcher') as capture:
+        main()
+    capture.assert_called_once_with(pcap_url)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack import launch_trace
+from gns3_webclient_pack.launcher import main
+
+
+@pytest.fixture(autouse=True)
+def trace():
+
+    launch_trace.disable()
+    yield
+    launch_trace.disable()
+
+
+def _read_trace(path):
+
+    # JSON array format without the optional closing bracket
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    return json.loads(content.rstrip().rstrip(",") + "]")
+
+
+def test_span_disabled():
+
+    with launch_trace.span("spawn"):
+        pass
+    assert launch_trace.events() == []
+
+
+def test_span(tmp_path):
+
+    launch_trace.enable(str(tmp_path / "trace.json"), dump_at_exit=False)
+    with launch_trace.span("spawn", program="telnet"):
+        pass
+    with pytest.raises(ValueError):
+        with launch_trace.span("url_parse"):
+            raise ValueError()
+
+    spawn, url_parse = launch_trace.events()
+    assert spawn["name"] == "spawn"
+    assert spawn["ph"] == "X"
+    assert spawn["pid"] == os.getpid()
+    assert spawn["dur"] >= 0
+    assert spawn["args"] == {"program": "telnet"}
+    assert url_parse["args"] == {"error": "ValueError"}
+    assert url_parse["ts"] >= spawn["ts"]
+
+
+def test_dump_appends(tmp_path):
+
+    path = str(tmp_path / "trace.json")
+    launch_trace.enable(path, dump_at_exit=False)
+    for name in ("first", "second"):
+        with launch_trace.span(name):
+            pass
+        launch_trace.dump()
+    assert launch_trace.events() == []
+    assert [event["name"] for event in _read_trace(path)] == ["first", "second"]
+
+
+def test_enabled_from_environment(monkeypatch):
+
+    monkeypatch.delenv(launch_trace.TRACE_ENV_VARIABLE, raising=False)
+    assert not launch_trace.enabled_from_environment()
+    monkeypatch.setenv(launch_trace.TRACE_ENV_VARIABLE, "0")
+    assert not launch_trace.enabled_from_environment()
+    monkeypatch.setenv(launch_trace.TRACE_ENV_VARIABLE, "1")
+    assert launch_trace.enabled_from_environment()
+
+
+def test_main_trace(local_config, tmp_path):
+
+    local_config.saveSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    with patch('subprocess.Popen'), \
+            patch('sys.platform', new="linux"), \
+            patch('sys.argv', new=["gns3-webclient-launcher", "--trace", "gns3+telnet://localhost:6000"]), \
+            patch('gns3_webclient_pack.local_config.LocalConfig.configDirectory', return_value=str(tmp_path)), \
+            patch('gns3_webclient_pack.launcher.configure_logging'):
+        main()
+
+    assert launch_trace.is_enabled()
+    launch_trace.dump()
+    names = [event["name"] for event in _read_trace(str(tmp_path / launch_trace.TRACE_FILENAME))]
+    for name in ("imports", "config_load", "url_parse", "settings_load", "template_render", "spawn"):
+        assert name in names
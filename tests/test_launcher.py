@@ -19,7 +19,7 @@ import os
 import shlex
 import pytest
 from unittest.mock import patch
-from gns3_webclient_pack.launcher import launcher, LauncherError
+from gns3_webclient_pack.launcher import launcher, main, LauncherError
 from gns3_webclient_pack.qt import QtWidgets
 
 
@@ -142,3 +142,29 @@ def test_spice_command_on_windows(local_config):
             patch('sys.platform', new="win"):
         launcher("gns3+spice://localhost:6000")
         proc.assert_called_once_with("remote-viewer localhost 6000", env=os.environ)
+
+
+def test_main_telnet_without_gui(local_config):
+
+    local_config.loadSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.platform', new="win"), \
+            patch('sys.argv', new=["gns3-webclient-launcher", "gns3+telnet://localhost:6000"]), \
+            patch('gns3_webclient_pack.launcher.configure_logging'), \
+            patch('gns3_webclient_pack.launcher.application') as application:
+        main()
+        proc.assert_called_once_with("telnet localhost 6000", env=os.environ)
+        assert not application.called
+
+
+def test_main_gui_built_on_error(local_config, monkeypatch):
+
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", lambda *args: QtWidgets.QMessageBox.Ok)
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.argv', new=["gns3-webclient-launcher", "gns3+vnc://localhost:2000"]), \
+            patch('gns3_webclient_pack.launcher.configure_logging'), \
+            patch('gns3_webclient_pack.launcher.application') as application:
+        with pytest.raises(SystemExit):
+            main()
+        assert not proc.called
+        application.assert_called_once_with()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Launch latency benchmarks, from URL string to subprocess.Popen, per URL scheme.
+
+Results are written as JSON to the file given by the GNS3_WEBCLIENT_BENCHMARK_OUTPUT
+environment variable (launcher_benchmark.json in the pytest temporary directory by default)
+so runs can be compared across commits.
+"""
+
+import sys
+import json
+import time
+import subprocess
+import threading
+import http.server
+import pytest
+from unittest.mock import patch, MagicMock
+
+from gns3_webclient_pack.launcher import launcher, parse_url, Command
+from gns3_webclient_pack.local_config import LocalConfig
+
+from benchmark_utils import ROOT, stats, timeit, write_report
+
+REPEAT = 20
+INTERPRETER_REPEAT = 3
+
+CONSOLE_URLS = {
+    "telnet": ("gns3+telnet://localhost:6000?name=R1&project_id=1234&node_id=5678", "telnet_command", "telnet {host} {port}"),
+    "vnc": ("gns3+vnc://localhost:5901?name=R1&project_id=1234&node_id=5678", "vnc_command", "vncviewer {host}:{display}"),
+    "spice": ("gns3+spice://localhost:5000?name=R1&project_id=1234&node_id=5678", "spice_command", "remote-viewer spice://{host}:{port}"),
+}
+
+PCAP_DATA = b"\xd4\xc3\xb2\xa1\x02\x00\x04\x00" + b"\x00" * 16
+
+
+class PopenRecorder:
+    """
+    Replaces subprocess.Popen: records the time and arguments of each spawn.
+    """
+
+    def __init__(self):
+
+        self.calls = []
+
+    def __call__(self, args, **kwargs):
+
+        self.calls.append((time.perf_counter(), args))
+        process = MagicMock()
+        process.pid = 0
+        return process
+
+
+class FakeControllerHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Minimal GNS3 v2 controller: /version and a finite packet capture stream.
+    """
+
+    def do_GET(self):
+
+        if self.path == "/v2/version":
+            self._reply("application/json", json.dumps({"version": "2.2.0", "local": False}).encode())
+        elif self.path.endswith("/pcap"):
+            self._reply("application/vnd.tcpdump.pcap", PCAP_DATA)
+        else:
+            self.send_error(404)
+
+    def _reply(self, content_type, body):
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+
+        pass
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory):
+
+    results = {}
+    yield results
+    write_report(results, "GNS3_WEBCLIENT_BENCHMARK_OUTPUT", tmp_path_factory.getbasetemp() / "launcher_benchmark.json", key="schemes")
+
+
+@pytest.fixture
+def fake_controller():
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FakeControllerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
+def _interpreter_stages():
+
+    interpreter = []
+    imports = []
+    for _ in range(INTERPRETER_REPEAT):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        interpreter.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import gns3_webclient_pack.launcher"], cwd=ROOT, check=True)
+        # the import stage excludes the interpreter start measured just before
+        imports.append(max(time.perf_counter() - start - interpreter[-1], 0))
+    return stats(interpreter), stats(imports)
+
+
+def _config_load_stage(local_config):
+
+    return timeit(lambda: LocalConfig(config_file=local_config.configFilePath()), REPEAT)
+
+
+def _url_to_spawn(url, recorder, repeat=REPEAT):
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        launcher(url)
+        durations.append(recorder.calls[-1][0] - start)
+    return stats(durations)
+
+
+@pytest.mark.parametrize("scheme", sorted(CONSOLE_URLS))
+def test_console_launch_benchmark(scheme, local_config, results):
+
+    url, setting, command_line = CONSOLE_URLS[scheme]
+    local_config.saveSectionSettings("CommandsSettings", {setting: command_line})
+
+    stages = {}
+    stages["interpreter_start"], stages["imports"] = _interpreter_stages()
+    stages["config_load"] = _config_load_stage(local_config)
+    stages["url_parse"] = timeit(lambda: parse_url(url), REPEAT)
+    _, url_data = parse_url(url)
+    stages["template_render"] = timeit(lambda: Command(**url_data).render(command_line), REPEAT)
+
+    recorder = PopenRecorder()
+    with patch("subprocess.Popen", new=recorder), \
+            patch("sys.platform", new="linux"):
+        command = Command(**url_data)
+        stages["spawn"] = timeit(lambda: command._exec_command(command.render(command_line)), REPEAT)
+        stages["url_to_spawn"] = _url_to_spawn(url, recorder)
+
+    assert len(recorder.calls) == 2 * REPEAT
+    results[scheme] = stages
+
+
+def test_pcap_launch_benchmark(qtbot, local_config, fake_controller, results):
+
+    url = "gns3+pcap://127.0.0.1:{}?project_id=1234&link_id=5678&name=capture".format(fake_controller)
+    command_line = "wireshark {pcap_file}"
+    local_config.saveSectionSettings("CommandsSettings", {"pcap_command": command_line})
+    local_config.saveSectionSettings("ControllerSettings", {"protocol": "http"})
+
+    stages = {}
+    stages["interpreter_start"], stages["imports"] = _interpreter_stages()
+    stages["config_load"] = _config_load_stage(local_config)
+    stages["url_parse"] = timeit(lambda: parse_url(url), REPEAT)
+
+    recorder = PopenRecorder()
+    with patch("subprocess.Popen", new=recorder), \
+            patch("sys.platform", new="linux"):
+        stages["url_to_spawn"] = _url_to_spawn(url, recorder, repeat=5)
+
+    assert all(args[0] == "wireshark" for _, args in recorder.calls)
+    results["pcap"] = stages
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import json
+import subprocess
+
+# modules only some launches need, they must be imported by the code paths using them
+LAUNCHER_DEFERRED_MODULES = {
+    "PyQt5.QtGui",
+    "PyQt5.QtWidgets",
+    "PyQt5.QtNetwork",
+    "psutil",
+    "distro",
+    "gns3_webclient_pack.settings",
+    "gns3_webclient_pack.application",
+    "gns3_webclient_pack.main_window",
+    "gns3_webclient_pack.pcap_stream",
+    "gns3_webclient_pack.launcher_service",
+    "gns3_webclient_pack.dialogs.login_dialog",
+    "gns3_webclient_pack.ui.resources_rc",
+    "gns3_webclient_pack.utils.bring_to_front",
+}
+
+
+def _imported_modules(statement):
+    """
+    Returns the modules loaded after running a statement in a fresh interpreter.
+    """
+
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    output = subprocess.run([sys.executable, "-c", "import sys, json\n{}\nprint(json.dumps(sorted(sys.modules)))".format(statement)],
+                            cwd=root,
+                            stdout=subprocess.PIPE,
+                            universal_newlines=True,
+                            check=True).stdout
+    return set(json.loads(output.splitlines()[-1]))
+
+
+def test_launcher_deferred_imports():
+
+    # the number of modules and the import time depend on the Python version and
+    # the platform, only the heavy modules kept off the launch path are checked
+    modules = _imported_modules("import gns3_webclient_pack.launcher")
+    assert "gns3_webclient_pack.launcher" in modules
+    assert not modules & LAUNCHER_DEFERRED_MODULES
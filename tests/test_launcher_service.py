@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import uuid
+import threading
+import pytest
+from unittest.mock import patch
+from gns3_webclient_pack import launcher_service
+from gns3_webclient_pack.launcher import launcher, LauncherError
+from gns3_webclient_pack.utils.file_lock import FileLock
+from gns3_webclient_pack.launcher_service import LauncherService, forward_url, is_forwardable
+
+
+@pytest.fixture(autouse=True)
+def address(tmp_path):
+
+    if sys.platform.startswith("win"):
+        # a named pipe, not a file path
+        address = "gns3-webclient-test-{}".format(uuid.uuid4().hex)
+    else:
+        address = str(tmp_path / "launcher.sock")
+    with patch('gns3_webclient_pack.launcher_service.service_address', return_value=address):
+        yield
+
+
+@pytest.fixture
+def service(qtbot, local_config):
+
+    service = LauncherService(launcher, idle_timeout=0)
+    service.listen()
+    yield service
+    service.close()
+
+
+def _forward_in_thread(qtbot, url):
+
+    result = {}
+
+    def forward():
+        try:
+            result["launched"] = forward_url(url)
+        except LauncherError as e:
+            result["error"] = str(e)
+
+    thread = threading.Thread(target=forward)
+    thread.start()
+    qtbot.waitUntil(lambda: not thread.is_alive(), timeout=5000)
+    return result
+
+
+def test_is_forwardable():
+
+    assert is_forwardable("gns3+telnet://localhost:6000")
+    assert is_forwardable("GNS3+VNC://localhost:5900")
+    assert not is_forwardable("gns3+pcap://localhost:3080?project_id=1&link_id=2")
+    assert not is_forwardable("gns3+telnetx://localhost:6000")
+
+
+def test_forward_url_without_service(local_config):
+
+    assert forward_url("gns3+telnet://localhost:6000") is False
+
+
+def test_forward_url_to_service(qtbot, local_config, service):
+
+    local_config.loadSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    # the detected settings are computed on first use, not while the platform is patched
+    from gns3_webclient_pack import settings
+    for name in settings.DETECTED_SETTINGS:
+        getattr(settings, name)
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.platform', new="win"):
+        result = _forward_in_thread(qtbot, "gns3+telnet://localhost:6000")
+        assert result == {"launched": True}
+        proc.assert_called_once()
+        assert proc.call_args[0][0] == "telnet localhost 6000"
+
+
+def test_forward_url_to_service_with_error(qtbot, local_config, service):
+
+    with patch('subprocess.Popen') as proc:
+        result = _forward_in_thread(qtbot, "gns3+vnc://localhost:2000")
+        assert "VNC requires a port superior or equal to 5900" in result["error"]
+        assert not proc.called
+
+
+def test_forward_url_to_service_with_unexpected_error(qtbot, local_config):
+
+    def callback(url):
+        raise RuntimeError("unexpected failure")
+
+    service = LauncherService(callback, idle_timeout=0)
+    service.listen()
+    try:
+        result = _forward_in_thread(qtbot, "gns3+telnet://localhost:6000")
+        assert "unexpected failure" in result["error"]
+        # the service is still answering
+        result = _forward_in_thread(qtbot, "gns3+telnet://localhost:6000")
+        assert "unexpected failure" in result["error"]
+    finally:
+        service.close()
+
+
+def test_second_service_keeps_first_listening(qtbot, local_config, service):
+
+    other = LauncherService(launcher, idle_timeout=0)
+    with pytest.raises(LauncherError, match="already listening"):
+        other.listen()
+    # the socket of the running service has not been removed
+    local_config.loadSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    with patch('subprocess.Popen'):
+        assert _forward_in_thread(qtbot, "gns3+telnet://localhost:6000") == {"launched": True}
+
+
+def test_service_start_serialized(local_config):
+
+    lock_path = os.path.join(local_config.configDirectory(), launcher_service.SERVICE_LOCK_FILENAME)
+    service = LauncherService(launcher, idle_timeout=0)
+    # another service is starting
+    with FileLock(lock_path), patch.object(launcher_service, "SERVICE_LOCK_TIMEOUT", new=0.1):
+        with pytest.raises(LauncherError, match="Cannot start the launcher service"):
+            service.listen()
+    service.listen()
+    service.close()
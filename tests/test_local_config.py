@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import json
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack import local_config as local_config_module
+from gns3_webclient_pack.local_config import LocalConfig, ConfigSerializer, CONFIG_FORMAT
+from gns3_webclient_pack.settings import COMMANDS_SETTINGS, CONTROLLER_SETTINGS
+from gns3_webclient_pack.settings_sections import SECTION_CLASSES
+
+
+@pytest.fixture
+def config_file(tmp_path):
+
+    path = tmp_path / "webclient_pack.conf"
+    with open(str(path), "w", encoding="utf-8") as f:
+        json.dump({"type": "settings", "version": "2.2.0", "CommandsSettings": {"telnet_command": "telnet {host} {port}"}}, f)
+    return path
+
+
+def _read(path):
+
+    with open(str(path), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_read_only_does_not_write(config_file):
+
+    content = config_file.read_bytes()
+    mtime = os.stat(str(config_file)).st_mtime_ns
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert config.isReadOnly()
+
+    settings = config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
+    assert settings["telnet_command"] == "telnet {host} {port}"
+    # defaults are merged in memory only
+    assert settings["vnc_command"] == COMMANDS_SETTINGS["vnc_command"]
+    config.saveSectionSettings("CommandsSettings", settings)
+    assert config_file.read_bytes() == content
+    assert os.stat(str(config_file)).st_mtime_ns == mtime
+
+
+def test_read_only_writes_explicit_changes(config_file):
+
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    controller_settings = config.loadSectionSettings("ControllerSettings", CONTROLLER_SETTINGS)
+    config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
+
+    # another process changes the file in the meantime
+    data = _read(config_file)
+    data["GeneralSettings"] = {"hide_main_window": True}
+    with open(str(config_file), "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    controller_settings["token"] = "refreshed"
+    config.saveSectionSettings("ControllerSettings", controller_settings)
+    data = _read(config_file)
+    assert data["ControllerSettings"]["token"] == "refreshed"
+    # only the changed section is written: no defaults and other sections left as they are
+    assert data["CommandsSettings"] == {"telnet_command": "telnet {host} {port}"}
+    assert data["GeneralSettings"] == {"hide_main_window": True}
+
+
+def test_read_only_missing_file(tmp_path):
+
+    path = tmp_path / "config" / "webclient_pack.conf"
+    config = LocalConfig(config_file=str(path), read_only=True)
+    assert config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS) == COMMANDS_SETTINGS
+    assert not path.exists()
+
+    config.saveSectionSettings("ControllerSettings", {"token": "abc"})
+    # the saved section is written with its default values
+    assert _read(path)["ControllerSettings"] == dict(CONTROLLER_SETTINGS, token="abc")
+    assert "CommandsSettings" not in _read(path)
+
+
+def test_write_mode_adds_defaults(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
+    assert _read(config_file)["CommandsSettings"]["vnc_command"] == COMMANDS_SETTINGS["vnc_command"]
+
+
+def test_section_view(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    view = config.sectionView("CommandsSettings", COMMANDS_SETTINGS)
+    assert view["telnet_command"] == "telnet {host} {port}"
+    assert view["vnc_command"] == COMMANDS_SETTINGS["vnc_command"]
+    with pytest.raises(TypeError):
+        view["telnet_command"] = "xterm"
+    # cached until the section changes
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS) is view
+
+    settings = config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
+    settings["telnet_command"] = "xterm -e telnet {host} {port}"
+    assert view["telnet_command"] == "telnet {host} {port}"
+    config.saveSectionSettings("CommandsSettings", settings)
+    new_view = config.sectionView("CommandsSettings", COMMANDS_SETTINGS)
+    assert new_view is not view
+    assert new_view["telnet_command"] == "xterm -e telnet {host} {port}"
+
+
+def test_section_view_nested(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    config.saveSectionSettings("CustomCommands", {"telnet": {"My terminal": "myterm {host} {port}"}, "vnc": {}})
+    view = config.sectionView("CustomCommands", {"telnet": {}, "vnc": {}, "spice": {}})
+    assert view["telnet"]["My terminal"] == "myterm {host} {port}"
+    assert dict(view["spice"]) == {}
+    with pytest.raises(TypeError):
+        view["telnet"]["Other"] = "other"
+
+
+def test_load_section_settings_copy(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    settings = config.loadSectionSettings("CustomCommands", {"telnet": {}})
+    settings["telnet"]["My terminal"] = "myterm"
+    assert config.loadSectionSettings("CustomCommands", {"telnet": {}}) == {"telnet": {}}
+
+
+def test_batch_single_write(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    with patch.object(config, "_writeConfig", wraps=config._writeConfig) as write_config:
+        with config.batch():
+            config.saveSectionSettings("CommandsSettings", {"telnet_command": "xterm"})
+            config.saveSectionSettings("ControllerSettings", {"username": "admin"})
+            config.setSettings({"GeneralSettings": {"hide_main_window": True}})
+            assert not write_config.called
+            assert config.hasPendingChanges()
+        write_config.assert_called_once_with()
+    data = _read(config_file)
+    assert data["CommandsSettings"]["telnet_command"] == "xterm"
+    assert data["ControllerSettings"] == {"username": "admin"}
+    assert data["GeneralSettings"] == {"hide_main_window": True}
+
+
+def test_batch_rollback(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    content = config_file.read_bytes()
+    with pytest.raises(ValueError):
+        with config.batch():
+            config.saveSectionSettings("CommandsSettings", {"telnet_command": "xterm"})
+            raise ValueError()
+    assert not config.hasPendingChanges()
+    assert config.sectionView("CommandsSettings", {})["telnet_command"] == "telnet {host} {port}"
+    assert config_file.read_bytes() == content
+
+
+def test_set_settings_signal(config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    changes = []
+    config.config_changed_signal.connect(changes.append)
+
+    with config.batch():
+        config.setSettings({"GeneralSettings": {"hide_main_window": True}})
+        # nothing is announced before the change is written
+        assert changes == []
+    assert changes == [{"GeneralSettings"}]
+
+    with pytest.raises(ValueError):
+        with config.batch():
+            config.setSettings({"GeneralSettings": {"hide_main_window": False}})
+            raise ValueError()
+    assert len(changes) == 1
+
+    # another process changed a section: a single signal for both changes
+    data = _read(config_file)
+    data["ControllerSettings"] = {"username": "admin"}
+    _replace(config_file, data)
+    config.setSettings({"GeneralSettings": {"hide_main_window": False}})
+    assert changes[1:] == [{"ControllerSettings", "GeneralSettings"}]
+
+
+def test_write_delay(qtbot, config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    config.setWriteDelay(50)
+    with patch.object(config, "_writeConfig", wraps=config._writeConfig) as write_config:
+        for index in range(5):
+            config.saveSectionSettings("CustomCommands", {"telnet": {"term{}".format(index): "term"}})
+        assert not write_config.called
+        qtbot.waitUntil(lambda: not config.hasPendingChanges(), timeout=2000)
+        write_config.assert_called_once_with()
+    assert _read(config_file)["CustomCommands"]["telnet"] == {"term4": "term"}
+
+    config.saveSectionSettings("CustomCommands", {"telnet": {}})
+    config.flush()
+    assert not config.hasPendingChanges()
+    assert _read(config_file)["CustomCommands"]["telnet"] == {}
+
+
+def _replace(path, data):
+
+    # write-then-rename like LocalConfig does
+    temporary = str(path) + ".tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(temporary, str(path))
+
+
+def test_check_config_changed(config_file):
+
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    config.sectionView("CommandsSettings", COMMANDS_SETTINGS)
+    changes = []
+    config.config_changed_signal.connect(changes.append)
+
+    data = _read(config_file)
+    data["CommandsSettings"]["telnet_command"] = "xterm"
+    data["GeneralSettings"] = {"hide_main_window": True}
+    _replace(config_file, data)
+    os.utime(str(config_file), (0, os.stat(str(config_file)).st_mtime + 10))
+    config.checkConfigChanged()
+    assert changes == [{"CommandsSettings", "GeneralSettings"}]
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "xterm"
+
+    # same content: nothing reloaded
+    os.utime(str(config_file), (0, os.stat(str(config_file)).st_mtime + 10))
+    config.checkConfigChanged()
+    assert len(changes) == 1
+
+
+def test_check_config_changed_pending_changes(qtbot, config_file):
+
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    config.setWriteDelay(60000)
+    config.saveSectionSettings("CommandsSettings", {"telnet_command": "xterm"})
+    assert config.hasPendingChanges()
+
+    # another process changes the same section and another one
+    data = _read(config_file)
+    data["CommandsSettings"]["telnet_command"] = "other"
+    data["ControllerSettings"] = {"username": "admin"}
+    _replace(config_file, data)
+    os.utime(str(config_file), (0, os.stat(str(config_file)).st_mtime + 10))
+
+    # the file is merged: the pending change is kept and not written yet
+    config.checkConfigChanged()
+    assert config.hasPendingChanges()
+    assert config.sectionView("CommandsSettings", {})["telnet_command"] == "xterm"
+    assert config.sectionView("ControllerSettings", {})["username"] == "admin"
+    assert _read(config_file)["CommandsSettings"]["telnet_command"] == "other"
+
+    config.flush()
+    data = _read(config_file)
+    assert data["CommandsSettings"]["telnet_command"] == "xterm"
+    assert data["ControllerSettings"] == {"username": "admin"}
+
+
+def test_watcher(qtbot, config_file):
+
+    config = LocalConfig(config_file=str(config_file))
+    config.startWatching(debounce=50)
+    try:
+        with qtbot.assertNotEmitted(config.config_changed_signal, wait=300):
+            # our own writes are ignored
+            config.saveSectionSettings("CommandsSettings", {"telnet_command": "xterm"})
+
+        data = _read(config_file)
+        data["CommandsSettings"]["vnc_command"] = "vncviewer {host}"
+        with qtbot.waitSignal(config.config_changed_signal, timeout=5000) as blocker:
+            _replace(config_file, data)
+        assert blocker.args == [{"CommandsSettings"}]
+        assert config.sectionView("CommandsSettings", {})["vnc_command"] == "vncviewer {host}"
+
+        # the replaced file is still watched
+        data["ControllerSettings"] = {"username": "admin"}
+        with qtbot.waitSignal(config.config_changed_signal, timeout=5000) as blocker:
+            _replace(config_file, data)
+        assert blocker.args == [{"ControllerSettings"}]
+    finally:
+        config.stopWatching()
+
+
+def test_read_only_snapshot(config_file):
+
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert os.path.exists(str(config_file) + ".snapshot")
+
+    with patch.object(LocalConfig, "_readConfig") as read_config:
+        config = LocalConfig(config_file=str(config_file), read_only=True)
+        assert not read_config.called
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "telnet {host} {port}"
+
+    # any change to the config file rebuilds the snapshot
+    data = _read(config_file)
+    data["CommandsSettings"]["telnet_command"] = "xterm -e telnet {host} {port}"
+    with open(str(config_file), "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "xterm -e telnet {host} {port}"
+
+    # so does a new version of the package
+    with patch("gns3_webclient_pack.local_config.__version__", new="99.0.0"), \
+            patch.object(LocalConfig, "_readConfig", return_value={}) as read_config:
+        LocalConfig(config_file=str(config_file), read_only=True)
+        assert read_config.called
+
+
+def test_read_only_snapshot_defaults(config_file):
+
+    LocalConfig(config_file=str(config_file), read_only=True)
+    with open(str(config_file) + ".snapshot", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    # the snapshot has the default values merged, the file content is kept apart
+    assert snapshot["settings"]["CommandsSettings"]["vnc_command"] == COMMANDS_SETTINGS["vnc_command"]
+    assert snapshot["settings"]["ControllerSettings"] == CONTROLLER_SETTINGS
+    assert snapshot["file_settings"]["CommandsSettings"] == {"telnet_command": "telnet {host} {port}"}
+
+    # the typed sections are not validated again
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    for section_class in SECTION_CLASSES:
+        with patch.object(section_class, "fromSettings") as from_settings:
+            section = config.section(section_class)
+            assert not from_settings.called
+        assert section == section_class.fromSettings(config.sectionView(section_class.SECTION, section_class.defaults()))
+
+    # the default commands depend on the detected console clients
+    with patch("gns3_webclient_pack.utils.console_detection.detection_key", return_value=["other"]), \
+            patch.object(LocalConfig, "_readConfig", return_value={}) as read_config:
+        LocalConfig(config_file=str(config_file), read_only=True)
+        assert read_config.called
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="the config file is webclient_pack.ini on Windows")
+def test_read_only_snapshot_cwd_config(config_file, tmp_path, monkeypatch):
+
+    LocalConfig(config_file=str(config_file), read_only=True)
+
+    cwd = tmp_path / "cwd"
+    cwd.mkdir()
+    cwd_config_file = cwd / os.path.basename(str(config_file))
+    with open(str(cwd_config_file), "w", encoding="utf-8") as f:
+        json.dump({"type": "settings", "CommandsSettings": {"telnet_command": "cwd-telnet {host} {port}"}}, f)
+    monkeypatch.chdir(str(cwd))
+
+    # the snapshot of the user config file is not used for the config file of the current directory
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert config.configFilePath() == str(cwd_config_file)
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "cwd-telnet {host} {port}"
+    assert os.path.exists(str(cwd_config_file) + ".snapshot")
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "cwd-telnet {host} {port}"
+
+
+def test_read_only_snapshot_corrupted(config_file):
+
+    with open(str(config_file) + ".snapshot", "wb") as f:
+        f.write(b"garbage")
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert config.sectionView("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "telnet {host} {port}"
+
+
+@pytest.mark.parametrize("read_only", (True, False))
+def test_concurrent_writers_section_merge(config_file, read_only):
+
+    first = LocalConfig(config_file=str(config_file), read_only=read_only)
+    second = LocalConfig(config_file=str(config_file), read_only=read_only)
+    first.saveSectionSettings("ControllerSettings", {"token": "first"})
+    second.saveSectionSettings("GeneralSettings", {"hide_main_window": True})
+    first.saveSectionSettings("CommandsSettings", {"telnet_command": "xterm"})
+
+    data = _read(config_file)
+    assert data["ControllerSettings"]["token"] == "first"
+    assert data["GeneralSettings"]["hide_main_window"] is True
+    assert data["CommandsSettings"]["telnet_command"] == "xterm"
+    # the writer also picked up the section changed by the other one
+    assert first.sectionView("GeneralSettings", {})["hide_main_window"] is True
+    assert [name for name in os.listdir(str(config_file.parent)) if name.endswith(".tmp")] == []
+
+
+def test_write_lock_timeout(config_file, caplog):
+
+    from gns3_webclient_pack.utils.file_lock import FileLock
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    content = config_file.read_bytes()
+    with FileLock(str(config_file) + ".lock"):
+        with patch("gns3_webclient_pack.local_config.LocalConfig._fileLock", return_value=FileLock(str(config_file) + ".lock", timeout=0.1)):
+            config.saveSectionSettings("ControllerSettings", {"token": "abc"})
+    assert "Timeout" in caplog.text
+    assert config_file.read_bytes() == content
+    assert not config.hasPendingChanges()
+
+
+def test_legacy_format_migration(config_file):
+
+    # files written by previous versions are indented and have no format key
+    assert "format" not in _read(config_file)
+    config = LocalConfig(config_file=str(config_file))
+    assert config.sectionView("CommandsSettings", {})["telnet_command"] == "telnet {host} {port}"
+
+    data = config_file.read_bytes()
+    assert b"\n" not in data
+    assert _read(config_file)["format"] == CONFIG_FORMAT
+    assert _read(config_file)["CommandsSettings"]["telnet_command"] == "telnet {host} {port}"
+
+
+def test_unsupported_format(config_file, caplog):
+
+    content = _read(config_file)
+    content["format"] = CONFIG_FORMAT + 1
+    with open(str(config_file), "w", encoding="utf-8") as f:
+        json.dump(content, f)
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    assert "not supported" in caplog.text
+    assert config.sectionView("CommandsSettings", {})["telnet_command"] == "telnet {host} {port}"
+
+
+@pytest.mark.parametrize("threshold", (0, None))
+def test_serializer(threshold):
+
+    config = {"type": "settings", "CustomCommands": {"telnet": {"cmd{}".format(i): "telnet {host} {port}" for i in range(100)}}}
+    if threshold is None:
+        threshold = local_config_module.FAST_JSON_THRESHOLD
+    with patch("gns3_webclient_pack.local_config.FAST_JSON_THRESHOLD", threshold):
+        compact = ConfigSerializer().dumps(config)
+        pretty = ConfigSerializer(pretty=True).dumps(config)
+        assert len(compact) < len(pretty)
+        assert pretty.startswith(b'{\n    "CustomCommands"')
+        assert ConfigSerializer().loads(compact) == config
+        assert ConfigSerializer().loads(pretty) == config
+
+
+def test_export_config(config_file, tmp_path):
+
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    export_path = tmp_path / "export.conf"
+    config.exportConfig(str(export_path))
+    assert export_path.read_text().startswith('{\n    "CommandsSettings"')
+
+    exported = LocalConfig(config_file=str(export_path), read_only=True)
+    assert exported.sectionView("CommandsSettings", {})["telnet_command"] == "telnet {host} {port}"
+
+
+def test_read_only_unchanged_file_writes_only_saved_section(config_file):
+
+    config = LocalConfig(config_file=str(config_file), read_only=True)
+    # defaults are merged in memory, in a section of the file and in a new one
+    config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)
+    config.loadSectionSettings("ControllerSettings", CONTROLLER_SETTINGS)
+
+    config.saveSectionSettings("GeneralSettings", {"hide_main_window": True})
+    data = _read(config_file)
+    assert data["GeneralSettings"]["hide_main_window"] is True
+    assert data["CommandsSettings"] == {"telnet_command": "telnet {host} {port}"}
+    assert "ControllerSettings" not in data
+
+    # the file is unchanged since our own write
+    config.saveSectionSettings("ControllerSettings", {"token": "abc"})
+    data = _read(config_file)
+    assert data["CommandsSettings"] == {"telnet_command": "telnet {host} {port}"}
+    assert data["ControllerSettings"]["token"] == "abc"
+    assert data["GeneralSettings"]["hide_main_window"] is True
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+LocalConfig benchmarks (load, section load/save, change checks) for configs
+with thousands of custom commands, and a multi-process stress test.
+
+Results are written as JSON to the file given by the GNS3_WEBCLIENT_CONFIG_BENCHMARK_OUTPUT
+environment variable (config_benchmark.json in the pytest temporary directory by default)
+so runs can be compared across commits.
+"""
+
+import os
+import sys
+import json
+import time
+import subprocess
+import pytest
+
+from gns3_webclient_pack.local_config import LocalConfig
+from gns3_webclient_pack.settings import COMMANDS_SETTINGS, CUSTOM_COMMANDS_SETTINGS
+
+from benchmark_utils import ROOT, timeit, write_report
+
+REPEAT = 10
+
+# number of custom commands of each console type
+CONFIG_SIZES = (0, 1000, 5000)
+
+STRESS_PROCESSES = 4
+STRESS_SAVES = 25
+
+STRESS_WORKER = """
+import sys
+from gns3_webclient_pack.local_config import LocalConfig
+
+path, worker, saves = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+config = LocalConfig(config_file=path, read_only=True)
+for counter in range(saves):
+    section = config.loadSectionSettings("Stress{}".format(worker), {"counter": -1})
+    assert section["counter"] == counter - 1, section
+    config.saveSectionSettings("Stress{}".format(worker), {"counter": counter})
+    config.checkConfigChanged()
+"""
+
+
+def _custom_commands(size):
+
+    return {
+        console_type: {"{} client {}".format(console_type, i): "{}-client {{host}} {{port}} --profile {}".format(console_type, i) for i in range(size)}
+        for console_type in ("telnet", "vnc", "spice")
+    }
+
+
+@pytest.fixture(scope="module")
+def results(tmp_path_factory):
+
+    results = {}
+    yield results
+    write_report(results, "GNS3_WEBCLIENT_CONFIG_BENCHMARK_OUTPUT", tmp_path_factory.getbasetemp() / "config_benchmark.json")
+
+
+@pytest.fixture
+def config_path(tmp_path):
+
+    return str(tmp_path / "webclient_pack.conf")
+
+
+@pytest.mark.parametrize("size", CONFIG_SIZES)
+def test_config_benchmark(size, config_path, results):
+
+    config = LocalConfig(config_file=config_path)
+    config.saveSectionSettings("CustomCommands", _custom_commands(size))
+    config.saveSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+
+    stages = {"file_size": os.path.getsize(config_path)}
+    stages["cold_load"] = timeit(lambda: LocalConfig(config_file=config_path), REPEAT)
+    # the launcher loads the config read-only, from the snapshot after the first load
+    stages["cold_load_read_only"] = timeit(lambda: LocalConfig(config_file=config_path, read_only=True), REPEAT)
+    stages["load_section"] = timeit(lambda: config.loadSectionSettings("CustomCommands", CUSTOM_COMMANDS_SETTINGS), REPEAT)
+    stages["section_view"] = timeit(lambda: config.sectionView("CustomCommands", CUSTOM_COMMANDS_SETTINGS), REPEAT)
+
+    counter = iter(range(REPEAT))
+    stages["save_section"] = timeit(lambda: config.saveSectionSettings("CommandsSettings", {"vnc_command": "vncviewer {}".format(next(counter))}), REPEAT)
+    stages["check_config_changed"] = timeit(config.checkConfigChanged, REPEAT)
+
+    other = LocalConfig(config_file=config_path)
+
+    def change_and_check():
+        other.saveSectionSettings("CommandsSettings", {"spice_command": "remote-viewer {}".format(time.perf_counter())})
+        # make sure the mtime changes even with a coarse file system clock
+        os.utime(config_path, ns=(time.time_ns(), time.time_ns() + 1000000))
+        config.checkConfigChanged()
+
+    stages["check_config_changed_reload"] = timeit(change_and_check, REPEAT)
+
+    assert len(config.loadSectionSettings("CustomCommands", CUSTOM_COMMANDS_SETTINGS)["telnet"]) == size
+    assert config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)["spice_command"].startswith("remote-viewer ")
+    results["commands_{}".format(size)] = stages
+
+
+def test_config_stress(config_path, results):
+
+    config = LocalConfig(config_file=config_path)
+    config.saveSectionSettings("CustomCommands", _custom_commands(100))
+
+    start = time.perf_counter()
+    # the read-only config caches the console detection in the user config directory
+    home = os.path.dirname(config_path)
+    env = dict(os.environ, HOME=home, APPDATA=home)
+    workers = [subprocess.Popen([sys.executable, "-c", STRESS_WORKER, config_path, str(worker), str(STRESS_SAVES)],
+                                cwd=ROOT,
+                                env=env,
+                                stderr=subprocess.PIPE)
+               for worker in range(STRESS_PROCESSES)]
+
+    # readers must never see a partially written file
+    reads = 0
+    while any(worker.poll() is None for worker in workers):
+        with open(config_path, "rb") as f:
+            content = json.loads(f.read().decode("utf-8"))
+        assert content["type"] == "settings"
+        reads += 1
+
+    for worker in workers:
+        _, stderr = worker.communicate()
+        assert worker.returncode == 0, stderr.decode()
+    duration = time.perf_counter() - start
+
+    # no update of a process has been lost by a concurrent write of another one
+    with open(config_path, encoding="utf-8") as f:
+        content = json.load(f)
+    for worker in range(STRESS_PROCESSES):
+        assert content["Stress{}".format(worker)]["counter"] == STRESS_SAVES - 1
+    assert len(content["CustomCommands"]["telnet"]) == 100
+    assert [name for name in os.listdir(os.path.dirname(config_path)) if name.endswith(".tmp")] == []
+
+    results["stress"] = {
+        "processes": STRESS_PROCESSES,
+        "saves_per_process": STRESS_SAVES,
+        "duration_s": round(duration, 3),
+        "reads": reads,
+    }
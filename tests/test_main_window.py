@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack.qt import QtWidgets
+from gns3_webclient_pack.main_window import MainWindow
+from gns3_webclient_pack.settings_sections import CommandsSettings, ControllerSettings, CustomCommands
+
+
+@pytest.fixture
+def main_window(qtbot, local_config):
+
+    window = MainWindow()
+    qtbot.addWidget(window)
+    yield window
+    delattr(MainWindow, "_instance")
+
+
+def test_command_dialog_reused(main_window, local_config):
+
+    local_config.saveSectionSettings("CustomCommands", {"telnet": {"My telnet": "my-telnet {host} {port}"},
+                                                        "vnc": {"My VNC": "my-vnc {host}:{port}"}})
+
+    with patch.object(QtWidgets.QDialog, "exec_", return_value=QtWidgets.QDialog.Accepted):
+        assert main_window._getCommand("telnet", "my-telnet {host} {port}") == (True, "my-telnet {host} {port}")
+        dialog = main_window._command_dialog
+        assert main_window._getCommand("vnc", "my-vnc {host}:{port}") == (True, "my-vnc {host}:{port}")
+        assert main_window._command_dialog is dialog
+        assert dialog.uiCommandComboBox.currentText() == "My VNC"
+
+        # the command is selected again when it has not changed
+        assert main_window._getCommand("vnc", "my-vnc {host}:{port}") == (True, "my-vnc {host}:{port}")
+        assert dialog.uiCommandComboBox.currentText() == "My VNC"
+
+    with patch.object(QtWidgets.QDialog, "exec_", return_value=QtWidgets.QDialog.Rejected):
+        assert main_window._getCommand("telnet", "my-telnet {host} {port}") == (False, None)
+
+
+def test_about_dialog_reused(main_window):
+
+    with patch.object(QtWidgets.QDialog, "exec_", return_value=QtWidgets.QDialog.Accepted):
+        main_window._aboutActionSlot()
+        dialog = main_window._about_dialog
+        main_window._aboutActionSlot()
+    assert main_window._about_dialog is dialog
+
+
+def test_apply_settings(main_window, local_config):
+
+    local_config.saveSection(local_config.section(ControllerSettings).replace(token="abc"))
+    main_window.uiTelnetCommandLineEdit.setText("my-telnet {host} {port} ")
+    main_window.uiUserLineEdit.setText("alice")
+    main_window._applySlot()
+
+    assert local_config.section(CommandsSettings).telnet_command == "my-telnet {host} {port}"
+    controller_settings = local_config.section(ControllerSettings)
+    assert controller_settings.username == "alice"
+    # the settings which are not in the window are kept
+    assert controller_settings.token == "abc"
+
+
+def test_command_dialog_custom_commands(main_window, local_config):
+
+    with patch.object(QtWidgets.QDialog, "exec_", return_value=QtWidgets.QDialog.Rejected):
+        main_window._getCommand("telnet", "my-telnet {host} {port}")
+    dialog = main_window._command_dialog
+
+    with patch.object(QtWidgets.QInputDialog, "getText", return_value=("My telnet", True)):
+        dialog._savePushButtonClickedSlot()
+    assert local_config.section(CustomCommands).commands("telnet") == {"My telnet": "my-telnet {host} {port}"}
+    assert dialog.uiCommandComboBox.currentText() == "My telnet"
+
+    dialog._removePushButtonClickedSlot()
+    assert local_config.section(CustomCommands).commands("telnet") == {}
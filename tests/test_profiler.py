@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import pstats
+import pytest
+from unittest.mock import patch
+
+from gns3_webclient_pack.utils.profiler import requested_modes, profiled, report_path, PROFILE_ENV_VARIABLE
+from gns3_webclient_pack.local_config import LocalConfig
+from gns3_webclient_pack.launcher import main
+
+
+@pytest.fixture
+def config_directory(local_config, tmp_path):
+
+    with patch('gns3_webclient_pack.local_config.LocalConfig.configDirectory', return_value=str(tmp_path)):
+        yield tmp_path
+
+
+def test_report_path_without_config(monkeypatch, tmp_path):
+
+    monkeypatch.setattr(LocalConfig, "_instance", None, raising=False)
+    with patch('gns3_webclient_pack.local_config.config_directory', return_value=str(tmp_path)):
+        path = report_path("launcher", ".prof")
+    assert os.path.dirname(path) == str(tmp_path)
+    # no config has been loaded or created
+    assert LocalConfig._instance is None
+
+
+def test_requested_modes(monkeypatch):
+
+    monkeypatch.delenv(PROFILE_ENV_VARIABLE, raising=False)
+    argv = ["gns3-webclient-launcher", "--profile", "gns3+telnet://localhost:6000", "--profile-memory"]
+    assert requested_modes(argv) == {"cpu", "memory"}
+    assert argv == ["gns3-webclient-launcher", "gns3+telnet://localhost:6000"]
+    assert requested_modes(argv) == set()
+
+    monkeypatch.setenv(PROFILE_ENV_VARIABLE, "memory")
+    assert requested_modes([]) == {"memory"}
+    monkeypatch.setenv(PROFILE_ENV_VARIABLE, "1")
+    assert requested_modes([]) == {"cpu"}
+
+
+def test_profiled_reports_on_exit(config_directory, monkeypatch):
+
+    monkeypatch.setenv(PROFILE_ENV_VARIABLE, "cpu,memory")
+
+    @profiled("test")
+    def entry_point():
+        data = [bytearray(1024) for _ in range(100)]
+        raise SystemExit(len(data))
+
+    with pytest.raises(SystemExit):
+        entry_point()
+
+    files = sorted(os.listdir(str(config_directory)))
+    profiles = [f for f in files if f.endswith(".prof")]
+    assert len(profiles) == 1
+    assert profiles[0].startswith("test-")
+    stats = pstats.Stats(str(config_directory / profiles[0]))
+    assert any(function[2] == "entry_point" for function in stats.stats)
+    assert any(f.endswith("-cpu.txt") for f in files)
+    memory_reports = [f for f in files if f.endswith("-memory.txt")]
+    assert len(memory_reports) == 1
+    with open(str(config_directory / memory_reports[0])) as f:
+        assert "Peak traced memory" in f.read()
+
+
+def test_main_profile(config_directory, monkeypatch):
+
+    monkeypatch.delenv(PROFILE_ENV_VARIABLE, raising=False)
+    LocalConfig.instance().saveSectionSettings("CommandsSettings", {"telnet_command": "telnet {host} {port}"})
+    with patch('subprocess.Popen') as proc, \
+            patch('sys.platform', new="linux"), \
+            patch('sys.argv', new=["gns3-webclient-launcher", "--profile", "gns3+telnet://localhost:6000"]), \
+            patch('gns3_webclient_pack.launcher.configure_logging'):
+        main()
+        assert proc.call_args[0][0] == ["telnet", "localhost", "6000"]
+    assert any(f.startswith("launcher-") and f.endswith(".prof") for f in os.listdir(str(config_directory)))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import logging
+from unittest.mock import patch
+
+from gns3_webclient_pack.qt import QtCore
+from gns3_webclient_pack.ui import resources_rc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+RESOURCES = ("icons/config.svg", "icons/help.svg", "icons/quit.svg", "icons/reload.svg", "images/gns3_logo.png", "images/gns3_webclient.ico")
+
+
+
+def test_resources_registered():
+
+    assert resources_rc.qInitResources()
+    for name in RESOURCES:
+        resource = QtCore.QFile(":/" + name)
+        assert resource.open(QtCore.QIODevice.ReadOnly), name
+        with open(os.path.join(ROOT, "resources", name), "rb") as f:
+            assert bytes(resource.readAll()) == f.read(), name
+        resource.close()
+
+
+def test_resources_missing(caplog):
+
+    resources_rc.qCleanupResources()
+    try:
+        with patch("os.path.isfile", return_value=False), \
+                patch("gns3_webclient_pack.utils.get_resource.get_resource", return_value=None), \
+                caplog.at_level(logging.ERROR):
+            assert not resources_rc.qInitResources()
+        assert "Could not register the Qt resources" in caplog.text
+        assert not QtCore.QFile(":/icons/help.svg").exists()
+    finally:
+        assert resources_rc.qInitResources()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Import cost of the Qt resources: the binary resource file registered by
+resources_rc compared with a Python module embedding the same data, like
+pyrcc5 generates.
+
+Results are written as JSON to the file given by the GNS3_WEBCLIENT_RESOURCES_BENCHMARK_OUTPUT
+environment variable (resources_benchmark.json in the pytest temporary directory by default)
+so runs can be compared across commits. The memory allocated by the imports,
+measured with tracemalloc, is deterministic and checked.
+"""
+
+import os
+import sys
+import json
+import struct
+import subprocess
+import pytest
+
+from gns3_webclient_pack.ui import resources_rc
+
+from benchmark_utils import ROOT, stats, write_report
+
+REPEAT = 3
+
+# imports the module given on the command line, reports its import time
+# or, as tracing slows imports down, the memory it allocates
+IMPORT_PROFILER = """
+import sys
+import json
+import time
+import logging
+import importlib
+import tracemalloc
+
+from gns3_webclient_pack.qt import QtCore
+
+sys.path.insert(0, sys.argv[2])
+trace_memory = sys.argv[3] == "memory"
+if trace_memory:
+    tracemalloc.start()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+duration = time.perf_counter() - start
+assert QtCore.QFile(":/icons/help.svg").exists()
+if trace_memory:
+    current, peak = tracemalloc.get_traced_memory()
+    print(json.dumps({"memory": current, "peak_memory": peak}))
+else:
+    print(json.dumps({"duration": duration}))
+"""
+
+
+def _write_python_resources(path):
+    """
+    Writes the resources as a Python module, like pyrcc5 does.
+    """
+
+    with open(os.path.join(ROOT, "gns3_webclient_pack", resources_rc.RESOURCE_FILE), "rb") as f:
+        content = f.read()
+    version, tree_offset, data_offset, names_offset = struct.unpack(">IIII", content[4:20])
+    with open(os.path.join(path, "python_resources_rc.py"), "w", encoding="utf-8") as f:
+        f.write("from PyQt5 import QtCore\n")
+        f.write("qt_resource_struct = {!r}\n".format(content[tree_offset:data_offset]))
+        f.write("qt_resource_data = {!r}\n".format(content[data_offset:names_offset]))
+        f.write("qt_resource_name = {!r}\n".format(content[names_offset:]))
+        f.write("QtCore.qRegisterResourceData({}, qt_resource_struct, qt_resource_name, qt_resource_data)\n".format(version))
+
+
+def _profile_import(module, path):
+
+    results = []
+    # the first run writes the bytecode cache and is not measured
+    for mode in ["time", "memory"] + ["time"] * REPEAT:
+        output = subprocess.run([sys.executable, "-c", IMPORT_PROFILER, module, path, mode],
+                                cwd=ROOT,
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True,
+                                check=True).stdout
+        results.append(json.loads(output))
+    profile = stats([result["duration"] for result in results[2:]])
+    profile.update(results[1])
+    return profile
+
+
+@pytest.mark.skipif(not os.path.exists(os.path.join(ROOT, "resources")), reason="resource sources not available")
+def test_resources_import_benchmark(tmp_path):
+
+    _write_python_resources(str(tmp_path))
+    python_module = _profile_import("python_resources_rc", str(tmp_path))
+    binary_file = _profile_import("gns3_webclient_pack.ui.resources_rc", str(tmp_path))
+    write_report({"python_module": python_module, "binary_file": binary_file},
+                 "GNS3_WEBCLIENT_RESOURCES_BENCHMARK_OUTPUT",
+                 tmp_path / "resources_benchmark.json")
+
+    # the data is mapped by Qt instead of being loaded in Python objects,
+    # only the memory allocations are compared: the import time is too noisy
+    assert binary_file["peak_memory"] < python_module["peak_memory"]
+    assert binary_file["memory"] < python_module["memory"]
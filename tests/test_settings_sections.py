@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import pytest
+
+from gns3_webclient_pack.settings import COMMANDS_SETTINGS, CONTROLLER_SETTINGS
+from gns3_webclient_pack.settings_sections import CommandsSettings, ControllerSettings, LauncherSettings, CustomCommands
+
+
+def test_from_settings_defaults():
+
+    commands = CommandsSettings.fromSettings({"telnet_command": "telnet {host} {port}"})
+    assert commands.telnet_command == "telnet {host} {port}"
+    assert commands.vnc_command == COMMANDS_SETTINGS["vnc_command"]
+    assert not hasattr(commands, "__dict__")
+
+
+def test_validation():
+
+    controller = ControllerSettings.fromSettings({"protocol": "ftp", "accept_invalid_ssl_certificates": "true", "username": 42})
+    assert controller.protocol == CONTROLLER_SETTINGS["protocol"]
+    assert controller.accept_invalid_ssl_certificates is True
+    assert controller.username == CONTROLLER_SETTINGS["username"]
+
+    launcher = LauncherSettings.fromSettings({"batch_concurrency": "8", "batch_pace": 1, "resident_idle_timeout": "never"})
+    assert launcher.batch_concurrency == 8
+    assert launcher.batch_pace == 1.0
+    assert launcher.resident_idle_timeout == 3600
+
+    # numbers are never truncated
+    defaults = LauncherSettings.defaults()
+    launcher = LauncherSettings.fromSettings({"coalesce_window": 1.5, "batch_concurrency": 8.0, "batch_pace": float("nan")})
+    assert launcher.coalesce_window == defaults["coalesce_window"]
+    assert launcher.batch_concurrency == 8
+    assert launcher.batch_pace == defaults["batch_pace"]
+
+
+def test_read_only_and_replace():
+
+    controller = ControllerSettings.fromSettings({})
+    with pytest.raises(AttributeError):
+        controller.token = "abc"
+    updated = controller.replace(token="abc")
+    assert updated.token == "abc"
+    assert controller.token == ""
+    assert updated != controller
+    assert updated.toDict() == dict(CONTROLLER_SETTINGS, token="abc")
+
+
+def test_custom_commands():
+
+    custom = CustomCommands.fromSettings({"telnet": {"putty": "putty {host}", "invalid": 1}, "vnc": None})
+    assert custom.telnet == (("putty", "putty {host}"),)
+    assert custom.vnc == ()
+    assert custom.commands("telnet") == {"putty": "putty {host}"}
+    custom = custom.replace(spice={"viewer": "remote-viewer"})
+    assert custom.toDict() == {"telnet": {"putty": "putty {host}"}, "vnc": {}, "spice": {"viewer": "remote-viewer"}}
+
+
+def test_local_config_section(local_config):
+
+    commands = local_config.section(CommandsSettings)
+    assert local_config.section(CommandsSettings) is commands
+
+    local_config.saveSection(commands.replace(telnet_command="xterm"))
+    assert local_config.section(CommandsSettings).telnet_command == "xterm"
+    assert local_config.loadSectionSettings("CommandsSettings", COMMANDS_SETTINGS)["telnet_command"] == "xterm"
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2024 GNS3 Technologies Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import json
+import time
+import base64
+from unittest.mock import patch
+
+from gns3_webclient_pack.token_cache import TOKEN_CACHE_FILENAME, controller_key, token_expiry, load_token, store_token
+
+
+def _jwt(exp=None):
+
+    claims = {"sub": "admin"}
+    if exp is not None:
+        claims["exp"] = exp
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip("=")
+    return "eyJhbGciOiJIUzI1NiJ9.{}.signature".format(payload)
+
+
+def test_controller_key():
+
+    assert controller_key("HTTP", "Controller.local", 3080) == "http://controller.local:3080"
+    assert controller_key("https", "::1", 443) == "https://[::1]:443"
+
+
+def test_token_expiry():
+
+    assert token_expiry(_jwt(1700000000)) == 1700000000
+    assert token_expiry(_jwt()) is None
+    assert token_expiry("not a token") is None
+    assert token_expiry("") is None
+
+
+def test_store_and_load(tmp_path):
+
+    path = str(tmp_path / TOKEN_CACHE_FILENAME)
+    first = _jwt(time.time() + 3600)
+    second = _jwt(time.time() + 3600)
+    assert load_token(path, "http://first:3080") is None
+
+    store_token(path, "http://first:3080", first)
+    store_token(path, "http://second:3080", second)
+    assert load_token(path, "http://first:3080") == first
+    assert load_token(path, "http://second:3080") == second
+    if os.name == "posix":
+        assert os.stat(path).st_mode & 0o077 == 0
+
+    store_token(path, "http://first:3080", None)
+    assert load_token(path, "http://first:3080") is None
+    assert load_token(path, "http://second:3080") == second
+
+
+def test_expired_tokens(tmp_path):
+
+    path = str(tmp_path / TOKEN_CACHE_FILENAME)
+    store_token(path, "http://expired:3080", _jwt(time.time() - 10))
+    store_token(path, "http://soon:3080", _jwt(time.time() + 5))
+    assert load_token(path, "http://expired:3080") is None
+    assert load_token(path, "http://soon:3080") is None
+
+    # expired tokens are dropped on the next write
+    store_token(path, "http://other:3080", _jwt())
+    with open(path, encoding="utf-8") as f:
+        assert list(json.load(f)) == ["http://other:3080"]
+
+
+def test_corrupted_cache(tmp_path):
+
+    path = tmp_path / TOKEN_CACHE_FILENAME
+    path.write_text("{")
+    assert load_token(str(path), "http://first:3080") is None
+    token = _jwt(time.time() + 3600)
+    store_token(str(path), "http://first:3080", token)
+    assert load_token(str(path), "http://first:3080") == token
+
+
+def test_pcap_stream_authenticates_once(qtbot, local_config):
+
+    from gns3_webclient_pack.pcap_stream import PcapStream
+
+    def _stream(host):
+        return PcapStream("wireshark {pcap_file}", "http", "admin", "admin", "", False,
+                          host, 3080, "", {}, "gns3+pcap://{}:3080".format(host))
+
+    token = _jwt(time.time() + 3600)
+    stream = _stream("first")
+    assert stream._cachedToken() is None
+    with patch.object(PcapStream, "_executeHTTPQuery", return_value={"access_token": token}) as query:
+        assert stream._authenticate()
+    assert query.call_args[0][:2] == ("POST", "/access/users/authenticate")
+
+    # a new launcher process reuses the token of the same controller only
+    assert _stream("first")._cachedToken() == token
+    assert _stream("second")._cachedToken() is None
+    assert os.path.exists(os.path.join(local_config.configDirectory(), TOKEN_CACHE_FILENAME))